@@ -0,0 +1,59 @@
+"""
+Micro-benchmark: validated vs trusted ActionOutput construction, and which of the two
+from_result() picks (trusted from TRUSTED_MIN_ITEMS list items on).
+
+Run with: python benchmarks/bench_action_response.py [iterations]
+"""
+import sys
+import timeit
+
+from bson import ObjectId
+
+from mongodb_rooms_pkg.actions.base import TRUSTED_MIN_ITEMS
+from mongodb_rooms_pkg.actions.bulk_write import ActionOutput as BulkWriteOutput
+from mongodb_rooms_pkg.actions.bulk_write import BulkOperationResult
+from mongodb_rooms_pkg.actions.insert import ActionOutput as InsertOutput
+from mongodb_rooms_pkg.actions.update import ActionOutput as UpdateOutput
+
+
+def insert_case(size: int):
+    values = {"collection_name": "events", "inserted_count": size, "inserted_ids": [ObjectId() for _ in range(size)], "acknowledged": True}
+    return size, lambda: InsertOutput(**values), lambda: InsertOutput.trusted(**values)
+
+def bulk_write_case(size: int):
+    values = {
+        "collection_name": "events", "ordered": False, "inserted_count": size, "matched_count": 0, "modified_count": 0,
+        "deleted_count": 0, "upserted_count": 0, "failed_count": 0, "acknowledged": True,
+        "results": [BulkOperationResult(index=i, operation="insert", status="ok") for i in range(size)],
+    }
+    return size, lambda: BulkWriteOutput(**values), lambda: BulkWriteOutput.trusted(**values)
+
+def update_case():
+    values = {"collection_name": "events", "matched_count": 1, "modified_count": 1, "upserted_id": None, "acknowledged": True}
+    return 0, lambda: UpdateOutput(**values), lambda: UpdateOutput.trusted(**values)
+
+def main(iterations: int) -> None:
+    cases = [
+        ("insert_one", insert_case(1), iterations),
+        ("insert, 10 ids", insert_case(10), iterations),
+        ("insert, 100 ids", insert_case(100), iterations),
+        (f"insert, {TRUSTED_MIN_ITEMS} ids", insert_case(TRUSTED_MIN_ITEMS), iterations // 10),
+        ("insert, 1000 ids", insert_case(1000), iterations // 10),
+        ("insert, 10000 ids", insert_case(10000), iterations // 100),
+        ("bulk_write, 100 ops", bulk_write_case(100), iterations),
+        ("bulk_write, 1000 ops", bulk_write_case(1000), iterations // 10),
+        ("update (scalars only)", update_case(), iterations),
+    ]
+    for name, (size, validated, trusted), number in cases:
+        number = max(1, number)
+        validated_s = min(timeit.repeat(validated, number=number, repeat=5)) / number
+        trusted_s = min(timeit.repeat(trusted, number=number, repeat=5)) / number
+        print(
+            f"{name:<22} validated {validated_s * 1e6:8.2f} us/call  trusted {trusted_s * 1e6:8.2f} us/call  "
+            f"saving {(validated_s - trusted_s) * 1e6:8.2f} us/call ({validated_s / trusted_s:.1f}x)  "
+            f"from_result: {'trusted' if size >= TRUSTED_MIN_ITEMS else 'validated'}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
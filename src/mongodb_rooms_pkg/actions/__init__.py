@@ -1,9 +1,20 @@
+from .aggregate import aggregate
+from .bulk_write import bulk_write
 from .create_collection import create_collection
+from .create_indexes import create_indexes
 from .delete import delete
 from .describe import describe
 from .describe_collection import describe_collection
+from .drop_index import drop_index
+from .export_collection import export_collection
+from .find import find
+from .import_file import import_file
 from .insert import insert
+from .insert_chunked import insert_chunked
+from .list_indexes import list_indexes
+from .paginate import paginate
+from .parallel_scan import parallel_scan
 from .update import update
 from .upsert import upsert
 
-__all__ = ["describe","describe_collection", "create_collection", "upsert", "insert", "update", "delete"]
+__all__ = ["describe","describe_collection", "create_collection", "upsert", "insert", "update", "delete", "find", "aggregate", "bulk_write", "insert_chunked", "create_indexes", "drop_index", "list_indexes", "paginate", "parallel_scan", "export_collection", "import_file"]
@@ -0,0 +1,126 @@
+from collections.abc import Iterable
+from typing import Any, Optional, Union
+
+from loguru import logger
+from pydantic import BaseModel, Field, SkipValidation
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.utils.batching import iter_cursor_batches
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+WRITE_STAGES = ("$out", "$merge")
+
+
+class ActionInput(BaseModel):
+    collection: str
+    pipeline: list[dict[str, Any]]
+    allow_disk_use: bool = False
+    max_time_ms: Optional[int] = Field(None, gt=0)
+    batch_size: int = Field(100, gt=0)
+    hint: Optional[Union[str, dict[str, Any]]] = None
+
+class ActionOutput(OutputBase):
+    collection_name: str
+    batch_size: int
+    # Not validated: pydantic would wrap the generator in an iterator without close().
+    pages: SkipValidation[Iterable[list[Any]]]
+    output_collection: Optional[str] = None
+
+def _output_collection(pipeline: list[dict[str, Any]]) -> Optional[str]:
+    if not pipeline:
+        return None
+    last_stage = pipeline[-1]
+    if "$out" in last_stage:
+        target = last_stage["$out"]
+    elif "$merge" in last_stage:
+        target = last_stage["$merge"]
+        target = target.get("into") if isinstance(target, dict) else target
+    else:
+        return None
+    if isinstance(target, dict):
+        return ".".join(part for part in (target.get("db"), target.get("coll")) if part)
+    return target
+
+def aggregate(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+    """
+    Run an aggregation pipeline on the server.
+    Results are returned as a lazy iterator of pages backed by the server-side cursor, closed
+    once the pages are exhausted or `output.pages.close()` is called. When the pipeline ends
+    with `$out` or `$merge`, the results are written back on the server and `pages` is empty.
+    """
+    logger.debug("MongoDB rooms package - Aggregate action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
+
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                batch_size=action_input.batch_size,
+                pages=[]
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        if any(key in WRITE_STAGES for stage in action_input.pipeline[:-1] for key in stage):
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = "'$out' and '$merge' can only be used as the last stage of the pipeline"
+            code = 400
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                batch_size=action_input.batch_size,
+                pages=[]
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        db = connection[config.database]
+        collection = db[action_input.collection]
+
+        options = {
+            "allowDiskUse": action_input.allow_disk_use,
+            "batchSize": action_input.batch_size,
+        }
+        if action_input.max_time_ms:
+            options["maxTimeMS"] = action_input.max_time_ms
+        if isinstance(action_input.hint, dict):
+            options["hint"] = list(action_input.hint.items())
+        elif action_input.hint:
+            options["hint"] = action_input.hint
+
+        cursor = collection.aggregate(action_input.pipeline, **options)
+        output_collection = _output_collection(action_input.pipeline)
+
+        if output_collection:
+            cursor.close()
+            tokens = TokensSchema(stepAmount=1200, totalCurrentAmount=17436)
+            message = f"Aggregation on collection '{action_input.collection}' written to '{output_collection}'"
+            pages = []
+        else:
+            tokens = TokensSchema(stepAmount=1000, totalCurrentAmount=17236)
+            message = f"Opened aggregation cursor on collection '{action_input.collection}' (batch size {action_input.batch_size})"
+            pages = iter_cursor_batches(cursor, action_input.batch_size)
+
+        code = 200
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            batch_size=action_input.batch_size,
+            pages=pages,
+            output_collection=output_collection
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error running aggregation: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error running aggregation: {str(e)}"
+        code = 500
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            batch_size=action_input.batch_size,
+            pages=[]
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
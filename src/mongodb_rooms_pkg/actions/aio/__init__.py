@@ -0,0 +1,9 @@
+from .create_collection import create_collection
+from .delete import delete
+from .describe import describe
+from .describe_collection import describe_collection
+from .insert import insert
+from .update import update
+from .upsert import upsert
+
+__all__ = ["describe", "describe_collection", "create_collection", "upsert", "insert", "update", "delete"]
@@ -0,0 +1,101 @@
+from loguru import logger
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.indexes import create_index_models_async
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from ..base import ActionResponse, TokensSchema
+from ..create_collection import ActionInput, ActionOutput
+
+
+async def create_collection(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+    logger.debug("MongoDB rooms package - Async create collection action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
+
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            output = ActionOutput(
+                collection_name=action_input.collection_name,
+                created=False,
+                schema_applied=False,
+                message="No database connection"
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        db = connection[config.database]
+        existing_collections = await db.list_collection_names()
+
+        if action_input.collection_name in existing_collections:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = f"Collection '{action_input.collection_name}' already exists"
+            code = 409
+            output = ActionOutput(
+                collection_name=action_input.collection_name,
+                created=False,
+                schema_applied=False,
+                message="Collection already exists"
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        collection_options = action_input.options or {}
+
+        if action_input.schema_definition:
+            collection_options["validator"] = {
+                "$jsonSchema": action_input.schema_definition
+            }
+            collection_options["validationLevel"] = collection_options.get("validationLevel", "strict")
+            collection_options["validationAction"] = collection_options.get("validationAction", "error")
+
+        collection = await db.create_collection(action_input.collection_name, **collection_options)
+        schema_applied = bool(action_input.schema_definition)
+
+        index_names = []
+        if action_input.indexes:
+            try:
+                index_names = await create_index_models_async(collection, action_input.indexes)
+            except Exception as e:
+                logger.error(f"Error creating indexes for new collection: {e}")
+                tokens = TokensSchema(stepAmount=1000, totalCurrentAmount=17236)
+                message = f"Created collection '{action_input.collection_name}' but failed to create its indexes: {str(e)}"
+                code = 207
+                output = ActionOutput(
+                    collection_name=action_input.collection_name,
+                    created=True,
+                    schema_applied=schema_applied,
+                    message=f"Collection created, index creation failed: {str(e)}"
+                )
+                return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        tokens = TokensSchema(stepAmount=1000, totalCurrentAmount=17236)
+        message = f"Successfully created collection '{action_input.collection_name}'"
+        if schema_applied:
+            message += " with JSON schema validation"
+        if index_names:
+            message += f" and {len(index_names)} index(es)"
+        code = 201
+
+        output = ActionOutput(
+            collection_name=action_input.collection_name,
+            created=True,
+            schema_applied=schema_applied,
+            message="Collection created successfully",
+            index_names=index_names
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error creating collection: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error creating collection: {str(e)}"
+        code = 500
+        output = ActionOutput(
+            collection_name=action_input.collection_name,
+            created=False,
+            schema_applied=False,
+            message=f"Error: {str(e)}"
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
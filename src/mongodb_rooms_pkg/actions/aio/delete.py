@@ -0,0 +1,93 @@
+from typing import Optional
+
+from loguru import logger
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.concerns import ConcernResolver, UnknownConcernProfileError, resolve_collection
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from ..base import ActionResponse, TokensSchema
+from ..delete import ActionInput, ActionOutput
+
+
+async def delete(config: CustomAddonConfig, connection, action_input: ActionInput,
+                 resolver: Optional[ConcernResolver] = None) -> ActionResponse:
+    logger.debug("MongoDB rooms package - Async delete action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
+
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                deleted_count=0,
+                acknowledged=False
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        if not action_input.filter:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = "Filter cannot be empty for safety reasons"
+            code = 400
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                deleted_count=0,
+                acknowledged=False
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        db = connection[config.database]
+        try:
+            collection = resolve_collection(config, db, action_input.collection, action_input.concern_profile, resolver)
+        except UnknownConcernProfileError as e:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = str(e)
+            code = 400
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                deleted_count=0,
+                acknowledged=False
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        if action_input.delete_many:
+            result = await collection.delete_many(action_input.filter)
+        else:
+            result = await collection.delete_one(action_input.filter)
+
+        operation_type = "many" if action_input.delete_many else "one"
+        tokens = TokensSchema(stepAmount=1000, totalCurrentAmount=17236)
+        if not result.acknowledged:
+            # w=0: the server reports nothing back, so there is no count to return.
+            message = f"Sent delete_{operation_type} to collection '{action_input.collection}' without acknowledgement"
+            code = 200
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                deleted_count=0,
+                acknowledged=False
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        message = f"Successfully deleted {result.deleted_count} document(s) from collection '{action_input.collection}' (delete_{operation_type})"
+        code = 200
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            deleted_count=result.deleted_count,
+            acknowledged=result.acknowledged
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error deleting documents: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error deleting documents: {str(e)}"
+        code = 500
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            deleted_count=0,
+            acknowledged=False
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
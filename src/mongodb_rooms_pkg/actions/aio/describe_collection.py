@@ -0,0 +1,108 @@
+import asyncio
+from typing import Any, Optional
+
+from loguru import logger
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.collection_stats import fetch_collection_metadata_async
+from mongodb_rooms_pkg.services.schema_inference import DEFAULT_MAX_DEPTH, DEFAULT_SAMPLE_SIZE, infer_schema_async
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from ..base import ActionResponse, TokensSchema
+from ..describe_collection import ActionOutput, CollectionDescription, build_collection_stats, build_field_infos
+
+
+async def _describe_one(db, collection_name: str, exists: bool, stats_result: Optional[dict[str, Any]],
+                        indexes: Optional[list[dict[str, Any]]], sample_size: int, max_depth: int) -> CollectionDescription:
+    try:
+        if not exists:
+            return CollectionDescription(collection_name=collection_name, exists=False)
+
+        stats = build_collection_stats(stats_result) if stats_result is not None else None
+        schema_sample = None
+
+        try:
+            schema_sample = build_field_infos(await infer_schema_async(db[collection_name], sample_size, max_depth))
+        except Exception as e:
+            logger.warning(f"Could not analyze schema for {collection_name}: {e}")
+
+        return CollectionDescription(
+            collection_name=collection_name,
+            exists=True,
+            stats=stats,
+            indexes=indexes,
+            schema_sample=schema_sample
+        )
+
+    except Exception as e:
+        logger.error(f"Error processing collection {collection_name}: {e}")
+        return CollectionDescription(collection_name=collection_name, exists=False)
+
+async def describe_collection(config: CustomAddonConfig, connection, collections: list[str] = None,
+                              max_concurrency: int = 1) -> ActionResponse:
+    """
+    Async describe_collection: stats and indexes come from one batched $collStats/$indexStats
+    aggregation, then schema samples run as concurrent tasks, at most max_concurrency at a
+    time, and are gathered back in the requested order.
+    """
+    logger.debug("MongoDB rooms package - Async describe collection action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Collection names: {}", lambda: summarize(collections))
+
+    if not collections:
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = "Collection names array is required"
+        code = 400
+        output = ActionOutput(
+            collections=[],
+            total_processed=0
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            output = ActionOutput(
+                collections=[],
+                total_processed=0
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        db = connection[config.database]
+        existing = set(await db.list_collection_names(filter={"name": {"$in": list(collections)}}))
+        present = [name for name in collections if name in existing]
+        stats, indexes = await fetch_collection_metadata_async(db, present)
+        sample_size = config.schemaSampleSize or DEFAULT_SAMPLE_SIZE
+        max_depth = config.schemaMaxDepth if config.schemaMaxDepth is not None else DEFAULT_MAX_DEPTH
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or 1))
+
+        async def bounded(collection_name: str) -> CollectionDescription:
+            async with semaphore:
+                return await _describe_one(
+                    db, collection_name, collection_name in existing, stats.get(collection_name), indexes.get(collection_name),
+                    sample_size, max_depth
+                )
+
+        collection_descriptions = list(await asyncio.gather(*(bounded(name) for name in collections)))
+
+        tokens = TokensSchema(stepAmount=1500 * len(collections), totalCurrentAmount=16236 + (1500 * len(collections)))
+        message = f"Described {len(collections)} collections successfully"
+        code = 200
+        output = ActionOutput(
+            collections=collection_descriptions,
+            total_processed=len(collections)
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error describing collections: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error describing collections: {str(e)}"
+        code = 500
+        output = ActionOutput(
+            collections=[],
+            total_processed=0
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
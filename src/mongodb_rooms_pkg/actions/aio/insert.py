@@ -0,0 +1,114 @@
+from typing import Optional
+
+from bson.raw_bson import RawBSONDocument
+from loguru import logger
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.concerns import ConcernResolver, UnknownConcernProfileError, resolve_collection
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from ..base import ActionResponse, TokensSchema
+from ..insert import ActionInput, ActionOutput
+
+
+async def insert(config: CustomAddonConfig, connection, action_input: ActionInput,
+                 resolver: Optional[ConcernResolver] = None) -> ActionResponse:
+    logger.debug("MongoDB rooms package - Async insert action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
+
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                inserted_count=0,
+                inserted_ids=[],
+                acknowledged=False
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        provided = sum(bool(value) for value in (action_input.document, action_input.documents, action_input.raw_documents))
+        if not provided:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = "Either 'document' or 'documents' must be provided (or 'raw_documents' with pre-encoded BSON)"
+            code = 400
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                inserted_count=0,
+                inserted_ids=[],
+                acknowledged=False
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        if provided > 1:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            if action_input.raw_documents:
+                message = "Cannot combine 'raw_documents' with 'document' or 'documents'"
+            else:
+                message = "Cannot provide both 'document' and 'documents'. Use one or the other"
+            code = 400
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                inserted_count=0,
+                inserted_ids=[],
+                acknowledged=False
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        db = connection[config.database]
+        try:
+            collection = resolve_collection(config, db, action_input.collection, action_input.concern_profile, resolver)
+        except UnknownConcernProfileError as e:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = str(e)
+            code = 400
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                inserted_count=0,
+                inserted_ids=[],
+                acknowledged=False
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        if action_input.document:
+            result = await collection.insert_one(action_input.document)
+            inserted_ids = [result.inserted_id]
+            inserted_count = 1
+        elif action_input.raw_documents:
+            raw_documents = [RawBSONDocument(raw) for raw in action_input.raw_documents]
+            result = await collection.insert_many(raw_documents)
+            # pymongo leaves RawBSONDocuments out of inserted_ids: count what was sent instead.
+            inserted_ids = [document["_id"] for document in raw_documents if "_id" in document]
+            inserted_count = len(raw_documents)
+        else:
+            result = await collection.insert_many(action_input.documents)
+            inserted_ids = result.inserted_ids
+            inserted_count = len(inserted_ids)
+
+        tokens = TokensSchema(stepAmount=1200, totalCurrentAmount=17436)
+        message = f"Successfully inserted {inserted_count} document(s) into collection '{action_input.collection}'"
+        code = 200
+        output = ActionOutput.from_result(
+            len(inserted_ids),
+            collection_name=action_input.collection,
+            inserted_count=inserted_count,
+            inserted_ids=inserted_ids,
+            acknowledged=result.acknowledged
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error inserting documents: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error inserting documents: {str(e)}"
+        code = 500
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            inserted_count=0,
+            inserted_ids=[],
+            acknowledged=False
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
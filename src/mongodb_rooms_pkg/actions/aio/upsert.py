@@ -0,0 +1,131 @@
+from typing import Optional
+
+from loguru import logger
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.concerns import ConcernResolver, UnknownConcernProfileError, resolve_collection
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from ..base import ActionResponse, TokensSchema
+from ..upsert import ActionInput, ActionOutput
+
+
+async def upsert(config: CustomAddonConfig, connection, action_input: ActionInput,
+                 resolver: Optional[ConcernResolver] = None) -> ActionResponse:
+    logger.debug("MongoDB rooms package - Async upsert action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
+
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                matched_count=0,
+                modified_count=0,
+                acknowledged=False,
+                operation_performed="none"
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        if not action_input.filter:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = "Filter cannot be empty"
+            code = 400
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                matched_count=0,
+                modified_count=0,
+                acknowledged=False,
+                operation_performed="none"
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        if not action_input.update:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = "Update document cannot be empty"
+            code = 400
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                matched_count=0,
+                modified_count=0,
+                acknowledged=False,
+                operation_performed="none"
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        db = connection[config.database]
+        try:
+            collection = resolve_collection(config, db, action_input.collection, action_input.concern_profile, resolver)
+        except UnknownConcernProfileError as e:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = str(e)
+            code = 400
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                matched_count=0,
+                modified_count=0,
+                acknowledged=False,
+                operation_performed="none"
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        if action_input.update_many:
+            result = await collection.update_many(
+                action_input.filter,
+                action_input.update,
+                upsert=True
+            )
+            operation_type = "update_many"
+        else:
+            result = await collection.update_one(
+                action_input.filter,
+                action_input.update,
+                upsert=True
+            )
+            operation_type = "update_one"
+
+        if not result.acknowledged:
+            # w=0: the server reports nothing back, so whether it inserted or updated is unknown.
+            tokens = TokensSchema(stepAmount=1100, totalCurrentAmount=17336)
+            message = f"Sent upsert to collection '{action_input.collection}' using {operation_type} without acknowledgement"
+            code = 200
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                matched_count=0,
+                modified_count=0,
+                acknowledged=False,
+                operation_performed="unknown"
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        operation_performed = "insert" if result.upserted_id else "update"
+
+        tokens = TokensSchema(stepAmount=1100, totalCurrentAmount=17336)
+        message = f"Successfully performed upsert operation ({operation_performed}) in collection '{action_input.collection}' using {operation_type}"
+        code = 200
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            matched_count=result.matched_count,
+            modified_count=result.modified_count,
+            upserted_id=getattr(result, 'upserted_id', None),
+            acknowledged=result.acknowledged,
+            operation_performed=operation_performed
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error performing upsert operation: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error performing upsert operation: {str(e)}"
+        code = 500
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            matched_count=0,
+            modified_count=0,
+            acknowledged=False,
+            operation_performed="error"
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
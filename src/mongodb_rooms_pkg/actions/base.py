@@ -1,19 +1,71 @@
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel
 
+_TRUSTED_LAYOUTS: dict[type, tuple[tuple[str, ...], dict[str, Any]]] = {}
+# Below this many list items, compiled validation is cheaper than trusted(): see
+# benchmarks/bench_action_response.py.
+TRUSTED_MIN_ITEMS = 500
 
-class TokensSchema(BaseModel):
+
+class TrustedModel(BaseModel):
+    """
+    Base for response models that also accept already-trusted data.
+
+    trusted() builds an instance without validation by filling __dict__ directly (a leaner
+    equivalent of model_construct). Use it only for values that come straight from pymongo
+    result objects on success paths; anything derived from user input keeps going through
+    the validating constructor. Pydantic's compiled validation is cheaper than this for small
+    scalar-only models, so the saving only shows on outputs carrying server-sized lists
+    (inserted ids, per-operation results...): from_result() picks whichever is cheaper.
+    See benchmarks/bench_action_response.py.
+    """
+
+    @classmethod
+    def from_result(cls, item_count: int, **values):
+        """trusted() when the output carries at least TRUSTED_MIN_ITEMS list items, the validating constructor otherwise."""
+        if item_count >= TRUSTED_MIN_ITEMS:
+            return cls.trusted(**values)
+        return cls(**values)
+
+    @classmethod
+    def trusted(cls, **values):
+        if cls.__private_attributes__ or cls.model_config.get("extra") == "allow":
+            return cls.model_construct(**values)
+        layout = _TRUSTED_LAYOUTS.get(cls)
+        if layout is None:
+            layout = _TRUSTED_LAYOUTS[cls] = (
+                tuple(cls.model_fields),
+                {name: field for name, field in cls.model_fields.items() if not field.is_required()}
+            )
+        names, optional = layout
+        # Built in declaration order: serialization follows __dict__ order.
+        if len(values) == len(names):
+            fields = {name: values[name] for name in names}
+        else:
+            fields = {
+                name: values[name] if name in values else optional[name].get_default(call_default_factory=True)
+                for name in names if name in values or name in optional
+            }
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "__dict__", fields)
+        object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
+
+class TokensSchema(TrustedModel):
     stepAmount: int
     totalCurrentAmount: int
 
 
-class OutputBase(BaseModel):
+class OutputBase(TrustedModel):
     """for output. Should be overwritted per action."""
     pass
 
 
-class ActionResponse(BaseModel):
+class ActionResponse(TrustedModel):
     output: OutputBase
     tokens: TokensSchema
     message: Optional[str] = None
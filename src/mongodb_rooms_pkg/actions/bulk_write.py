@@ -0,0 +1,200 @@
+from typing import Any, Literal, Optional
+
+from loguru import logger
+from pydantic import BaseModel
+from pymongo import DeleteMany, DeleteOne, InsertOne, ReplaceOne, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+
+class BulkOperation(BaseModel):
+    operation: Literal["insert", "update", "upsert", "replace", "delete"]
+    document: Optional[dict[str, Any]] = None
+    filter: Optional[dict[str, Any]] = None
+    update: Optional[dict[str, Any]] = None
+    many: Optional[bool] = False
+    upsert: Optional[bool] = False
+
+class ActionInput(BaseModel):
+    collection: str
+    operations: list[BulkOperation]
+    ordered: Optional[bool] = True
+
+class BulkOperationResult(BaseModel):
+    index: int
+    operation: str
+    status: Literal["ok", "error", "skipped", "unacknowledged"]
+    inserted_id: Optional[Any] = None
+    upserted_id: Optional[Any] = None
+    error_code: Optional[int] = None
+    error: Optional[str] = None
+
+class ActionOutput(OutputBase):
+    collection_name: str
+    ordered: bool
+    inserted_count: int
+    matched_count: int
+    modified_count: int
+    deleted_count: int
+    upserted_count: int
+    failed_count: int
+    results: list[BulkOperationResult]
+    acknowledged: bool
+
+def _validate_operation(operation: BulkOperation) -> Optional[str]:
+    if operation.operation in ("insert", "replace") and operation.document is None:
+        return f"'{operation.operation}' requires 'document'"
+    if operation.operation != "insert" and not operation.filter:
+        return f"'{operation.operation}' requires a non-empty 'filter'"
+    if operation.operation in ("update", "upsert") and not operation.update:
+        return f"'{operation.operation}' requires a non-empty 'update'"
+    return None
+
+def _to_request(operation: BulkOperation):
+    op_filter = operation.filter or {}
+    if operation.operation == "insert":
+        return InsertOne(operation.document)
+    if operation.operation == "replace":
+        return ReplaceOne(op_filter, operation.document, upsert=bool(operation.upsert))
+    if operation.operation == "delete":
+        return DeleteMany(op_filter) if operation.many else DeleteOne(op_filter)
+    upsert = operation.operation == "upsert" or bool(operation.upsert)
+    if operation.many:
+        return UpdateMany(op_filter, operation.update, upsert=upsert)
+    return UpdateOne(op_filter, operation.update, upsert=upsert)
+
+def _empty_output(action_input: ActionInput) -> ActionOutput:
+    return ActionOutput(
+        collection_name=action_input.collection,
+        ordered=bool(action_input.ordered),
+        inserted_count=0,
+        matched_count=0,
+        modified_count=0,
+        deleted_count=0,
+        upserted_count=0,
+        failed_count=0,
+        results=[],
+        acknowledged=False
+    )
+
+def bulk_write(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+    logger.debug("MongoDB rooms package - Bulk write action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
+
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            return ActionResponse(output=_empty_output(action_input), tokens=tokens, message=message, code=code)
+
+        if not action_input.operations:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = "At least one operation must be provided"
+            code = 400
+            return ActionResponse(output=_empty_output(action_input), tokens=tokens, message=message, code=code)
+
+        for index, operation in enumerate(action_input.operations):
+            error = _validate_operation(operation)
+            if error:
+                tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+                message = f"Invalid operation at index {index}: {error}"
+                code = 400
+                return ActionResponse(output=_empty_output(action_input), tokens=tokens, message=message, code=code)
+
+        db = connection[config.database]
+        collection = db[action_input.collection]
+
+        requests = [_to_request(operation) for operation in action_input.operations]
+        results = [
+            BulkOperationResult(index=index, operation=operation.operation, status="ok")
+            for index, operation in enumerate(action_input.operations)
+        ]
+
+        try:
+            result = collection.bulk_write(requests, ordered=action_input.ordered)
+            if not result.acknowledged:
+                # w=0: the server reports nothing back, so there are no counts or errors to return.
+                for item, operation in zip(results, action_input.operations):
+                    item.status = "unacknowledged"
+                    if operation.operation == "insert":
+                        item.inserted_id = operation.document.get("_id")
+                tokens = TokensSchema(stepAmount=1300, totalCurrentAmount=17536)
+                message = f"Sent {len(requests)} operation(s) to collection '{action_input.collection}' without acknowledgement"
+                code = 200
+                output = ActionOutput.from_result(
+                    len(results),
+                    collection_name=action_input.collection,
+                    ordered=bool(action_input.ordered),
+                    inserted_count=0,
+                    matched_count=0,
+                    modified_count=0,
+                    deleted_count=0,
+                    upserted_count=0,
+                    failed_count=0,
+                    results=results,
+                    acknowledged=False
+                )
+                return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+            details = {
+                "nInserted": result.inserted_count,
+                "nMatched": result.matched_count,
+                "nModified": result.modified_count,
+                "nRemoved": result.deleted_count,
+                "upserted": [{"index": index, "_id": _id} for index, _id in result.upserted_ids.items()],
+                "writeErrors": [],
+            }
+        except BulkWriteError as e:
+            details = e.details
+
+        failed_indexes = set()
+        for write_error in details.get("writeErrors", []):
+            index = write_error["index"]
+            failed_indexes.add(index)
+            results[index].status = "error"
+            results[index].error_code = write_error.get("code")
+            results[index].error = write_error.get("errmsg")
+        if action_input.ordered and failed_indexes:
+            for item in results[min(failed_indexes) + 1:]:
+                item.status = "skipped"
+        for upserted in details.get("upserted", []):
+            results[upserted["index"]].upserted_id = upserted["_id"]
+        for item, operation in zip(results, action_input.operations):
+            if operation.operation == "insert" and item.status == "ok":
+                item.inserted_id = operation.document.get("_id")
+
+        upserted_count = len(details.get("upserted", []))
+        failed_count = len(failed_indexes)
+        tokens = TokensSchema(stepAmount=1300, totalCurrentAmount=17536)
+        if failed_count:
+            message = f"Bulk write on collection '{action_input.collection}' completed with {failed_count} failed operation(s)"
+            code = 207
+        else:
+            message = f"Successfully executed {len(requests)} operation(s) on collection '{action_input.collection}'"
+            code = 200
+        output = ActionOutput.from_result(
+            len(results),
+            collection_name=action_input.collection,
+            ordered=bool(action_input.ordered),
+            inserted_count=details.get("nInserted", 0),
+            matched_count=details.get("nMatched", 0),
+            modified_count=details.get("nModified", 0),
+            deleted_count=details.get("nRemoved", 0),
+            upserted_count=upserted_count,
+            failed_count=failed_count,
+            results=results,
+            acknowledged=True
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error executing bulk write: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error executing bulk write: {str(e)}"
+        code = 500
+        return ActionResponse(output=_empty_output(action_input), tokens=tokens, message=message, code=code)
@@ -4,6 +4,8 @@ from loguru import logger
 from pydantic import BaseModel
 
 from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.indexes import IndexSpec, create_index_models
+from mongodb_rooms_pkg.utils.summary import summarize
 
 from .base import ActionResponse, OutputBase, TokensSchema
 
@@ -12,17 +14,19 @@ class ActionInput(BaseModel):
     collection_name: str
     schema_definition: Optional[dict[str, Any]] = None
     options: Optional[dict[str, Any]] = None
+    indexes: Optional[list[IndexSpec]] = None
 
 class ActionOutput(OutputBase):
     collection_name: str
     created: bool
     schema_applied: bool
     message: str
+    index_names: list[str] = []
 
 def create_collection(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
     logger.debug("MongoDB rooms package - Create collection action executing...")
-    logger.debug(f"Config: {config}")
-    logger.debug(f"Input: {action_input}")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
 
     try:
         if not connection:
@@ -61,20 +65,40 @@ def create_collection(config: CustomAddonConfig, connection, action_input: Actio
             collection_options["validationLevel"] = collection_options.get("validationLevel", "strict")
             collection_options["validationAction"] = collection_options.get("validationAction", "error")
 
-        db.create_collection(action_input.collection_name, **collection_options)
-
+        collection = db.create_collection(action_input.collection_name, **collection_options)
         schema_applied = bool(action_input.schema_definition)
+
+        index_names = []
+        if action_input.indexes:
+            try:
+                index_names = create_index_models(collection, action_input.indexes)
+            except Exception as e:
+                logger.error(f"Error creating indexes for new collection: {e}")
+                tokens = TokensSchema(stepAmount=1000, totalCurrentAmount=17236)
+                message = f"Created collection '{action_input.collection_name}' but failed to create its indexes: {str(e)}"
+                code = 207
+                output = ActionOutput(
+                    collection_name=action_input.collection_name,
+                    created=True,
+                    schema_applied=schema_applied,
+                    message=f"Collection created, index creation failed: {str(e)}"
+                )
+                return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
         tokens = TokensSchema(stepAmount=1000, totalCurrentAmount=17236)
         message = f"Successfully created collection '{action_input.collection_name}'"
         if schema_applied:
             message += " with JSON schema validation"
+        if index_names:
+            message += f" and {len(index_names)} index(es)"
         code = 201
 
         output = ActionOutput(
             collection_name=action_input.collection_name,
             created=True,
             schema_applied=schema_applied,
-            message="Collection created successfully"
+            message="Collection created successfully",
+            index_names=index_names
         )
         return ActionResponse(output=output, tokens=tokens, message=message, code=code)
 
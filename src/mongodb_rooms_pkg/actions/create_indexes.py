@@ -0,0 +1,71 @@
+from typing import Optional, Union
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.indexes import IndexSpec, create_index_models
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+
+class ActionInput(BaseModel):
+    collection: str
+    indexes: list[IndexSpec]
+    commit_quorum: Optional[Union[int, str]] = None
+    max_time_ms: Optional[int] = Field(None, gt=0)
+
+class ActionOutput(OutputBase):
+    collection_name: str
+    index_names: list[str]
+
+def create_indexes(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+    """
+    Build every index of action_input.indexes with a single createIndexes command. The server
+    builds them together in one pass over the collection, holding exclusive locks only at the
+    start and end of the build; commit_quorum controls how many replica set members must
+    finish it before the indexes become ready.
+    """
+    logger.debug("MongoDB rooms package - Create indexes action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
+
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            output = ActionOutput(collection_name=action_input.collection, index_names=[])
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        if not action_input.indexes:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = "At least one index must be provided"
+            code = 400
+            output = ActionOutput(collection_name=action_input.collection, index_names=[])
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        db = connection[config.database]
+        collection = db[action_input.collection]
+
+        kwargs = {}
+        if action_input.commit_quorum is not None:
+            kwargs["commitQuorum"] = action_input.commit_quorum
+        if action_input.max_time_ms is not None:
+            kwargs["maxTimeMS"] = action_input.max_time_ms
+        index_names = create_index_models(collection, action_input.indexes, **kwargs)
+
+        tokens = TokensSchema(stepAmount=1000, totalCurrentAmount=17236)
+        message = f"Successfully created {len(index_names)} index(es) on collection '{action_input.collection}'"
+        code = 201
+        output = ActionOutput(collection_name=action_input.collection, index_names=index_names)
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error creating indexes: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error creating indexes: {str(e)}"
+        code = 500
+        output = ActionOutput(collection_name=action_input.collection, index_names=[])
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
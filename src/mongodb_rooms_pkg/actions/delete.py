@@ -4,6 +4,8 @@ from loguru import logger
 from pydantic import BaseModel
 
 from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.concerns import ConcernResolver, UnknownConcernProfileError, resolve_collection
+from mongodb_rooms_pkg.utils.summary import summarize
 
 from .base import ActionResponse, OutputBase, TokensSchema
 
@@ -12,16 +14,18 @@ class ActionInput(BaseModel):
     collection: str
     filter: dict[str, Any]
     delete_many: Optional[bool] = False
+    concern_profile: Optional[str] = None
 
 class ActionOutput(OutputBase):
     collection_name: str
     deleted_count: int
     acknowledged: bool
 
-def delete(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+def delete(config: CustomAddonConfig, connection, action_input: ActionInput,
+           resolver: Optional[ConcernResolver] = None) -> ActionResponse:
     logger.debug("MongoDB rooms package - Delete action executing...")
-    logger.debug(f"Config: {config}")
-    logger.debug(f"Input: {action_input}")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
 
     try:
         if not connection:
@@ -47,7 +51,18 @@ def delete(config: CustomAddonConfig, connection, action_input: ActionInput) ->
             return ActionResponse(output=output, tokens=tokens, message=message, code=code)
 
         db = connection[config.database]
-        collection = db[action_input.collection]
+        try:
+            collection = resolve_collection(config, db, action_input.collection, action_input.concern_profile, resolver)
+        except UnknownConcernProfileError as e:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = str(e)
+            code = 400
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                deleted_count=0,
+                acknowledged=False
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
 
         if action_input.delete_many:
             result = collection.delete_many(action_input.filter)
@@ -56,6 +71,17 @@ def delete(config: CustomAddonConfig, connection, action_input: ActionInput) ->
 
         operation_type = "many" if action_input.delete_many else "one"
         tokens = TokensSchema(stepAmount=1000, totalCurrentAmount=17236)
+        if not result.acknowledged:
+            # w=0: the server reports nothing back, so there is no count to return.
+            message = f"Sent delete_{operation_type} to collection '{action_input.collection}' without acknowledgement"
+            code = 200
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                deleted_count=0,
+                acknowledged=False
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
         message = f"Successfully deleted {result.deleted_count} document(s) from collection '{action_input.collection}' (delete_{operation_type})"
         code = 200
         output = ActionOutput(
@@ -4,6 +4,8 @@ from loguru import logger
 from pydantic import BaseModel
 
 from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.metadata_cache import MetadataCache, cached
+from mongodb_rooms_pkg.utils.summary import summarize
 
 from .base import ActionResponse, OutputBase, TokensSchema
 
@@ -23,9 +25,9 @@ class ActionOutput(OutputBase):
     server_info: Optional[dict[str, Any]] = None
     total_collections: int
 
-def describe(config: CustomAddonConfig, connection) -> ActionResponse:
+def describe(config: CustomAddonConfig, connection, cache: Optional[MetadataCache] = None) -> ActionResponse:
     logger.debug("MongoDB rooms package - Describe action executing...")
-    logger.debug(f"Config: {config}")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
 
     try:
         if not connection:
@@ -41,7 +43,7 @@ def describe(config: CustomAddonConfig, connection) -> ActionResponse:
 
         db = connection[config.database]
 
-        collections = db.list_collection_names()
+        collections = cached(cache, (config.database, None, "collection_names"), db.list_collection_names)
 
         db_stats = None
         server_info = None
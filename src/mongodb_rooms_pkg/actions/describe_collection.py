@@ -1,9 +1,22 @@
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 from loguru import logger
 from pydantic import BaseModel
 
 from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.collection_stats import existing_collections, load_collection_metadata
+from mongodb_rooms_pkg.services.metadata_cache import MetadataCache, cached
+from mongodb_rooms_pkg.services.schema_inference import (
+    DEFAULT_MAX_DEPTH,
+    DEFAULT_SAMPLE_SIZE,
+    SchemaProfile,
+    infer_schema,
+    profile_sample,
+)
+from mongodb_rooms_pkg.services.schema_store import SchemaProfileStore
+from mongodb_rooms_pkg.utils.summary import summarize
 
 from .base import ActionResponse, OutputBase, TokensSchema
 
@@ -24,6 +37,10 @@ class FieldInfo(BaseModel):
     data_types: list[str]
     null_count: int
     sample_values: list[Any]
+    count: Optional[int] = None
+    presence_ratio: Optional[float] = None
+    type_distribution: Optional[dict[str, float]] = None
+    cardinality_estimate: Optional[int] = None
 
 class CollectionDescription(BaseModel):
     collection_name: str
@@ -36,10 +53,81 @@ class ActionOutput(OutputBase):
     collections: list[CollectionDescription]
     total_processed: int
 
-def describe_collection(config: CustomAddonConfig, connection, collections: list[str] = None) -> ActionResponse:
+def build_collection_stats(stats_result: dict[str, Any]) -> CollectionStats:
+    return CollectionStats(
+        count=stats_result.get("count", 0),
+        size=stats_result.get("size", 0),
+        avg_obj_size=stats_result.get("avgObjSize"),
+        storage_size=stats_result.get("storageSize", 0),
+        indexes=stats_result.get("nindexes", 0),
+        total_index_size=stats_result.get("totalIndexSize", 0)
+    )
+
+def analyze_schema(sample_docs: Iterable[dict[str, Any]], max_depth: int = DEFAULT_MAX_DEPTH) -> Optional[list[FieldInfo]]:
+    fields = SchemaProfile(max_depth).observe_many(sample_docs).fields()
+    return build_field_infos(fields)
+
+def build_field_infos(fields: list[dict[str, Any]]) -> Optional[list[FieldInfo]]:
+    if not fields:
+        return None
+    return [FieldInfo(**field) for field in fields]
+
+def _schema_fields(db, database: str, collection_name: str, sample_size: int, max_depth: int,
+                   profile_store: Optional[SchemaProfileStore]) -> list[dict[str, Any]]:
+    if profile_store is None:
+        return infer_schema(db[collection_name], sample_size, max_depth)
+    fields = profile_store.fields(database, collection_name)
+    if fields is None:
+        profile_store.put(database, collection_name, profile_sample(db[collection_name], sample_size, max_depth))
+        profile_store.save()
+        fields = profile_store.fields(database, collection_name)
+    return fields
+
+def _describe_one(db, database: str, collection_name: str, exists: bool, stats_result: Optional[dict[str, Any]],
+                  indexes: Optional[list[dict[str, Any]]], sample_size: int, max_depth: int,
+                  profile_store: Optional[SchemaProfileStore]) -> CollectionDescription:
+    try:
+        if not exists:
+            return CollectionDescription(collection_name=collection_name, exists=False)
+
+        stats = build_collection_stats(stats_result) if stats_result is not None else None
+        schema_sample = None
+
+        try:
+            schema_sample = build_field_infos(
+                _schema_fields(db, database, collection_name, sample_size, max_depth, profile_store)
+            )
+        except Exception as e:
+            logger.warning(f"Could not analyze schema for {collection_name}: {e}")
+
+        return CollectionDescription(
+            collection_name=collection_name,
+            exists=True,
+            stats=stats,
+            indexes=indexes,
+            schema_sample=schema_sample
+        )
+
+    except Exception as e:
+        logger.error(f"Error processing collection {collection_name}: {e}")
+        return CollectionDescription(collection_name=collection_name, exists=False)
+
+def describe_collection(config: CustomAddonConfig, connection, collections: list[str] = None,
+                        cache: Optional[MetadataCache] = None, max_concurrency: int = 1,
+                        profile_store: Optional[SchemaProfileStore] = None) -> ActionResponse:
+    """
+    Describe each requested collection (stats, indexes and a sampled schema). Existence is
+    checked with one filtered listCollections, stats and indexes for all collections come
+    from a single batched $collStats/$indexStats aggregation, and the schema of each
+    collection is inferred server-side over a $sample of config.schemaSampleSize documents.
+    When a profile_store is given, its persisted (change-stream maintained) profile is
+    returned instead, and a missing profile is built once from a streamed sample.
+    With max_concurrency > 1 the schema inference calls run in parallel on a bounded
+    thread pool sharing the connection; results keep the order of the requested names.
+    """
     logger.debug("MongoDB rooms package - Describe collection action executing...")
-    logger.debug(f"Config: {config}")
-    logger.debug(f"Collection names: {collections}")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Collection names: {}", lambda: summarize(collections))
 
     if not collections:
         tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
@@ -63,93 +151,27 @@ def describe_collection(config: CustomAddonConfig, connection, collections: list
             return ActionResponse(output=output, tokens=tokens, message=message, code=code)
 
         db = connection[config.database]
-        existing_collections = db.list_collection_names()
-
-        collection_descriptions = []
-
-        for collection_name in collections:
-            try:
-                exists = collection_name in existing_collections
-
-                if not exists:
-                    collection_descriptions.append(CollectionDescription(
-                        collection_name=collection_name,
-                        exists=False
-                    ))
-                    continue
-
-                collection = db[collection_name]
-                stats = None
-                indexes = None
-                schema_sample = None
-
-                try:
-                    stats_result = db.command("collStats", collection_name)
-                    stats = CollectionStats(
-                        count=stats_result.get("count", 0),
-                        size=stats_result.get("size", 0),
-                        avg_obj_size=stats_result.get("avgObjSize"),
-                        storage_size=stats_result.get("storageSize", 0),
-                        indexes=stats_result.get("nindexes", 0),
-                        total_index_size=stats_result.get("totalIndexSize", 0)
-                    )
-                except Exception as e:
-                    logger.warning(f"Could not retrieve stats for {collection_name}: {e}")
-
-                try:
-                    indexes = list(collection.list_indexes())
-                except Exception as e:
-                    logger.warning(f"Could not retrieve indexes for {collection_name}: {e}")
-
-                try:
-                    sample_docs = list(collection.aggregate([
-                        {"$sample": {"size": 10}}
-                    ]))
-
-                    if sample_docs:
-                        field_analysis = {}
-                        for doc in sample_docs:
-                            for field, value in doc.items():
-                                if field not in field_analysis:
-                                    field_analysis[field] = {
-                                        "types": set(),
-                                        "null_count": 0,
-                                        "sample_values": []
-                                    }
-
-                                if value is None:
-                                    field_analysis[field]["null_count"] += 1
-                                else:
-                                    field_analysis[field]["types"].add(type(value).__name__)
-                                    if len(field_analysis[field]["sample_values"]) < 3:
-                                        field_analysis[field]["sample_values"].append(value)
-
-                        schema_sample = [
-                            FieldInfo(
-                                field_name=field,
-                                data_types=list(info["types"]),
-                                null_count=info["null_count"],
-                                sample_values=info["sample_values"]
-                            )
-                            for field, info in field_analysis.items()
-                        ]
-                except Exception as e:
-                    logger.warning(f"Could not analyze schema for {collection_name}: {e}")
-
-                collection_descriptions.append(CollectionDescription(
-                    collection_name=collection_name,
-                    exists=True,
-                    stats=stats,
-                    indexes=indexes,
-                    schema_sample=schema_sample
-                ))
-
-            except Exception as e:
-                logger.error(f"Error processing collection {collection_name}: {e}")
-                collection_descriptions.append(CollectionDescription(
-                    collection_name=collection_name,
-                    exists=False
-                ))
+        existing = set(cached(
+            cache, (config.database, None, ("collection_names", frozenset(collections))),
+            existing_collections, db, collections
+        ))
+        present = [name for name in collections if name in existing]
+        stats, indexes = load_collection_metadata(db, config.database, present, cache)
+        sample_size = config.schemaSampleSize or DEFAULT_SAMPLE_SIZE
+        max_depth = config.schemaMaxDepth if config.schemaMaxDepth is not None else DEFAULT_MAX_DEPTH
+
+        def describe_one(name: str) -> CollectionDescription:
+            return _describe_one(
+                db, config.database, name, name in existing, stats.get(name), indexes.get(name),
+                sample_size, max_depth, profile_store
+            )
+
+        workers = max(1, min(max_concurrency or 1, len(collections)))
+        if workers == 1:
+            collection_descriptions = [describe_one(name) for name in collections]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mongodb-describe") as executor:
+                collection_descriptions = list(executor.map(describe_one, collections))
 
         tokens = TokensSchema(stepAmount=1500 * len(collections), totalCurrentAmount=16236 + (1500 * len(collections)))
         message = f"Described {len(collections)} collections successfully"
@@ -0,0 +1,82 @@
+from typing import Optional, Union
+
+from loguru import logger
+from pydantic import BaseModel
+from pymongo.errors import OperationFailure
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+INDEX_NOT_FOUND = 27
+
+
+class ActionInput(BaseModel):
+    collection: str
+    name: Optional[str] = None
+    keys: Optional[dict[str, Union[int, str]]] = None
+
+class ActionOutput(OutputBase):
+    collection_name: str
+    index: Optional[str] = None
+    dropped: bool
+
+def drop_index(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+    logger.debug("MongoDB rooms package - Drop index action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
+
+    index = action_input.name
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            output = ActionOutput(collection_name=action_input.collection, index=index, dropped=False)
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        if (action_input.name is None) == (action_input.keys is None):
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = "Exactly one of 'name' or 'keys' must be provided"
+            code = 400
+            output = ActionOutput(collection_name=action_input.collection, index=index, dropped=False)
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        if action_input.name in ("_id_", "*"):
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = f"Refusing to drop index '{action_input.name}'"
+            code = 400
+            output = ActionOutput(collection_name=action_input.collection, index=index, dropped=False)
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        db = connection[config.database]
+        collection = db[action_input.collection]
+        target = action_input.name if action_input.name is not None else list(action_input.keys.items())
+        if index is None:
+            index = "_".join(f"{field}_{direction}" for field, direction in action_input.keys.items())
+
+        try:
+            collection.drop_index(target)
+        except OperationFailure as e:
+            if e.code != INDEX_NOT_FOUND:
+                raise
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = f"Index '{index}' not found on collection '{action_input.collection}'"
+            code = 404
+            output = ActionOutput(collection_name=action_input.collection, index=index, dropped=False)
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        tokens = TokensSchema(stepAmount=1000, totalCurrentAmount=17236)
+        message = f"Successfully dropped index '{index}' from collection '{action_input.collection}'"
+        code = 200
+        output = ActionOutput(collection_name=action_input.collection, index=index, dropped=True)
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error dropping index: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error dropping index: {str(e)}"
+        code = 500
+        output = ActionOutput(collection_name=action_input.collection, index=index, dropped=False)
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
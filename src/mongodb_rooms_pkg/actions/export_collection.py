@@ -0,0 +1,136 @@
+from typing import Any, Literal, Optional
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.storage.export import DocumentExporter, export_query
+from mongodb_rooms_pkg.storage.writers import MissingDependencyError, check_dependencies
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+
+class ActionInput(BaseModel):
+    collection: str
+    directory: str
+    format: Literal["ndjson", "bson", "parquet"] = "ndjson"
+    compression: Optional[Literal["gzip", "zstd", "snappy"]] = None
+    filter: Optional[dict[str, Any]] = None
+    projection: Optional[dict[str, Any]] = None
+    sort: Optional[dict[str, int]] = None
+    limit: Optional[int] = Field(None, ge=0)
+    basename: Optional[str] = None
+    max_documents_per_file: Optional[int] = Field(None, gt=0)
+    max_bytes_per_file: Optional[int] = Field(None, gt=0)
+    json_mode: Literal["relaxed", "canonical"] = "relaxed"
+    row_group_size: int = Field(10000, gt=0)
+    batch_size: int = Field(1000, gt=0)
+
+class ExportedFile(BaseModel):
+    path: str
+    documents: int
+    bytes: int
+    dropped_fields: list[str] = []
+
+class ActionOutput(OutputBase):
+    collection_name: str
+    format: str
+    files: list[ExportedFile]
+    document_count: int
+    bytes_written: int
+    dropped_field_count: int = 0
+
+def export_collection(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+    """
+    Stream a collection, or the result of a query, to local NDJSON, BSON or Parquet files
+    in constant memory, optionally compressed and split across several files.
+    """
+    logger.debug("MongoDB rooms package - Export collection action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
+
+    exporter = None
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                format=action_input.format,
+                files=[],
+                document_count=0,
+                bytes_written=0
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        try:
+            check_dependencies(action_input.format, action_input.compression)
+            exporter = DocumentExporter(
+                action_input.directory,
+                action_input.basename or action_input.collection,
+                format=action_input.format,
+                compression=action_input.compression,
+                max_documents_per_file=action_input.max_documents_per_file,
+                max_bytes_per_file=action_input.max_bytes_per_file,
+                json_mode=action_input.json_mode,
+                row_group_size=action_input.row_group_size
+            )
+        except (ValueError, MissingDependencyError) as e:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = str(e)
+            code = 400
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                format=action_input.format,
+                files=[],
+                document_count=0,
+                bytes_written=0
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        db = connection[config.database]
+        collection = db[action_input.collection]
+        export_query(
+            collection,
+            exporter,
+            filter=action_input.filter,
+            projection=action_input.projection,
+            sort=action_input.sort,
+            limit=action_input.limit,
+            batch_size=action_input.batch_size
+        )
+
+        tokens = TokensSchema(stepAmount=1000, totalCurrentAmount=17236)
+        message = f"Exported {exporter.document_count} document(s) from collection '{action_input.collection}' to {len(exporter.files)} {action_input.format} file(s)"
+        dropped_fields = exporter.dropped_fields
+        if dropped_fields:
+            message += f"; {len(dropped_fields)} field(s) missing from the Parquet schema were dropped"
+        code = 200
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            format=action_input.format,
+            files=exporter.files,
+            document_count=exporter.document_count,
+            bytes_written=exporter.bytes_written,
+            dropped_field_count=len(dropped_fields)
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error exporting collection: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error exporting collection: {str(e)}"
+        code = 500
+        # Files completed before the failure are kept and reported.
+        files = exporter.files if exporter is not None else []
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            format=action_input.format,
+            files=files,
+            document_count=sum(file["documents"] for file in files),
+            bytes_written=sum(file["bytes"] for file in files),
+            dropped_field_count=len(exporter.dropped_fields) if exporter is not None else 0
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
@@ -0,0 +1,84 @@
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from loguru import logger
+from pydantic import BaseModel, Field, SkipValidation
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.utils.batching import iter_cursor_batches
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+
+class ActionInput(BaseModel):
+    collection: str
+    filter: Optional[dict[str, Any]] = None
+    projection: Optional[dict[str, Any]] = None
+    sort: Optional[dict[str, int]] = None
+    limit: Optional[int] = Field(None, ge=0)
+    batch_size: int = Field(100, gt=0)
+
+class ActionOutput(OutputBase):
+    collection_name: str
+    batch_size: int
+    # Not validated: pydantic would wrap the generator in an iterator without close().
+    pages: SkipValidation[Iterable[list[Any]]]
+
+def find(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+    """
+    Query a collection and return the matching documents as a lazy iterator of pages.
+    Documents are pulled from the server-side cursor one batch at a time, so iterate
+    `output.pages` to consume them; the cursor is closed once the iterator is exhausted,
+    or when `output.pages.close()` is called to stop early.
+    """
+    logger.debug("MongoDB rooms package - Find action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
+
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                batch_size=action_input.batch_size,
+                pages=[]
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        db = connection[config.database]
+        collection = db[action_input.collection]
+
+        cursor = collection.find(
+            action_input.filter or {},
+            projection=action_input.projection,
+            batch_size=action_input.batch_size
+        )
+        if action_input.sort:
+            cursor = cursor.sort(list(action_input.sort.items()))
+        if action_input.limit:
+            cursor = cursor.limit(action_input.limit)
+
+        tokens = TokensSchema(stepAmount=800, totalCurrentAmount=17036)
+        message = f"Opened cursor on collection '{action_input.collection}' (batch size {action_input.batch_size})"
+        code = 200
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            batch_size=action_input.batch_size,
+            pages=iter_cursor_batches(cursor, action_input.batch_size)
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error finding documents: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error finding documents: {str(e)}"
+        code = 500
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            batch_size=action_input.batch_size,
+            pages=[]
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
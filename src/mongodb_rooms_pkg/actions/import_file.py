@@ -0,0 +1,153 @@
+import os
+from typing import Literal, Optional
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.storage.importer import FileImporter
+from mongodb_rooms_pkg.storage.writers import MissingDependencyError
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from .base import ActionResponse, OutputBase, TokensSchema
+from .insert_chunked import ChunkFailure
+
+
+class ActionInput(BaseModel):
+    collection: str
+    path: str
+    format: Optional[Literal["ndjson", "csv", "bson"]] = None
+    compression: Optional[Literal["gzip", "zstd"]] = None
+    chunk_size: int = Field(1000, gt=0)
+    write_workers: int = Field(4, gt=0)
+    upsert_keys: Optional[list[str]] = None
+    csv_fields: Optional[list[str]] = None
+    csv_types: Optional[dict[str, Literal["string", "int", "float", "bool", "date", "json"]]] = None
+    csv_delimiter: str = Field(",", min_length=1, max_length=1)
+    ignore_blanks: bool = False
+    max_rejected_samples: int = Field(100, ge=0)
+
+class RejectedRecord(BaseModel):
+    record: int
+    error: str
+
+class ActionOutput(OutputBase):
+    collection_name: str
+    records_read: int
+    written_count: int
+    rejected_count: int
+    rejected: list[RejectedRecord]
+    failed_count: int
+    failed_chunks: list[ChunkFailure]
+    bytes_read: int
+    elapsed_seconds: float
+    documents_per_second: float
+    megabytes_per_second: float
+
+def _empty_output(action_input: ActionInput) -> ActionOutput:
+    return ActionOutput(
+        collection_name=action_input.collection,
+        records_read=0,
+        written_count=0,
+        rejected_count=0,
+        rejected=[],
+        failed_count=0,
+        failed_chunks=[],
+        bytes_read=0,
+        elapsed_seconds=0.0,
+        documents_per_second=0.0,
+        megabytes_per_second=0.0
+    )
+
+def import_file(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+    """
+    Bulk-load a local NDJSON, CSV or BSON file (optionally gzip/zstd compressed) into a
+    collection without materializing it: records are streamed, parsed in batches and
+    written in concurrent chunks, with rejected rows and throughput reported. Invalid
+    arguments and unusable files are a 400; a file that fails part way through reports what
+    was written before the failure.
+    """
+    logger.debug("MongoDB rooms package - Import file action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
+
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            return ActionResponse(output=_empty_output(action_input), tokens=tokens, message=message, code=code)
+
+        db = connection[config.database]
+        collection = db[action_input.collection]
+        try:
+            if not os.path.isfile(action_input.path):
+                raise ValueError(f"File '{action_input.path}' does not exist")
+            importer = FileImporter(
+                collection,
+                action_input.path,
+                format=action_input.format,
+                compression=action_input.compression,
+                chunk_size=action_input.chunk_size,
+                write_workers=action_input.write_workers,
+                upsert_keys=action_input.upsert_keys,
+                csv_fields=action_input.csv_fields,
+                csv_types=action_input.csv_types,
+                csv_delimiter=action_input.csv_delimiter,
+                ignore_blanks=action_input.ignore_blanks,
+                max_rejected_samples=action_input.max_rejected_samples
+            )
+        except (ValueError, MissingDependencyError) as e:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = str(e)
+            code = 400
+            return ActionResponse(output=_empty_output(action_input), tokens=tokens, message=message, code=code)
+
+        report = importer.run()
+
+        if report["error"] and not report["written_count"] and not report["failed_count"]:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = f"Import of '{action_input.path}' failed before any document was written: {report['error']}"
+            code = 400
+        elif report["error"]:
+            tokens = TokensSchema(stepAmount=1200, totalCurrentAmount=17436)
+            message = (f"Import of '{action_input.path}' stopped after writing {report['written_count']} document(s) into "
+                       f"collection '{action_input.collection}': {report['error']}")
+            code = 207
+        elif report["records_read"] == 0:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = f"No records found in '{action_input.path}'"
+            code = 400
+        elif report["rejected_count"] or report["failed_chunks"]:
+            tokens = TokensSchema(stepAmount=1200, totalCurrentAmount=17436)
+            message = (f"Imported {report['written_count']} document(s) into collection '{action_input.collection}' with "
+                       f"{report['rejected_count']} rejected record(s) and {report['failed_count']} failed document(s)")
+            code = 207
+        else:
+            tokens = TokensSchema(stepAmount=1200, totalCurrentAmount=17436)
+            message = (f"Successfully imported {report['written_count']} document(s) into collection "
+                       f"'{action_input.collection}' ({report['documents_per_second']} documents/s)")
+            code = 200
+
+        output = ActionOutput.from_result(
+            len(report["rejected"]) + len(report["failed_chunks"]),
+            collection_name=action_input.collection,
+            records_read=report["records_read"],
+            written_count=report["written_count"],
+            rejected_count=report["rejected_count"],
+            rejected=[RejectedRecord(**rejected) for rejected in report["rejected"]],
+            failed_count=report["failed_count"],
+            failed_chunks=report["failed_chunks"],
+            bytes_read=report["bytes_read"],
+            elapsed_seconds=report["elapsed_seconds"],
+            documents_per_second=report["documents_per_second"],
+            megabytes_per_second=report["megabytes_per_second"]
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error importing file: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error importing file: {str(e)}"
+        code = 500
+        return ActionResponse(output=_empty_output(action_input), tokens=tokens, message=message, code=code)
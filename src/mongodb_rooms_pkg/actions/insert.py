@@ -1,9 +1,12 @@
 from typing import Any, Optional
 
+from bson.raw_bson import RawBSONDocument
 from loguru import logger
 from pydantic import BaseModel
 
 from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.concerns import ConcernResolver, UnknownConcernProfileError, resolve_collection
+from mongodb_rooms_pkg.utils.summary import summarize
 
 from .base import ActionResponse, OutputBase, TokensSchema
 
@@ -12,6 +15,8 @@ class ActionInput(BaseModel):
     collection: str
     document: Optional[dict[str, Any]] = None
     documents: Optional[list[dict[str, Any]]] = None
+    raw_documents: Optional[list[bytes]] = None
+    concern_profile: Optional[str] = None
 
 class ActionOutput(OutputBase):
     collection_name: str
@@ -19,10 +24,11 @@ class ActionOutput(OutputBase):
     inserted_ids: list[Any]
     acknowledged: bool
 
-def insert(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+def insert(config: CustomAddonConfig, connection, action_input: ActionInput,
+           resolver: Optional[ConcernResolver] = None) -> ActionResponse:
     logger.debug("MongoDB rooms package - Insert action executing...")
-    logger.debug(f"Config: {config}")
-    logger.debug(f"Input: {action_input}")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
 
     try:
         if not connection:
@@ -37,9 +43,10 @@ def insert(config: CustomAddonConfig, connection, action_input: ActionInput) ->
             )
             return ActionResponse(output=output, tokens=tokens, message=message, code=code)
 
-        if not action_input.document and not action_input.documents:
+        provided = sum(bool(value) for value in (action_input.document, action_input.documents, action_input.raw_documents))
+        if not provided:
             tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
-            message = "Either 'document' or 'documents' must be provided"
+            message = "Either 'document' or 'documents' must be provided (or 'raw_documents' with pre-encoded BSON)"
             code = 400
             output = ActionOutput(
                 collection_name=action_input.collection,
@@ -49,9 +56,12 @@ def insert(config: CustomAddonConfig, connection, action_input: ActionInput) ->
             )
             return ActionResponse(output=output, tokens=tokens, message=message, code=code)
 
-        if action_input.document and action_input.documents:
+        if provided > 1:
             tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
-            message = "Cannot provide both 'document' and 'documents'. Use one or the other"
+            if action_input.raw_documents:
+                message = "Cannot combine 'raw_documents' with 'document' or 'documents'"
+            else:
+                message = "Cannot provide both 'document' and 'documents'. Use one or the other"
             code = 400
             output = ActionOutput(
                 collection_name=action_input.collection,
@@ -62,12 +72,31 @@ def insert(config: CustomAddonConfig, connection, action_input: ActionInput) ->
             return ActionResponse(output=output, tokens=tokens, message=message, code=code)
 
         db = connection[config.database]
-        collection = db[action_input.collection]
+        try:
+            collection = resolve_collection(config, db, action_input.collection, action_input.concern_profile, resolver)
+        except UnknownConcernProfileError as e:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = str(e)
+            code = 400
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                inserted_count=0,
+                inserted_ids=[],
+                acknowledged=False
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
 
         if action_input.document:
             result = collection.insert_one(action_input.document)
             inserted_ids = [result.inserted_id]
             inserted_count = 1
+        elif action_input.raw_documents:
+            # Pre-encoded BSON is sent as-is: RawBSONDocument skips the dict encode step.
+            raw_documents = [RawBSONDocument(raw) for raw in action_input.raw_documents]
+            result = collection.insert_many(raw_documents)
+            # pymongo leaves RawBSONDocuments out of inserted_ids: count what was sent instead.
+            inserted_ids = [document["_id"] for document in raw_documents if "_id" in document]
+            inserted_count = len(raw_documents)
         else:
             result = collection.insert_many(action_input.documents)
             inserted_ids = result.inserted_ids
@@ -76,7 +105,8 @@ def insert(config: CustomAddonConfig, connection, action_input: ActionInput) ->
         tokens = TokensSchema(stepAmount=1200, totalCurrentAmount=17436)
         message = f"Successfully inserted {inserted_count} document(s) into collection '{action_input.collection}'"
         code = 200
-        output = ActionOutput(
+        output = ActionOutput.from_result(
+            len(inserted_ids),
             collection_name=action_input.collection,
             inserted_count=inserted_count,
             inserted_ids=inserted_ids,
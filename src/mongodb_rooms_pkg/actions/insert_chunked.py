@@ -0,0 +1,176 @@
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Optional
+
+from loguru import logger
+from pydantic import BaseModel, Field
+from pymongo.errors import BulkWriteError
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.utils.batching import iter_batches
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+
+class ActionInput(BaseModel):
+    collection: str
+    documents: Iterable[Any]
+    chunk_size: int = Field(1000, gt=0)
+    max_workers: int = Field(4, gt=0)
+
+class ChunkFailure(BaseModel):
+    chunk_index: int
+    document_count: int
+    inserted_count: int
+    errors: list[str]
+    # Reading the source failed here: the documents after the last chunk read were not inserted.
+    source_error: bool = False
+
+class ActionOutput(OutputBase):
+    collection_name: str
+    inserted_count: int
+    chunk_count: int
+    failed_chunks: list[ChunkFailure]
+    acknowledged: bool
+
+def _insert_chunk(collection, chunk_index: int, chunk: list[Any]) -> tuple[int, Optional[ChunkFailure], bool]:
+    try:
+        result = collection.insert_many(chunk, ordered=False)
+        # Not len(inserted_ids): pymongo leaves RawBSONDocuments out of it.
+        return len(chunk), None, bool(result.acknowledged)
+    except BulkWriteError as e:
+        inserted = e.details.get("nInserted", 0)
+        errors = [error.get("errmsg", str(error)) for error in e.details.get("writeErrors", [])]
+        errors += [error.get("errmsg", str(error)) for error in e.details.get("writeConcernErrors", [])]
+        return inserted, ChunkFailure(chunk_index=chunk_index, document_count=len(chunk), inserted_count=inserted, errors=errors), True
+    except Exception as e:
+        return 0, ChunkFailure(chunk_index=chunk_index, document_count=len(chunk), inserted_count=0, errors=[str(e)]), False
+
+def insert_in_chunks(collection, documents: Iterable[Any], chunk_size: int, max_workers: int,
+                     write_chunk: Callable[[Any, int, list[Any]], tuple[int, Optional[ChunkFailure], bool]] = _insert_chunk
+                     ) -> tuple[int, int, list[ChunkFailure], bool]:
+    """
+    Insert documents with unordered insert_many calls of chunk_size documents, running up to
+    max_workers chunks concurrently. The source iterable is consumed lazily: at most
+    2 * max_workers chunks are held in memory, which applies back-pressure on generators.
+    write_chunk(collection, chunk_index, chunk) replaces insert_many for other write
+    strategies and returns (written_count, failure or None, acknowledged).
+    If the source raises, the chunks already read are still written and the error is
+    reported as a last failure with source_error set.
+    Returns (inserted_count, chunk_count, failed_chunks, acknowledged), acknowledged being
+    whether the server acknowledged the writes (False with w=0 or when nothing was written).
+    """
+    inserted_count = 0
+    chunk_count = 0
+    failures = []
+    acknowledged = False
+    max_pending = max_workers * 2
+
+    def collect(future) -> None:
+        nonlocal inserted_count, acknowledged
+        inserted, failure, chunk_acknowledged = future.result()
+        inserted_count += inserted
+        acknowledged = acknowledged or chunk_acknowledged
+        if failure:
+            failures.append(failure)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mongodb-insert") as executor:
+        pending = set()
+        chunks = iter_batches(documents, chunk_size)
+        while True:
+            try:
+                chunk = next(chunks, None)
+            except Exception as e:
+                logger.error(f"Reading documents failed after {chunk_count} chunk(s): {e}")
+                failures.append(ChunkFailure(chunk_index=chunk_count, document_count=0, inserted_count=0,
+                                             errors=[f"Reading documents failed: {e}"], source_error=True))
+                break
+            if chunk is None:
+                break
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future)
+            pending.add(executor.submit(write_chunk, collection, chunk_count, chunk))
+            chunk_count += 1
+        for future in pending:
+            collect(future)
+
+    failures.sort(key=lambda failure: failure.chunk_index)
+    return inserted_count, chunk_count, failures, acknowledged
+
+def insert_chunked(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+    logger.debug("MongoDB rooms package - Chunked insert action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.debug(
+        "Input: collection={}, chunk_size={}, max_workers={}",
+        action_input.collection, action_input.chunk_size, action_input.max_workers
+    )
+
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                inserted_count=0,
+                chunk_count=0,
+                failed_chunks=[],
+                acknowledged=False
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        db = connection[config.database]
+        collection = db[action_input.collection]
+
+        inserted_count, chunk_count, failures, acknowledged = insert_in_chunks(
+            collection,
+            action_input.documents,
+            action_input.chunk_size,
+            action_input.max_workers
+        )
+
+        source_error = next((failure for failure in failures if failure.source_error), None)
+        if source_error:
+            tokens = TokensSchema(stepAmount=1200, totalCurrentAmount=17436)
+            message = (f"Reading documents failed after inserting {inserted_count} document(s) into collection "
+                       f"'{action_input.collection}' in {chunk_count} chunk(s): {source_error.errors[0]}")
+            code = 207 if inserted_count else 500
+        elif chunk_count == 0:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = "No documents provided"
+            code = 400
+        elif failures:
+            tokens = TokensSchema(stepAmount=1200, totalCurrentAmount=17436)
+            message = f"Inserted {inserted_count} document(s) into collection '{action_input.collection}' with {len(failures)} failed chunk(s) out of {chunk_count}"
+            code = 207
+        else:
+            tokens = TokensSchema(stepAmount=1200, totalCurrentAmount=17436)
+            message = f"Successfully inserted {inserted_count} document(s) into collection '{action_input.collection}' in {chunk_count} chunk(s)"
+            code = 200
+
+        output = ActionOutput.from_result(
+            len(failures),
+            collection_name=action_input.collection,
+            inserted_count=inserted_count,
+            chunk_count=chunk_count,
+            failed_chunks=failures,
+            acknowledged=acknowledged
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error inserting document chunks: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error inserting document chunks: {str(e)}"
+        code = 500
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            inserted_count=0,
+            chunk_count=0,
+            failed_chunks=[],
+            acknowledged=False
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
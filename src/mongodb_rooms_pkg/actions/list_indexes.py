@@ -0,0 +1,48 @@
+from typing import Any
+
+from loguru import logger
+from pydantic import BaseModel
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.indexes import normalize_index
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+
+class ActionInput(BaseModel):
+    collection: str
+
+class ActionOutput(OutputBase):
+    collection_name: str
+    indexes: list[dict[str, Any]]
+
+def list_indexes(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+    logger.debug("MongoDB rooms package - List indexes action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
+
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            output = ActionOutput(collection_name=action_input.collection, indexes=[])
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        db = connection[config.database]
+        indexes = [normalize_index(index) for index in db[action_input.collection].list_indexes()]
+
+        tokens = TokensSchema(stepAmount=1000, totalCurrentAmount=17236)
+        message = f"Found {len(indexes)} index(es) on collection '{action_input.collection}'"
+        code = 200
+        output = ActionOutput(collection_name=action_input.collection, indexes=indexes)
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error listing indexes: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error listing indexes: {str(e)}"
+        code = 500
+        output = ActionOutput(collection_name=action_input.collection, indexes=[])
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
@@ -0,0 +1,233 @@
+import base64
+import binascii
+import hashlib
+from typing import Any, Literal, Optional
+
+import bson
+from bson import json_util
+from bson.raw_bson import RawBSONDocument
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.schema_inference import bson_type_name
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+_MISSING = object()
+# BSON sort order of the type brackets after null (arrays and MinKey/MaxKey are not handled).
+SORT_BRACKETS = ("number", "string", "object", "binData", "objectId", "bool", "date", "timestamp", "regex")
+NUMBER_TYPES = ("int", "long", "double", "decimal")
+
+
+class ActionInput(BaseModel):
+    collection: str
+    filter: Optional[dict[str, Any]] = None
+    projection: Optional[dict[str, Any]] = None
+    sort_key: str = "_id"
+    direction: Literal[1, -1] = 1
+    page_size: int = Field(100, gt=0, le=10000)
+    continuation_token: Optional[str] = None
+
+class ActionOutput(OutputBase):
+    collection_name: str
+    documents: list[Any]
+    page_size: int
+    has_more: bool
+    next_token: Optional[str] = None
+
+
+class InvalidContinuationToken(ValueError):
+    pass
+
+
+def _fingerprint(action_input: ActionInput) -> str:
+    query = json_util.dumps([action_input.collection, action_input.filter or {}, action_input.sort_key, action_input.direction],
+                            sort_keys=True)
+    return hashlib.sha1(query.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_token(action_input: ActionInput, value: Any, last_id: Any) -> str:
+    payload = bson.encode({"q": _fingerprint(action_input), "v": value, "id": last_id})
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def decode_token(action_input: ActionInput) -> tuple[Any, Any]:
+    """(last sort value, last _id) from the continuation token; rejects tokens issued for another query."""
+    try:
+        payload = bson.decode(base64.urlsafe_b64decode(action_input.continuation_token.encode("ascii")))
+    except (binascii.Error, bson.errors.InvalidBSON, ValueError) as e:
+        raise InvalidContinuationToken(f"Malformed continuation token: {e}") from e
+    if payload.get("q") != _fingerprint(action_input) or "v" not in payload or "id" not in payload:
+        raise InvalidContinuationToken("Continuation token does not belong to this collection, filter and sort")
+    return payload["v"], payload["id"]
+
+
+def sort_bracket(value: Any) -> str:
+    """$type alias of the BSON sort-order bracket value belongs to."""
+    type_name = bson_type_name(value)
+    return "number" if type_name in NUMBER_TYPES else type_name
+
+
+def keyset_filter(action_input: ActionInput, value: Any, last_id: Any) -> dict[str, Any]:
+    """
+    Filter selecting the documents strictly after (value, last_id) in sort order. $gt and
+    $lt only match values of the operand's type bracket, so the brackets sorting after
+    value's are added with $type, and null / missing sort keys (which sort before every
+    other type) explicitly: after the last page ascending, or at the end descending.
+    """
+    key = action_input.sort_key
+    op = "$gt" if action_input.direction == 1 else "$lt"
+    if key == "_id":
+        after = {"_id": {op: last_id}}
+    elif value is None:
+        # {key: None} also matches documents without the field, which sort as null.
+        same = {key: None, "_id": {op: last_id}}
+        after = {"$or": [same, {key: {"$ne": None}}]} if action_input.direction == 1 else same
+    else:
+        clauses = [{key: {op: value}}, {key: value, "_id": {op: last_id}}]
+        bracket = sort_bracket(value)
+        if bracket in SORT_BRACKETS:
+            index = SORT_BRACKETS.index(bracket)
+            following = SORT_BRACKETS[index + 1:] if action_input.direction == 1 else SORT_BRACKETS[:index]
+            if following:
+                clauses.append({key: {"$type": list(following)}})
+        if action_input.direction == -1:
+            clauses.append({key: None})
+        after = {"$or": clauses}
+    return {"$and": [action_input.filter, after]} if action_input.filter else after
+
+
+def keyset_projection(projection: Optional[dict[str, Any]], sort_key: str) -> tuple[Optional[dict[str, Any]], list[str]]:
+    """
+    Projection that keeps _id and the sort key (needed for the token) plus the fields to
+    strip from returned documents because the caller did not ask for them.
+    """
+    if not projection:
+        return projection, []
+    projection = dict(projection)
+    inclusive = any(value not in (0, False) for key, value in projection.items() if key != "_id")
+    strip = []
+    for key in dict.fromkeys(("_id", sort_key)):
+        value = projection.get(key, _MISSING)
+        if value in (0, False):
+            strip.append(key)
+            del projection[key]
+            if inclusive:
+                projection[key] = 1
+        elif value is _MISSING and inclusive and key != "_id":
+            strip.append(key)
+            projection[key] = 1
+    return projection, strip
+
+
+def strip_fields(document: Any, keys: list[str]) -> Any:
+    """
+    document without the given top-level keys. RawBSONDocuments (rawBson clients) are
+    read-only, so they are re-encoded without those keys; nested documents stay raw.
+    """
+    if isinstance(document, RawBSONDocument):
+        if not any(key in document for key in keys):
+            return document
+        return RawBSONDocument(bson.encode({key: value for key, value in document.items() if key not in keys}))
+    if isinstance(document, dict):
+        for key in keys:
+            document.pop(key, None)
+    return document
+
+
+def get_path(document: Any, path: str) -> Any:
+    value = document
+    for part in path.split("."):
+        try:
+            value = value[part]
+        except (KeyError, TypeError, IndexError):
+            return None
+    return value
+
+
+def paginate(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+    """
+    Return one page of a collection in (sort_key, _id) order using keyset pagination.
+    The next page starts after the last returned key instead of skipping the previous
+    ones, so every page costs the same given an index on (sort_key, _id). Pass
+    `output.next_token` back as `continuation_token` to fetch the following page.
+    """
+    logger.debug("MongoDB rooms package - Paginate action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
+
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                documents=[],
+                page_size=action_input.page_size,
+                has_more=False
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        query = action_input.filter or {}
+        if action_input.continuation_token:
+            try:
+                value, last_id = decode_token(action_input)
+            except InvalidContinuationToken as e:
+                tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+                message = str(e)
+                code = 400
+                output = ActionOutput(
+                    collection_name=action_input.collection,
+                    documents=[],
+                    page_size=action_input.page_size,
+                    has_more=False
+                )
+                return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+            query = keyset_filter(action_input, value, last_id)
+
+        sort = [("_id", action_input.direction)]
+        if action_input.sort_key != "_id":
+            sort.insert(0, (action_input.sort_key, action_input.direction))
+        projection, strip = keyset_projection(action_input.projection, action_input.sort_key)
+
+        db = connection[config.database]
+        collection = db[action_input.collection]
+        # One extra document tells whether another page exists without a count.
+        documents = list(collection.find(query, projection=projection, sort=sort, limit=action_input.page_size + 1))
+
+        has_more = len(documents) > action_input.page_size
+        documents = documents[:action_input.page_size]
+        next_token = None
+        if has_more:
+            last = documents[-1]
+            next_token = encode_token(action_input, get_path(last, action_input.sort_key), last["_id"])
+        if strip:
+            documents = [strip_fields(document, strip) for document in documents]
+
+        tokens = TokensSchema(stepAmount=800, totalCurrentAmount=17036)
+        message = f"Fetched {len(documents)} document(s) from collection '{action_input.collection}'"
+        code = 200
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            documents=documents,
+            page_size=action_input.page_size,
+            has_more=has_more,
+            next_token=next_token
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error paginating documents: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error paginating documents: {str(e)}"
+        code = 500
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            documents=[],
+            page_size=action_input.page_size,
+            has_more=False
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
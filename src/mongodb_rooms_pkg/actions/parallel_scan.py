@@ -0,0 +1,93 @@
+from collections.abc import Iterable
+from typing import Any, Callable, Optional
+
+from loguru import logger
+from pydantic import BaseModel, Field, SkipValidation
+
+from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.partitioned_scan import partition_filters, scan_partitions, split_points
+from mongodb_rooms_pkg.utils.summary import summarize
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+
+class ActionInput(BaseModel):
+    collection: str
+    filter: Optional[dict[str, Any]] = None
+    projection: Optional[dict[str, Any]] = None
+    partitions: int = Field(8, gt=0, le=1000)
+    max_workers: int = Field(4, gt=0)
+    batch_size: int = Field(1000, gt=0)
+    sample_size: Optional[int] = Field(None, gt=0)
+    queue_size: Optional[int] = Field(None, gt=0)
+    progress: Optional[Callable[[dict[str, Any]], Any]] = None
+
+class ActionOutput(OutputBase):
+    collection_name: str
+    batch_size: int
+    partitions: list[dict[str, Any]]
+    # Not validated: pydantic would wrap the generator in an iterator without close().
+    pages: SkipValidation[Iterable[list[Any]]]
+
+def parallel_scan(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+    """
+    Read a whole collection (or the documents matching filter) through several cursors at
+    once. The _id space is split into ranges from a sampled $bucketAuto, and the ranges are
+    read concurrently by max_workers threads sharing the connection's client. Iterate
+    `output.pages` to receive document batches as they arrive, in no particular order, and
+    call `output.pages.close()` to stop the scan early.
+    """
+    logger.debug("MongoDB rooms package - Parallel scan action executing...")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
+
+    try:
+        if not connection:
+            tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+            message = "No database connection provided"
+            code = 500
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                batch_size=action_input.batch_size,
+                partitions=[],
+                pages=[]
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+        db = connection[config.database]
+        collection = db[action_input.collection]
+
+        partitions = partition_filters(split_points(collection, action_input.partitions, action_input.sample_size))
+
+        tokens = TokensSchema(stepAmount=800, totalCurrentAmount=17036)
+        message = f"Scanning collection '{action_input.collection}' in {len(partitions)} partition(s) with {action_input.max_workers} worker(s)"
+        code = 200
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            batch_size=action_input.batch_size,
+            partitions=partitions,
+            pages=scan_partitions(
+                collection,
+                partitions,
+                filter=action_input.filter,
+                projection=action_input.projection,
+                batch_size=action_input.batch_size,
+                max_workers=action_input.max_workers,
+                queue_size=action_input.queue_size,
+                progress=action_input.progress
+            )
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
+    except Exception as e:
+        logger.error(f"Error scanning collection: {e}")
+        tokens = TokensSchema(stepAmount=500, totalCurrentAmount=16236)
+        message = f"Error scanning collection: {str(e)}"
+        code = 500
+        output = ActionOutput(
+            collection_name=action_input.collection,
+            batch_size=action_input.batch_size,
+            partitions=[],
+            pages=[]
+        )
+        return ActionResponse(output=output, tokens=tokens, message=message, code=code)
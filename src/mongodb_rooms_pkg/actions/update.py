@@ -4,6 +4,8 @@ from loguru import logger
 from pydantic import BaseModel
 
 from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.concerns import ConcernResolver, UnknownConcernProfileError, resolve_collection
+from mongodb_rooms_pkg.utils.summary import summarize
 
 from .base import ActionResponse, OutputBase, TokensSchema
 
@@ -14,6 +16,7 @@ class ActionInput(BaseModel):
     update: dict[str, Any]
     update_many: Optional[bool] = False
     upsert: Optional[bool] = False
+    concern_profile: Optional[str] = None
 
 class ActionOutput(OutputBase):
     collection_name: str
@@ -22,10 +25,11 @@ class ActionOutput(OutputBase):
     upserted_id: Optional[Any] = None
     acknowledged: bool
 
-def update(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+def update(config: CustomAddonConfig, connection, action_input: ActionInput,
+           resolver: Optional[ConcernResolver] = None) -> ActionResponse:
     logger.debug("MongoDB rooms package - Update action executing...")
-    logger.debug(f"Config: {config}")
-    logger.debug(f"Input: {action_input}")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
 
     try:
         if not connection:
@@ -65,7 +69,19 @@ def update(config: CustomAddonConfig, connection, action_input: ActionInput) ->
             return ActionResponse(output=output, tokens=tokens, message=message, code=code)
 
         db = connection[config.database]
-        collection = db[action_input.collection]
+        try:
+            collection = resolve_collection(config, db, action_input.collection, action_input.concern_profile, resolver)
+        except UnknownConcernProfileError as e:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = str(e)
+            code = 400
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                matched_count=0,
+                modified_count=0,
+                acknowledged=False
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
 
         if action_input.update_many:
             result = collection.update_many(
@@ -82,6 +98,18 @@ def update(config: CustomAddonConfig, connection, action_input: ActionInput) ->
 
         operation_type = "many" if action_input.update_many else "one"
         tokens = TokensSchema(stepAmount=1100, totalCurrentAmount=17336)
+        if not result.acknowledged:
+            # w=0: the server reports nothing back, so there are no counts to return.
+            message = f"Sent update_{operation_type} to collection '{action_input.collection}' without acknowledgement"
+            code = 200
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                matched_count=0,
+                modified_count=0,
+                acknowledged=False
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
         message = f"Successfully updated {result.modified_count} document(s) in collection '{action_input.collection}' (update_{operation_type})"
         code = 200
         output = ActionOutput(
@@ -4,6 +4,8 @@ from loguru import logger
 from pydantic import BaseModel
 
 from mongodb_rooms_pkg.configuration import CustomAddonConfig
+from mongodb_rooms_pkg.services.concerns import ConcernResolver, UnknownConcernProfileError, resolve_collection
+from mongodb_rooms_pkg.utils.summary import summarize
 
 from .base import ActionResponse, OutputBase, TokensSchema
 
@@ -13,6 +15,7 @@ class ActionInput(BaseModel):
     filter: dict[str, Any]
     update: dict[str, Any]
     update_many: Optional[bool] = False
+    concern_profile: Optional[str] = None
 
 class ActionOutput(OutputBase):
     collection_name: str
@@ -22,10 +25,11 @@ class ActionOutput(OutputBase):
     acknowledged: bool
     operation_performed: str
 
-def upsert(config: CustomAddonConfig, connection, action_input: ActionInput) -> ActionResponse:
+def upsert(config: CustomAddonConfig, connection, action_input: ActionInput,
+           resolver: Optional[ConcernResolver] = None) -> ActionResponse:
     logger.debug("MongoDB rooms package - Upsert action executing...")
-    logger.debug(f"Config: {config}")
-    logger.debug(f"Input: {action_input}")
+    logger.opt(lazy=True).debug("Config: {}", lambda: summarize(config))
+    logger.opt(lazy=True).debug("Input: {}", lambda: summarize(action_input))
 
     try:
         if not connection:
@@ -68,7 +72,20 @@ def upsert(config: CustomAddonConfig, connection, action_input: ActionInput) ->
             return ActionResponse(output=output, tokens=tokens, message=message, code=code)
 
         db = connection[config.database]
-        collection = db[action_input.collection]
+        try:
+            collection = resolve_collection(config, db, action_input.collection, action_input.concern_profile, resolver)
+        except UnknownConcernProfileError as e:
+            tokens = TokensSchema(stepAmount=300, totalCurrentAmount=16536)
+            message = str(e)
+            code = 400
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                matched_count=0,
+                modified_count=0,
+                acknowledged=False,
+                operation_performed="none"
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
 
         if action_input.update_many:
             result = collection.update_many(
@@ -85,6 +102,20 @@ def upsert(config: CustomAddonConfig, connection, action_input: ActionInput) ->
             )
             operation_type = "update_one"
 
+        if not result.acknowledged:
+            # w=0: the server reports nothing back, so whether it inserted or updated is unknown.
+            tokens = TokensSchema(stepAmount=1100, totalCurrentAmount=17336)
+            message = f"Sent upsert to collection '{action_input.collection}' using {operation_type} without acknowledgement"
+            code = 200
+            output = ActionOutput(
+                collection_name=action_input.collection,
+                matched_count=0,
+                modified_count=0,
+                acknowledged=False,
+                operation_performed="unknown"
+            )
+            return ActionResponse(output=output, tokens=tokens, message=message, code=code)
+
         operation_performed = "insert" if result.upserted_id else "update"
 
         tokens = TokensSchema(stepAmount=1100, totalCurrentAmount=17336)
@@ -1,16 +1,78 @@
 import importlib
+from functools import cache, partial
 
 from loguru import logger
+from pymongo.errors import PyMongoError
 
-from mongodb_rooms_pkg.services.connection import build_uri, create_connection
+from mongodb_rooms_pkg.services.connection import ClientRegistry, ConnectionHealth, build_uri, create_connection
 
+from .actions.aggregate import aggregate
+from .actions.bulk_write import bulk_write
 from .actions.create_collection import create_collection
+from .actions.create_indexes import create_indexes
 from .actions.delete import delete
 from .actions.describe import describe
 from .actions.describe_collection import describe_collection
+from .actions.drop_index import drop_index
+from .actions.export_collection import export_collection
+from .actions.find import find
+from .actions.import_file import import_file
 from .actions.insert import insert
+from .actions.insert_chunked import insert_chunked
+from .actions.list_indexes import list_indexes
+from .actions.paginate import paginate
+from .actions.parallel_scan import parallel_scan
 from .actions.upsert import upsert
+from .services.change_streams import ChangeStreamSubscription, ResumeTokenStore
+from .services.concerns import ConcernResolver
 from .services.credentials import CredentialsRegistry
+from .services.index_advisor import IndexAdvisor
+from .services.metadata_cache import MetadataCache
+from .services.metrics import CommandMetricsListener, MetricsCollector, to_prometheus
+from .services.pool_telemetry import find_pool_telemetry, pool_telemetry_from_config
+from .services.schema_inference import DEFAULT_MAX_DEPTH, DEFAULT_SAMPLE_SIZE, profile_sample
+from .services.schema_store import SchemaProfileStore, SchemaProfileWatcher
+from .services.slow_op_profiler import slow_op_profiler_from_config
+from .utils.summary import summarize
+
+ADVISED_ACTIONS = ("update", "delete", "upsert")
+
+
+class PrefixedLogger:
+    """
+    Logger that prefixes every message with the addon type.
+
+    Extra positional arguments are substituted into "{}" placeholders by loguru only when a
+    sink accepts the level; with lazy=True callables among them are only called then too,
+    so expensive payload summaries cost nothing when DEBUG is disabled.
+    """
+
+    def __init__(self, addon_type: str):
+        self.addon_type = addon_type
+        self._prefix = f"[TYPE: {addon_type.upper()}] "
+        self._logger = logger.opt(depth=2)
+        self._lazy_logger = logger.opt(depth=2, lazy=True)
+
+    def _log(self, level: str, message: str, args: tuple, lazy: bool) -> None:
+        target = self._lazy_logger if lazy else self._logger
+        target.log(level, self._prefix + message, *args)
+
+    def debug(self, message, *args, lazy: bool = False):
+        self._log("DEBUG", message, args, lazy)
+
+    def info(self, message, *args, lazy: bool = False):
+        self._log("INFO", message, args, lazy)
+
+    def warning(self, message, *args, lazy: bool = False):
+        self._log("WARNING", message, args, lazy)
+
+    def error(self, message, *args, lazy: bool = False):
+        self._log("ERROR", message, args, lazy)
+
+
+@cache
+def get_prefixed_logger(addon_type: str) -> PrefixedLogger:
+    return PrefixedLogger(addon_type)
 
 
 class MongoDBRoomsAddon:
@@ -27,67 +89,343 @@ class MongoDBRoomsAddon:
         self.modules = ["actions", "configuration", "memory", "services", "storage", "tools", "utils"]
         self.config = None
         self.connection = None
+        self.connection_uri = None
+        self.connection_variant = ""
+        self.health = ConnectionHealth()
+        self.metadata_cache = None
+        self.schema_store = None
+        self.schema_watchers = {}
+        self.resume_tokens = None
+        self.subscriptions = {}
+        self.metrics_collector = MetricsCollector()
+        self.telemetry = None
+        self.profiler = None
+        self.index_advisor = IndexAdvisor()
+        self.concern_resolver = None
         self.credentials = CredentialsRegistry()
 
     @property
     def logger(self):
         """Custom logger that prefixes all messages with addon type"""
-        class PrefixedLogger:
-            def __init__(self, addon_type):
-                self.addon_type = addon_type
-                self._logger = logger
+        return get_prefixed_logger(self.type)
 
-            def debug(self, message):
-                self._logger.debug(f"[TYPE: {self.addon_type.upper()}] {message}")
-
-            def info(self, message):
-                self._logger.info(f"[TYPE: {self.addon_type.upper()}] {message}")
+    def describe(self) -> dict:
+        self.logger.info("Describing MongoDB Rooms Addon...")
+        return describe(self.config, self.connection, cache=self.metadata_cache)
 
-            def warning(self, message):
-                self._logger.warning(f"[TYPE: {self.addon_type.upper()}] {message}")
+    def describe_collection(self, collections: list, max_concurrency: int = None) -> dict:
+        self.logger.info(f"Describing collections: {collections}")
+        return describe_collection(self.config, self.connection, collections, cache=self.metadata_cache,
+                                   max_concurrency=max_concurrency or (self.config and self.config.describeMaxConcurrency),
+                                   profile_store=self.schema_store)
 
-            def error(self, message):
-                self._logger.error(f"[TYPE: {self.addon_type.upper()}] {message}")
+    def watch_schema(self, collections: list) -> dict:
+        """
+        Keep the persisted schema profiles of the given collections current by following
+        their change streams in background threads. Profiles missing from the store are
+        built from a streamed sample first. Requires schemaProfilePath to be configured.
 
-        return PrefixedLogger(self.type)
+        Returns:
+            dict: collection name -> True if a watcher is running for it
+        """
+        if self.connection is None or self.schema_store is None:
+            self.logger.error("Schema watching requires a connection and schemaProfilePath")
+            return dict.fromkeys(collections, False)
+
+        db = self.connection[self.config.database]
+        sample_size = self.config.schemaSampleSize or DEFAULT_SAMPLE_SIZE
+        max_depth = self.config.schemaMaxDepth if self.config.schemaMaxDepth is not None else DEFAULT_MAX_DEPTH
+        started = {}
+        for name in collections:
+            watcher = self.schema_watchers.get(name)
+            if watcher is None or not watcher.running:
+                watcher = SchemaProfileWatcher(self.schema_store, db[name], self.config.database,
+                                               sample=partial(profile_sample, db[name], sample_size, max_depth))
+                try:
+                    stream = watcher.bootstrap()
+                except PyMongoError as e:
+                    self.logger.error(f"Could not watch schema changes for collection {name}: {e}")
+                    started[name] = False
+                    continue
+                watcher.start(stream)
+                self.schema_watchers[name] = watcher
+                self.logger.info(f"Watching schema changes for collection: {name}")
+            started[name] = watcher.running
+        return started
+
+    def _stop_schema_watchers(self) -> None:
+        for watcher in self.schema_watchers.values():
+            watcher.stop(timeout=5)
+        self.schema_watchers = {}
+        if self.schema_store is not None:
+            self.schema_store.save()
+
+    def watch(self, collection: str = None, filter: dict = None, full_document: str = None, batch_size: int = 100,
+              callback=None, name: str = None, max_await_time_ms: int = 1000):
+        """
+        Subscribe to changes of a collection, or of the whole database when collection is None,
+        instead of polling. Events matching filter (a $match on change events, e.g.
+        {"operationType": "insert"}) are delivered in batches of up to batch_size. The resume token
+        is stored under name after each processed batch (persisted when changeStreamResumePath is
+        set), so a restarted room that watches under the same name continues where it stopped.
+
+        Without callback, returns a generator of event batches that runs in the caller's thread.
+        With callback, batches are passed to callback(events) from a background thread and the
+        running ChangeStreamSubscription is returned; stop it with unwatch(name).
+        """
+        if self.connection is None:
+            self.logger.error("Watching requires a connection")
+            return None
+        if self.resume_tokens is None:
+            self.resume_tokens = ResumeTokenStore()
+        db = self.connection[self.config.database]
+        name = name or f"{self.config.database}.{collection or '*'}"
+        subscription = ChangeStreamSubscription(db[collection] if collection else db, name, self.resume_tokens,
+                                                filter=filter, full_document=full_document, batch_size=batch_size,
+                                                max_await_time_ms=max_await_time_ms)
+        if callback is None:
+            self.logger.info(f"Watching changes for {name}")
+            return subscription.batches()
+
+        self.unwatch(name)
+        subscription.start(callback)
+        self.subscriptions[name] = subscription
+        self.logger.info(f"Watching changes for {name} in the background")
+        return subscription
+
+    def unwatch(self, name: str) -> bool:
+        """Stop the background subscription registered under name."""
+        subscription = self.subscriptions.pop(name, None)
+        if subscription is None:
+            return False
+        subscription.stop(timeout=5)
+        return True
 
-    def describe(self) -> dict:
-        self.logger.info("Describing MongoDB Rooms Addon...")
-        return describe(self.config, self.connection)
+    def watch_status(self) -> dict:
+        """Status (running, delivered events, resume token, last error) of each background subscription."""
+        return {name: subscription.status() for name, subscription in self.subscriptions.items()}
 
-    def describe_collection(self, collections: list) -> dict:
-        self.logger.info(f"Describing collections: {collections}")
-        return describe_collection(self.config, self.connection, collections)
+    def _stop_subscriptions(self) -> None:
+        for name in list(self.subscriptions):
+            self.unwatch(name)
 
-    def create_collection(self, collection_name: str, schema_definition: dict = None, options: dict = None) -> dict:
+    def create_collection(self, collection_name: str, schema_definition: dict = None, options: dict = None,
+                          indexes: list = None) -> dict:
         from .actions.create_collection import ActionInput
-        action_input = ActionInput(collection_name=collection_name, schema_definition=schema_definition, options=options)
+        action_input = ActionInput(collection_name=collection_name, schema_definition=schema_definition, options=options,
+                                   indexes=indexes)
         self.logger.info(f"Creating collection: {collection_name}")
-        return create_collection(self.config, self.connection, action_input)
+        response = self._run("create_collection", collection_name, create_collection, action_input)
+        self._invalidate_metadata(collection_name)
+        return response
 
-    def insert(self, collection: str, document: dict = None, documents: list = None) -> dict:
+    def insert(self, collection: str, document: dict = None, documents: list = None, raw_documents: list = None,
+               concern_profile: str = None) -> dict:
         from .actions.insert import ActionInput
-        action_input = ActionInput(collection=collection, document=document, documents=documents)
+        action_input = ActionInput(collection=collection, document=document, documents=documents, raw_documents=raw_documents,
+                                   concern_profile=concern_profile)
         self.logger.info(f"Inserting into collection: {collection}")
-        return insert(self.config, self.connection, action_input)
-
-    def update(self, collection: str, filter: dict, update_data: dict, update_many: bool = False, upsert: bool = False) -> dict:
+        response = self._run("insert", collection, insert, action_input, resolver=self.concern_resolver)
+        self._invalidate_metadata(collection)
+        return response
+
+    def insert_chunked(self, collection: str, documents, chunk_size: int = 1000, max_workers: int = 4) -> dict:
+        from .actions.insert_chunked import ActionInput
+        action_input = ActionInput(collection=collection, documents=documents, chunk_size=chunk_size, max_workers=max_workers)
+        self.logger.info(f"Inserting chunks into collection: {collection}")
+        response = self._run("insert_chunked", collection, insert_chunked, action_input)
+        self._invalidate_metadata(collection)
+        return response
+
+    def update(self, collection: str, filter: dict, update_data: dict, update_many: bool = False, upsert: bool = False,
+               concern_profile: str = None) -> dict:
         from .actions.update import ActionInput, update
-        action_input = ActionInput(collection=collection, filter=filter, update=update_data, update_many=update_many, upsert=upsert)
+        action_input = ActionInput(collection=collection, filter=filter, update=update_data, update_many=update_many, upsert=upsert,
+                                   concern_profile=concern_profile)
         self.logger.info(f"Updating collection: {collection}")
-        return update(self.config, self.connection, action_input)
+        response = self._run("update", collection, update, action_input, resolver=self.concern_resolver)
+        self._invalidate_metadata(collection)
+        return response
 
-    def delete(self, collection: str, filter: dict, delete_many: bool = False) -> dict:
+    def delete(self, collection: str, filter: dict, delete_many: bool = False, concern_profile: str = None) -> dict:
         from .actions.delete import ActionInput
-        action_input = ActionInput(collection=collection, filter=filter, delete_many=delete_many)
+        action_input = ActionInput(collection=collection, filter=filter, delete_many=delete_many, concern_profile=concern_profile)
         self.logger.info(f"Deleting from collection: {collection}")
-        return delete(self.config, self.connection, action_input)
+        response = self._run("delete", collection, delete, action_input, resolver=self.concern_resolver)
+        self._invalidate_metadata(collection)
+        return response
 
-    def upsert(self, collection: str, filter: dict, update_data: dict, update_many: bool = False) -> dict:
+    def upsert(self, collection: str, filter: dict, update_data: dict, update_many: bool = False,
+               concern_profile: str = None) -> dict:
         from .actions.upsert import ActionInput
-        action_input = ActionInput(collection=collection, filter=filter, update=update_data, update_many=update_many)
+        action_input = ActionInput(collection=collection, filter=filter, update=update_data, update_many=update_many,
+                                   concern_profile=concern_profile)
         self.logger.info(f"Upserting into collection: {collection}")
-        return upsert(self.config, self.connection, action_input)
+        response = self._run("upsert", collection, upsert, action_input, resolver=self.concern_resolver)
+        self._invalidate_metadata(collection)
+        return response
+
+    def find(self, collection: str, filter: dict = None, projection: dict = None, sort: dict = None,
+             limit: int = None, batch_size: int = 100) -> dict:
+        from .actions.find import ActionInput
+        action_input = ActionInput(collection=collection, filter=filter, projection=projection, sort=sort,
+                                   limit=limit, batch_size=batch_size)
+        self.logger.info(f"Finding documents in collection: {collection}")
+        return self._run("find", collection, find, action_input)
+
+    def paginate(self, collection: str, filter: dict = None, projection: dict = None, sort_key: str = "_id",
+                 direction: int = 1, page_size: int = 100, continuation_token: str = None) -> dict:
+        from .actions.paginate import ActionInput
+        action_input = ActionInput(collection=collection, filter=filter, projection=projection, sort_key=sort_key,
+                                   direction=direction, page_size=page_size, continuation_token=continuation_token)
+        self.logger.info(f"Paginating collection: {collection}")
+        return self._run("paginate", collection, paginate, action_input)
+
+    def parallel_scan(self, collection: str, filter: dict = None, projection: dict = None, partitions: int = 8,
+                      max_workers: int = 4, batch_size: int = 1000, sample_size: int = None, progress=None) -> dict:
+        from .actions.parallel_scan import ActionInput
+        action_input = ActionInput(collection=collection, filter=filter, projection=projection, partitions=partitions,
+                                   max_workers=max_workers, batch_size=batch_size, sample_size=sample_size, progress=progress)
+        self.logger.info(f"Scanning collection in parallel: {collection}")
+        return self._run("parallel_scan", collection, parallel_scan, action_input)
+
+    def export_collection(self, collection: str, directory: str, format: str = "ndjson", compression: str = None,
+                          filter: dict = None, projection: dict = None, sort: dict = None, limit: int = None,
+                          max_documents_per_file: int = None, max_bytes_per_file: int = None, basename: str = None,
+                          json_mode: str = "relaxed", row_group_size: int = 10000, batch_size: int = 1000) -> dict:
+        from .actions.export_collection import ActionInput
+        action_input = ActionInput(collection=collection, directory=directory, format=format, compression=compression,
+                                   filter=filter, projection=projection, sort=sort, limit=limit,
+                                   max_documents_per_file=max_documents_per_file, max_bytes_per_file=max_bytes_per_file,
+                                   basename=basename, json_mode=json_mode, row_group_size=row_group_size,
+                                   batch_size=batch_size)
+        self.logger.info(f"Exporting collection: {collection}")
+        return self._run("export_collection", collection, export_collection, action_input)
+
+    def import_file(self, collection: str, path: str, format: str = None, compression: str = None,
+                    chunk_size: int = 1000, write_workers: int = 4, upsert_keys: list = None,
+                    csv_fields: list = None, csv_types: dict = None, csv_delimiter: str = ",",
+                    ignore_blanks: bool = False) -> dict:
+        from .actions.import_file import ActionInput
+        action_input = ActionInput(collection=collection, path=path, format=format, compression=compression,
+                                   chunk_size=chunk_size, write_workers=write_workers,
+                                   upsert_keys=upsert_keys, csv_fields=csv_fields, csv_types=csv_types,
+                                   csv_delimiter=csv_delimiter, ignore_blanks=ignore_blanks)
+        self.logger.info(f"Importing {path} into collection: {collection}")
+        response = self._run("import_file", collection, import_file, action_input)
+        self._invalidate_metadata(collection)
+        return response
+
+    def aggregate(self, collection: str, pipeline: list, allow_disk_use: bool = False, max_time_ms: int = None,
+                  batch_size: int = 100, hint=None) -> dict:
+        from .actions.aggregate import ActionInput
+        action_input = ActionInput(collection=collection, pipeline=pipeline, allow_disk_use=allow_disk_use,
+                                   max_time_ms=max_time_ms, batch_size=batch_size, hint=hint)
+        self.logger.info(f"Running aggregation on collection: {collection}")
+        return self._run("aggregate", collection, aggregate, action_input)
+
+    def bulk_write(self, collection: str, operations: list, ordered: bool = True) -> dict:
+        from .actions.bulk_write import ActionInput
+        action_input = ActionInput(collection=collection, operations=operations, ordered=ordered)
+        self.logger.info(f"Running bulk write on collection: {collection}")
+        response = self._run("bulk_write", collection, bulk_write, action_input)
+        self._invalidate_metadata(collection)
+        return response
+
+    def _run(self, action: str, collection: str, func, action_input, **kwargs):
+        if action in ADVISED_ACTIONS:
+            self.index_advisor.observe(action, collection, action_input.filter)
+        profiler = self.profiler
+        # Reported once the operation is complete: for find/aggregate, when their pages are exhausted.
+        on_complete = None if profiler is None else lambda seconds: profiler.observe(action, collection, action_input, seconds)
+        return self.metrics_collector.timed(action, collection, func, self.config, self.connection, action_input,
+                                            on_complete=on_complete, **kwargs)
+
+    def slow_operations(self) -> list:
+        """
+        Operations recorded by the slow-operation profiler (slowOpThresholdMS), oldest first,
+        with the command they ran and, once explained, the winning plan, documents examined
+        vs returned and whether a COLLSCAN happened.
+        """
+        return self.profiler.records() if self.profiler is not None else []
+
+    def export_slow_operations(self, path: str) -> int:
+        """Write the profiler's records to path as Extended JSON lines; returns how many were written."""
+        return self.profiler.export(path) if self.profiler is not None else 0
+
+    def metrics(self) -> dict:
+        """
+        Per (action, collection) call, error and document counts with latency percentiles,
+        plus per command wire byte counts for this addon's database when commandMetrics is on.
+
+        Returns:
+            dict: `actions` and `commands` lists of metric entries
+        """
+        commands = []
+        if self.config is not None and self.config.commandMetrics:
+            commands = CommandMetricsListener().snapshot(self.config.database)
+        return {"actions": self.metrics_collector.snapshot(), "commands": commands}
+
+    def prometheus_metrics(self) -> str:
+        """Render metrics() in the Prometheus text exposition format."""
+        return to_prometheus(self.metrics_collector, self.metrics()["commands"])
+
+    def pool_telemetry(self) -> dict:
+        """
+        Connection pool and server monitoring data of the shared client, per server address:
+        checked-out and waiting connections, check-out wait time, connection churn and
+        heartbeat RTT. Requires poolTelemetry to be enabled.
+
+        Returns:
+            dict: `pools` and `servers` keyed by "host:port" (empty when telemetry is disabled)
+        """
+        if self.telemetry is None:
+            return {"pools": {}, "servers": {}}
+        return self.telemetry.snapshot()
+
+    def create_indexes(self, collection: str, indexes: list, commit_quorum=None, max_time_ms: int = None) -> dict:
+        from .actions.create_indexes import ActionInput
+        action_input = ActionInput(collection=collection, indexes=indexes, commit_quorum=commit_quorum, max_time_ms=max_time_ms)
+        self.logger.info(f"Creating indexes on collection: {collection}")
+        response = self._run("create_indexes", collection, create_indexes, action_input)
+        self._invalidate_metadata(collection)
+        return response
+
+    def drop_index(self, collection: str, name: str = None, keys: dict = None) -> dict:
+        from .actions.drop_index import ActionInput
+        action_input = ActionInput(collection=collection, name=name, keys=keys)
+        self.logger.info(f"Dropping index on collection: {collection}")
+        response = self._run("drop_index", collection, drop_index, action_input)
+        self._invalidate_metadata(collection)
+        return response
+
+    def list_indexes(self, collection: str) -> dict:
+        from .actions.list_indexes import ActionInput
+        action_input = ActionInput(collection=collection)
+        self.logger.info(f"Listing indexes of collection: {collection}")
+        return self._run("list_indexes", collection, list_indexes, action_input)
+
+    def index_suggestions(self, collections: list = None) -> list:
+        """
+        Suggest indexes for the filters update, delete and upsert calls have used so far,
+        checked against each collection's current indexes.
+
+        Returns:
+            list: suggestions with the proposed `keys`, the filter fields, how often the
+            filter shape was seen and the best existing index
+        """
+        suggestions = []
+        for collection in collections or self.index_advisor.collections():
+            response = self.list_indexes(collection)
+            if response.code != 200:
+                self.logger.warning(f"Cannot check indexes of {collection}: {response.message}")
+                continue
+            suggestions.extend(self.index_advisor.suggest(collection, response.output.indexes))
+        return suggestions
+
+    def _invalidate_metadata(self, collection: str = None) -> None:
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(self.config.database, collection)
 
     def initConnection(self) -> bool:
         """
@@ -102,17 +440,78 @@ class MongoDBRoomsAddon:
         self.logger.info("Initializing connection with provided configuration...")
         try:
             uri = build_uri(self.config)
-            self.logger.debug(f"Connection URI for MongoDB: {uri}")
-            self.connection = create_connection(uri)
+            self.logger.debug("Connection URI for MongoDB: {}", uri)
+            self.closeConnection()
+            lazy = bool(self.config.lazyConnection)
+            raw_bson = bool(self.config.rawBson)
+            command_metrics = bool(self.config.commandMetrics)
+            telemetry = pool_telemetry_from_config(self.config)
+            if lazy or raw_bson:
+                factory = partial(create_connection, lazy=lazy, raw_bson=raw_bson)
+            else:
+                factory = create_connection
+            if telemetry is not None:
+                factory = partial(factory, telemetry=telemetry)
+            if command_metrics:
+                factory = partial(factory, command_listener=CommandMetricsListener())
+            variant = "+".join(name for name, enabled in (
+                ("raw", raw_bson), ("telemetry", telemetry is not None), ("commands", command_metrics)
+            ) if enabled)
+            self.connection = ClientRegistry().acquire(uri, factory, variant)
             if self.connection is None:
+                self.health.mark_unreachable("MongoDB client connection failed")
                 self.logger.error("MongoDB client connection failed.")
                 return False
-            self.logger.info("Connection initialized successfully for MongoDB")
+            self.connection_uri = uri
+            self.connection_variant = variant
+            self.telemetry = find_pool_telemetry(self.connection) if telemetry is not None else None
+            self.profiler = slow_op_profiler_from_config(self.config, self.connection)
+            self.concern_resolver = ConcernResolver(self.config.concernProfiles)
+            ttl = self.config.metadataCacheTTLSeconds
+            self.metadata_cache = MetadataCache(ttl, self.config.metadataCacheMaxEntries or 1024) if ttl else None
+            profile_path = self.config.schemaProfilePath
+            max_depth = self.config.schemaMaxDepth if self.config.schemaMaxDepth is not None else DEFAULT_MAX_DEPTH
+            self.schema_store = SchemaProfileStore(profile_path, max_depth) if profile_path else None
+            self.resume_tokens = ResumeTokenStore(self.config.changeStreamResumePath or None)
+            if lazy:
+                self.health.check(self.connection)
+                self.logger.info("Connection created lazily for MongoDB, health check running in background")
+            else:
+                self.health.mark_ready()
+                self.logger.info("Connection initialized successfully for MongoDB")
             return True
         except Exception as e:
+            self.health.mark_unreachable(str(e))
             self.logger.error(f"Failed to initialize connection for MongoDB: {e}")
             return False
 
+    def connectionStatus(self) -> dict:
+        """
+        Report connection readiness without blocking.
+
+        Returns:
+            dict: `status` (disconnected, connecting, ready or unreachable), last `error` and `checked_at` timestamp
+        """
+        return self.health.status()
+
+    def closeConnection(self) -> None:
+        """
+        Release this addon's handle on the shared MongoClient.
+        The client itself is closed once no other addon instance uses it.
+        """
+        self._stop_schema_watchers()
+        self._stop_subscriptions()
+        if self.profiler is not None:
+            self.profiler.stop(timeout=5)
+            self.profiler = None
+        if self.connection_uri is not None:
+            ClientRegistry().release(self.connection_uri, self.connection_variant)
+            self.logger.info("Connection released for MongoDB")
+        self.connection = None
+        self.connection_uri = None
+        self.telemetry = None
+        self.health.mark_disconnected()
+
     def test(self) -> bool:
         """
         Test function for template rooms package.
@@ -186,12 +585,12 @@ class MongoDBRoomsAddon:
         try:
             from mongodb_rooms_pkg.configuration import CustomAddonConfig
 
-            self.logger.debug(f"Received addon_config: {addon_config}")
+            self.logger.debug("Received addon_config: {}", lambda: summarize(addon_config), lazy=True)
 
             config_data = addon_config.copy()
             if 'config' in addon_config and isinstance(addon_config['config'], dict):
                 config_data.update(addon_config['config'])
-                self.logger.debug(f"Merged config_data: {config_data}")
+                self.logger.debug("Merged config_data: {}", lambda: summarize(config_data), lazy=True)
 
             self.config = CustomAddonConfig(**config_data)
             self.logger.info(f"Addon configuration loaded successfully: {self.config}")
@@ -218,7 +617,7 @@ class MongoDBRoomsAddon:
             bool: True if credentials are loaded successfully, False otherwise
         """
         self.logger.debug("Loading credentials...")
-        self.logger.debug(f"Received credentials: {kwargs}")
+        self.logger.debug("Received credentials: {}", lambda: summarize(kwargs), lazy=True)
         try:
             if self.config and hasattr(self.config, 'secrets'):
                 required_secrets = list(self.config.secrets.keys())
@@ -0,0 +1,158 @@
+from mongodb_rooms_pkg.services.concerns import ConcernResolver
+from mongodb_rooms_pkg.services.connection import build_uri, create_async_connection
+from mongodb_rooms_pkg.services.pool_telemetry import pool_telemetry_from_config
+
+from .actions.aio.create_collection import create_collection
+from .actions.aio.delete import delete
+from .actions.aio.describe import describe
+from .actions.aio.describe_collection import describe_collection
+from .actions.aio.insert import insert
+from .actions.aio.update import update
+from .actions.aio.upsert import upsert
+from .addon import MongoDBRoomsAddon
+from .services.credentials import CredentialsRegistry
+from .utils.summary import summarize
+
+
+class AsyncMongoDBRoomsAddon:
+    """
+    Asyncio variant of MongoDBRoomsAddon backed by pymongo's AsyncMongoClient.
+
+    Exposes the same core actions as awaitable methods so that many concurrent calls can
+    share one event loop instead of blocking it.
+    """
+
+    type = "storage"
+
+    logger = MongoDBRoomsAddon.logger
+    test = MongoDBRoomsAddon.test
+    loadCredentials = MongoDBRoomsAddon.loadCredentials
+
+    def __init__(self):
+        self.modules = ["actions", "configuration", "memory", "services", "storage", "tools", "utils"]
+        self.config = None
+        self.connection = None
+        self.telemetry = None
+        self.concern_resolver = None
+        self.credentials = CredentialsRegistry()
+
+    async def describe(self) -> dict:
+        self.logger.info("Describing MongoDB Rooms Addon...")
+        return await describe(self.config, self.connection)
+
+    async def describe_collection(self, collections: list, max_concurrency: int = None) -> dict:
+        self.logger.info(f"Describing collections: {collections}")
+        return await describe_collection(self.config, self.connection, collections,
+                                          max_concurrency=max_concurrency or (self.config and self.config.describeMaxConcurrency))
+
+    async def create_collection(self, collection_name: str, schema_definition: dict = None, options: dict = None,
+                                indexes: list = None) -> dict:
+        from .actions.create_collection import ActionInput
+        action_input = ActionInput(collection_name=collection_name, schema_definition=schema_definition, options=options,
+                                   indexes=indexes)
+        self.logger.info(f"Creating collection: {collection_name}")
+        return await create_collection(self.config, self.connection, action_input)
+
+    async def insert(self, collection: str, document: dict = None, documents: list = None, concern_profile: str = None) -> dict:
+        from .actions.insert import ActionInput
+        action_input = ActionInput(collection=collection, document=document, documents=documents, concern_profile=concern_profile)
+        self.logger.info(f"Inserting into collection: {collection}")
+        return await insert(self.config, self.connection, action_input, resolver=self.concern_resolver)
+
+    async def update(self, collection: str, filter: dict, update_data: dict, update_many: bool = False, upsert: bool = False,
+                     concern_profile: str = None) -> dict:
+        from .actions.update import ActionInput
+        action_input = ActionInput(collection=collection, filter=filter, update=update_data, update_many=update_many, upsert=upsert,
+                                   concern_profile=concern_profile)
+        self.logger.info(f"Updating collection: {collection}")
+        return await update(self.config, self.connection, action_input, resolver=self.concern_resolver)
+
+    async def delete(self, collection: str, filter: dict, delete_many: bool = False, concern_profile: str = None) -> dict:
+        from .actions.delete import ActionInput
+        action_input = ActionInput(collection=collection, filter=filter, delete_many=delete_many, concern_profile=concern_profile)
+        self.logger.info(f"Deleting from collection: {collection}")
+        return await delete(self.config, self.connection, action_input, resolver=self.concern_resolver)
+
+    async def upsert(self, collection: str, filter: dict, update_data: dict, update_many: bool = False,
+                     concern_profile: str = None) -> dict:
+        from .actions.upsert import ActionInput
+        action_input = ActionInput(collection=collection, filter=filter, update=update_data, update_many=update_many,
+                                   concern_profile=concern_profile)
+        self.logger.info(f"Upserting into collection: {collection}")
+        return await upsert(self.config, self.connection, action_input, resolver=self.concern_resolver)
+
+    def pool_telemetry(self) -> dict:
+        """Connection pool and server monitoring data; see MongoDBRoomsAddon.pool_telemetry."""
+        if self.telemetry is None:
+            return {"pools": {}, "servers": {}}
+        return self.telemetry.snapshot()
+
+    async def initConnection(self) -> bool:
+        """
+        Initialize the asyncio connection with the provided configuration.
+        Returns:
+            bool: True if connection is initialized successfully, False otherwise
+        """
+        if not self.config or not hasattr(self.config, 'scheme'):
+            self.logger.error("No valid configuration found. Cannot initialize connection.")
+            return False
+
+        self.logger.info("Initializing async connection with provided configuration...")
+        try:
+            uri = build_uri(self.config)
+            self.logger.debug("Connection URI for MongoDB: {}", uri)
+            telemetry = pool_telemetry_from_config(self.config)
+            if telemetry is not None:
+                self.connection = await create_async_connection(uri, telemetry=telemetry)
+            else:
+                self.connection = await create_async_connection(uri)
+            if self.connection is None:
+                self.logger.error("MongoDB async client connection failed.")
+                return False
+            self.telemetry = telemetry
+            profiles = self.config.concernProfiles
+            self.concern_resolver = ConcernResolver(profiles if isinstance(profiles, dict) else None)
+            self.logger.info("Async connection initialized successfully for MongoDB")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to initialize async connection for MongoDB: {e}")
+            return False
+
+    async def closeConnection(self) -> None:
+        if self.connection is not None:
+            await self.connection.close()
+            self.connection = None
+            self.telemetry = None
+
+    async def loadAddonConfig(self, addon_config: dict):
+        """
+        Load addon configuration and open the asyncio connection.
+
+        Args:
+            addon_config (dict): Addon configuration dictionary
+
+        Returns:
+            bool: True if configuration is loaded successfully, False otherwise
+        """
+        try:
+            from mongodb_rooms_pkg.configuration import CustomAddonConfig
+
+            self.logger.debug("Received addon_config: {}", lambda: summarize(addon_config), lazy=True)
+
+            config_data = addon_config.copy()
+            if 'config' in addon_config and isinstance(addon_config['config'], dict):
+                config_data.update(addon_config['config'])
+                self.logger.debug("Merged config_data: {}", lambda: summarize(config_data), lazy=True)
+
+            self.config = CustomAddonConfig(**config_data)
+            self.logger.info(f"Addon configuration loaded successfully: {self.config}")
+
+            connection_success = await self.initConnection()
+            if not connection_success:
+                self.logger.error("Connection initialization failed after loading configuration")
+                return False
+
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to load addon configuration: {e}")
+            return False
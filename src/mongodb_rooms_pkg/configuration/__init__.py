@@ -1,4 +1,4 @@
-from .addonconfig import CustomAddonConfig
+from .addonconfig import ConcernProfile, CustomAddonConfig
 from .baseconfig import BaseAddonConfig
 
-__all__ = ["BaseAddonConfig", "CustomAddonConfig"]
+__all__ = ["BaseAddonConfig", "CustomAddonConfig", "ConcernProfile"]
@@ -1,10 +1,28 @@
-from typing import Optional
+from typing import Literal, Optional, Union
 
-from pydantic import Field, model_validator
+from pydantic import BaseModel, Field, model_validator
+from pymongo.errors import ConfigurationError
+from pymongo.write_concern import WriteConcern
 
 from .baseconfig import BaseAddonConfig
 
 
+class ConcernProfile(BaseModel):
+    w: Optional[Union[int, str]] = Field(None, description="Write concern (e.g. 0, 1, majority)")
+    wtimeoutMS: Optional[int] = Field(None, description="Timeout for write concern")
+    journal: Optional[bool] = Field(None, description="Whether to wait for journal commit acknowledgement")
+    readConcern: Optional[Literal["local", "available", "majority", "linearizable", "snapshot"]] = Field(None, description="Read concern level")
+    readPreference: Optional[Literal["primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest"]] = Field(None, description="Read preference mode")
+
+    @model_validator(mode='after')
+    def validate_write_concern(self):
+        try:
+            WriteConcern(w=self.w, wtimeout=self.wtimeoutMS, j=self.journal)
+        except (ConfigurationError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid write concern: {e}") from e
+        return self
+
+
 class CustomAddonConfig(BaseAddonConfig):
     scheme: str = Field("mongodb", description="Connection scheme, either 'mongodb' or 'mongodb+srv'")
     host: str = Field(..., description="Database host or comma-separated replica set members")
@@ -29,12 +47,30 @@ class CustomAddonConfig(BaseAddonConfig):
     maxPoolSize: Optional[int] = Field(None, description="Maximum number of connections in the connection pool")
     minPoolSize: Optional[int] = Field(None, description="Minimum number of connections in the connection pool")
     maxIdleTimeMS: Optional[int] = Field(None, description="Maximum idle time for connections")
+    lazyConnection: Optional[bool] = Field(False, description="Create the client without a blocking ping and check health in the background")
+    rawBson: Optional[bool] = Field(False, description="Use RawBSONDocument as document_class so reads return undecoded BSON documents")
+    metadataCacheTTLSeconds: Optional[float] = Field(None, description="Time-to-live of cached collection metadata in seconds (0 or null, the default, disables the cache)")
+    metadataCacheMaxEntries: Optional[int] = Field(1024, description="Maximum number of cached collection metadata entries")
+    schemaSampleSize: Optional[int] = Field(1000, description="Number of sampled documents describe_collection profiles per collection")
+    schemaMaxDepth: Optional[int] = Field(3, description="How many levels of nested documents schema inference descends into")
+    schemaProfilePath: Optional[str] = Field(None, description="Local JSON file persisting schema profiles kept current by change streams")
+    changeStreamResumePath: Optional[str] = Field(None, description="Local JSON file persisting resume tokens of watch() subscriptions")
+    poolTelemetry: Optional[bool] = Field(False, description="Track connection pool usage, check-out wait time, churn and heartbeat RTT")
+    poolSaturationRatio: Optional[float] = Field(0.9, description="Share of maxPoolSize checked out at which a pool_saturated warning is logged")
+    poolWaitAlertMS: Optional[int] = Field(1000, description="Connection check-out wait in milliseconds above which a pool_saturated warning is logged")
+    slowOpThresholdMS: Optional[float] = Field(None, description="Record actions slower than this many milliseconds and explain them in the background (null disables the profiler)")
+    slowOpExplainIntervalSeconds: Optional[float] = Field(1.0, description="Minimum interval between two explains run by the slow-operation profiler")
+    slowOpBufferSize: Optional[int] = Field(100, description="Number of slow operations kept in the profiler's ring buffer")
+    commandMetrics: Optional[bool] = Field(False, description="Count commands and BSON bytes sent/received per collection with a pymongo CommandListener")
+    describeMaxConcurrency: Optional[int] = Field(4, description="Maximum number of collections describe_collection introspects in parallel")
 
     # Write concern & journaling
     w: Optional[str] = Field(None, description="Write concern (e.g. 1, majority)")
     wtimeoutMS: Optional[int] = Field(None, description="Timeout for write concern")
     journal: Optional[bool] = Field(None, description="Whether to wait for journal commit acknowledgement")
 
+    concernProfiles: Optional[dict[str, ConcernProfile]] = Field(None, description="Named write/read concern profiles selectable per action with concern_profile")
+
     # Read preferences
     readPreference: Optional[str] = Field(None, description="Read preference (e.g. primary, secondary)")
     readPreferenceTags: Optional[list[str]] = Field(None, description="List of read preference tags")
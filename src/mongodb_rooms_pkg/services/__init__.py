@@ -1,4 +1,5 @@
+from .connection import ClientRegistry
 from .credentials import CredentialsRegistry
 from .example import demo_service
 
-__all__ = ["demo_service", "CredentialsRegistry"]
+__all__ = ["demo_service", "CredentialsRegistry", "ClientRegistry"]
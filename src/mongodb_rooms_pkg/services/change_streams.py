@@ -0,0 +1,190 @@
+import os
+import threading
+from collections.abc import Iterator
+from typing import Any, Callable, Optional
+
+from bson import json_util
+from loguru import logger
+from pymongo.errors import PyMongoError
+
+from mongodb_rooms_pkg.utils.files import atomic_write
+
+FULL_DOCUMENT_MODES = ("default", "updateLookup", "whenAvailable", "required")
+INVALIDATE_EVENTS = ("invalidate",)
+
+
+class ResumeTokenStore:
+    """
+    Thread-safe map of subscription name -> last processed change-stream resume token.
+    With a path, tokens are kept in a local Extended JSON file written atomically on
+    save(); without one they only live as long as the store.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.RLock()
+        self._tokens: dict[str, Any] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._tokens = dict(json_util.loads(f.read()).get("resume_tokens", {}))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load change stream resume tokens from {self.path}: {e}")
+
+    def get(self, name: str) -> Any:
+        with self._lock:
+            return self._tokens.get(name)
+
+    def set(self, name: str, token: Any) -> None:
+        with self._lock:
+            self._tokens[name] = token
+
+    def drop(self, name: str) -> None:
+        with self._lock:
+            self._tokens.pop(name, None)
+
+    def names(self) -> list[str]:
+        with self._lock:
+            return sorted(self._tokens)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            atomic_write(self.path, json_util.dumps({"resume_tokens": self._tokens}))
+
+
+class ChangeStreamSubscription:
+    """
+    Change stream on a collection or database delivered in batches of up to batch_size
+    events. A batch is handed out as soon as it is full or the stream goes idle. The
+    resume token of a batch's last event is stored (and saved) once the batch has been
+    processed: when the iterator asks for the next batch, or after the callback returned.
+    Delivery is therefore at-least-once: a batch interrupted by a crash is delivered again.
+    """
+
+    def __init__(self, target, name: str, store: ResumeTokenStore, filter: Optional[dict[str, Any]] = None,
+                 full_document: Optional[str] = None, batch_size: int = 100, max_await_time_ms: int = 1000):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if full_document is not None and full_document not in FULL_DOCUMENT_MODES:
+            raise ValueError(f"full_document must be one of {', '.join(FULL_DOCUMENT_MODES)}")
+        self.target = target
+        self.name = name
+        self.store = store
+        self.filter = filter
+        self.full_document = full_document
+        self.batch_size = batch_size
+        self.max_await_time_ms = max_await_time_ms
+        self.delivered = 0
+        self.error: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pipeline(self) -> list[dict[str, Any]]:
+        return [{"$match": self.filter}] if self.filter else []
+
+    def open_stream(self):
+        return self.target.watch(
+            self.pipeline,
+            full_document=self.full_document,
+            resume_after=self.store.get(self.name),
+            max_await_time_ms=self.max_await_time_ms,
+            batch_size=self.batch_size
+        )
+
+    def _commit(self, token: Any) -> None:
+        if token is not None:
+            self.store.set(self.name, token)
+            self.store.save()
+
+    def consume(self, stream, max_batches: Optional[int] = None) -> Iterator[list]:
+        """
+        Yield batches of change events from stream (anything with try_next(), alive and
+        resume_token) until it is exhausted or invalidated, max_batches were yielded or
+        stop() is called.
+        """
+        batches = 0
+        batch: list = []
+        committed = self.store.get(self.name)
+        while not self._stop.is_set() and (max_batches is None or batches < max_batches):
+            change = stream.try_next()
+            if change is not None:
+                batch.append(change)
+                invalidated = change.get("operationType") in INVALIDATE_EVENTS
+                if len(batch) < self.batch_size and not invalidated:
+                    continue
+            elif not batch:
+                # Idle: keep the stored token current with the server's post-batch token so
+                # a restart does not rescan oplog entries that the filter skipped.
+                token = getattr(stream, "resume_token", None)
+                if token is not None and token != committed:
+                    self._commit(token)
+                    committed = token
+                if not stream.alive:
+                    break
+                continue
+            else:
+                invalidated = False
+
+            token = batch[-1].get("_id")
+            self.delivered += len(batch)
+            batches += 1
+            yield batch
+            batch = []
+            if invalidated:
+                logger.info(f"Change stream {self.name} was invalidated")
+                self.store.drop(self.name)
+                self.store.save()
+                return
+            self._commit(token)
+            committed = token
+
+    def batches(self, max_batches: Optional[int] = None) -> Iterator[list]:
+        """Open the change stream and yield batches of events from it."""
+        self._stop.clear()
+        with self.open_stream() as stream:
+            yield from self.consume(stream, max_batches=max_batches)
+
+    def _run(self, callback: Callable[[list], Any]) -> None:
+        try:
+            for batch in self.batches():
+                callback(batch)
+        except PyMongoError as e:
+            self.error = str(e)
+            logger.warning(f"Change stream {self.name} stopped: {e}")
+        except Exception as e:
+            self.error = str(e)
+            logger.error(f"Change stream {self.name} callback failed, stopping: {e}")
+
+    def start(self, callback: Callable[[list], Any]) -> threading.Thread:
+        """Deliver batches to callback from a background thread."""
+        self.error = None
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(callback,), name=f"mongodb-watch-{self.name}", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "running": self.running,
+            "delivered": self.delivered,
+            "resume_token": self.store.get(self.name),
+            "error": self.error,
+        }
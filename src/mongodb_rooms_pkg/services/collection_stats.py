@@ -0,0 +1,187 @@
+from typing import Any, Optional
+
+from loguru import logger
+from pymongo.errors import OperationFailure
+
+from .metadata_cache import MetadataCache
+
+COLL_STATS_STAGE = {"$collStats": {"storageStats": {}, "count": {}}}
+INDEX_STATS_STAGE = {"$indexStats": {}}
+STATS_FIELDS = ("count", "size", "storageSize", "nindexes", "totalIndexSize")
+
+
+def build_batch_pipeline(names: list[str]) -> list[dict[str, Any]]:
+    """
+    Build one aggregation that returns $collStats and $indexStats documents for every
+    collection in names. It runs on names[0] and pulls the others in with $unionWith;
+    each document is tagged with _collection and _kind so results can be split again.
+    """
+    def tagged(name: str, stage: dict[str, Any], kind: str) -> list[dict[str, Any]]:
+        return [stage, {"$addFields": {"_collection": name, "_kind": kind}}]
+
+    pipeline = tagged(names[0], COLL_STATS_STAGE, "stats")
+    pipeline.append({"$unionWith": {"coll": names[0], "pipeline": tagged(names[0], INDEX_STATS_STAGE, "index")}})
+    for name in names[1:]:
+        pipeline.append({"$unionWith": {"coll": name, "pipeline": tagged(name, COLL_STATS_STAGE, "stats")}})
+        pipeline.append({"$unionWith": {"coll": name, "pipeline": tagged(name, INDEX_STATS_STAGE, "index")}})
+    return pipeline
+
+def merge_coll_stats(docs: list[dict[str, Any]]) -> Optional[dict[str, Any]]:
+    """
+    Fold $collStats output (one document per shard) into a collStats-command shaped dict.
+    """
+    if not docs:
+        return None
+    merged = dict.fromkeys(STATS_FIELDS, 0)
+    for doc in docs:
+        storage = doc.get("storageStats", {})
+        merged["count"] += storage.get("count", doc.get("count", 0))
+        merged["size"] += storage.get("size", 0)
+        merged["storageSize"] += storage.get("storageSize", 0)
+        merged["totalIndexSize"] += storage.get("totalIndexSize", 0)
+        merged["nindexes"] = max(merged["nindexes"], storage.get("nindexes", 0))
+    merged["avgObjSize"] = merged["size"] / merged["count"] if merged["count"] else None
+    return merged
+
+def merge_index_stats(docs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Turn $indexStats output into list_indexes-style specs, keeping one entry per index name
+    across shards.
+    """
+    indexes = {}
+    for doc in docs:
+        indexes.setdefault(doc["name"], doc.get("spec") or {"name": doc["name"], "key": doc.get("key", {})})
+    return list(indexes.values())
+
+def split_batch(docs: list[dict[str, Any]]) -> tuple[dict[str, dict[str, Any]], dict[str, list[dict[str, Any]]]]:
+    stats_docs: dict[str, list[dict[str, Any]]] = {}
+    index_docs: dict[str, list[dict[str, Any]]] = {}
+    for doc in docs:
+        target = stats_docs if doc.get("_kind") == "stats" else index_docs
+        target.setdefault(doc.get("_collection"), []).append(doc)
+    stats = {name: merge_coll_stats(group) for name, group in stats_docs.items()}
+    indexes = {name: merge_index_stats(group) for name, group in index_docs.items()}
+    return stats, indexes
+
+def existing_collections(db, names: list[str]) -> list[str]:
+    """Return which of names exist, using a single nameOnly listCollections with a filter."""
+    return db.list_collection_names(filter={"name": {"$in": list(names)}})
+
+def _collection_stats(db, name: str) -> Optional[dict[str, Any]]:
+    try:
+        return merge_coll_stats(list(db[name].aggregate([COLL_STATS_STAGE])))
+    except OperationFailure as e:
+        logger.debug(f"$collStats unavailable for {name}, falling back to collStats: {e}")
+        return db.command("collStats", name)
+
+def _collection_indexes(db, name: str) -> list[dict[str, Any]]:
+    try:
+        indexes = merge_index_stats(list(db[name].aggregate([INDEX_STATS_STAGE])))
+        if indexes:
+            return indexes
+    except OperationFailure as e:
+        logger.debug(f"$indexStats unavailable for {name}, falling back to listIndexes: {e}")
+    return list(db[name].list_indexes())
+
+def fetch_collection_metadata(db, names: list[str]) -> tuple[dict[str, dict[str, Any]], dict[str, list[dict[str, Any]]]]:
+    """
+    Fetch collStats-shaped stats and index specs for existing collections, in one
+    aggregation when the server allows it. Collections missing from the batch result (or
+    every collection, if the batch is rejected) are fetched one by one, falling back to
+    the collStats and listIndexes commands.
+    """
+    if not names:
+        return {}, {}
+
+    stats: dict[str, dict[str, Any]] = {}
+    indexes: dict[str, list[dict[str, Any]]] = {}
+    try:
+        stats, indexes = split_batch(list(db[names[0]].aggregate(build_batch_pipeline(names))))
+    except OperationFailure as e:
+        logger.debug(f"Batched collection stats unavailable, fetching per collection: {e}")
+
+    for name in names:
+        try:
+            if stats.get(name) is None:
+                stats[name] = _collection_stats(db, name)
+        except Exception as e:
+            logger.warning(f"Could not retrieve stats for {name}: {e}")
+        try:
+            if name not in indexes:
+                indexes[name] = _collection_indexes(db, name)
+        except Exception as e:
+            logger.warning(f"Could not retrieve indexes for {name}: {e}")
+    return stats, indexes
+
+def load_collection_metadata(db, database: str, names: list[str],
+                             cache: Optional[MetadataCache] = None) -> tuple[dict[str, dict[str, Any]], dict[str, list[dict[str, Any]]]]:
+    """
+    fetch_collection_metadata through the metadata cache: only collections with a missing
+    stats or indexes entry are fetched, and their results are cached individually.
+    """
+    if cache is None:
+        return fetch_collection_metadata(db, names)
+
+    stats = {}
+    indexes = {}
+    missing = []
+    for name in names:
+        found_stats, stats[name] = cache.get((database, name, "stats"))
+        found_indexes, indexes[name] = cache.get((database, name, "indexes"))
+        if not (found_stats and found_indexes):
+            missing.append(name)
+
+    fetched_stats, fetched_indexes = fetch_collection_metadata(db, missing)
+    for name in missing:
+        stats[name] = fetched_stats.get(name)
+        indexes[name] = fetched_indexes.get(name)
+        if stats[name] is not None:
+            cache.set((database, name, "stats"), stats[name])
+        if indexes[name] is not None:
+            cache.set((database, name, "indexes"), indexes[name])
+    return stats, indexes
+
+async def _collection_stats_async(db, name: str) -> Optional[dict[str, Any]]:
+    try:
+        cursor = await db[name].aggregate([COLL_STATS_STAGE])
+        return merge_coll_stats(await cursor.to_list())
+    except OperationFailure as e:
+        logger.debug(f"$collStats unavailable for {name}, falling back to collStats: {e}")
+        return await db.command("collStats", name)
+
+async def _collection_indexes_async(db, name: str) -> list[dict[str, Any]]:
+    try:
+        cursor = await db[name].aggregate([INDEX_STATS_STAGE])
+        indexes = merge_index_stats(await cursor.to_list())
+        if indexes:
+            return indexes
+    except OperationFailure as e:
+        logger.debug(f"$indexStats unavailable for {name}, falling back to listIndexes: {e}")
+    cursor = await db[name].list_indexes()
+    return await cursor.to_list()
+
+async def fetch_collection_metadata_async(db, names: list[str]) -> tuple[dict[str, dict[str, Any]], dict[str, list[dict[str, Any]]]]:
+    """Asyncio counterpart of fetch_collection_metadata for AsyncMongoClient databases."""
+    if not names:
+        return {}, {}
+
+    stats: dict[str, dict[str, Any]] = {}
+    indexes: dict[str, list[dict[str, Any]]] = {}
+    try:
+        cursor = await db[names[0]].aggregate(build_batch_pipeline(names))
+        stats, indexes = split_batch(await cursor.to_list())
+    except OperationFailure as e:
+        logger.debug(f"Batched collection stats unavailable, fetching per collection: {e}")
+
+    for name in names:
+        try:
+            if stats.get(name) is None:
+                stats[name] = await _collection_stats_async(db, name)
+        except Exception as e:
+            logger.warning(f"Could not retrieve stats for {name}: {e}")
+        try:
+            if name not in indexes:
+                indexes[name] = await _collection_indexes_async(db, name)
+        except Exception as e:
+            logger.warning(f"Could not retrieve indexes for {name}: {e}")
+    return stats, indexes
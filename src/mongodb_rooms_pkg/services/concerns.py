@@ -0,0 +1,73 @@
+import threading
+from typing import Any, Optional
+
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import make_read_preference, read_pref_mode_from_name
+from pymongo.write_concern import WriteConcern
+
+from mongodb_rooms_pkg.configuration.addonconfig import ConcernProfile
+
+
+class UnknownConcernProfileError(ValueError):
+    pass
+
+
+def concern_options(profile: ConcernProfile) -> dict[str, Any]:
+    """Translate a ConcernProfile into with_options() keyword arguments."""
+    options = {}
+    if profile.w is not None or profile.wtimeoutMS is not None or profile.journal is not None:
+        options["write_concern"] = WriteConcern(w=profile.w, wtimeout=profile.wtimeoutMS, j=profile.journal)
+    if profile.readConcern is not None:
+        options["read_concern"] = ReadConcern(profile.readConcern)
+    if profile.readPreference is not None:
+        options["read_preference"] = make_read_preference(read_pref_mode_from_name(profile.readPreference), None)
+    return options
+
+
+class ConcernResolver:
+    """
+    Resolves (collection, concern profile) pairs to collection handles configured with the
+    profile's write concern, read concern and read preference. with_options() copies are
+    cached per (database, collection, profile), so repeated calls reuse the same handle.
+    """
+
+    def __init__(self, profiles: Optional[dict[str, ConcernProfile]] = None):
+        self._options = {name: concern_options(profile) for name, profile in (profiles or {}).items()}
+        self._collections: dict[tuple[str, str, str], Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def profiles(self) -> list[str]:
+        return sorted(self._options)
+
+    def collection(self, db, name: str, profile: Optional[str] = None):
+        if profile is None:
+            return db[name]
+        options = self._options.get(profile)
+        if options is None:
+            raise UnknownConcernProfileError(f"Unknown concern profile '{profile}'")
+        key = (db.name, name, profile)
+        with self._lock:
+            collection = self._collections.get(key)
+            if collection is None:
+                collection = self._collections[key] = db[name].with_options(**options)
+            return collection
+
+    def clear(self) -> None:
+        with self._lock:
+            self._collections.clear()
+
+
+def resolve_collection(config, db, name: str, profile: Optional[str] = None,
+                       resolver: Optional[ConcernResolver] = None):
+    """
+    Collection handle for name with the named concern profile applied. Without a resolver
+    (actions called directly) the profile is looked up in config.concernProfiles and the
+    handle is not cached.
+    """
+    if profile is None:
+        return db[name]
+    if resolver is None:
+        profiles = config.concernProfiles or {}
+        resolver = ConcernResolver({profile: profiles[profile]} if profile in profiles else {})
+    return resolver.collection(db, name, profile)
@@ -1,12 +1,17 @@
-from typing import Optional
-from urllib.parse import quote_plus
+import threading
+import time
+from typing import Callable, Optional
+from urllib.parse import parse_qsl, quote_plus, urlencode
 
+from bson.raw_bson import RawBSONDocument
 from loguru import logger
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient, MongoClient, monitoring
 from pymongo.errors import ConnectionFailure
 
 from mongodb_rooms_pkg.configuration.addonconfig import CustomAddonConfig
 
+from .pool_telemetry import PoolTelemetry
+
 
 def build_uri(config: "CustomAddonConfig") -> str:
     """
@@ -67,14 +72,42 @@ def build_uri(config: "CustomAddonConfig") -> str:
         uri += f"?{query}"
     return uri
 
-def create_connection(uri: str) -> Optional[MongoClient]:
+DEFAULT_SERVER_SELECTION_TIMEOUT_MS = 5000
+
+
+def _client_options(uri: str) -> dict:
+    # Only apply the default server selection timeout when the URI does not configure one,
+    # keyword arguments would otherwise override the user's serverSelectionTimeoutMS.
+    query = uri.partition("?")[2]
+    if any(key.lower() == "serverselectiontimeoutms" for key, _ in parse_qsl(query)):
+        return {}
+    return {"serverSelectionTimeoutMS": DEFAULT_SERVER_SELECTION_TIMEOUT_MS}
+
+def create_connection(uri: str, lazy: bool = False, raw_bson: bool = False,
+                      telemetry: Optional[PoolTelemetry] = None,
+                      command_listener: Optional[monitoring.CommandListener] = None) -> Optional[MongoClient]:
     """
     Create a MongoDB connection using the provided URI.
     Returns a MongoClient if successful, otherwise None.
+    With lazy=True the client is returned without the blocking ping: server selection happens
+    in the background and on the first operation.
+    With raw_bson=True the client decodes documents as RawBSONDocument, which keeps the
+    server's BSON bytes and only parses the fields that are actually accessed.
+    With telemetry, the PoolTelemetry listener observes the client's connection pools and
+    server heartbeats. command_listener, if given, observes the client's commands.
     """
     try:
         logger.debug(f"Attempting to connect to MongoDB with URI: {uri}")
-        client = MongoClient(uri, serverSelectionTimeoutMS=5000)
+        options = _client_options(uri)
+        if raw_bson:
+            options["document_class"] = RawBSONDocument
+        listeners = [listener for listener in (telemetry, command_listener) if listener is not None]
+        if listeners:
+            options["event_listeners"] = listeners
+        client = MongoClient(uri, **options)
+        if lazy:
+            logger.debug("MongoClient created lazily, skipping ping")
+            return client
         logger.debug("MongoClient created, testing connection with ping...")
         client.admin.command("ping")
         logger.info("Successfully connected to MongoDB.")
@@ -91,3 +124,162 @@ def create_connection(uri: str) -> Optional[MongoClient]:
         else:
             logger.error(f"MongoDB connection failed with {error_type}: {e}")
         return None
+
+class ConnectionHealth:
+    """
+    Non-blocking view of a client's reachability.
+    check() pings the server in a daemon thread and records the outcome, so callers can poll
+    status() without waiting on server selection.
+    """
+
+    def __init__(self):
+        self._status = "disconnected"
+        self._error: Optional[str] = None
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _set(self, status: str, error: Optional[str] = None) -> None:
+        with self._lock:
+            self._status = status
+            self._error = error
+            self._checked_at = time.time()
+
+    def mark_ready(self) -> None:
+        self._set("ready")
+
+    def mark_unreachable(self, error: Optional[str] = None) -> None:
+        self._set("unreachable", error)
+
+    def mark_disconnected(self) -> None:
+        self._set("disconnected")
+
+    def check(self, client: MongoClient) -> threading.Thread:
+        self._set("connecting")
+
+        def ping():
+            try:
+                client.admin.command("ping")
+                self._set("ready")
+                logger.info("Background MongoDB health check succeeded.")
+            except Exception as e:
+                self._set("unreachable", str(e))
+                logger.error(f"Background MongoDB health check failed: {e}")
+
+        thread = threading.Thread(target=ping, name="mongodb-health-check", daemon=True)
+        thread.start()
+        return thread
+
+    def status(self) -> dict:
+        with self._lock:
+            return {"status": self._status, "error": self._error, "checked_at": self._checked_at}
+
+def normalize_uri(uri: str) -> str:
+    """
+    Normalize a MongoDB URI so that equivalent URIs map to the same pooled client:
+    URI options are case-insensitive and unordered, so keys are lower-cased and sorted.
+    """
+    base, _, query = uri.partition("?")
+    if not query:
+        return base
+    params = sorted((key.lower(), value) for key, value in parse_qsl(query, keep_blank_values=True))
+    return f"{base}?{urlencode(params)}"
+
+class ClientRegistry:
+    """
+    Process-wide, reference-counted pool of MongoClient instances keyed by normalized URI.
+    Addon instances pointing at the same cluster share one client (and therefore one connection
+    pool and one set of monitoring threads); the client is closed when the last user releases it.
+    """
+    _instance: Optional['ClientRegistry'] = None
+    _clients: dict[str, MongoClient] = {}
+    _refcounts: dict[str, int] = {}
+    _key_locks: dict[str, threading.Lock] = {}
+    _lock = threading.Lock()
+
+    def __new__(cls) -> 'ClientRegistry':
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    @staticmethod
+    def _key(uri: str, variant: str = "") -> str:
+        key = normalize_uri(uri)
+        return f"{key}#{variant}" if variant else key
+
+    def acquire(self, uri: str, factory: Callable[[str], Optional[MongoClient]] = None,
+                variant: str = "") -> Optional[MongoClient]:
+        """
+        Return the shared client for uri, creating it with factory (create_connection by default)
+        on first use. Returns None, without registering anything, if the client cannot be created.
+        variant separates clients that connect to the same URI with different client options
+        (e.g. "raw" for RawBSONDocument clients).
+        """
+        key = self._key(uri, variant)
+        with self._key_lock(key):
+            client = self._clients.get(key)
+            if client is None:
+                client = (factory or create_connection)(uri)
+                if client is None:
+                    return None
+                self._clients[key] = client
+                self._refcounts[key] = 0
+                logger.debug("Registered new shared MongoClient")
+            self._refcounts[key] += 1
+            return client
+
+    def release(self, uri: str, variant: str = "") -> None:
+        key = self._key(uri, variant)
+        with self._key_lock(key):
+            if key not in self._clients:
+                return
+            self._refcounts[key] -= 1
+            if self._refcounts[key] > 0:
+                return
+            client = self._clients.pop(key)
+            del self._refcounts[key]
+        client.close()
+        logger.debug("Closed shared MongoClient after last release")
+
+    def refcount(self, uri: str, variant: str = "") -> int:
+        return self._refcounts.get(self._key(uri, variant), 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._refcounts.clear()
+        for client in clients:
+            client.close()
+        logger.debug("Closed all shared MongoClients")
+
+async def create_async_connection(uri: str, telemetry: Optional[PoolTelemetry] = None) -> Optional[AsyncMongoClient]:
+    """
+    Create an asyncio MongoDB connection using the provided URI.
+    Returns an AsyncMongoClient if successful, otherwise None.
+    """
+    try:
+        logger.debug(f"Attempting to connect to MongoDB (async) with URI: {uri}")
+        options = _client_options(uri)
+        if telemetry is not None:
+            options["event_listeners"] = [telemetry]
+        client = AsyncMongoClient(uri, **options)
+        logger.debug("AsyncMongoClient created, testing connection with ping...")
+        await client.admin.command("ping")
+        logger.info("Successfully connected to MongoDB (async).")
+        return client
+    except ConnectionFailure as e:
+        logger.error(f"MongoDB connection failed - server unreachable or network issue: {e}")
+        return None
+    except Exception as e:
+        error_type = type(e).__name__
+        if "authentication" in str(e).lower() or "auth" in str(e).lower():
+            logger.error(f"MongoDB authentication failed - check username/password: {e}")
+        elif "invalid" in str(e).lower() and "uri" in str(e).lower():
+            logger.error(f"Invalid MongoDB URI format - check host configuration: {e}")
+        else:
+            logger.error(f"MongoDB connection failed with {error_type}: {e}")
+        return None
@@ -0,0 +1,127 @@
+import threading
+from typing import Any, Optional
+
+RANGE_OPERATORS = {"$gt", "$gte", "$lt", "$lte", "$ne", "$nin", "$exists", "$regex", "$not", "$type", "$mod"}
+EQUALITY_OPERATORS = {"$eq", "$in", "$all", "$elemMatch", "$size"}
+DEFAULT_MAX_SHAPES = 1000
+
+
+def filter_shape(filter: dict[str, Any]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Reduce a query filter to its shape: the fields compared by equality and the fields
+    compared by range, each sorted. Top-level $and branches are flattened; $or, $nor, $expr
+    and $text cannot be served by a single compound index prefix and are ignored.
+    """
+    equality: set[str] = set()
+    ranges: set[str] = set()
+
+    def visit(document: dict[str, Any]) -> None:
+        for field, condition in document.items():
+            if field == "$and":
+                for branch in condition:
+                    visit(branch)
+                continue
+            if field.startswith("$"):
+                continue
+            if isinstance(condition, dict) and condition and all(key.startswith("$") for key in condition):
+                operators = set(condition)
+                if operators & EQUALITY_OPERATORS:
+                    equality.add(field)
+                elif operators & RANGE_OPERATORS:
+                    ranges.add(field)
+            else:
+                equality.add(field)
+
+    visit(filter or {})
+    ranges -= equality
+    return tuple(sorted(equality)), tuple(sorted(ranges))
+
+def prefix_coverage(index_keys: list[str], equality: tuple[str, ...], ranges: tuple[str, ...]) -> int:
+    """
+    Number of filter fields an index can use as a key prefix: equality fields in any order
+    first, then one range field (the equality, sort, range rule).
+    """
+    covered = 0
+    remaining = set(equality)
+    for field in index_keys:
+        if field in remaining:
+            remaining.discard(field)
+            covered += 1
+            continue
+        if not remaining and field in ranges:
+            covered += 1
+        break
+    return covered
+
+
+class IndexAdvisor:
+    """
+    Collects the filter shapes of update, delete and upsert calls per collection and, given
+    the collection's listIndexes output, suggests compound indexes for the shapes no existing
+    index serves fully. Only a bounded number of distinct shapes is tracked.
+    """
+
+    def __init__(self, max_shapes: int = DEFAULT_MAX_SHAPES):
+        self.max_shapes = max_shapes
+        self._lock = threading.Lock()
+        self._shapes: dict[tuple[str, tuple[str, ...], tuple[str, ...]], dict[str, Any]] = {}
+
+    def observe(self, action: str, collection: str, filter: Optional[dict[str, Any]]) -> None:
+        equality, ranges = filter_shape(filter or {})
+        if not equality and not ranges:
+            return
+        key = (collection, equality, ranges)
+        with self._lock:
+            entry = self._shapes.get(key)
+            if entry is None:
+                if len(self._shapes) >= self.max_shapes:
+                    return
+                entry = self._shapes[key] = {"count": 0, "actions": {}}
+            entry["count"] += 1
+            entry["actions"][action] = entry["actions"].get(action, 0) + 1
+
+    def collections(self) -> list[str]:
+        with self._lock:
+            return sorted({collection for collection, _, _ in self._shapes})
+
+    def suggest(self, collection: str, indexes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Suggested indexes for collection, most frequently seen filter shape first."""
+        index_keys = [(index.get("name"), list(dict(index.get("key", {})))) for index in indexes if not index.get("hidden")]
+        with self._lock:
+            shapes = [(key, dict(entry, actions=dict(entry["actions"]))) for key, entry in self._shapes.items() if key[0] == collection]
+
+        suggestions: dict[tuple[str, ...], dict[str, Any]] = {}
+        for (_, equality, ranges), entry in shapes:
+            wanted = len(equality) + (1 if ranges else 0)
+            best_name, best = None, 0
+            for name, keys in index_keys:
+                covered = prefix_coverage(keys, equality, ranges)
+                if covered > best:
+                    best_name, best = name, covered
+            if best >= wanted:
+                continue
+            keys = dict.fromkeys(equality, 1)
+            if ranges:
+                keys[ranges[0]] = 1
+            existing = suggestions.get(tuple(keys))
+            if existing is not None:
+                existing["occurrences"] += entry["count"]
+                for action, count in entry["actions"].items():
+                    existing["actions"][action] = existing["actions"].get(action, 0) + count
+                continue
+            suggestions[tuple(keys)] = {
+                "collection": collection,
+                "keys": keys,
+                "equality_fields": list(equality),
+                "range_fields": list(ranges),
+                "occurrences": entry["count"],
+                "actions": entry["actions"],
+                "best_existing_index": best_name,
+                "covered_fields": best,
+                "reason": "no usable index" if best == 0 else f"index '{best_name}' covers {best} of {wanted} fields",
+            }
+        return sorted(suggestions.values(), key=lambda suggestion: -suggestion["occurrences"])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._shapes.clear()
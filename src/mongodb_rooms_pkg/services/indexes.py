@@ -0,0 +1,73 @@
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel, Field, model_validator
+from pymongo import IndexModel
+
+INDEX_DIRECTIONS = (1, -1, "text", "2d", "2dsphere", "hashed")
+WILDCARD_SUFFIX = "$**"
+
+
+class IndexSpec(BaseModel):
+    """
+    One index definition. `keys` maps fields to a direction (1, -1) or an index type
+    ("text", "2dsphere", "hashed"...), in key order; a "$**" or "path.$**" field makes it a
+    wildcard index.
+    """
+    keys: dict[str, Union[int, str]]
+    name: Optional[str] = None
+    unique: Optional[bool] = None
+    sparse: Optional[bool] = None
+    hidden: Optional[bool] = None
+    partial_filter_expression: Optional[dict[str, Any]] = None
+    expire_after_seconds: Optional[int] = Field(None, ge=0)
+    wildcard_projection: Optional[dict[str, Any]] = None
+    collation: Optional[dict[str, Any]] = None
+
+    @model_validator(mode="after")
+    def validate_index(self):
+        if not self.keys:
+            raise ValueError("Index keys cannot be empty")
+        for field, direction in self.keys.items():
+            if direction not in INDEX_DIRECTIONS:
+                raise ValueError(f"Invalid direction {direction!r} for index field '{field}'")
+        wildcard = any(field.endswith(WILDCARD_SUFFIX) for field in self.keys)
+        if self.wildcard_projection is not None and list(self.keys) != [WILDCARD_SUFFIX]:
+            raise ValueError("wildcard_projection requires a single '$**' key")
+        if self.expire_after_seconds is not None and (len(self.keys) != 1 or wildcard or "_id" in self.keys):
+            raise ValueError("TTL indexes (expire_after_seconds) need a single non-_id, non-wildcard field")
+        if wildcard and self.unique:
+            raise ValueError("Wildcard indexes cannot be unique")
+        if self.hidden and list(self.keys) == ["_id"]:
+            raise ValueError("The _id index cannot be hidden")
+        return self
+
+    def to_index_model(self) -> IndexModel:
+        options = {
+            "name": self.name,
+            "unique": self.unique,
+            "sparse": self.sparse,
+            "hidden": self.hidden,
+            "partialFilterExpression": self.partial_filter_expression,
+            "expireAfterSeconds": self.expire_after_seconds,
+            "wildcardProjection": self.wildcard_projection,
+            "collation": self.collation,
+        }
+        return IndexModel(list(self.keys.items()), **{key: value for key, value in options.items() if value is not None})
+
+
+def normalize_index(index: Any) -> dict[str, Any]:
+    """Turn a listIndexes document (SON key included) into a plain dict."""
+    document = dict(index)
+    document["key"] = dict(document.get("key", {}))
+    return document
+
+def create_index_models(collection, indexes: list[IndexSpec], **kwargs: Any) -> list[str]:
+    """Build every index of indexes in one createIndexes command; returns their names."""
+    if not indexes:
+        return []
+    return collection.create_indexes([index.to_index_model() for index in indexes], **kwargs)
+
+async def create_index_models_async(collection, indexes: list[IndexSpec], **kwargs: Any) -> list[str]:
+    if not indexes:
+        return []
+    return await collection.create_indexes([index.to_index_model() for index in indexes], **kwargs)
@@ -0,0 +1,83 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+
+class MetadataCache:
+    """
+    Thread-safe TTL cache with LRU eviction for collection metadata (collection names,
+    collStats, index lists...).
+
+    Keys are tuples of (database, collection or None, kind), which lets invalidate() drop
+    every entry of a database or of a single collection.
+    """
+
+    def __init__(self, ttl_seconds: float = 10.0, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[..., Any], *args: Any) -> Any:
+        found, value = self.get(key)
+        if found:
+            return value
+        value = loader(*args)
+        self.set(key, value)
+        return value
+
+    def invalidate(self, database: str, collection: Optional[str] = None) -> None:
+        """
+        Drop cached metadata for a whole database, or for one collection along with the
+        database's collection list (writes can create collections implicitly).
+        """
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if key[0] == database and (collection is None or key[1] in (collection, None))
+            ]
+            for key in stale:
+                del self._entries[key]
+        logger.debug(f"Invalidated {len(stale)} metadata cache entries")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cached(cache: Optional[MetadataCache], key: Hashable, loader: Callable[..., Any], *args: Any) -> Any:
+    """Call loader(*args) through cache when one is configured, otherwise call it directly."""
+    if cache is None:
+        return loader(*args)
+    return cache.get_or_load(key, loader, *args)
@@ -0,0 +1,345 @@
+import bisect
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any, Callable, Optional
+
+import bson
+from pymongo import monitoring
+
+from ..actions.base import OutputBase
+
+# Upper bounds, in seconds, of the latency histogram buckets (Prometheus style, +Inf implied).
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PERCENTILES = (0.5, 0.95, 0.99)
+DOCUMENT_COUNT_FIELDS = ("inserted_count", "modified_count", "upserted_count", "deleted_count")
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; percentiles are interpolated within buckets."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                return min(lower + (upper - lower) * (rank - seen) / bucket_count, self.max)
+            seen += bucket_count
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_seconds": self.total,
+            "max_seconds": self.max,
+            **{f"p{int(q * 100)}_seconds": self.percentile(q) for q in PERCENTILES},
+        }
+
+
+class _ActionStats:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.documents = 0
+        self.latency = LatencyHistogram()
+
+
+class _CommandStats:
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+
+def documents_processed(response: Any) -> int:
+    """Number of documents an action response reports as written or deleted."""
+    output = getattr(response, "output", None)
+    counts = (getattr(output, name, None) for name in DOCUMENT_COUNT_FIELDS)
+    return sum(count for count in counts if isinstance(count, int))
+
+
+class TimedPages:
+    """
+    Lazy pages of an action output, passed through unchanged: on_page is called with every
+    page consumed, and on_done(seconds since start, error) once the pages are exhausted,
+    raise or are closed.
+    """
+
+    def __init__(self, pages: Iterable[list[Any]], start: float, on_page: Callable[[list[Any]], Any],
+                 on_done: Callable[[float, bool], Any]):
+        self._pages = iter(pages)
+        self._start = start
+        self._on_page = on_page
+        self._on_done = on_done
+        self._done = False
+
+    def __iter__(self) -> "TimedPages":
+        return self
+
+    def __next__(self) -> list[Any]:
+        try:
+            page = next(self._pages)
+        except StopIteration:
+            self._finish(False)
+            raise
+        except Exception:
+            self._finish(True)
+            raise
+        self._on_page(page)
+        return page
+
+    def _finish(self, error: bool) -> None:
+        if not self._done:
+            self._done = True
+            self._on_done(time.perf_counter() - self._start, error)
+
+    def close(self) -> None:
+        close = getattr(self._pages, "close", None)
+        if close is not None:
+            close()
+        self._finish(False)
+
+
+class MetricsCollector:
+    """
+    Thread-safe per (action, collection) counters: calls, errors, documents processed and a
+    latency histogram. Addon methods report through timed(); for cursor-backed pages the
+    documents are counted as they are consumed and the latency covers reading all of them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._actions: dict[tuple[str, str], _ActionStats] = {}
+
+    def _stats(self, action: str, collection: Optional[str]) -> _ActionStats:
+        key = (action, collection or "")
+        stats = self._actions.get(key)
+        if stats is None:
+            stats = self._actions[key] = _ActionStats()
+        return stats
+
+    def record(self, action: str, collection: Optional[str], seconds: Optional[float], error: bool = False,
+               documents: int = 0) -> None:
+        """Count one call; seconds is None when its latency is reported later through observe_latency()."""
+        with self._lock:
+            stats = self._stats(action, collection)
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.documents += documents
+            if seconds is not None:
+                stats.latency.observe(seconds)
+
+    def observe_latency(self, action: str, collection: Optional[str], seconds: float, error: bool = False) -> None:
+        with self._lock:
+            stats = self._stats(action, collection)
+            stats.errors += int(error)
+            stats.latency.observe(seconds)
+
+    def add_documents(self, action: str, collection: Optional[str], documents: int) -> None:
+        with self._lock:
+            self._stats(action, collection).documents += documents
+
+    def timed(self, action: str, collection: Optional[str], func: Callable[..., Any], *args: Any,
+              on_complete: Optional[Callable[[float], Any]] = None, **kwargs: Any) -> Any:
+        """
+        Call func, record its latency and outcome, and return its response. When the output
+        has lazy `pages` (find, aggregate...), the call is counted at once but its latency is
+        only recorded once the pages are exhausted, since that is when the server work ends.
+        on_complete, if given, is called with that same latency when it is recorded.
+        """
+        start = time.perf_counter()
+        try:
+            response = func(*args, **kwargs)
+        except Exception:
+            self.record(action, collection, time.perf_counter() - start, error=True)
+            raise
+        code = getattr(response, "code", None)
+        error = isinstance(code, int) and code >= 400
+        documents = documents_processed(response)
+        output = getattr(response, "output", None)
+        if isinstance(output, OutputBase) and hasattr(output, "pages"):
+            if isinstance(output.pages, list):
+                documents += sum(len(page) for page in output.pages)
+            else:
+                output.pages = TimedPages(
+                    output.pages, start,
+                    on_page=lambda page: self.add_documents(action, collection, len(page)),
+                    on_done=lambda seconds, failed: self._complete(action, collection, seconds, failed, on_complete)
+                )
+                self.record(action, collection, None, error=error, documents=documents)
+                return response
+        seconds = time.perf_counter() - start
+        self.record(action, collection, seconds, error=error, documents=documents)
+        if on_complete is not None:
+            on_complete(seconds)
+        return response
+
+    def _complete(self, action: str, collection: Optional[str], seconds: float, error: bool,
+                  on_complete: Optional[Callable[[float], Any]]) -> None:
+        self.observe_latency(action, collection, seconds, error)
+        if on_complete is not None:
+            on_complete(seconds)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    "action": action,
+                    "collection": collection,
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "documents": stats.documents,
+                    "latency": stats.latency.snapshot(),
+                }
+                for (action, collection), stats in sorted(self._actions.items())
+            ]
+
+    def histograms(self) -> list[tuple[str, str, LatencyHistogram]]:
+        with self._lock:
+            return [(action, collection, stats.latency) for (action, collection), stats in sorted(self._actions.items())]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._actions.clear()
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    """
+    Process-wide pymongo CommandListener counting commands and wire bytes per
+    (database, collection, command). Sizes are measured by BSON-encoding the command and
+    reply documents, which costs roughly one extra encode per command, so it is opt-in and
+    only attached, through event_listeners, to the clients of addons enabling commandMetrics.
+    """
+
+    _instance: Optional['CommandMetricsListener'] = None
+
+    def __new__(cls) -> 'CommandMetricsListener':
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._lock = threading.Lock()
+            cls._instance._pending = {}
+            cls._instance._commands = {}
+        return cls._instance
+
+    @staticmethod
+    def _size(document: Any) -> int:
+        raw = getattr(document, "raw", None)
+        if raw is not None:
+            return len(raw)
+        try:
+            return len(bson.encode(document))
+        except Exception:
+            return 0
+
+    def started(self, event) -> None:
+        # getMore names its collection separately, its own value is the cursor id.
+        target = event.command.get("collection" if event.command_name == "getMore" else event.command_name)
+        collection = target if isinstance(target, str) else ""
+        key = (event.database_name, collection, event.command_name)
+        size = self._size(event.command)
+        with self._lock:
+            self._pending[(event.connection_id, event.request_id)] = key
+            stats = self._commands.setdefault(key, _CommandStats())
+            stats.calls += 1
+            stats.bytes_sent += size
+
+    def succeeded(self, event) -> None:
+        size = self._size(event.reply)
+        with self._lock:
+            key = self._pending.pop((event.connection_id, event.request_id), None)
+            if key is not None:
+                self._commands[key].bytes_received += size
+
+    def failed(self, event) -> None:
+        with self._lock:
+            key = self._pending.pop((event.connection_id, event.request_id), None)
+            if key is not None:
+                self._commands[key].failures += 1
+
+    def snapshot(self, database: Optional[str] = None) -> list[dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    "database": db,
+                    "collection": collection,
+                    "command": command,
+                    "calls": stats.calls,
+                    "failures": stats.failures,
+                    "bytes_sent": stats.bytes_sent,
+                    "bytes_received": stats.bytes_received,
+                }
+                for (db, collection, command), stats in sorted(self._commands.items())
+                if database is None or db == database
+            ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._commands.clear()
+
+
+def _labels(**labels: str) -> str:
+    escaped = (
+        f'{name}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for name, value in labels.items()
+    )
+    return "{" + ",".join(escaped) + "}"
+
+def to_prometheus(collector: MetricsCollector, commands: Optional[list[dict[str, Any]]] = None,
+                  prefix: str = "mongodb_rooms") -> str:
+    """Render collector (and optional command snapshots) in the Prometheus text format."""
+    lines = []
+    actions = collector.snapshot()
+    for metric, field, help_text in (
+        ("action_calls_total", "calls", "Number of action calls"),
+        ("action_errors_total", "errors", "Number of failed action calls"),
+        ("action_documents_total", "documents", "Documents written, deleted or read by actions"),
+    ):
+        lines += [f"# HELP {prefix}_{metric} {help_text}", f"# TYPE {prefix}_{metric} counter"]
+        lines += [
+            f"{prefix}_{metric}{_labels(action=entry['action'], collection=entry['collection'])} {entry[field]}"
+            for entry in actions
+        ]
+
+    name = f"{prefix}_action_duration_seconds"
+    lines += [f"# HELP {name} Action latency", f"# TYPE {name} histogram"]
+    for action, collection, histogram in collector.histograms():
+        cumulative = 0
+        for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f"{name}_bucket{_labels(action=action, collection=collection, le=le)} {cumulative}")
+        lines.append(f"{name}_sum{_labels(action=action, collection=collection)} {histogram.total}")
+        lines.append(f"{name}_count{_labels(action=action, collection=collection)} {histogram.count}")
+
+    if commands is not None:
+        for metric, field, help_text in (
+            ("command_calls_total", "calls", "Number of commands sent to the server"),
+            ("command_failures_total", "failures", "Number of failed commands"),
+            ("command_sent_bytes_total", "bytes_sent", "BSON bytes of commands sent"),
+            ("command_received_bytes_total", "bytes_received", "BSON bytes of replies received"),
+        ):
+            lines += [f"# HELP {prefix}_{metric} {help_text}", f"# TYPE {prefix}_{metric} counter"]
+            lines += [
+                f"{prefix}_{metric}{_labels(database=entry['database'], collection=entry['collection'], command=entry['command'])} {entry[field]}"
+                for entry in commands
+            ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,161 @@
+import datetime
+import queue
+import threading
+from collections.abc import Iterator
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+from bson import Decimal128, Int64, ObjectId
+from loguru import logger
+
+from mongodb_rooms_pkg.utils.batching import iter_batches
+
+_DONE = object()
+
+
+class PartitionScanError(RuntimeError):
+    def __init__(self, partition: int, cause: Exception):
+        super().__init__(f"Partition {partition} failed: {cause}")
+        self.partition = partition
+        self.cause = cause
+
+
+def id_type_alias(value: Any) -> Optional[str]:
+    """$type alias of an _id value, or None for types range partitioning does not handle."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float, Int64, Decimal128, Decimal)):
+        return "number"
+    if isinstance(value, ObjectId):
+        return "objectId"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, datetime.datetime):
+        return "date"
+    return None
+
+
+def split_points(collection, partitions: int, sample_size: Optional[int] = None) -> list[Any]:
+    """
+    _id values splitting the collection into about `partitions` equally sized ranges, taken
+    from a $bucketAuto over a $sample of the _id index. Returns [] (one partition) when the
+    collection is too small or its sampled _id values are not all of one comparable type.
+    """
+    if partitions <= 1:
+        return []
+    pipeline = [
+        {"$sample": {"size": sample_size or partitions * 100}},
+        {"$project": {"_id": 1}},
+        {"$bucketAuto": {"groupBy": "$_id", "buckets": partitions}},
+    ]
+    buckets = list(collection.aggregate(pipeline))
+    points = [bucket["_id"]["min"] for bucket in buckets[1:]]
+    aliases = {id_type_alias(bucket["_id"][bound]) for bucket in buckets for bound in ("min", "max")}
+    if len(aliases) != 1 or None in aliases:
+        if buckets:
+            logger.info("Sampled _id values are not of a single range-partitionable type, scanning as one partition")
+        return []
+    return points
+
+
+def partition_filters(points: list[Any]) -> list[dict[str, Any]]:
+    """
+    Range filters covering the whole _id space for the given split points. Range queries only
+    match values of the bounds' type, so a last partition collects the _id values of any
+    other type.
+    """
+    if not points:
+        return [{}]
+    ranges = [{"_id": {"$lt": points[0]}}]
+    ranges += [{"_id": {"$gte": lower, "$lt": upper}} for lower, upper in zip(points, points[1:])]
+    ranges.append({"_id": {"$gte": points[-1]}})
+    ranges.append({"_id": {"$not": {"$type": id_type_alias(points[0])}}})
+    return ranges
+
+
+def scan_partitions(collection, partitions: list[dict[str, Any]], filter: Optional[dict[str, Any]] = None,
+                    projection: Optional[dict[str, Any]] = None, batch_size: int = 1000, max_workers: int = 4,
+                    queue_size: Optional[int] = None,
+                    progress: Optional[Callable[[dict[str, Any]], Any]] = None) -> Iterator[list[Any]]:
+    """
+    Read every partition with its own cursor on max_workers threads sharing the collection's
+    client, and yield batches of documents in the order they arrive. At most queue_size
+    batches (default 2 * max_workers) wait in memory: workers block once it is full.
+    progress, if given, is called from the consuming thread after every batch and finished
+    partition. Closing the iterator, or dropping it, stops the workers and their cursors; a
+    failed partition stops the scan with PartitionScanError. Workers are daemon threads, so
+    an iterator still referenced at interpreter exit does not keep the process alive.
+    """
+    batches: queue.Queue = queue.Queue(maxsize=queue_size or max_workers * 2)
+    pending: queue.SimpleQueue = queue.SimpleQueue()
+    stop = threading.Event()
+    counts = [0] * len(partitions)
+    finished = [False] * len(partitions)
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read(index: int, range_filter: dict[str, Any]) -> None:
+        try:
+            query = {"$and": [filter, range_filter]} if filter and range_filter else (filter or range_filter)
+            cursor = collection.find(query, projection=projection, batch_size=batch_size)
+            try:
+                for batch in iter_batches(cursor, batch_size):
+                    if not put((index, batch)):
+                        return
+            finally:
+                cursor.close()
+            put((index, _DONE))
+        except Exception as e:
+            put((index, e))
+
+    def work() -> None:
+        while not stop.is_set():
+            try:
+                index, range_filter = pending.get_nowait()
+            except queue.Empty:
+                return
+            read(index, range_filter)
+
+    def report(index: int) -> None:
+        if progress is not None:
+            progress({
+                "partition": index,
+                "partition_documents": counts[index],
+                "partition_done": finished[index],
+                "documents": sum(counts),
+                "completed": sum(finished),
+                "total": len(partitions),
+            })
+
+    for item in enumerate(partitions):
+        pending.put(item)
+    workers = []
+    try:
+        for number in range(min(max_workers, len(partitions))):
+            worker = threading.Thread(target=work, name=f"mongodb-scan_{number}", daemon=True)
+            worker.start()
+            workers.append(worker)
+        remaining = len(partitions)
+        while remaining:
+            index, item = batches.get()
+            if item is _DONE:
+                finished[index] = True
+                remaining -= 1
+                report(index)
+                continue
+            if isinstance(item, Exception):
+                raise PartitionScanError(index, item) from item
+            counts[index] += len(item)
+            report(index)
+            yield item
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join()
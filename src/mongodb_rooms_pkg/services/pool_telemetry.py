@@ -0,0 +1,264 @@
+import threading
+import time
+from typing import Any, Optional
+
+from loguru import logger
+from pymongo import monitoring
+
+from .metrics import LatencyHistogram
+
+DEFAULT_MAX_POOL_SIZE = 100
+
+
+def _address(address: Any) -> str:
+    if isinstance(address, tuple) and len(address) == 2:
+        return f"{address[0]}:{address[1]}"
+    return str(address)
+
+
+class _PoolStats:
+    def __init__(self, max_pool_size: int):
+        self.max_pool_size = max_pool_size
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.check_outs = 0
+        self.check_out_failures: dict[str, int] = {}
+        self.wait_time = LatencyHistogram()
+        self.created = 0
+        self.closed = 0
+        self.closed_by_reason: dict[str, int] = {}
+        self.cleared = 0
+        self.last_alert_at = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "max_pool_size": self.max_pool_size,
+            "checked_out": self.checked_out,
+            "peak_checked_out": self.peak_checked_out,
+            "utilization": self.checked_out / self.max_pool_size if self.max_pool_size else None,
+            "waiting": self.waiting,
+            "peak_waiting": self.peak_waiting,
+            "check_outs": self.check_outs,
+            "check_out_failures": dict(self.check_out_failures),
+            "wait_time": self.wait_time.snapshot(),
+            "connections_open": self.created - self.closed,
+            "connections_created": self.created,
+            "connections_closed": self.closed,
+            "closed_by_reason": dict(self.closed_by_reason),
+            "cleared": self.cleared,
+        }
+
+
+class _ServerStats:
+    def __init__(self):
+        self.server_type: Optional[str] = None
+        self.heartbeats = 0
+        self.heartbeat_failures = 0
+        self.last_rtt: Optional[float] = None
+        self.rtt = LatencyHistogram()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "server_type": self.server_type,
+            "heartbeats": self.heartbeats,
+            "heartbeat_failures": self.heartbeat_failures,
+            "last_rtt_seconds": self.last_rtt,
+            "rtt": self.rtt.snapshot(),
+        }
+
+
+class PoolTelemetry(monitoring.ConnectionPoolListener, monitoring.ServerListener, monitoring.ServerHeartbeatListener):
+    """
+    Connection pool and server monitoring listener for one MongoClient, passed through
+    event_listeners by create_connection. Tracks, per server address, checked-out and waiting
+    connections, check-out wait time, connection churn and heartbeat round-trip time.
+
+    Pool lifecycle changes, check-out failures and heartbeat failures are logged as structured
+    events (loguru extra field "event"). A "pool_saturated" warning is emitted, at most once per
+    alert_interval_seconds and server, when checked-out connections reach saturation_ratio of
+    maxPoolSize or a check-out waited longer than wait_alert_seconds.
+    """
+
+    def __init__(self, saturation_ratio: float = 0.9, wait_alert_seconds: float = 1.0,
+                 alert_interval_seconds: float = 60.0):
+        self.saturation_ratio = saturation_ratio
+        self.wait_alert_seconds = wait_alert_seconds
+        self.alert_interval_seconds = alert_interval_seconds
+        self._lock = threading.Lock()
+        self._pools: dict[str, _PoolStats] = {}
+        self._servers: dict[str, _ServerStats] = {}
+
+    @staticmethod
+    def _event(name: str, level: str, message: str, **fields: Any) -> None:
+        logger.bind(event=name, **fields).log(level, message)
+
+    def _pool(self, address: Any, max_pool_size: Optional[int] = None) -> _PoolStats:
+        key = _address(address)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _PoolStats(max_pool_size or DEFAULT_MAX_POOL_SIZE)
+        return pool
+
+    def _server(self, address: Any) -> _ServerStats:
+        return self._servers.setdefault(_address(address), _ServerStats())
+
+    def _check_saturation(self, address: Any, pool: _PoolStats, wait: Optional[float] = None) -> Optional[dict[str, Any]]:
+        saturated = pool.max_pool_size and pool.checked_out >= self.saturation_ratio * pool.max_pool_size
+        slow_wait = wait is not None and wait >= self.wait_alert_seconds
+        now = time.monotonic()
+        if not (saturated or slow_wait) or now - pool.last_alert_at < self.alert_interval_seconds:
+            return None
+        pool.last_alert_at = now
+        return {
+            "address": _address(address),
+            "checked_out": pool.checked_out,
+            "max_pool_size": pool.max_pool_size,
+            "waiting": pool.waiting,
+            "wait_seconds": wait,
+        }
+
+    def _alert(self, alert: Optional[dict[str, Any]]) -> None:
+        if alert is not None:
+            self._event(
+                "pool_saturated", "WARNING",
+                f"MongoDB connection pool for {alert['address']} is saturated: "
+                f"{alert['checked_out']}/{alert['max_pool_size']} connections checked out, {alert['waiting']} waiting",
+                **alert
+            )
+
+    # Connection pool events
+
+    def pool_created(self, event) -> None:
+        max_pool_size = (event.options or {}).get("maxPoolSize")
+        with self._lock:
+            pool = self._pool(event.address, max_pool_size)
+            if max_pool_size:
+                pool.max_pool_size = max_pool_size
+        self._event("pool_created", "DEBUG", f"MongoDB connection pool created for {_address(event.address)}",
+                    address=_address(event.address), max_pool_size=max_pool_size)
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        with self._lock:
+            self._pool(event.address).cleared += 1
+        self._event("pool_cleared", "WARNING", f"MongoDB connection pool cleared for {_address(event.address)}",
+                    address=_address(event.address))
+
+    def pool_closed(self, event) -> None:
+        self._event("pool_closed", "DEBUG", f"MongoDB connection pool closed for {_address(event.address)}",
+                    address=_address(event.address))
+
+    def connection_created(self, event) -> None:
+        with self._lock:
+            self._pool(event.address).created += 1
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_closed(self, event) -> None:
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.closed += 1
+            pool.closed_by_reason[event.reason] = pool.closed_by_reason.get(event.reason, 0) + 1
+
+    def connection_check_out_started(self, event) -> None:
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.waiting += 1
+            pool.peak_waiting = max(pool.peak_waiting, pool.waiting)
+
+    def connection_check_out_failed(self, event) -> None:
+        wait = getattr(event, "duration", None)
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.waiting = max(pool.waiting - 1, 0)
+            pool.check_out_failures[event.reason] = pool.check_out_failures.get(event.reason, 0) + 1
+            alert = self._check_saturation(event.address, pool, wait)
+        self._event("connection_check_out_failed", "WARNING",
+                    f"MongoDB connection check out failed for {_address(event.address)}: {event.reason}",
+                    address=_address(event.address), reason=event.reason, wait_seconds=wait)
+        self._alert(alert)
+
+    def connection_checked_out(self, event) -> None:
+        wait = getattr(event, "duration", None)
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.waiting = max(pool.waiting - 1, 0)
+            pool.checked_out += 1
+            pool.peak_checked_out = max(pool.peak_checked_out, pool.checked_out)
+            pool.check_outs += 1
+            if wait is not None:
+                pool.wait_time.observe(wait)
+            alert = self._check_saturation(event.address, pool, wait)
+        self._alert(alert)
+
+    def connection_checked_in(self, event) -> None:
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.checked_out = max(pool.checked_out - 1, 0)
+
+    # Server and heartbeat events
+
+    def opened(self, event) -> None:
+        pass
+
+    def description_changed(self, event) -> None:
+        server_type = event.new_description.server_type_name
+        previous = event.previous_description.server_type_name
+        with self._lock:
+            self._server(event.server_address).server_type = server_type
+        if server_type != previous:
+            self._event("server_type_changed", "INFO",
+                        f"MongoDB server {_address(event.server_address)} changed from {previous} to {server_type}",
+                        address=_address(event.server_address), previous=previous, server_type=server_type)
+
+    def closed(self, event) -> None:
+        pass
+
+    def started(self, event) -> None:
+        pass
+
+    def succeeded(self, event) -> None:
+        with self._lock:
+            server = self._server(event.connection_id)
+            server.heartbeats += 1
+            server.last_rtt = event.duration
+            server.rtt.observe(event.duration)
+
+    def failed(self, event) -> None:
+        with self._lock:
+            server = self._server(event.connection_id)
+            server.heartbeats += 1
+            server.heartbeat_failures += 1
+        self._event("heartbeat_failed", "WARNING",
+                    f"MongoDB heartbeat to {_address(event.connection_id)} failed: {event.reply}",
+                    address=_address(event.connection_id), error=str(event.reply))
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "pools": {address: pool.snapshot() for address, pool in sorted(self._pools.items())},
+                "servers": {address: server.snapshot() for address, server in sorted(self._servers.items())},
+            }
+
+
+def pool_telemetry_from_config(config) -> Optional[PoolTelemetry]:
+    """Build a PoolTelemetry listener when the configuration enables poolTelemetry."""
+    if not config.poolTelemetry:
+        return None
+    return PoolTelemetry(
+        saturation_ratio=config.poolSaturationRatio or 0.9,
+        wait_alert_seconds=(config.poolWaitAlertMS or 1000) / 1000
+    )
+
+def find_pool_telemetry(client) -> Optional[PoolTelemetry]:
+    """Return the PoolTelemetry listener a client was created with, if any."""
+    options = getattr(client, "options", None)
+    for listener in getattr(options, "event_listeners", None) or ():
+        if isinstance(listener, PoolTelemetry):
+            return listener
+    return None
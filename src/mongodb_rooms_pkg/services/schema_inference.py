@@ -0,0 +1,325 @@
+import datetime
+import hashlib
+import heapq
+import re
+import uuid
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any, Optional
+
+from bson import Binary, Code, DBRef, Decimal128, Int64, MaxKey, MinKey, ObjectId, Regex, Timestamp
+from loguru import logger
+from pymongo.errors import OperationFailure
+
+DEFAULT_SAMPLE_SIZE = 1000
+DEFAULT_MAX_DEPTH = 3
+DEFAULT_SKETCH_SIZE = 256
+MAX_SAMPLE_VALUES = 3
+INT32_MAX = 2 ** 31 - 1
+CONTAINER_TYPES = ("object", "array")
+
+_BSON_TYPE_NAMES = (
+    (bool, "bool"),
+    (Int64, "long"),
+    (int, "int"),
+    (float, "double"),
+    (str, "string"),
+    (Mapping, "object"),
+    ((list, tuple), "array"),
+    (ObjectId, "objectId"),
+    (datetime.datetime, "date"),
+    ((Decimal128, Decimal), "decimal"),
+    ((Binary, bytes, uuid.UUID), "binData"),
+    ((Regex, re.Pattern), "regex"),
+    (Timestamp, "timestamp"),
+    (Code, "javascript"),
+    (DBRef, "dbPointer"),
+    (MinKey, "minKey"),
+    (MaxKey, "maxKey"),
+)
+
+
+def bson_type_name(value: Any) -> str:
+    """Return the aggregation $type name of a decoded BSON value."""
+    if value is None:
+        return "null"
+    for types, name in _BSON_TYPE_NAMES:
+        if isinstance(value, types):
+            if name == "int" and not -INT32_MAX - 1 <= value <= INT32_MAX:
+                return "long"
+            return name
+    return type(value).__name__
+
+
+class KMVSketch:
+    """
+    K-minimum-values distinct counter: keeps the k smallest 64-bit hashes seen and
+    estimates cardinality from the k-th one, in O(k) memory regardless of stream length.
+    """
+
+    def __init__(self, k: int = DEFAULT_SKETCH_SIZE, hashes: Optional[list[int]] = None):
+        self.k = k
+        self._heap = [-h for h in (hashes or [])]
+        heapq.heapify(self._heap)
+        self._members = set(hashes or [])
+
+    @staticmethod
+    def _hash(value: Any) -> int:
+        digest = hashlib.blake2b(f"{bson_type_name(value)}:{value!r}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+    def add(self, value: Any) -> None:
+        h = self._hash(value)
+        if h in self._members:
+            return
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, -h)
+            self._members.add(h)
+        elif h < -self._heap[0]:
+            self._members.discard(-heapq.heapreplace(self._heap, -h))
+            self._members.add(h)
+
+    def estimate(self) -> int:
+        if len(self._heap) < self.k:
+            return len(self._heap)
+        kth = -self._heap[0]
+        return int((self.k - 1) * (2 ** 64) / (kth + 1))
+
+    def hashes(self) -> list[int]:
+        return sorted(-h for h in self._heap)
+
+
+class SchemaProfile:
+    """
+    Streaming schema accumulator. observe() walks one document, descending into nested
+    documents and into documents held in arrays up to max_depth, and keeps per dotted path:
+    the number of documents containing it, per-BSON-type document counts, a few sample
+    values and a KMV sketch of distinct scalar values. Memory depends on the number of
+    paths, never on the number of documents observed.
+    """
+
+    def __init__(self, max_depth: int = DEFAULT_MAX_DEPTH, sketch_size: int = DEFAULT_SKETCH_SIZE):
+        self.max_depth = max_depth
+        self.sketch_size = sketch_size
+        self.document_count = 0
+        self._paths: dict[str, dict[str, Any]] = {}
+        self._sketches: dict[str, KMVSketch] = {}
+
+    def _walk(self, value: Any, path: str, depth: int, seen: dict[str, set[str]]) -> None:
+        type_name = bson_type_name(value)
+        seen.setdefault(path, set()).add(type_name)
+        if type_name not in CONTAINER_TYPES and type_name != "null":
+            stats = self._paths.setdefault(path, _empty_path())
+            if len(stats["sample_values"]) < MAX_SAMPLE_VALUES and value not in stats["sample_values"]:
+                stats["sample_values"].append(value)
+            self._sketches.setdefault(path, KMVSketch(self.sketch_size)).add(value)
+
+        if depth >= self.max_depth:
+            return
+        if type_name == "object":
+            children = [value]
+        elif type_name == "array":
+            children = [element for element in value if isinstance(element, Mapping)]
+        else:
+            return
+        for child in children:
+            for key, child_value in child.items():
+                self._walk(child_value, f"{path}.{key}", depth + 1, seen)
+
+    def observe(self, document: dict[str, Any], new_document: bool = True) -> None:
+        """
+        Add document to the profile. With new_document=False (a new version of a document
+        already observed) sample values and sketches are updated and paths or types not seen
+        before are recorded, but document and presence counts are left unchanged.
+        """
+        seen: dict[str, set[str]] = {}
+        for key, value in document.items():
+            self._walk(value, key, 0, seen)
+        if new_document:
+            self.document_count += 1
+        for path, types in seen.items():
+            stats = self._paths.setdefault(path, _empty_path())
+            if new_document or stats["count"] == 0:
+                stats["count"] += 1
+            for type_name in types:
+                if new_document or type_name not in stats["types"]:
+                    stats["types"][type_name] = stats["types"].get(type_name, 0) + 1
+
+    def observe_many(self, documents) -> "SchemaProfile":
+        for document in documents:
+            self.observe(document)
+        return self
+
+    def fields(self) -> list[dict[str, Any]]:
+        return [
+            _field_summary(
+                path, stats["count"], stats["types"], self.document_count,
+                self._sketches[path].estimate() if path in self._sketches else None,
+                stats["sample_values"]
+            )
+            for path, stats in self._paths.items()
+        ]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "max_depth": self.max_depth,
+            "sketch_size": self.sketch_size,
+            "document_count": self.document_count,
+            "paths": self._paths,
+            "sketches": {path: sketch.hashes() for path, sketch in self._sketches.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SchemaProfile":
+        profile = cls(data.get("max_depth", DEFAULT_MAX_DEPTH), data.get("sketch_size", DEFAULT_SKETCH_SIZE))
+        profile.document_count = data.get("document_count", 0)
+        profile._paths = data.get("paths", {})
+        profile._sketches = {
+            path: KMVSketch(profile.sketch_size, hashes) for path, hashes in data.get("sketches", {}).items()
+        }
+        return profile
+
+
+def _empty_path() -> dict[str, Any]:
+    return {"count": 0, "types": {}, "sample_values": []}
+
+def _field_summary(path: str, count: int, types: dict[str, int], total: int,
+                   cardinality: Optional[int], sample_values: list[Any]) -> dict[str, Any]:
+    type_total = sum(types.values()) or 1
+    return {
+        "field_name": path,
+        "data_types": [type_name for type_name in types if type_name != "null"],
+        "null_count": types.get("null", 0),
+        "sample_values": sample_values,
+        "count": count,
+        "presence_ratio": count / total if total else None,
+        "type_distribution": {type_name: n / type_total for type_name, n in types.items()},
+        "cardinality_estimate": cardinality,
+    }
+
+
+def _children(parent: str, source: str, depth: int) -> dict[str, Any]:
+    return {"$map": {
+        "input": {"$objectToArray": source},
+        "as": "child",
+        "in": {"k": {"$concat": [f"$${parent}.k", ".", "$$child.k"]}, "v": "$$child.v", "d": depth + 1}
+    }}
+
+def build_schema_pipeline(sample_size: int = DEFAULT_SAMPLE_SIZE, max_depth: int = DEFAULT_MAX_DEPTH) -> list[dict[str, Any]]:
+    """
+    Aggregation that profiles a $sample of sample_size documents on the server. Each
+    document becomes a list of {k: dotted path, v: value, d: depth} entries; every round
+    expands the entries of the current depth that hold documents or arrays of documents.
+    Two $group stages then yield one row per (path, $type) with the number of documents,
+    the distinct scalar values and a few samples, so only the histogram reaches Python.
+    """
+    pipeline: list[dict[str, Any]] = [
+        {"$sample": {"size": sample_size}},
+        {"$project": {"_kv": {"$map": {
+            "input": {"$objectToArray": "$$ROOT"},
+            "as": "f",
+            "in": {"k": "$$f.k", "v": "$$f.v", "d": 0}
+        }}}},
+    ]
+    for depth in range(max_depth):
+        expand = {"$let": {"vars": {"parent": "$$this"}, "in": {"$switch": {
+            "branches": [
+                {"case": {"$ne": ["$$parent.d", depth]}, "then": []},
+                {"case": {"$eq": [{"$type": "$$parent.v"}, "object"]}, "then": _children("parent", "$$parent.v", depth)},
+                {"case": {"$eq": [{"$type": "$$parent.v"}, "array"]}, "then": {"$reduce": {
+                    "input": {"$filter": {"input": "$$parent.v", "as": "e", "cond": {"$eq": [{"$type": "$$e"}, "object"]}}},
+                    "initialValue": [],
+                    "in": {"$concatArrays": ["$$value", _children("parent", "$$this", depth)]}
+                }}},
+            ],
+            "default": []
+        }}}}
+        pipeline.append({"$set": {"_kv": {"$reduce": {
+            "input": "$_kv",
+            "initialValue": [],
+            "in": {"$concatArrays": ["$$value", ["$$this"], expand]}
+        }}}})
+    pipeline += [
+        {"$unwind": "$_kv"},
+        {"$group": {
+            "_id": {"doc": "$_id", "path": "$_kv.k", "type": {"$type": "$_kv.v"}},
+            "value": {"$first": {"$cond": [
+                {"$in": [{"$type": "$_kv.v"}, ["object", "array", "null"]]}, None, "$_kv.v"
+            ]}}
+        }},
+        {"$group": {
+            "_id": {"path": "$_id.path", "type": "$_id.type"},
+            "count": {"$sum": 1},
+            "values": {"$addToSet": "$value"}
+        }},
+        {"$project": {
+            "_id": 0,
+            "path": "$_id.path",
+            "type": "$_id.type",
+            "count": 1,
+            "values": {"$filter": {"input": "$values", "cond": {"$ne": ["$$this", None]}}}
+        }},
+        {"$project": {
+            "path": 1,
+            "type": 1,
+            "count": 1,
+            "distinct": {"$size": "$values"},
+            "samples": {"$slice": ["$values", MAX_SAMPLE_VALUES]}
+        }},
+        {"$sort": {"path": 1, "type": 1}},
+    ]
+    return pipeline
+
+def fields_from_histogram(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Fold the (path, type) rows of build_schema_pipeline into per-path field summaries."""
+    paths: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        entry = paths.setdefault(row["path"], {"types": {}, "distinct": 0, "samples": []})
+        entry["types"][row["type"]] = row["count"]
+        entry["distinct"] += row.get("distinct", 0)
+        entry["samples"].extend(row.get("samples", [])[:MAX_SAMPLE_VALUES - len(entry["samples"])])
+
+    total = sum(paths["_id"]["types"].values()) if "_id" in paths else max(
+        (max(entry["types"].values()) for entry in paths.values()), default=0
+    )
+    return [
+        _field_summary(
+            path, min(sum(entry["types"].values()), total), entry["types"], total,
+            entry["distinct"] if any(t not in CONTAINER_TYPES + ("null",) for t in entry["types"]) else None,
+            entry["samples"]
+        )
+        for path, entry in paths.items()
+    ]
+
+def infer_schema(collection, sample_size: int = DEFAULT_SAMPLE_SIZE, max_depth: int = DEFAULT_MAX_DEPTH) -> list[dict[str, Any]]:
+    """
+    Profile a collection with the server-side histogram pipeline. When the server rejects
+    it, stream a $sample through SchemaProfile instead, one cursor batch at a time.
+    """
+    try:
+        return fields_from_histogram(list(collection.aggregate(build_schema_pipeline(sample_size, max_depth), allowDiskUse=True)))
+    except OperationFailure as e:
+        logger.debug(f"Server-side schema inference unavailable, streaming sample: {e}")
+    return profile_sample(collection, sample_size, max_depth).fields()
+
+def profile_sample(collection, sample_size: int = DEFAULT_SAMPLE_SIZE, max_depth: int = DEFAULT_MAX_DEPTH) -> SchemaProfile:
+    """Stream a $sample of sample_size documents through a new SchemaProfile."""
+    cursor = collection.aggregate([{"$sample": {"size": sample_size}}])
+    try:
+        return SchemaProfile(max_depth).observe_many(cursor)
+    finally:
+        cursor.close()
+
+async def infer_schema_async(collection, sample_size: int = DEFAULT_SAMPLE_SIZE,
+                             max_depth: int = DEFAULT_MAX_DEPTH) -> list[dict[str, Any]]:
+    """Asyncio counterpart of infer_schema for AsyncMongoClient collections."""
+    try:
+        cursor = await collection.aggregate(build_schema_pipeline(sample_size, max_depth), allowDiskUse=True)
+        return fields_from_histogram(await cursor.to_list())
+    except OperationFailure as e:
+        logger.debug(f"Server-side schema inference unavailable, streaming sample: {e}")
+    cursor = await collection.aggregate([{"$sample": {"size": sample_size}}])
+    profile = SchemaProfile(max_depth)
+    async for document in cursor:
+        profile.observe(document)
+    return profile.fields()
@@ -0,0 +1,281 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from bson import json_util
+from loguru import logger
+from pymongo.errors import PyMongoError
+
+from mongodb_rooms_pkg.utils.files import atomic_write
+
+from .schema_inference import DEFAULT_MAX_DEPTH, SchemaProfile
+
+END_OF_STREAM_EVENTS = ("drop", "dropDatabase", "rename", "invalidate")
+# invalidate events are always delivered and cannot be filtered out.
+WATCH_PIPELINE = [{"$match": {"operationType": {"$in": ["insert", "update", "replace", "delete", "drop", "dropDatabase", "rename"]}}}]
+
+
+class SchemaProfileStore:
+    """
+    Persistent, thread-safe store of SchemaProfile objects keyed by "database.collection",
+    kept in a local JSON file (Extended JSON, so sample values keep their BSON types) next
+    to the change-stream resume token each profile is current up to. Profiles created by
+    observe() descend max_depth levels into nested documents.
+    """
+
+    def __init__(self, path: str, max_depth: int = DEFAULT_MAX_DEPTH):
+        self.path = path
+        self.max_depth = max_depth
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self._profiles: dict[str, SchemaProfile] = {}
+        self._resume_tokens: dict[str, Any] = {}
+        self._updated_at: dict[str, float] = {}
+        # Serialized entry per key as last written, and the keys changed since.
+        self._entries: dict[str, str] = {}
+        self._dirty: set[str] = set()
+        self._load()
+
+    @staticmethod
+    def _key(database: str, collection: str) -> str:
+        return f"{database}.{collection}"
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json_util.loads(f.read())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load schema profiles from {self.path}: {e}")
+            return
+        for key, entry in data.get("profiles", {}).items():
+            self._profiles[key] = SchemaProfile.from_dict(entry["profile"])
+            self._resume_tokens[key] = entry.get("resume_token")
+            self._updated_at[key] = entry.get("updated_at", 0.0)
+            self._dirty.add(key)
+
+    def save(self) -> None:
+        """
+        Write every profile to disk atomically. Only entries changed since the last save are
+        serialized under the data lock; the file is assembled and written outside it, so
+        readers and watchers are not blocked on disk I/O. Saves are serialized among
+        themselves, so an older snapshot can never replace a newer one.
+        """
+        with self._save_lock:
+            with self._lock:
+                dirty = self._dirty
+                if not dirty and os.path.exists(self.path):
+                    return
+                self._dirty = set()
+                for key in dirty:
+                    profile = self._profiles.get(key)
+                    if profile is None:
+                        self._entries.pop(key, None)
+                        continue
+                    self._entries[key] = json_util.dumps({
+                        "profile": profile.to_dict(),
+                        "resume_token": self._resume_tokens.get(key),
+                        "updated_at": self._updated_at.get(key, 0.0),
+                    })
+                entries = dict(self._entries)
+            body = ", ".join(f"{json.dumps(key)}: {entry}" for key, entry in entries.items())
+            try:
+                atomic_write(self.path, f'{{"profiles": {{{body}}}}}')
+            except BaseException:
+                with self._lock:
+                    self._dirty |= dirty
+                raise
+
+    def has(self, database: str, collection: str) -> bool:
+        with self._lock:
+            return self._key(database, collection) in self._profiles
+
+    def fields(self, database: str, collection: str) -> Optional[list[dict[str, Any]]]:
+        with self._lock:
+            profile = self._profiles.get(self._key(database, collection))
+            return profile.fields() if profile is not None else None
+
+    def document_count(self, database: str, collection: str) -> int:
+        with self._lock:
+            profile = self._profiles.get(self._key(database, collection))
+            return profile.document_count if profile is not None else 0
+
+    def put(self, database: str, collection: str, profile: SchemaProfile, resume_token: Any = None) -> None:
+        key = self._key(database, collection)
+        with self._lock:
+            self._profiles[key] = profile
+            self._resume_tokens[key] = resume_token
+            self._updated_at[key] = time.time()
+            self._dirty.add(key)
+
+    def observe(self, database: str, collection: str, document: dict[str, Any], new_document: bool = True) -> None:
+        """Feed one document into the collection's profile; see SchemaProfile.observe for new_document."""
+        key = self._key(database, collection)
+        with self._lock:
+            profile = self._profiles.get(key)
+            if profile is None:
+                profile = self._profiles[key] = SchemaProfile(self.max_depth)
+            profile.observe(document, new_document)
+            self._updated_at[key] = time.time()
+            self._dirty.add(key)
+
+    def resume_token(self, database: str, collection: str) -> Any:
+        with self._lock:
+            return self._resume_tokens.get(self._key(database, collection))
+
+    def set_resume_token(self, database: str, collection: str, token: Any) -> None:
+        key = self._key(database, collection)
+        with self._lock:
+            self._resume_tokens[key] = token
+            self._dirty.add(key)
+
+    def drop(self, database: str, collection: str) -> None:
+        key = self._key(database, collection)
+        with self._lock:
+            self._profiles.pop(key, None)
+            self._resume_tokens.pop(key, None)
+            self._updated_at.pop(key, None)
+            self._dirty.add(key)
+
+
+class SchemaProfileWatcher:
+    """
+    Keeps one collection's stored profile current by feeding inserted, replaced and
+    updated documents (full_document="updateLookup") from a change stream into it. Only
+    inserts count as new documents: updates and replacements revise a document the profile
+    has already counted. The
+    resume token is persisted with the profile every flush_every events and whenever the
+    stream goes idle, so a restarted watcher continues where the last one stopped.
+
+    Delete events carry no document, so they cannot be taken out of the profile field by
+    field. Instead, once the deletes seen since the last sample reach resample_ratio of the
+    profiled document count, the profile is rebuilt from sample(). Without a sample
+    callable deletes are ignored, and presence ratios drift towards fields of deleted
+    documents.
+    """
+
+    def __init__(self, store: SchemaProfileStore, collection, database: str, flush_every: int = 100,
+                 max_await_time_ms: int = 1000, sample: Optional[Callable[[], SchemaProfile]] = None,
+                 resample_ratio: float = 0.1):
+        self.store = store
+        self.collection = collection
+        self.database = database
+        self.name = collection.name
+        self.flush_every = flush_every
+        self.max_await_time_ms = max_await_time_ms
+        self.sample = sample
+        self.resample_ratio = resample_ratio
+        self._deletes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def open_stream(self):
+        return self.collection.watch(
+            WATCH_PIPELINE,
+            full_document="updateLookup",
+            resume_after=self.store.resume_token(self.database, self.name),
+            max_await_time_ms=self.max_await_time_ms
+        )
+
+    def bootstrap(self):
+        """
+        Open the change stream and, if the store has no profile for the collection yet,
+        build one from sample() stamped with the stream's current resume token. The stream
+        is opened before sampling, so changes made while the sample is read are still
+        delivered to consume(). Returns the open stream for start().
+        """
+        stream = self.open_stream()
+        if self.sample is not None and not self.store.has(self.database, self.name):
+            try:
+                profile = self.sample()
+            except BaseException:
+                stream.close()
+                raise
+            self.store.put(self.database, self.name, profile, resume_token=getattr(stream, "resume_token", None))
+            self.store.save()
+        return stream
+
+    def _flush(self, stream) -> None:
+        token = getattr(stream, "resume_token", None)
+        if token is not None:
+            self.store.set_resume_token(self.database, self.name, token)
+        self.store.save()
+
+    def _deleted(self, stream) -> bool:
+        """Count one delete event; re-sample the profile once enough have been seen. Returns True if it did."""
+        self._deletes += 1
+        if self.sample is None:
+            return False
+        threshold = max(1, self.resample_ratio * self.store.document_count(self.database, self.name))
+        if self._deletes < threshold:
+            return False
+        logger.info(f"{self._deletes} documents deleted from {self.database}.{self.name}, re-sampling its schema profile")
+        self.store.put(self.database, self.name, self.sample(), resume_token=getattr(stream, "resume_token", None))
+        self.store.save()
+        self._deletes = 0
+        return True
+
+    def consume(self, stream, max_events: Optional[int] = None) -> int:
+        """
+        Apply change events from stream (anything with try_next(), alive and resume_token)
+        until it is exhausted, max_events were applied or stop() is called.
+        """
+        processed = 0
+        pending = 0
+        while not self._stop.is_set() and (max_events is None or processed < max_events):
+            change = stream.try_next()
+            if change is None:
+                if pending:
+                    self._flush(stream)
+                    pending = 0
+                if not stream.alive:
+                    break
+                continue
+            if change.get("operationType") in END_OF_STREAM_EVENTS:
+                logger.info(f"Change stream for {self.database}.{self.name} ended ({change['operationType']}), dropping schema profile")
+                self.store.drop(self.database, self.name)
+                self.store.save()
+                return processed
+            processed += 1
+            pending += 1
+            if change.get("operationType") == "delete":
+                if self._deleted(stream):
+                    pending = 0
+            elif change.get("fullDocument") is not None:
+                self.store.observe(self.database, self.name, change["fullDocument"], change.get("operationType") == "insert")
+            if pending >= self.flush_every:
+                self._flush(stream)
+                pending = 0
+        if pending:
+            self._flush(stream)
+        return processed
+
+    def _run(self, stream=None) -> None:
+        try:
+            with stream if stream is not None else self.open_stream() as stream:
+                self.consume(stream)
+        except PyMongoError as e:
+            logger.warning(f"Schema profile watcher for {self.database}.{self.name} stopped: {e}")
+        except Exception as e:
+            logger.exception(f"Schema profile watcher for {self.database}.{self.name} failed: {e}")
+
+    def start(self, stream=None) -> threading.Thread:
+        """Consume stream (e.g. from bootstrap()), or a newly opened one, in a daemon thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(stream,), name=f"mongodb-schema-watch-{self.name}",
+                                        daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
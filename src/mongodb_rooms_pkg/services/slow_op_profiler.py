@@ -0,0 +1,229 @@
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Optional
+
+from bson import json_util
+from loguru import logger
+from pymongo.errors import PyMongoError
+
+DEFAULT_BUFFER_SIZE = 100
+DEFAULT_EXPLAIN_INTERVAL_SECONDS = 1.0
+EXPLAIN_QUEUE_SIZE = 16
+
+
+def explain_command(action: str, collection: str, action_input: Any) -> Optional[dict[str, Any]]:
+    """
+    Rebuild the database command an action ran from its input, in the form the explain
+    command accepts. Returns None for actions that cannot be explained.
+    """
+    if action in ("update", "upsert"):
+        upsert = action == "upsert" or bool(getattr(action_input, "upsert", False))
+        return {"update": collection, "updates": [{
+            "q": action_input.filter,
+            "u": action_input.update,
+            "multi": bool(action_input.update_many),
+            "upsert": upsert,
+        }]}
+    if action == "delete":
+        return {"delete": collection, "deletes": [{"q": action_input.filter, "limit": 0 if action_input.delete_many else 1}]}
+    if action == "find":
+        command = {"find": collection, "filter": action_input.filter or {}}
+        if action_input.projection:
+            command["projection"] = action_input.projection
+        if action_input.sort:
+            command["sort"] = action_input.sort
+        if action_input.limit:
+            command["limit"] = action_input.limit
+        return command
+    if action == "paginate":
+        from mongodb_rooms_pkg.actions.paginate import decode_token, keyset_filter
+        query = action_input.filter or {}
+        if action_input.continuation_token:
+            query = keyset_filter(action_input, *decode_token(action_input))
+        sort = {action_input.sort_key: action_input.direction, "_id": action_input.direction}
+        return {"find": collection, "filter": query, "sort": sort, "limit": action_input.page_size + 1}
+    if action == "aggregate":
+        command = {"aggregate": collection, "pipeline": action_input.pipeline, "cursor": {}}
+        if action_input.allow_disk_use:
+            command["allowDiskUse"] = True
+        if action_input.hint is not None:
+            command["hint"] = action_input.hint
+        return command
+    return None
+
+def _plan_stages(plan: Any):
+    """Yield every stage document of a query plan tree."""
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            yield plan
+        for key in ("inputStage", "queryPlan", "winningPlan"):
+            yield from _plan_stages(plan.get(key))
+        for key in ("inputStages", "shards"):
+            for child in plan.get(key) or ():
+                yield from _plan_stages(child)
+    elif isinstance(plan, list):
+        for child in plan:
+            yield from _plan_stages(child)
+
+def _find_key(document: Any, key: str) -> Any:
+    """Depth-first search for key, descending through aggregation $cursor stages and shards."""
+    if isinstance(document, dict):
+        if key in document:
+            return document[key]
+        children = document.values()
+    elif isinstance(document, list):
+        children = document
+    else:
+        return None
+    for child in children:
+        found = _find_key(child, key)
+        if found is not None:
+            return found
+    return None
+
+def summarize_explain(explain: dict[str, Any]) -> dict[str, Any]:
+    """
+    Extract the winning plan, the documents and keys examined against documents returned,
+    and whether any stage scanned the whole collection from an executionStats explain.
+    """
+    winning_plan = _find_key(explain, "winningPlan")
+    stats = _find_key(explain, "executionStats") or {}
+    stages = [stage.get("stage") for stage in _plan_stages(winning_plan)]
+    docs_examined = stats.get("totalDocsExamined")
+    returned = stats.get("nReturned")
+    return {
+        "winning_plan": winning_plan,
+        "stages": stages,
+        "collscan": "COLLSCAN" in stages,
+        "docs_examined": docs_examined,
+        "keys_examined": stats.get("totalKeysExamined"),
+        "n_returned": returned,
+        "execution_time_ms": stats.get("executionTimeMillis"),
+        "examined_per_returned": docs_examined / returned if docs_examined is not None and returned else None,
+    }
+
+
+class SlowOpProfiler:
+    """
+    Opt-in profiler for addon actions slower than threshold_seconds. Each slow operation is
+    recorded in a bounded ring buffer with the command it ran; a background thread re-runs
+    that command with explain("executionStats") at most once per explain_interval_seconds and
+    attaches the winning plan, docs examined vs returned and COLLSCAN detection to the record.
+    Explains never run on the caller's thread; operations beyond the rate limit are recorded
+    without a plan.
+    """
+
+    def __init__(self, db, threshold_seconds: float, explain_interval_seconds: float = DEFAULT_EXPLAIN_INTERVAL_SECONDS,
+                 capacity: int = DEFAULT_BUFFER_SIZE):
+        self.db = db
+        self.threshold_seconds = threshold_seconds
+        self.explain_interval_seconds = explain_interval_seconds
+        self._records: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=EXPLAIN_QUEUE_SIZE)
+        self._next_explain_at = 0.0
+        self._thread: Optional[threading.Thread] = None
+
+    def observe(self, action: str, collection: str, action_input: Any, seconds: float) -> Optional[dict[str, Any]]:
+        """Record the operation if it was slow; returns the record, or None when it was not."""
+        if seconds < self.threshold_seconds:
+            return None
+        command = explain_command(action, collection, action_input)
+        record = {
+            "timestamp": time.time(),
+            "action": action,
+            "collection": collection,
+            "duration_ms": seconds * 1000,
+            "command": command,
+            "explain_status": "unsupported" if command is None else "rate_limited",
+            "explain": None,
+        }
+        queued = False
+        with self._lock:
+            self._records.append(record)
+            now = time.monotonic()
+            if command is not None and now >= self._next_explain_at:
+                try:
+                    record["explain_status"] = "pending"
+                    self._queue.put_nowait(record)
+                    self._next_explain_at = now + self.explain_interval_seconds
+                    queued = True
+                except queue.Full:
+                    record["explain_status"] = "rate_limited"
+        if queued:
+            self._ensure_worker()
+        logger.bind(event="slow_operation", action=action, collection=collection, duration_ms=record["duration_ms"]).warning(
+            f"Slow MongoDB {action} on {collection}: {record['duration_ms']:.1f} ms"
+        )
+        return record
+
+    def explain(self, record: dict[str, Any]) -> None:
+        """Run the explain for a record and store its summary on it."""
+        try:
+            result = self.db.command("explain", record["command"], verbosity="executionStats")
+            summary = summarize_explain(result)
+            status = "done"
+        except PyMongoError as e:
+            summary = None
+            status = f"failed: {e}"
+        with self._lock:
+            record["explain"] = summary
+            record["explain_status"] = status
+        if summary is not None and summary["collscan"]:
+            logger.bind(event="slow_operation_collscan", action=record["action"], collection=record["collection"]).warning(
+                f"Slow MongoDB {record['action']} on {record['collection']} ran a COLLSCAN "
+                f"({summary['docs_examined']} documents examined, {summary['n_returned']} returned)"
+            )
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="mongodb-slow-op-explain", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            record = self._queue.get()
+            if record is None:
+                return
+            self.explain(record)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout)
+        self._thread = None
+
+    def records(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [dict(record) for record in self._records]
+
+    def export(self, path: str) -> int:
+        """Write the buffered records to path as Extended JSON lines; returns how many were written."""
+        records = self.records()
+        with open(path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json_util.dumps(record) + "\n")
+        return len(records)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+
+def slow_op_profiler_from_config(config, connection) -> Optional[SlowOpProfiler]:
+    """Build a SlowOpProfiler on the configured database when slowOpThresholdMS is set."""
+    threshold_ms = config.slowOpThresholdMS
+    if threshold_ms is None or threshold_ms < 0:
+        return None
+    interval = config.slowOpExplainIntervalSeconds
+    return SlowOpProfiler(
+        connection[config.database],
+        threshold_ms / 1000,
+        explain_interval_seconds=interval if interval is not None else DEFAULT_EXPLAIN_INTERVAL_SECONDS,
+        capacity=config.slowOpBufferSize or DEFAULT_BUFFER_SIZE
+    )
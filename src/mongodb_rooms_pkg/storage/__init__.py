@@ -1,3 +1,6 @@
 from .example import demo_storage
+from .export import DocumentExporter, export_query
+from .importer import FileImporter
+from .writers import MissingDependencyError, ParquetSchemaError
 
-__all__ = ["demo_storage"]
+__all__ = ["demo_storage", "DocumentExporter", "export_query", "FileImporter", "MissingDependencyError", "ParquetSchemaError"]
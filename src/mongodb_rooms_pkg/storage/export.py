@@ -0,0 +1,142 @@
+import os
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from loguru import logger
+
+from .writers import FORMATS, JSON_MODES, PARQUET_COMPRESSIONS, STREAM_COMPRESSIONS, file_extension, open_writer
+
+
+class DocumentExporter:
+    """
+    Writes a stream of documents to numbered files <basename>-<part>.<ext> in directory,
+    starting a new file once max_documents_per_file documents or max_bytes_per_file
+    (uncompressed) bytes were written. Only the current document (and, for Parquet, the
+    current row group) is held in memory. Files are written under a .part name and renamed
+    when complete, so readers never see a half-written file; `files` lists completed ones,
+    with the fields each Parquet file had to drop (see ParquetWriter).
+    """
+
+    def __init__(self, directory: str, basename: str, format: str = "ndjson", compression: Optional[str] = None,
+                 max_documents_per_file: Optional[int] = None, max_bytes_per_file: Optional[int] = None,
+                 json_mode: str = "relaxed", row_group_size: int = 10000):
+        if format not in FORMATS:
+            raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+        allowed = PARQUET_COMPRESSIONS if format == "parquet" else tuple(STREAM_COMPRESSIONS)
+        if compression is not None and compression not in allowed:
+            raise ValueError(f"{format} files support compression {', '.join(allowed)}")
+        if json_mode not in JSON_MODES:
+            raise ValueError(f"json_mode must be one of {', '.join(JSON_MODES)}")
+        self.directory = directory
+        self.basename = basename
+        self.format = format
+        self.compression = compression
+        self.max_documents_per_file = max_documents_per_file
+        self.max_bytes_per_file = max_bytes_per_file
+        self.json_mode = json_mode
+        self.row_group_size = row_group_size
+        self.files: list[dict[str, Any]] = []
+        self.document_count = 0
+        self._writer = None
+        self._path: Optional[str] = None
+        self._file_documents = 0
+        self._file_bytes = 0
+
+    def _open(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"{self.basename}-{len(self.files):05d}.{file_extension(self.format, self.compression)}"
+        self._path = os.path.join(self.directory, name)
+        self._writer = open_writer(self.format, f"{self._path}.part", self.compression, self.json_mode, self.row_group_size)
+        self._file_documents = 0
+        self._file_bytes = 0
+
+    def _finish(self) -> None:
+        self._writer.close()
+        os.replace(f"{self._path}.part", self._path)
+        dropped_fields = sorted(getattr(self._writer, "dropped_fields", ()))
+        self.files.append({
+            "path": self._path,
+            "documents": self._file_documents,
+            "bytes": os.path.getsize(self._path),
+            "dropped_fields": dropped_fields,
+        })
+        if dropped_fields:
+            logger.warning(f"Fields missing from the Parquet schema of {self._path} were not exported: {', '.join(dropped_fields)}")
+        logger.debug(f"Exported {self._file_documents} document(s) to {self._path}")
+        self._writer = None
+
+    def _full(self) -> bool:
+        return ((self.max_documents_per_file is not None and self._file_documents >= self.max_documents_per_file)
+                or (self.max_bytes_per_file is not None and self._file_bytes >= self.max_bytes_per_file))
+
+    def write(self, document: Any) -> None:
+        if self._writer is None:
+            self._open()
+        self._file_bytes += self._writer.write(document)
+        self._file_documents += 1
+        self.document_count += 1
+        if self._full():
+            self._finish()
+
+    def write_all(self, documents: Iterable[Any]) -> "DocumentExporter":
+        try:
+            for document in documents:
+                self.write(document)
+        except BaseException:
+            self.abort()
+            raise
+        self.close()
+        return self
+
+    def close(self) -> None:
+        """Complete the current file. An export without documents still produces one (empty) file."""
+        if self._writer is None and not self.files:
+            self._open()
+        if self._writer is not None:
+            self._finish()
+
+    def abort(self) -> None:
+        """Discard the file being written; completed files are kept."""
+        if self._writer is None:
+            return
+        try:
+            self._writer.close()
+        except Exception as e:
+            logger.warning(f"Error closing aborted export file {self._path}: {e}")
+        try:
+            os.remove(f"{self._path}.part")
+        except OSError:
+            pass
+        self._writer = None
+
+    @property
+    def bytes_written(self) -> int:
+        return sum(file["bytes"] for file in self.files)
+
+    @property
+    def dropped_fields(self) -> list[str]:
+        """Fields left out of at least one Parquet file because its schema had no column for them."""
+        return sorted({field for file in self.files for field in file["dropped_fields"]})
+
+
+def export_query(collection, exporter: DocumentExporter, filter: Optional[dict[str, Any]] = None,
+                 projection: Optional[dict[str, Any]] = None, sort: Optional[dict[str, int]] = None,
+                 limit: Optional[int] = None, batch_size: int = 1000) -> DocumentExporter:
+    """
+    Stream the result of a query into exporter. The projection is applied by the server.
+    BSON exports read undecoded RawBSONDocuments, so their bytes are copied to disk as
+    received without being decoded and re-encoded.
+    """
+    if exporter.format == "bson":
+        collection = collection.with_options(codec_options=CodecOptions(document_class=RawBSONDocument))
+    cursor = collection.find(filter or {}, projection=projection, batch_size=batch_size)
+    if sort:
+        cursor = cursor.sort(list(sort.items()))
+    if limit:
+        cursor = cursor.limit(limit)
+    try:
+        return exporter.write_all(cursor)
+    finally:
+        cursor.close()
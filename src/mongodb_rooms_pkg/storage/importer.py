@@ -0,0 +1,378 @@
+import codecs
+import csv
+import datetime
+import gzip
+import io
+import mmap
+import os
+import struct
+import time
+from collections.abc import Iterator
+from typing import Any, Callable, Optional
+
+from bson import json_util
+from bson.raw_bson import RawBSONDocument
+from loguru import logger
+from pymongo import ReplaceOne
+from pymongo.errors import BulkWriteError
+
+from mongodb_rooms_pkg.utils.batching import iter_batches
+
+from .writers import check_dependencies, require_optional
+
+IMPORT_FORMATS = ("ndjson", "csv", "bson")
+CSV_TYPES = ("string", "int", "float", "bool", "date", "json")
+_BSON_SIZE = struct.Struct("<i")
+
+
+def detect_format(path: str) -> tuple[str, Optional[str]]:
+    """(format, compression) from a file name such as users.ndjson.gz or dump/users.bson."""
+    name = path.lower()
+    compression = None
+    if name.endswith(".gz"):
+        compression, name = "gzip", name[:-3]
+    elif name.endswith(".zst"):
+        compression, name = "zstd", name[:-4]
+    extension = name.rsplit(".", 1)[-1]
+    format = {"json": "ndjson", "jsonl": "ndjson"}.get(extension, extension)
+    if format not in IMPORT_FORMATS:
+        raise ValueError(f"Cannot infer the import format of '{path}', pass one of {', '.join(IMPORT_FORMATS)}")
+    return format, compression
+
+
+def open_input(path: str, compression: Optional[str] = None):
+    if compression is None:
+        return open(path, "rb")
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    if compression == "zstd":
+        zstandard = require_optional("zstandard", "zstd compression requires zstandard: pip install mongodb-rooms-pkg[zstd]")
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True))
+    raise ValueError(f"Unsupported compression '{compression}'")
+
+
+class _CountingReader:
+    """Counts the bytes read from a compressed stream (uncompressed size)."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.bytes_read = 0
+
+    def readline(self, *args) -> bytes:
+        line = self.stream.readline(*args)
+        self.bytes_read += len(line)
+        return line
+
+    def read(self, *args) -> bytes:
+        data = self.stream.read(*args)
+        self.bytes_read += len(data)
+        return data
+
+
+class RecordReader:
+    """
+    Yields (record number, raw record) from an input file. Uncompressed NDJSON and BSON files
+    are memory-mapped, so records are sliced out of the page cache without read() copies;
+    compressed files are streamed. Records are not parsed here: NDJSON lines and BSON
+    documents stay bytes and CSV rows stay lists of strings until a RecordParser gets them.
+    """
+
+    def __init__(self, path: str, format: str, compression: Optional[str] = None, delimiter: str = ",",
+                 encoding: str = "utf-8"):
+        self.path = path
+        self.format = format
+        self.compression = compression
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.bytes_read = 0
+        self.header: Optional[list[str]] = None
+
+    def __iter__(self) -> Iterator[tuple[int, Any]]:
+        if self.format == "csv":
+            return self._csv_records()
+        if self.compression is None and os.path.getsize(self.path) > 0:
+            return self._mapped_records()
+        return self._streamed_records()
+
+    def _mapped_records(self) -> Iterator[tuple[int, Any]]:
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if self.format == "bson":
+                yield from self._bson_records(mapped, len(mapped))
+                return
+            number = 0
+            while True:
+                line = mapped.readline()
+                if not line:
+                    return
+                number += 1
+                self.bytes_read = mapped.tell()
+                if line.strip():
+                    yield number, line
+
+    def _streamed_records(self) -> Iterator[tuple[int, Any]]:
+        with open_input(self.path, self.compression) as raw:
+            stream = _CountingReader(raw)
+            if self.format == "bson":
+                yield from self._bson_stream_records(stream)
+                return
+            for number, line in enumerate(iter(stream.readline, b""), start=1):
+                self.bytes_read = stream.bytes_read
+                if line.strip():
+                    yield number, line
+
+    def _bson_records(self, buffer, size: int) -> Iterator[tuple[int, Any]]:
+        position = 0
+        number = 0
+        while position < size:
+            number += 1
+            length = _BSON_SIZE.unpack_from(buffer, position)[0] if position + 4 <= size else 0
+            if length < 5 or position + length > size:
+                # A corrupt length leaves no way to find the next document boundary.
+                yield number, ValueError(f"Truncated or corrupt BSON document at byte {position}")
+                return
+            self.bytes_read = position + length
+            yield number, buffer[position:position + length]
+            position += length
+
+    def _bson_stream_records(self, stream) -> Iterator[tuple[int, Any]]:
+        number = 0
+        while True:
+            prefix = stream.read(4)
+            if not prefix:
+                return
+            number += 1
+            length = _BSON_SIZE.unpack(prefix)[0] if len(prefix) == 4 else 0
+            body = stream.read(length - 4) if length >= 5 else b""
+            if length < 5 or len(body) != length - 4:
+                yield number, ValueError(f"Truncated or corrupt BSON document #{number}")
+                return
+            self.bytes_read = stream.bytes_read
+            yield number, prefix + body
+
+    def _csv_records(self) -> Iterator[tuple[int, Any]]:
+        with open_input(self.path, self.compression) as raw:
+            stream = _CountingReader(raw)
+            text = codecs.getreader(self.encoding)(stream)
+            reader = csv.reader(text, delimiter=self.delimiter)
+            if self.header is None:
+                self.header = next(reader, None)
+            for number, row in enumerate(reader, start=1):
+                self.bytes_read = stream.bytes_read
+                if row:
+                    yield number, row
+
+
+def _set_path(document: dict[str, Any], path: str, value: Any) -> None:
+    *parents, leaf = path.split(".")
+    for part in parents:
+        document = document.setdefault(part, {})
+    document[leaf] = value
+
+
+def _to_bool(value: str) -> bool:
+    normalized = value.strip().lower()
+    if normalized in ("true", "1"):
+        return True
+    if normalized in ("false", "0"):
+        return False
+    raise ValueError(f"Invalid boolean '{value}'")
+
+
+_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "string": str,
+    "int": int,
+    "float": float,
+    "bool": _to_bool,
+    "date": lambda value: datetime.datetime.fromisoformat(value.strip().replace("Z", "+00:00")),
+    "json": json_util.loads,
+}
+
+
+class RecordParser:
+    """Turns raw records into documents; a failing record becomes a rejection, not an error."""
+
+    def __init__(self, format: str, fields: Optional[list[str]] = None, types: Optional[dict[str, str]] = None,
+                 ignore_blanks: bool = False, upsert_keys: Optional[list[str]] = None):
+        unknown = {t for t in (types or {}).values() if t not in CSV_TYPES}
+        if unknown:
+            raise ValueError(f"Unknown CSV column type(s) {', '.join(sorted(unknown))}, expected {', '.join(CSV_TYPES)}")
+        self.format = format
+        self.fields = fields
+        self.types = types or {}
+        self.ignore_blanks = ignore_blanks
+        self.upsert_keys = upsert_keys or []
+
+    def parse(self, raw: Any) -> Any:
+        if isinstance(raw, Exception):
+            raise raw
+        if self.format == "bson":
+            # Inserted as-is: the driver sends the bytes without decoding or re-encoding them.
+            return RawBSONDocument(bytes(raw))
+        if self.format == "ndjson":
+            document = json_util.loads(raw)
+            if not isinstance(document, dict):
+                raise ValueError("Record is not a JSON object")
+            return document
+        if len(raw) > len(self.fields):
+            raise ValueError(f"Row has {len(raw)} columns, header has {len(self.fields)}")
+        document: dict[str, Any] = {}
+        for field, value in zip(self.fields, raw):
+            if value == "" and self.ignore_blanks:
+                continue
+            _set_path(document, field, _CONVERTERS[self.types.get(field, "string")](value))
+        return document
+
+    def key_filter(self, document: Any) -> dict[str, Any]:
+        key = {}
+        for name in self.upsert_keys:
+            value = document
+            for part in name.split("."):
+                value = value[part]
+            key[name] = value
+        return key
+
+    def parse_batch(self, records: list[tuple[int, Any]]) -> tuple[list[Any], list[dict[str, Any]]]:
+        documents, rejected = [], []
+        for number, raw in records:
+            try:
+                document = self.parse(raw)
+            except Exception as e:
+                rejected.append({"record": number, "error": str(e)})
+                continue
+            if self.upsert_keys:
+                try:
+                    self.key_filter(document)
+                except (KeyError, TypeError) as e:
+                    rejected.append({"record": number, "error": f"Missing upsert key {e}"})
+                    continue
+            documents.append(document)
+        return documents, rejected
+
+
+def upsert_chunk_writer(parser: RecordParser) -> Callable[[Any, int, list[Any]], tuple[int, Any, bool]]:
+    """insert_in_chunks write_chunk that replaces documents by their upsert key, inserting missing ones."""
+    from mongodb_rooms_pkg.actions.insert_chunked import ChunkFailure
+
+    def write_chunk(collection, chunk_index: int, chunk: list[Any]) -> tuple[int, Optional["ChunkFailure"], bool]:
+        operations = [ReplaceOne(parser.key_filter(document), document, upsert=True) for document in chunk]
+        try:
+            result = collection.bulk_write(operations, ordered=False)
+            if not result.acknowledged:
+                # w=0: no counts come back, report what was sent.
+                return len(chunk), None, False
+            return result.matched_count + result.upserted_count, None, True
+        except BulkWriteError as e:
+            written = e.details.get("nMatched", 0) + e.details.get("nUpserted", 0)
+            errors = [error.get("errmsg", str(error)) for error in e.details.get("writeErrors", [])]
+            errors += [error.get("errmsg", str(error)) for error in e.details.get("writeConcernErrors", [])]
+            return written, ChunkFailure(chunk_index=chunk_index, document_count=len(chunk), inserted_count=written, errors=errors), True
+        except Exception as e:
+            return 0, ChunkFailure(chunk_index=chunk_index, document_count=len(chunk), inserted_count=0, errors=[str(e)]), False
+
+    return write_chunk
+
+
+class FileImporter:
+    """
+    Streaming import pipeline: a RecordReader feeds batches of chunk_size raw records to a
+    RecordParser, and the parsed documents go to insert_in_chunks (insert_many, or bulk
+    ReplaceOne upserts when upsert_keys are given) with write_workers concurrent chunks.
+    Parsing stays on the reading thread: it is pure Python, so parser threads would only
+    contend for the GIL. Every stage pulls from the previous one only when it has room, so
+    the file is read no faster than MongoDB accepts the writes and memory stays bounded by a
+    few chunks per worker. Rows that cannot be parsed are counted and sampled in the report,
+    and so are documents the server rejected.
+
+    The constructor raises ValueError or MissingDependencyError for arguments that cannot
+    work; run() does not raise for a file that turns out to be unreadable part way through
+    (e.g. invalid UTF-8 in a CSV file): the report keeps the counts of what was written
+    before and the reason in `error`.
+    """
+
+    def __init__(self, collection, path: str, format: Optional[str] = None, compression: Optional[str] = None,
+                 chunk_size: int = 1000, write_workers: int = 4, upsert_keys: Optional[list[str]] = None,
+                 csv_fields: Optional[list[str]] = None, csv_types: Optional[dict[str, str]] = None,
+                 csv_delimiter: str = ",", ignore_blanks: bool = False, max_rejected_samples: int = 100):
+        if format is None:
+            format, detected = detect_format(path)
+            compression = compression or detected
+        elif format not in IMPORT_FORMATS:
+            raise ValueError(f"format must be one of {', '.join(IMPORT_FORMATS)}")
+        check_dependencies(format, compression)
+        self.collection = collection
+        self.path = path
+        self.format = format
+        self.chunk_size = chunk_size
+        self.write_workers = write_workers
+        self.max_rejected_samples = max_rejected_samples
+        self.reader = RecordReader(path, format, compression, delimiter=csv_delimiter)
+        if csv_fields is not None:
+            self.reader.header = list(csv_fields)
+        self.parser = RecordParser(format, csv_fields, csv_types, ignore_blanks, upsert_keys)
+        self.upsert_keys = upsert_keys
+        self.records_read = 0
+        self.rejected_count = 0
+        self.rejected: list[dict[str, Any]] = []
+
+    def _reject(self, rejected: list[dict[str, Any]]) -> None:
+        self.rejected_count += len(rejected)
+        room = self.max_rejected_samples - len(self.rejected)
+        if room > 0:
+            self.rejected.extend(rejected[:room])
+
+    def _batches(self) -> Iterator[list[tuple[int, Any]]]:
+        for batch in iter_batches(self.reader, self.chunk_size):
+            self.records_read += len(batch)
+            if self.format == "csv" and self.parser.fields is None:
+                if not self.reader.header:
+                    raise ValueError("CSV file has no header row; pass csv_fields")
+                self.parser.fields = self.reader.header
+            yield batch
+
+    def documents(self) -> Iterator[Any]:
+        """Parsed documents in file order, parsed one batch of chunk_size records at a time."""
+        for batch in self._batches():
+            documents, rejected = self.parser.parse_batch(batch)
+            self._reject(rejected)
+            yield from documents
+
+    def run(self) -> dict[str, Any]:
+        # Imported here: the actions package imports storage, so a module-level import would be circular.
+        from mongodb_rooms_pkg.actions.insert_chunked import insert_in_chunks
+
+        started = time.perf_counter()
+        write_chunk = upsert_chunk_writer(self.parser) if self.upsert_keys else None
+        inserted, chunk_count, failures, _ = insert_in_chunks(
+            self.collection,
+            self.documents(),
+            self.chunk_size,
+            self.write_workers,
+            **({"write_chunk": write_chunk} if write_chunk else {})
+        )
+        elapsed = time.perf_counter() - started
+        failed_documents = sum(failure.document_count - failure.inserted_count for failure in failures)
+        error = next((failure.errors[0] for failure in failures if failure.source_error), None)
+        report = {
+            "path": self.path,
+            "format": self.format,
+            "records_read": self.records_read,
+            "written_count": inserted,
+            "rejected_count": self.rejected_count,
+            "rejected": self.rejected,
+            "failed_count": failed_documents,
+            "failed_chunks": failures,
+            "chunk_count": chunk_count,
+            "bytes_read": self.reader.bytes_read,
+            "elapsed_seconds": round(elapsed, 3),
+            "documents_per_second": round(inserted / elapsed, 1) if elapsed > 0 else 0.0,
+            "megabytes_per_second": round(self.reader.bytes_read / elapsed / 1_000_000, 2) if elapsed > 0 else 0.0,
+            "error": error,
+        }
+        if error:
+            logger.warning(f"Import of {self.path} stopped after writing {inserted} document(s): {error}")
+        else:
+            logger.info(
+                f"Imported {inserted} document(s) from {self.path} in {report['elapsed_seconds']}s "
+                f"({report['documents_per_second']} docs/s), {self.rejected_count} rejected, {failed_documents} failed"
+            )
+        return report
@@ -0,0 +1,216 @@
+import gzip
+from typing import Any, BinaryIO, Optional
+
+import bson
+from bson import Binary, Decimal128, ObjectId, json_util
+from bson.raw_bson import RawBSONDocument
+
+FORMATS = ("ndjson", "bson", "parquet")
+EXTENSIONS = {"ndjson": "ndjson", "bson": "bson", "parquet": "parquet"}
+STREAM_COMPRESSIONS = {"gzip": "gz", "zstd": "zst"}
+PARQUET_COMPRESSIONS = ("gzip", "zstd", "snappy")
+JSON_MODES = {"relaxed": json_util.RELAXED_JSON_OPTIONS, "canonical": json_util.CANONICAL_JSON_OPTIONS}
+
+
+class MissingDependencyError(ImportError):
+    pass
+
+
+def require_optional(module: str, message: str):
+    try:
+        return __import__(module)
+    except ImportError as e:
+        raise MissingDependencyError(message) from e
+
+
+def check_dependencies(format: str, compression: Optional[str] = None) -> None:
+    """Raise MissingDependencyError up front when the optional package a format needs is absent."""
+    if format == "parquet":
+        require_optional("pyarrow", "Parquet export requires pyarrow: pip install mongodb-rooms-pkg[parquet]")
+    elif compression == "zstd":
+        require_optional("zstandard", "zstd compression requires zstandard: pip install mongodb-rooms-pkg[zstd]")
+
+
+def file_extension(format: str, compression: Optional[str] = None) -> str:
+    extension = EXTENSIONS[format]
+    if format != "parquet" and compression:
+        extension += "." + STREAM_COMPRESSIONS[compression]
+    return extension
+
+
+def open_stream(path: str, compression: Optional[str] = None) -> BinaryIO:
+    """Binary write stream on path, gzip or zstd compressed on the fly."""
+    if compression is None:
+        return open(path, "wb")
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    if compression == "zstd":
+        zstandard = require_optional("zstandard", "zstd compression requires zstandard: pip install mongodb-rooms-pkg[zstd]")
+        raw = open(path, "wb")
+        return zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+    raise ValueError(f"Unsupported compression '{compression}'")
+
+
+class NDJSONWriter:
+    """One Extended JSON document per line, as mongoexport writes them."""
+
+    def __init__(self, path: str, compression: Optional[str] = None, json_mode: str = "relaxed"):
+        self.stream = open_stream(path, compression)
+        self.json_options = JSON_MODES[json_mode]
+
+    def write(self, document: Any) -> int:
+        data = json_util.dumps(document, json_options=self.json_options).encode("utf-8") + b"\n"
+        self.stream.write(data)
+        return len(data)
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+class BSONWriter:
+    """Concatenated BSON documents, the layout of mongodump's <collection>.bson files."""
+
+    def __init__(self, path: str, compression: Optional[str] = None):
+        self.stream = open_stream(path, compression)
+
+    def write(self, document: Any) -> int:
+        data = document.raw if isinstance(document, RawBSONDocument) else bson.encode(document)
+        self.stream.write(data)
+        return len(data)
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+def to_arrow_value(value: Any) -> Any:
+    """BSON values Arrow has no type for become strings (ObjectId, Decimal128...) or bytes."""
+    if isinstance(value, dict):
+        return {key: to_arrow_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_arrow_value(item) for item in value]
+    if isinstance(value, Binary):
+        return bytes(value)
+    if isinstance(value, (ObjectId, Decimal128)):
+        return str(value)
+    if value is None or isinstance(value, (str, int, float, bool, bytes)) or hasattr(value, "isoformat"):
+        return value
+    return str(value)
+
+
+class ParquetSchemaError(ValueError):
+    pass
+
+
+def stringify(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return json_util.dumps(value)
+
+
+class ParquetWriter:
+    """
+    Columnar Parquet file written one row group of row_group_size documents at a time. The
+    schema is inferred from the first row group: columns mixing types there, or holding only
+    nulls, become strings (Extended JSON for non-string values). A Parquet file has a single
+    schema, so fields that first appear in a later row group are dropped and recorded in
+    dropped_fields (dotted paths), values of a string column's other types are stringified,
+    and any other value that cannot be converted without loss raises ParquetSchemaError.
+    """
+
+    def __init__(self, path: str, compression: Optional[str] = None, row_group_size: int = 10000):
+        check_dependencies("parquet")
+        import pyarrow
+        import pyarrow.parquet
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.path = path
+        self.compression = compression or "none"
+        self.row_group_size = row_group_size
+        self.rows: list[dict[str, Any]] = []
+        self.schema = None
+        self.writer = None
+        self.dropped_fields: set[str] = set()
+        self._row_groups = 0
+
+    def write(self, document: Any) -> int:
+        self.rows.append(to_arrow_value(dict(document)))
+        if len(self.rows) >= self.row_group_size:
+            return self.flush()
+        return 0
+
+    def _infer(self, values: list[Any]):
+        pa = self._pa
+        try:
+            array = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return pa.array([stringify(value) for value in values], type=pa.string())
+        return array.cast(pa.string()) if pa.types.is_null(array.type) else array
+
+    def _missing(self, source, target, prefix: str) -> list[str]:
+        """Dotted paths of the struct fields of source that target has no room for."""
+        types = self._pa.types
+        if types.is_struct(source) and types.is_struct(target):
+            missing = []
+            for field in source:
+                index = target.get_field_index(field.name)
+                if index == -1:
+                    missing.append(prefix + field.name)
+                else:
+                    missing += self._missing(field.type, target.field(index).type, f"{prefix}{field.name}.")
+            return missing
+        if types.is_list(source) and types.is_list(target):
+            return self._missing(source.value_type, target.value_type, prefix)
+        return []
+
+    def _convert(self, name: str, values: list[Any], type):
+        pa = self._pa
+        try:
+            array = pa.array(values)
+            self.dropped_fields.update(self._missing(array.type, type, f"{name}."))
+            # Safe cast: fails instead of truncating 1.5 to 1 or overflowing.
+            return array if array.type == type else array.cast(type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            if pa.types.is_string(type):
+                return pa.array([stringify(value) for value in values], type=pa.string())
+            raise ParquetSchemaError(
+                f"Field '{name}' in row group {self._row_groups} does not fit the {type} column inferred from the "
+                f"first row group ({e}); export it as ndjson or bson, or project it out"
+            ) from e
+
+    def flush(self) -> int:
+        if not self.rows:
+            return 0
+        pa = self._pa
+        names = list(dict.fromkeys(key for row in self.rows for key in row))
+        if self.schema is None:
+            columns = [self._infer([row.get(name) for row in self.rows]) for name in names]
+            table = pa.Table.from_arrays(columns, names=names)
+            self.schema = table.schema
+            self.writer = self._pq.ParquetWriter(self.path, self.schema, compression=self.compression)
+        else:
+            self.dropped_fields.update(name for name in names if self.schema.get_field_index(name) == -1)
+            columns = [self._convert(field.name, [row.get(field.name) for row in self.rows], field.type)
+                       for field in self.schema]
+            table = pa.Table.from_arrays(columns, schema=self.schema)
+        self.writer.write_table(table)
+        self.rows = []
+        self._row_groups += 1
+        return table.nbytes
+
+    def close(self) -> None:
+        self.flush()
+        if self.writer is None:
+            # No documents: still leave a valid (empty) Parquet file behind.
+            self.writer = self._pq.ParquetWriter(self.path, self._pa.schema([]), compression=self.compression)
+        self.writer.close()
+
+
+def open_writer(format: str, path: str, compression: Optional[str] = None, json_mode: str = "relaxed",
+                row_group_size: int = 10000):
+    if format == "ndjson":
+        return NDJSONWriter(path, compression, json_mode)
+    if format == "bson":
+        return BSONWriter(path, compression)
+    if format == "parquet":
+        return ParquetWriter(path, compression, row_group_size)
+    raise ValueError(f"Unsupported export format '{format}'")
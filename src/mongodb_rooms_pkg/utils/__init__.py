@@ -1,3 +1,6 @@
+from .batching import iter_batches, iter_cursor_batches
 from .example import demo_util
+from .files import atomic_write
+from .summary import summarize
 
-__all__ = ["demo_util"]
+__all__ = ["atomic_write", "demo_util", "iter_batches", "iter_cursor_batches", "summarize"]
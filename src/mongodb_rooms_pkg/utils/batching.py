@@ -0,0 +1,29 @@
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+
+def iter_batches(iterable: Iterable[Any], batch_size: int) -> Iterator[list[Any]]:
+    """
+    Lazily split an iterable (cursor, generator, list...) into lists of at most batch_size items.
+    Only one batch is held in memory at a time.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_cursor_batches(cursor, batch_size: int) -> Iterator[list[Any]]:
+    """
+    Same as iter_batches for a pymongo cursor, closing the cursor once the batches are exhausted
+    or the iterator is discarded.
+    """
+    try:
+        yield from iter_batches(cursor, batch_size)
+    finally:
+        cursor.close()
@@ -0,0 +1,24 @@
+import os
+import tempfile
+
+
+def atomic_write(path: str, data: str) -> None:
+    """
+    Replace the file at path with data in one step: data is written to a uniquely named
+    temporary file in the same directory, which is then renamed over path. Readers see the
+    old or the new content, never a partial file, and concurrent writers cannot clobber
+    each other's temporary file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
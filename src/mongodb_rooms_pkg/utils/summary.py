@@ -0,0 +1,51 @@
+import reprlib
+from typing import Any
+
+from bson.raw_bson import RawBSONDocument
+from pydantic import BaseModel
+
+DEFAULT_MAX_LENGTH = 512
+
+
+class _SummaryRepr(reprlib.Repr):
+    """reprlib.Repr that also bounds pydantic models, bytes and raw BSON documents."""
+
+    def __init__(self):
+        super().__init__()
+        self.maxlevel = 3
+        self.maxlist = 5
+        self.maxtuple = 5
+        self.maxset = 5
+        self.maxdict = 5
+        self.maxstring = 80
+        self.maxother = 80
+
+    def repr1(self, x: Any, level: int) -> str:
+        if isinstance(x, BaseModel):
+            if level <= 0:
+                return f"{type(x).__name__}(...)"
+            fields = ", ".join(f"{name}={self.repr1(getattr(x, name, None), level - 1)}" for name in type(x).model_fields)
+            return f"{type(x).__name__}({fields})"
+        if isinstance(x, RawBSONDocument):
+            return f"RawBSONDocument(<{len(x.raw)} bytes>)"
+        if isinstance(x, (bytes, bytearray, memoryview)):
+            return f"<{len(x)} bytes>"
+        text = super().repr1(x, level)
+        if isinstance(x, (list, tuple, set, frozenset, dict)) and len(x) > self.maxlist:
+            text += f" (len={len(x)})"
+        return text
+
+
+_summary_repr = _SummaryRepr()
+
+
+def summarize(value: Any, max_length: int = DEFAULT_MAX_LENGTH) -> str:
+    """
+    Bounded, cheap representation of a log payload: containers show their first few items
+    and their length, strings and bytes are truncated, pydantic models are walked field by
+    field without model_dump(). The cost no longer grows with the payload size.
+    """
+    text = _summary_repr.repr(value)
+    if len(text) > max_length:
+        return text[:max_length - 3] + "..."
+    return text
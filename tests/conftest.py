@@ -1,10 +1,78 @@
 import sys
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from mongodb_rooms_pkg.configuration import CustomAddonConfig  # noqa: E402
+from mongodb_rooms_pkg.services.connection import ClientRegistry  # noqa: E402
+
+
+class FakeCursor:
+    """Cursor over a list of documents: iterable, chainable sort() / limit(), remembers close()."""
+
+    def __init__(self, documents):
+        self.documents = list(documents)
+        self.closed = False
+        self.sort_spec = None
+        self.limit_value = None
+
+    def __iter__(self):
+        return iter(self.documents)
+
+    def sort(self, spec):
+        self.sort_spec = spec
+        return self
+
+    def limit(self, value):
+        self.limit_value = value
+        if value:
+            self.documents = self.documents[:value]
+        return self
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def reset_client_registry():
+    yield
+    ClientRegistry().clear()
+
+@pytest.fixture
+def addon_config():
+    """Build a CustomAddonConfig for database "testdb"; keyword arguments override the defaults."""
+    def make(**overrides):
+        defaults = {
+            "id": "test_addon",
+            "type": "database",
+            "name": "test_addon",
+            "description": "Test addon",
+            "host": "localhost",
+            "database": "testdb",
+            "secrets": {"db_user": "user", "db_password": "pass"},
+        }
+        defaults.update(overrides)
+        return CustomAddonConfig(**defaults)
+    return make
+
+@pytest.fixture
+def fake_cursor():
+    return FakeCursor
+
+@pytest.fixture
+def mock_connection():
+    """(connection, db, collection) mocks: connection[name] returns db and db[name] returns collection."""
+    connection = MagicMock()
+    db = MagicMock()
+    db.name = "testdb"
+    collection = MagicMock()
+    connection.__getitem__.return_value = db
+    db.__getitem__.return_value = collection
+    return connection, db, collection
+
 @pytest.fixture
 def sample_config():
     return {
@@ -83,18 +83,17 @@ class TestMongoDBRoomsAddon:
 
         assert result is False
 
-    def test_init_connection_success(self):
+    def test_init_connection_success(self, addon_config):
         addon = MongoDBRoomsAddon()
-        mock_config = Mock()
-        mock_config.scheme = "mongodb"
-        addon.config = mock_config
+        config = addon_config()
+        addon.config = config
 
         with patch('mongodb_rooms_pkg.addon.build_uri', return_value="mongodb://test") as mock_build_uri, \
              patch('mongodb_rooms_pkg.addon.create_connection', return_value=Mock()) as mock_create_conn:
 
             result = addon.initConnection()
 
-            mock_build_uri.assert_called_once_with(mock_config)
+            mock_build_uri.assert_called_once_with(config)
             mock_create_conn.assert_called_once_with("mongodb://test")
             assert result is True
 
@@ -104,7 +103,7 @@ class TestMongoDBRoomsAddon:
         with patch('mongodb_rooms_pkg.addon.describe', return_value={"status": "success"}) as mock_describe:
             result = addon.describe()
 
-            mock_describe.assert_called_once_with(addon.config, addon.connection)
+            mock_describe.assert_called_once_with(addon.config, addon.connection, cache=addon.metadata_cache)
             assert result == {"status": "success"}
 
     def test_test_method_success(self):
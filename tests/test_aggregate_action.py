@@ -0,0 +1,111 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from mongodb_rooms_pkg.actions.aggregate import ActionInput as AggregateInput
+from mongodb_rooms_pkg.actions.aggregate import _output_collection, aggregate
+
+
+class TestAggregateAction:
+    def test_aggregate_input_requires_pipeline(self):
+        with pytest.raises(ValidationError):
+            AggregateInput(collection="orders")
+
+    def test_aggregate_no_connection(self, addon_config):
+        input_data = AggregateInput(collection="orders", pipeline=[])
+
+        response = aggregate(addon_config(), None, input_data)
+
+        assert response.code == 500
+        assert response.message == "No database connection provided"
+
+    def test_aggregate_streams_pages_with_options(self, addon_config, mock_connection, fake_cursor):
+        cursor = fake_cursor([{"_id": "a", "total": 3}, {"_id": "b", "total": 5}, {"_id": "c", "total": 1}])
+        connection, _, mock_collection = mock_connection
+        mock_collection.aggregate.return_value = cursor
+        pipeline = [{"$group": {"_id": "$customer", "total": {"$sum": 1}}}]
+        input_data = AggregateInput(
+            collection="orders",
+            pipeline=pipeline,
+            allow_disk_use=True,
+            max_time_ms=1000,
+            batch_size=2,
+            hint={"customer": 1}
+        )
+
+        response = aggregate(addon_config(), connection, input_data)
+
+        assert response.code == 200
+        assert response.output.output_collection is None
+        mock_collection.aggregate.assert_called_once_with(
+            pipeline, allowDiskUse=True, batchSize=2, maxTimeMS=1000, hint=[("customer", 1)]
+        )
+        pages = list(response.output.pages)
+        assert [len(page) for page in pages] == [2, 1]
+        assert cursor.closed is True
+
+    def test_closing_output_pages_closes_cursor(self, addon_config, mock_connection, fake_cursor):
+        cursor = fake_cursor([{"_id": i} for i in range(5)])
+        connection, _, mock_collection = mock_connection
+        mock_collection.aggregate.return_value = cursor
+
+        response = aggregate(addon_config(), connection, AggregateInput(collection="orders", pipeline=[], batch_size=2))
+        assert len(next(response.output.pages)) == 2
+        response.output.pages.close()
+
+        assert cursor.closed is True
+
+    def test_aggregate_with_out_stage(self, addon_config, mock_connection, fake_cursor):
+        cursor = fake_cursor([])
+        connection, _, mock_collection = mock_connection
+        mock_collection.aggregate.return_value = cursor
+        input_data = AggregateInput(
+            collection="orders",
+            pipeline=[{"$match": {"status": "paid"}}, {"$out": "paid_orders"}]
+        )
+
+        response = aggregate(addon_config(), connection, input_data)
+
+        assert response.code == 200
+        assert response.output.output_collection == "paid_orders"
+        assert list(response.output.pages) == []
+        assert cursor.closed is True
+
+    def test_aggregate_rejects_write_stage_not_last(self, addon_config):
+        input_data = AggregateInput(
+            collection="orders",
+            pipeline=[{"$out": "paid_orders"}, {"$match": {"status": "paid"}}]
+        )
+
+        response = aggregate(addon_config(), MagicMock(), input_data)
+
+        assert response.code == 400
+
+    def test_aggregate_error(self, addon_config, mock_connection):
+        connection, _, mock_collection = mock_connection
+        mock_collection.aggregate.return_value = None
+        mock_collection.aggregate.side_effect = Exception("boom")
+
+        response = aggregate(addon_config(), connection, AggregateInput(collection="orders", pipeline=[]))
+
+        assert response.code == 500
+        assert "Error running aggregation: boom" in response.message
+
+
+class TestOutputCollection:
+    def test_out_string(self):
+        assert _output_collection([{"$out": "target"}]) == "target"
+
+    def test_out_with_database(self):
+        assert _output_collection([{"$out": {"db": "reports", "coll": "daily"}}]) == "reports.daily"
+
+    def test_merge_into(self):
+        assert _output_collection([{"$merge": {"into": "target", "on": "_id"}}]) == "target"
+
+    def test_merge_string(self):
+        assert _output_collection([{"$merge": "target"}]) == "target"
+
+    def test_no_write_stage(self):
+        assert _output_collection([{"$match": {}}]) is None
+        assert _output_collection([]) is None
@@ -0,0 +1,146 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from mongodb_rooms_pkg.actions.aio.describe_collection import describe_collection
+from mongodb_rooms_pkg.actions.aio.insert import insert
+from mongodb_rooms_pkg.actions.aio.update import update
+from mongodb_rooms_pkg.actions.insert import ActionInput as InsertInput
+from mongodb_rooms_pkg.actions.update import ActionInput as UpdateInput
+from mongodb_rooms_pkg.async_addon import AsyncMongoDBRoomsAddon
+from mongodb_rooms_pkg.services.connection import create_async_connection
+
+
+class TestAsyncActions:
+    def test_async_insert_no_connection(self, addon_config):
+        input_data = InsertInput(collection="users", document={"name": "a"})
+
+        response = asyncio.run(insert(addon_config(), None, input_data))
+
+        assert response.code == 500
+        assert response.message == "No database connection provided"
+
+    def test_async_insert_many(self, addon_config, mock_connection):
+        connection, _, mock_collection = mock_connection
+        mock_result = MagicMock(inserted_ids=["id1", "id2"], acknowledged=True)
+        mock_collection.insert_many = AsyncMock(return_value=mock_result)
+        input_data = InsertInput(collection="users", documents=[{"a": 1}, {"a": 2}])
+
+        response = asyncio.run(insert(addon_config(), connection, input_data))
+
+        assert response.code == 200
+        assert response.output.inserted_count == 2
+        mock_collection.insert_many.assert_awaited_once()
+
+    def test_async_update(self, addon_config, mock_connection):
+        connection, _, mock_collection = mock_connection
+        mock_result = MagicMock(matched_count=1, modified_count=1, upserted_id=None, acknowledged=True)
+        mock_collection.update_one = AsyncMock(return_value=mock_result)
+        input_data = UpdateInput(collection="users", filter={"a": 1}, update={"$set": {"b": 2}})
+
+        response = asyncio.run(update(addon_config(), connection, input_data))
+
+        assert response.code == 200
+        assert response.output.modified_count == 1
+        mock_collection.update_one.assert_awaited_once_with({"a": 1}, {"$set": {"b": 2}}, upsert=False)
+
+    def test_async_describe_collection(self, addon_config, mock_connection):
+        connection, mock_db, mock_collection = mock_connection
+        mock_db.list_collection_names = AsyncMock(return_value=["users"])
+        batch_cursor = MagicMock()
+        batch_cursor.to_list = AsyncMock(return_value=[
+            {"_collection": "users", "_kind": "stats", "storageStats": {"count": 2, "size": 100, "storageSize": 200, "nindexes": 1, "totalIndexSize": 10}},
+            {"_collection": "users", "_kind": "index", "name": "_id_", "key": {"_id": 1}},
+        ])
+        sample_cursor = MagicMock()
+        sample_cursor.to_list = AsyncMock(return_value=[
+            {"path": "_id", "type": "int", "count": 2, "distinct": 2, "samples": [1, 2]},
+            {"path": "name", "type": "null", "count": 1, "distinct": 0, "samples": []},
+            {"path": "name", "type": "string", "count": 1, "distinct": 1, "samples": ["a"]},
+        ])
+        mock_collection.aggregate = AsyncMock(side_effect=lambda pipeline, **kwargs: sample_cursor if "$sample" in pipeline[0] else batch_cursor)
+
+        response = asyncio.run(describe_collection(addon_config(), connection, ["users", "missing"]))
+
+        assert response.code == 200
+        users, missing = response.output.collections
+        assert users.exists is True
+        assert users.stats.count == 2
+        assert users.indexes[0]["name"] == "_id_"
+        name_field = next(field for field in users.schema_sample if field.field_name == "name")
+        assert name_field.null_count == 1
+        assert missing.exists is False
+        mock_db.list_collection_names.assert_awaited_once_with(filter={"name": {"$in": ["users", "missing"]}})
+
+
+class TestAsyncMongoDBRoomsAddon:
+    def test_addon_initialization(self):
+        addon = AsyncMongoDBRoomsAddon()
+
+        assert addon.type == "storage"
+        assert addon.config is None
+        assert addon.connection is None
+        assert addon.logger.addon_type == "storage"
+
+    def test_init_connection_no_config(self):
+        addon = AsyncMongoDBRoomsAddon()
+
+        assert asyncio.run(addon.initConnection()) is False
+
+    def test_init_connection_success(self, addon_config):
+        addon = AsyncMongoDBRoomsAddon()
+        addon.config = addon_config()
+        client = MagicMock()
+
+        with patch('mongodb_rooms_pkg.async_addon.build_uri', return_value="mongodb://test"), \
+             patch('mongodb_rooms_pkg.async_addon.create_async_connection', AsyncMock(return_value=client)) as mock_create:
+            result = asyncio.run(addon.initConnection())
+
+        assert result is True
+        assert addon.connection is client
+        mock_create.assert_awaited_once_with("mongodb://test")
+
+    def test_load_addon_config(self):
+        addon = AsyncMongoDBRoomsAddon()
+        config_data = {
+            "id": "test_id",
+            "name": "test_name",
+            "type": "storage",
+            "host": "localhost",
+            "database": "testdb",
+            "secrets": {"db_user": "user", "db_password": "pass"}
+        }
+
+        with patch.object(addon, 'initConnection', AsyncMock(return_value=True)) as mock_init:
+            result = asyncio.run(addon.loadAddonConfig(config_data))
+
+        assert result is True
+        assert addon.config.database == "testdb"
+        mock_init.assert_awaited_once()
+
+    def test_insert_delegates_to_async_action(self):
+        addon = AsyncMongoDBRoomsAddon()
+
+        with patch('mongodb_rooms_pkg.async_addon.insert', AsyncMock(return_value={"status": "success"})) as mock_insert:
+            result = asyncio.run(addon.insert("users", document={"name": "a"}))
+
+        assert result == {"status": "success"}
+        mock_insert.assert_awaited_once()
+
+
+class TestCreateAsyncConnection:
+    @patch('mongodb_rooms_pkg.services.connection.AsyncMongoClient')
+    def test_create_async_connection_success(self, mock_client_class):
+        mock_client = MagicMock()
+        mock_client.admin.command = AsyncMock(return_value={"ok": 1})
+        mock_client_class.return_value = mock_client
+
+        result = asyncio.run(create_async_connection("mongodb://localhost:27017/testdb"))
+
+        assert result is mock_client
+        mock_client.admin.command.assert_awaited_once_with("ping")
+
+    @patch('mongodb_rooms_pkg.services.connection.AsyncMongoClient')
+    def test_create_async_connection_failure(self, mock_client_class):
+        mock_client_class.side_effect = Exception("Authentication failed")
+
+        assert asyncio.run(create_async_connection("mongodb://localhost:27017/testdb")) is None
@@ -1,7 +1,7 @@
 import pytest
 from pydantic import ValidationError
 
-from mongodb_rooms_pkg.actions.base import ActionResponse, OutputBase, TokensSchema
+from mongodb_rooms_pkg.actions.base import TRUSTED_MIN_ITEMS, ActionResponse, OutputBase, TokensSchema
 
 
 class TestTokensSchema:
@@ -123,3 +123,84 @@ class TestActionResponse:
         assert response_dict["code"] == 200
         assert response_dict["tokens"]["stepAmount"] == 100
         assert response_dict["tokens"]["totalCurrentAmount"] == 1000
+
+
+class TestTrustedConstruction:
+    def test_trusted_matches_validated(self):
+        from mongodb_rooms_pkg.actions.insert import ActionOutput as InsertOutput
+
+        values = {"collection_name": "users", "inserted_count": 2, "inserted_ids": ["a", "b"], "acknowledged": True}
+        validated = ActionResponse(
+            output=InsertOutput(**values),
+            tokens=TokensSchema(stepAmount=1200, totalCurrentAmount=17436),
+            message="ok",
+            code=200
+        )
+        trusted = ActionResponse.trusted(
+            output=InsertOutput.trusted(**values),
+            tokens=TokensSchema.trusted(stepAmount=1200, totalCurrentAmount=17436),
+            message="ok",
+            code=200
+        )
+
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.model_dump_json() == validated.model_dump_json()
+
+    def test_trusted_fills_defaults(self):
+        tokens = TokensSchema.trusted(stepAmount=1, totalCurrentAmount=2)
+
+        response = ActionResponse.trusted(output=OutputBase.trusted(), tokens=tokens)
+
+        assert response.message is None
+        assert response.code is None
+
+    def test_trusted_default_factory(self):
+        from pydantic import Field
+
+        class ListOutput(OutputBase):
+            items: list[int] = Field(default_factory=list)
+
+        first = ListOutput.trusted()
+        first.items.append(1)
+
+        assert ListOutput.trusted().items == []
+        assert ListOutput.trusted(items=[2]).model_fields_set == {"items"}
+
+    def test_trusted_skips_validation(self):
+        tokens = TokensSchema.trusted(stepAmount="not-validated", totalCurrentAmount=0)
+
+        assert tokens.stepAmount == "not-validated"
+
+    def test_from_result_validates_small_outputs(self):
+        tokens = TokensSchema.from_result(0, stepAmount=1, totalCurrentAmount=2)
+        assert tokens.stepAmount == 1
+        with pytest.raises(ValidationError):
+            TokensSchema.from_result(TRUSTED_MIN_ITEMS - 1, stepAmount="invalid", totalCurrentAmount=0)
+
+    def test_from_result_trusts_large_outputs(self):
+        tokens = TokensSchema.from_result(TRUSTED_MIN_ITEMS, stepAmount="not-validated", totalCurrentAmount=0)
+        assert tokens.stepAmount == "not-validated"
+
+    @pytest.mark.parametrize("documents, trusted_calls", [(1, 0), (TRUSTED_MIN_ITEMS - 1, 0), (TRUSTED_MIN_ITEMS, 1)])
+    def test_insert_trusts_only_large_results(self, documents, trusted_calls, addon_config, mock_connection):
+        from unittest.mock import MagicMock, patch
+
+        from mongodb_rooms_pkg.actions.insert import ActionInput as InsertInput
+        from mongodb_rooms_pkg.actions.insert import ActionOutput as InsertOutput
+        from mongodb_rooms_pkg.actions.insert import insert
+
+        connection, _, collection = mock_connection
+        ids = [f"id{i}" for i in range(documents)]
+        collection.insert_one.return_value = MagicMock(inserted_id="id0", acknowledged=True)
+        collection.insert_many.return_value = MagicMock(inserted_ids=ids, acknowledged=True)
+        if documents == 1:
+            action_input = InsertInput(collection="users", document={"a": 1})
+        else:
+            action_input = InsertInput(collection="users", documents=[{"a": i} for i in range(documents)])
+
+        with patch.object(InsertOutput, "trusted", wraps=InsertOutput.trusted) as trusted:
+            response = insert(addon_config(), connection, action_input)
+
+        assert trusted.call_count == trusted_calls
+        assert response.code == 200
+        assert response.output.inserted_ids == ids
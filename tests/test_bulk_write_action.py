@@ -0,0 +1,138 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+from pymongo import DeleteOne, InsertOne, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError
+from pymongo.results import BulkWriteResult
+
+from mongodb_rooms_pkg.actions.bulk_write import ActionInput as BulkWriteInput
+from mongodb_rooms_pkg.actions.bulk_write import bulk_write
+
+
+def get_mixed_input(ordered=True):
+    return BulkWriteInput(
+        collection="users",
+        ordered=ordered,
+        operations=[
+            {"operation": "insert", "document": {"_id": 1, "name": "a"}},
+            {"operation": "update", "filter": {"_id": 2}, "update": {"$set": {"x": 1}}, "many": True},
+            {"operation": "upsert", "filter": {"_id": 3}, "update": {"$set": {"x": 2}}},
+            {"operation": "delete", "filter": {"_id": 4}},
+        ]
+    )
+
+
+class TestBulkWriteAction:
+    def test_bulk_write_input_invalid_operation(self):
+        with pytest.raises(ValidationError):
+            BulkWriteInput(collection="users", operations=[{"operation": "drop"}])
+
+    def test_bulk_write_no_connection(self, addon_config):
+        response = bulk_write(addon_config(), None, get_mixed_input())
+
+        assert response.code == 500
+        assert response.message == "No database connection provided"
+
+    def test_bulk_write_empty_operations(self, addon_config):
+        response = bulk_write(addon_config(), MagicMock(), BulkWriteInput(collection="users", operations=[]))
+
+        assert response.code == 400
+
+    def test_bulk_write_invalid_operation_fields(self, addon_config):
+        input_data = BulkWriteInput(collection="users", operations=[{"operation": "delete"}])
+
+        response = bulk_write(addon_config(), MagicMock(), input_data)
+
+        assert response.code == 400
+        assert "index 0" in response.message
+
+    def test_bulk_write_success(self, addon_config, mock_connection):
+        connection, _, mock_collection = mock_connection
+        mock_result = MagicMock()
+        mock_result.inserted_count = 1
+        mock_result.matched_count = 1
+        mock_result.modified_count = 1
+        mock_result.deleted_count = 1
+        mock_result.upserted_ids = {2: 3}
+        mock_result.acknowledged = True
+        mock_collection.bulk_write.return_value = mock_result
+
+        response = bulk_write(addon_config(), connection, get_mixed_input(ordered=False))
+
+        assert response.code == 200
+        requests = mock_collection.bulk_write.call_args.args[0]
+        assert mock_collection.bulk_write.call_args.kwargs == {"ordered": False}
+        assert requests == [
+            InsertOne({"_id": 1, "name": "a"}),
+            UpdateMany({"_id": 2}, {"$set": {"x": 1}}, upsert=False),
+            UpdateOne({"_id": 3}, {"$set": {"x": 2}}, upsert=True),
+            DeleteOne({"_id": 4}),
+        ]
+        output = response.output
+        assert output.inserted_count == 1
+        assert output.upserted_count == 1
+        assert output.failed_count == 0
+        assert output.results[0].inserted_id == 1
+        assert output.results[2].upserted_id == 3
+        assert all(item.status == "ok" for item in output.results)
+
+    def test_bulk_write_unacknowledged(self, addon_config, mock_connection):
+        connection, _, mock_collection = mock_connection
+        mock_collection.bulk_write.return_value = BulkWriteResult({}, False)
+
+        response = bulk_write(addon_config(w="0"), connection, get_mixed_input())
+
+        assert response.code == 200
+        output = response.output
+        assert output.acknowledged is False
+        assert (output.inserted_count, output.matched_count, output.modified_count, output.deleted_count) == (0, 0, 0, 0)
+        assert all(item.status == "unacknowledged" for item in output.results)
+        assert output.results[0].inserted_id == 1
+
+    def test_bulk_write_ordered_partial_failure(self, addon_config, mock_connection):
+        connection, _, mock_collection = mock_connection
+        mock_collection.bulk_write.side_effect = BulkWriteError({
+            "nInserted": 0,
+            "nMatched": 0,
+            "nModified": 0,
+            "nRemoved": 0,
+            "upserted": [],
+            "writeErrors": [{"index": 0, "code": 11000, "errmsg": "duplicate key"}],
+        })
+
+        response = bulk_write(addon_config(), connection, get_mixed_input(ordered=True))
+
+        assert response.code == 207
+        statuses = [item.status for item in response.output.results]
+        assert statuses == ["error", "skipped", "skipped", "skipped"]
+        assert response.output.results[0].error_code == 11000
+        assert response.output.failed_count == 1
+
+    def test_bulk_write_unordered_partial_failure(self, addon_config, mock_connection):
+        connection, _, mock_collection = mock_connection
+        mock_collection.bulk_write.side_effect = BulkWriteError({
+            "nInserted": 1,
+            "nMatched": 0,
+            "nModified": 0,
+            "nRemoved": 1,
+            "upserted": [{"index": 2, "_id": 3}],
+            "writeErrors": [{"index": 1, "code": 2, "errmsg": "bad update"}],
+        })
+
+        response = bulk_write(addon_config(), connection, get_mixed_input(ordered=False))
+
+        assert response.code == 207
+        statuses = [item.status for item in response.output.results]
+        assert statuses == ["ok", "error", "ok", "ok"]
+        assert response.output.deleted_count == 1
+        assert response.output.results[2].upserted_id == 3
+
+    def test_bulk_write_error(self, addon_config, mock_connection):
+        connection, _, mock_collection = mock_connection
+        mock_collection.bulk_write.side_effect = Exception("boom")
+
+        response = bulk_write(addon_config(), connection, get_mixed_input())
+
+        assert response.code == 500
+        assert "Error executing bulk write: boom" in response.message
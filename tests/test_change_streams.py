@@ -0,0 +1,197 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mongodb_rooms_pkg.addon import MongoDBRoomsAddon
+from mongodb_rooms_pkg.services.change_streams import ChangeStreamSubscription, ResumeTokenStore
+
+
+class FakeChangeStream:
+    """Stand-in for pymongo's ChangeStream: try_next() yields queued events (None = idle), then None."""
+
+    def __init__(self, events, keep_alive=False, idle_token=None):
+        self.events = list(events)
+        self.keep_alive = keep_alive
+        self.idle_token = idle_token
+        self.resume_token = None
+
+    @property
+    def alive(self):
+        return bool(self.events) or self.keep_alive
+
+    def try_next(self):
+        if not self.events:
+            if self.idle_token is not None:
+                self.resume_token = self.idle_token
+            return None
+        event = self.events.pop(0)
+        if event is not None:
+            self.resume_token = event.get("_id")
+        return event
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.keep_alive = False
+
+
+def event(token, operation="insert"):
+    return {"_id": {"_data": token}, "operationType": operation, "fullDocument": {"_id": token}}
+
+
+def subscription(stream, store, **kwargs):
+    target = MagicMock()
+    target.watch.return_value = stream
+    return ChangeStreamSubscription(target, "testdb.orders", store, **kwargs), target
+
+
+class TestResumeTokenStore:
+    def test_persists_tokens(self, tmp_path):
+        path = str(tmp_path / "tokens.json")
+        store = ResumeTokenStore(path)
+        store.set("testdb.orders", {"_data": "82A1"})
+        store.save()
+
+        assert ResumeTokenStore(path).get("testdb.orders") == {"_data": "82A1"}
+
+    def test_concurrent_saves(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        store = ResumeTokenStore(str(path))
+        errors = []
+
+        def work(name):
+            try:
+                for i in range(20):
+                    store.set(name, {"_data": str(i)})
+                    store.save()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(f"s{n}",)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert [p.name for p in tmp_path.iterdir()] == ["tokens.json"]
+        assert ResumeTokenStore(str(path)).names() == ["s0", "s1", "s2", "s3"]
+
+    def test_without_path_is_memory_only(self, tmp_path):
+        store = ResumeTokenStore()
+        store.set("a", {"_data": "1"})
+        store.save()
+        assert store.names() == ["a"]
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        path.write_text("{not json")
+        assert ResumeTokenStore(str(path)).names() == []
+
+
+class TestChangeStreamSubscription:
+    def test_batches_by_size_and_idle(self):
+        store = ResumeTokenStore()
+        stream = FakeChangeStream([event("1"), event("2"), event("3"), None, event("4")])
+        sub, _ = subscription(stream, store, batch_size=2)
+
+        batches = sub.batches()
+        assert [e["_id"]["_data"] for e in next(batches)] == ["1", "2"]
+        # The token of a batch is committed only once the next batch is requested.
+        assert store.get("testdb.orders") is None
+        assert [e["_id"]["_data"] for e in next(batches)] == ["3"]
+        assert store.get("testdb.orders") == {"_data": "2"}
+        assert [e["_id"]["_data"] for e in next(batches)] == ["4"]
+        assert list(batches) == []
+        assert store.get("testdb.orders") == {"_data": "4"}
+        assert sub.delivered == 4
+
+    def test_watch_options_and_resume(self, tmp_path):
+        store = ResumeTokenStore(str(tmp_path / "tokens.json"))
+        store.set("testdb.orders", {"_data": "9"})
+        sub, target = subscription(FakeChangeStream([]), store, filter={"operationType": "insert"},
+                                   full_document="updateLookup", batch_size=50)
+
+        assert list(sub.batches()) == []
+        target.watch.assert_called_once_with([{"$match": {"operationType": "insert"}}], full_document="updateLookup",
+                                             resume_after={"_data": "9"}, max_await_time_ms=1000, batch_size=50)
+
+    def test_idle_stream_advances_token(self):
+        store = ResumeTokenStore()
+        sub, _ = subscription(FakeChangeStream([], idle_token={"_data": "pbrt"}), store)
+        assert list(sub.batches()) == []
+        assert store.get("testdb.orders") == {"_data": "pbrt"}
+
+    def test_invalidate_ends_stream_and_drops_token(self):
+        store = ResumeTokenStore()
+        store.set("testdb.orders", {"_data": "0"})
+        stream = FakeChangeStream([event("1"), event("2", "invalidate"), event("3")])
+        sub, _ = subscription(stream, store, batch_size=10)
+
+        assert [[e["operationType"] for e in batch] for batch in sub.batches()] == [["insert", "invalidate"]]
+        assert store.get("testdb.orders") is None
+
+    @pytest.mark.parametrize("kwargs", [{"batch_size": 0}, {"full_document": "always"}])
+    def test_invalid_options(self, kwargs):
+        with pytest.raises(ValueError):
+            subscription(FakeChangeStream([]), ResumeTokenStore(), **kwargs)
+
+    def test_callback_failure_does_not_commit(self):
+        store = ResumeTokenStore()
+        sub, _ = subscription(FakeChangeStream([event("1")], keep_alive=True), store)
+
+        def callback(batch):
+            raise RuntimeError("boom")
+
+        sub.start(callback).join(2)
+
+        assert sub.running is False
+        assert sub.error == "boom"
+        assert store.get("testdb.orders") is None
+
+
+class TestAddonWatch:
+    def test_watch_requires_connection(self):
+        assert MongoDBRoomsAddon().watch("orders") is None
+
+    def test_background_watch_persists_tokens(self, tmp_path, addon_config):
+        path = str(tmp_path / "tokens.json")
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config(changeStreamResumePath=path)
+        with patch('mongodb_rooms_pkg.addon.create_connection', return_value=MagicMock()):
+            addon.initConnection()
+        db = addon.connection.__getitem__.return_value
+        db.__getitem__.return_value.watch.return_value = FakeChangeStream([event("1"), event("2")], keep_alive=True)
+        received = []
+        done = threading.Event()
+
+        def callback(batch):
+            received.extend(batch)
+            done.set()
+
+        addon.watch("orders", callback=callback, name="room-orders")
+        assert done.wait(2)
+        for _ in range(100):
+            if addon.resume_tokens.get("room-orders"):
+                break
+            threading.Event().wait(0.01)
+        assert addon.watch_status()["room-orders"]["delivered"] == 2
+        addon.closeConnection()
+
+        assert [e["_id"]["_data"] for e in received] == ["1", "2"]
+        assert addon.subscriptions == {}
+        assert ResumeTokenStore(path).get("room-orders") == {"_data": "2"}
+
+    def test_database_scope_iterator(self, addon_config):
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config()
+        with patch('mongodb_rooms_pkg.addon.create_connection', return_value=MagicMock()):
+            addon.initConnection()
+        db = addon.connection.__getitem__.return_value
+        db.watch.return_value = FakeChangeStream([event("1")])
+
+        assert [len(batch) for batch in addon.watch()] == [1]
+        db.watch.assert_called_once()
+        addon.closeConnection()
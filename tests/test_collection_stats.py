@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock
+
+from pymongo.errors import OperationFailure
+
+from mongodb_rooms_pkg.services.collection_stats import (
+    build_batch_pipeline,
+    existing_collections,
+    fetch_collection_metadata,
+    load_collection_metadata,
+    merge_coll_stats,
+    merge_index_stats,
+)
+from mongodb_rooms_pkg.services.metadata_cache import MetadataCache
+
+
+class TestBatchPipeline:
+    def test_pipeline_unions_every_collection(self):
+        pipeline = build_batch_pipeline(["users", "orders"])
+
+        assert pipeline[0] == {"$collStats": {"storageStats": {}, "count": {}}}
+        assert pipeline[1] == {"$addFields": {"_collection": "users", "_kind": "stats"}}
+        unions = [(stage["$unionWith"]["coll"], stage["$unionWith"]["pipeline"][1]["$addFields"]["_kind"]) for stage in pipeline[2:]]
+        assert unions == [("users", "index"), ("orders", "stats"), ("orders", "index")]
+
+    def test_existing_collections_uses_filter(self):
+        db = MagicMock()
+        db.list_collection_names.return_value = ["users"]
+
+        assert existing_collections(db, ["users", "missing"]) == ["users"]
+        db.list_collection_names.assert_called_once_with(filter={"name": {"$in": ["users", "missing"]}})
+
+
+class TestMergeStats:
+    def test_sums_shards(self):
+        merged = merge_coll_stats([
+            {"storageStats": {"count": 10, "size": 100, "storageSize": 200, "nindexes": 2, "totalIndexSize": 30}},
+            {"storageStats": {"count": 30, "size": 300, "storageSize": 400, "nindexes": 2, "totalIndexSize": 50}},
+        ])
+
+        assert merged == {"count": 40, "size": 400, "storageSize": 600, "nindexes": 2, "totalIndexSize": 80, "avgObjSize": 10.0}
+
+    def test_empty_collection(self):
+        assert merge_coll_stats([{"storageStats": {"count": 0, "size": 0}}])["avgObjSize"] is None
+        assert merge_coll_stats([]) is None
+
+    def test_index_specs_deduplicated(self):
+        indexes = merge_index_stats([
+            {"name": "_id_", "key": {"_id": 1}, "spec": {"v": 2, "key": {"_id": 1}, "name": "_id_"}},
+            {"name": "_id_", "key": {"_id": 1}, "spec": {"v": 2, "key": {"_id": 1}, "name": "_id_"}},
+            {"name": "email_1", "key": {"email": 1}},
+        ])
+
+        assert indexes == [{"v": 2, "key": {"_id": 1}, "name": "_id_"}, {"name": "email_1", "key": {"email": 1}}]
+
+
+class TestFetchCollectionMetadata:
+    def test_single_batched_aggregation(self):
+        db = MagicMock()
+        db.__getitem__.return_value.aggregate.return_value = [
+            {"_collection": "users", "_kind": "stats", "storageStats": {"count": 1, "size": 5}},
+            {"_collection": "users", "_kind": "index", "name": "_id_", "key": {"_id": 1}},
+            {"_collection": "orders", "_kind": "stats", "storageStats": {"count": 2, "size": 8}},
+            {"_collection": "orders", "_kind": "index", "name": "_id_", "key": {"_id": 1}},
+        ]
+
+        stats, indexes = fetch_collection_metadata(db, ["users", "orders"])
+
+        assert stats["users"]["count"] == 1
+        assert stats["orders"]["avgObjSize"] == 4.0
+        assert indexes["orders"] == [{"name": "_id_", "key": {"_id": 1}}]
+        db.__getitem__.return_value.aggregate.assert_called_once()
+        db.command.assert_not_called()
+
+    def test_falls_back_to_commands(self):
+        db = MagicMock()
+        db.__getitem__.return_value.aggregate.side_effect = OperationFailure("not authorized")
+        db.__getitem__.return_value.list_indexes.return_value = [{"name": "_id_"}]
+        db.command.return_value = {"count": 3}
+
+        stats, indexes = fetch_collection_metadata(db, ["users"])
+
+        assert stats == {"users": {"count": 3}}
+        assert indexes == {"users": [{"name": "_id_"}]}
+        db.command.assert_called_once_with("collStats", "users")
+
+    def test_cache_only_fetches_missing_collections(self):
+        db = MagicMock()
+        db.__getitem__.return_value.aggregate.return_value = [
+            {"_collection": "orders", "_kind": "stats", "storageStats": {"count": 2}},
+            {"_collection": "orders", "_kind": "index", "name": "_id_", "key": {"_id": 1}},
+        ]
+        cache = MetadataCache(ttl_seconds=60)
+        cache.set(("testdb", "users", "stats"), {"count": 1})
+        cache.set(("testdb", "users", "indexes"), [])
+
+        stats, indexes = load_collection_metadata(db, "testdb", ["users", "orders"], cache)
+
+        assert stats["users"] == {"count": 1}
+        assert stats["orders"]["count"] == 2
+        pipeline = db.__getitem__.return_value.aggregate.call_args.args[0]
+        assert len(pipeline) == 3
+        assert cache.get(("testdb", "orders", "indexes")) == (True, [{"name": "_id_", "key": {"_id": 1}}])
@@ -0,0 +1,175 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+from pymongo.read_preferences import ReadPreference
+from pymongo.results import DeleteResult, UpdateResult
+
+from mongodb_rooms_pkg.actions.aio.delete import delete as async_delete
+from mongodb_rooms_pkg.actions.aio.insert import ActionInput as AsyncInsertInput
+from mongodb_rooms_pkg.actions.aio.insert import insert as async_insert
+from mongodb_rooms_pkg.actions.aio.update import update as async_update
+from mongodb_rooms_pkg.actions.aio.upsert import upsert as async_upsert
+from mongodb_rooms_pkg.actions.delete import ActionInput as DeleteInput
+from mongodb_rooms_pkg.actions.delete import delete
+from mongodb_rooms_pkg.actions.insert import ActionInput as InsertInput
+from mongodb_rooms_pkg.actions.insert import insert
+from mongodb_rooms_pkg.actions.update import ActionInput as UpdateInput
+from mongodb_rooms_pkg.actions.update import update
+from mongodb_rooms_pkg.actions.upsert import ActionInput as UpsertInput
+from mongodb_rooms_pkg.actions.upsert import upsert
+from mongodb_rooms_pkg.addon import MongoDBRoomsAddon
+from mongodb_rooms_pkg.configuration import ConcernProfile
+from mongodb_rooms_pkg.services.concerns import ConcernResolver, UnknownConcernProfileError, concern_options
+
+PROFILES = {
+    "bulk": {"w": 1, "journal": False},
+    "critical": {"w": "majority", "wtimeoutMS": 5000, "journal": True, "readConcern": "majority",
+                 "readPreference": "primaryPreferred"},
+}
+
+
+class TestConcernProfile:
+    def test_options(self):
+        options = concern_options(ConcernProfile(**PROFILES["critical"]))
+        assert options["write_concern"].document == {"w": "majority", "wtimeout": 5000, "j": True}
+        assert options["read_concern"].level == "majority"
+        assert options["read_preference"] == ReadPreference.PRIMARY_PREFERRED
+
+    def test_empty_profile_has_no_options(self):
+        assert concern_options(ConcernProfile()) == {}
+
+    @pytest.mark.parametrize("kwargs", [
+        {"w": 0, "journal": True},
+        {"w": -1},
+        {"readConcern": "eventual"},
+        {"readPreference": "closest"},
+    ])
+    def test_invalid_profiles(self, kwargs):
+        with pytest.raises(ValidationError):
+            ConcernProfile(**kwargs)
+
+    def test_config_rejects_invalid_profile(self, addon_config):
+        with pytest.raises(ValidationError):
+            addon_config(concernProfiles={"bad": {"w": 0, "journal": True}})
+
+
+class TestConcernResolver:
+    def test_caches_handles_per_collection_and_profile(self, addon_config, mock_connection):
+        _, db, collection = mock_connection
+        resolver = ConcernResolver(addon_config(concernProfiles=PROFILES).concernProfiles)
+
+        first = resolver.collection(db, "events", "bulk")
+        assert resolver.collection(db, "events", "bulk") is first
+        resolver.collection(db, "events", "critical")
+
+        assert collection.with_options.call_count == 2
+        assert resolver.profiles == ["bulk", "critical"]
+
+    def test_no_profile_uses_plain_collection(self, mock_connection):
+        _, db, collection = mock_connection
+        assert ConcernResolver().collection(db, "events") is collection
+        collection.with_options.assert_not_called()
+
+    def test_unknown_profile(self, mock_connection):
+        _, db, _ = mock_connection
+        with pytest.raises(UnknownConcernProfileError):
+            ConcernResolver().collection(db, "events", "bulk")
+
+
+class TestActions:
+    def test_insert_uses_profile(self, addon_config, mock_connection):
+        connection, _, collection = mock_connection
+        profiled = collection.with_options.return_value
+        profiled.insert_one.return_value = MagicMock(inserted_id="1", acknowledged=True)
+
+        result = insert(addon_config(concernProfiles=PROFILES), connection, InsertInput(collection="events", document={"a": 1}, concern_profile="bulk"))
+
+        assert result.code == 200
+        assert collection.with_options.call_args.kwargs["write_concern"].document == {"w": 1, "j": False}
+        profiled.insert_one.assert_called_once()
+        collection.insert_one.assert_not_called()
+
+    def test_update_with_shared_resolver(self, addon_config, mock_connection):
+        connection, _, collection = mock_connection
+        collection.with_options.return_value.update_one.return_value = MagicMock(
+            matched_count=1, modified_count=1, upserted_id=None, acknowledged=True)
+        config = addon_config(concernProfiles=PROFILES)
+        resolver = ConcernResolver(config.concernProfiles)
+        action_input = UpdateInput(collection="accounts", filter={"_id": 1}, update={"$inc": {"n": 1}},
+                                   concern_profile="critical")
+
+        update(config, connection, action_input, resolver=resolver)
+        update(config, connection, action_input, resolver=resolver)
+
+        collection.with_options.assert_called_once()
+        assert collection.with_options.return_value.update_one.call_count == 2
+
+    def test_unknown_profile_is_rejected(self, addon_config, mock_connection):
+        connection, _, collection = mock_connection
+        result = delete(addon_config(concernProfiles=PROFILES), connection, DeleteInput(collection="events", filter={"a": 1}, concern_profile="nope"))
+        assert result.code == 400
+        assert "nope" in result.message
+        collection.delete_one.assert_not_called()
+
+    def test_async_insert_uses_profile(self, addon_config, mock_connection):
+        connection, _, collection = mock_connection
+        profiled = collection.with_options.return_value
+        profiled.insert_one = AsyncMock(return_value=MagicMock(inserted_id="1", acknowledged=True))
+
+        result = asyncio.run(async_insert(addon_config(concernProfiles=PROFILES), connection,
+                                          AsyncInsertInput(collection="events", document={"a": 1}, concern_profile="bulk")))
+
+        assert result.code == 200
+        profiled.insert_one.assert_awaited_once()
+
+
+UNACKNOWLEDGED_PROFILES = {**PROFILES, "fire_and_forget": {"w": 0}}
+UNACKNOWLEDGED_CASES = [
+    (update, "update_one", UpdateInput(collection="events", filter={"a": 1}, update={"$set": {"b": 1}},
+                                       concern_profile="fire_and_forget"), UpdateResult(None, False)),
+    (upsert, "update_one", UpsertInput(collection="events", filter={"a": 1}, update={"$set": {"b": 1}},
+                                       concern_profile="fire_and_forget"), UpdateResult(None, False)),
+    (delete, "delete_one", DeleteInput(collection="events", filter={"a": 1}, concern_profile="fire_and_forget"),
+     DeleteResult(None, False)),
+]
+
+
+class TestUnacknowledgedWrites:
+    @pytest.mark.parametrize("action, method, action_input, result", UNACKNOWLEDGED_CASES)
+    def test_sync_actions_return_zero_counts(self, action, method, action_input, result, addon_config, mock_connection):
+        connection, _, collection = mock_connection
+        getattr(collection.with_options.return_value, method).return_value = result
+
+        response = action(addon_config(concernProfiles=UNACKNOWLEDGED_PROFILES), connection, action_input)
+
+        assert response.code == 200
+        assert response.output.acknowledged is False
+        assert collection.with_options.call_args.kwargs["write_concern"].document == {"w": 0}
+
+    @pytest.mark.parametrize("action, method, action_input, result", [
+        (async_action, *case[1:]) for async_action, case in zip((async_update, async_upsert, async_delete), UNACKNOWLEDGED_CASES)
+    ])
+    def test_async_actions_return_zero_counts(self, action, method, action_input, result, addon_config, mock_connection):
+        connection, _, collection = mock_connection
+        setattr(collection.with_options.return_value, method, AsyncMock(return_value=result))
+
+        response = asyncio.run(action(addon_config(concernProfiles=UNACKNOWLEDGED_PROFILES), connection, action_input))
+
+        assert response.code == 200
+        assert response.output.acknowledged is False
+
+
+class TestAddon:
+    @patch("mongodb_rooms_pkg.addon.delete")
+    def test_forwards_profile_and_resolver(self, mock_delete, addon_config):
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config(concernProfiles=PROFILES)
+        addon.concern_resolver = ConcernResolver(addon.config.concernProfiles)
+
+        addon.delete("events", {"a": 1}, concern_profile="critical")
+
+        args, kwargs = mock_delete.call_args
+        assert args[2].concern_profile == "critical"
+        assert kwargs["resolver"] is addon.concern_resolver
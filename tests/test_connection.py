@@ -3,7 +3,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from mongodb_rooms_pkg.configuration.addonconfig import CustomAddonConfig
-from mongodb_rooms_pkg.services.connection import build_uri, create_connection
+from mongodb_rooms_pkg.services.connection import (
+    ClientRegistry,
+    ConnectionHealth,
+    build_uri,
+    create_connection,
+    normalize_uri,
+)
 
 
 def get_base_config():
@@ -277,3 +283,161 @@ class TestCreateConnection:
         result = create_connection(uri)
 
         assert result is None
+
+
+class TestNormalizeUri:
+    def test_sorts_and_lowercases_options(self):
+        assert normalize_uri("mongodb://h:1/db?w=1&authSource=admin") == normalize_uri("mongodb://h:1/db?authsource=admin&w=1")
+
+    def test_uri_without_options(self):
+        assert normalize_uri("mongodb://h:1/db") == "mongodb://h:1/db"
+
+
+class TestClientRegistry:
+    def test_registry_is_singleton(self):
+        assert ClientRegistry() is ClientRegistry()
+
+    def test_acquire_reuses_client_for_equivalent_uris(self):
+        factory = MagicMock(return_value=MagicMock())
+        registry = ClientRegistry()
+
+        first = registry.acquire("mongodb://h:1/db?w=1&appname=a", factory)
+        second = registry.acquire("mongodb://h:1/db?appname=a&w=1", factory)
+
+        assert first is second
+        factory.assert_called_once_with("mongodb://h:1/db?w=1&appname=a")
+        assert registry.refcount("mongodb://h:1/db?w=1&appname=a") == 2
+
+    def test_distinct_uris_get_distinct_clients(self):
+        factory = MagicMock(side_effect=lambda uri: MagicMock())
+        registry = ClientRegistry()
+
+        assert registry.acquire("mongodb://a:1/db", factory) is not registry.acquire("mongodb://b:1/db", factory)
+
+    def test_release_closes_client_after_last_user(self):
+        client = MagicMock()
+        registry = ClientRegistry()
+        registry.acquire("mongodb://h:1/db", lambda uri: client)
+        registry.acquire("mongodb://h:1/db", lambda uri: client)
+
+        registry.release("mongodb://h:1/db")
+        client.close.assert_not_called()
+
+        registry.release("mongodb://h:1/db")
+        client.close.assert_called_once()
+        assert registry.refcount("mongodb://h:1/db") == 0
+
+    def test_failed_creation_is_not_registered(self):
+        registry = ClientRegistry()
+
+        assert registry.acquire("mongodb://h:1/db", lambda uri: None) is None
+        assert registry.refcount("mongodb://h:1/db") == 0
+
+    def test_addons_share_client(self):
+        from mongodb_rooms_pkg.addon import MongoDBRoomsAddon
+
+        config = CustomAddonConfig(
+            **get_base_config(),
+            host="localhost",
+            database="testdb",
+            secrets={"db_user": "user", "db_password": "pass"}
+        )
+        first, second = MongoDBRoomsAddon(), MongoDBRoomsAddon()
+        first.config = second.config = config
+
+        with patch('mongodb_rooms_pkg.addon.create_connection', return_value=MagicMock()) as mock_create:
+            assert first.initConnection() is True
+            assert second.initConnection() is True
+
+        assert first.connection is second.connection
+        mock_create.assert_called_once()
+
+        first.closeConnection()
+        assert first.connection is None
+        second.connection.close.assert_not_called()
+        client = second.connection
+        second.closeConnection()
+        client.close.assert_called_once()
+
+
+class TestLazyConnection:
+    @patch('mongodb_rooms_pkg.services.connection.MongoClient')
+    def test_lazy_connection_skips_ping(self, mock_mongo_client):
+        mock_client = MagicMock()
+        mock_mongo_client.return_value = mock_client
+
+        result = create_connection("mongodb://localhost:27017/testdb", lazy=True)
+
+        assert result == mock_client
+        mock_client.admin.command.assert_not_called()
+
+    @patch('mongodb_rooms_pkg.services.connection.MongoClient')
+    def test_configured_server_selection_timeout_is_kept(self, mock_mongo_client):
+        uri = "mongodb://localhost:27017/testdb?serverSelectionTimeoutMS=30000"
+
+        create_connection(uri)
+
+        mock_mongo_client.assert_called_once_with(uri)
+
+    def test_health_check_ready(self):
+        health = ConnectionHealth()
+        client = MagicMock()
+
+        health.check(client).join(timeout=1)
+
+        assert health.status()["status"] == "ready"
+        client.admin.command.assert_called_once_with("ping")
+
+    def test_health_check_unreachable(self):
+        health = ConnectionHealth()
+        client = MagicMock()
+        client.admin.command.side_effect = Exception("No servers found")
+
+        health.check(client).join(timeout=1)
+
+        status = health.status()
+        assert status["status"] == "unreachable"
+        assert status["error"] == "No servers found"
+        assert status["checked_at"] is not None
+
+    def test_addon_lazy_connection(self):
+        from mongodb_rooms_pkg.addon import MongoDBRoomsAddon
+
+        addon = MongoDBRoomsAddon()
+        addon.config = CustomAddonConfig(
+            **get_base_config(),
+            host="localhost",
+            database="testdb",
+            lazyConnection=True,
+            secrets={"db_user": "user", "db_password": "pass"}
+        )
+        assert addon.connectionStatus()["status"] == "disconnected"
+
+        with patch('mongodb_rooms_pkg.services.connection.MongoClient') as mock_mongo_client, \
+             patch.object(addon.health, 'check') as mock_check:
+            assert addon.initConnection() is True
+
+        mock_mongo_client.return_value.admin.command.assert_not_called()
+        mock_check.assert_called_once_with(addon.connection)
+
+    def test_addon_eager_connection_status(self):
+        from mongodb_rooms_pkg.addon import MongoDBRoomsAddon
+
+        addon = MongoDBRoomsAddon()
+        addon.config = CustomAddonConfig(
+            **get_base_config(),
+            host="localhost",
+            database="testdb",
+            secrets={"db_user": "user", "db_password": "pass"}
+        )
+
+        with patch('mongodb_rooms_pkg.addon.create_connection', return_value=None):
+            assert addon.initConnection() is False
+        assert addon.connectionStatus()["status"] == "unreachable"
+
+        with patch('mongodb_rooms_pkg.addon.create_connection', return_value=MagicMock()):
+            assert addon.initConnection() is True
+        assert addon.connectionStatus()["status"] == "ready"
+
+        addon.closeConnection()
+        assert addon.connectionStatus()["status"] == "disconnected"
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+from mongodb_rooms_pkg.actions.aio.describe_collection import describe_collection as describe_collection_async
+from mongodb_rooms_pkg.actions.describe_collection import describe_collection
+
+
+class ConcurrencyTracker:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def __exit__(self, *exc):
+        with self.lock:
+            self.active -= 1
+
+
+def batch_result(pipeline):
+    names = [pipeline[1]["$addFields"]["_collection"]]
+    names += [stage["$unionWith"]["coll"] for stage in pipeline[2:] if stage["$unionWith"]["pipeline"][0] == {"$collStats": {"storageStats": {}, "count": {}}}]
+    docs = []
+    for name in names:
+        docs.append({"_collection": name, "_kind": "stats", "storageStats": {"count": int(name.split("_")[1]), "size": 0, "storageSize": 0, "nindexes": 1, "totalIndexSize": 0}})
+        docs.append({"_collection": name, "_kind": "index", "name": "_id_", "key": {"_id": 1}})
+    return docs
+
+
+def get_mock_connection(names, tracker):
+    mock_connection = MagicMock()
+    mock_db = MagicMock()
+    mock_connection.__getitem__.return_value = mock_db
+    mock_db.list_collection_names.return_value = names
+
+    def aggregate(pipeline, **kwargs):
+        if "$sample" in pipeline[0]:
+            with tracker:
+                time.sleep(0.02)
+            return []
+        return batch_result(pipeline)
+
+    mock_db.__getitem__.return_value.aggregate.side_effect = aggregate
+    return mock_connection
+
+
+class TestDescribeCollectionConcurrency:
+    def test_parallel_describe_keeps_order(self, addon_config):
+        names = [f"coll_{i}" for i in range(12)]
+        tracker = ConcurrencyTracker()
+        connection = get_mock_connection(names, tracker)
+
+        response = describe_collection(addon_config(), connection, names + ["missing"], max_concurrency=4)
+
+        assert response.code == 200
+        assert [c.collection_name for c in response.output.collections] == names + ["missing"]
+        assert [c.stats.count for c in response.output.collections[:-1]] == list(range(12))
+        assert response.output.collections[-1].exists is False
+        assert 1 < tracker.peak <= 4
+
+    def test_default_is_serial(self, addon_config):
+        names = [f"coll_{i}" for i in range(3)]
+        tracker = ConcurrencyTracker()
+
+        response = describe_collection(addon_config(), get_mock_connection(names, tracker), names)
+
+        assert response.code == 200
+        assert tracker.peak == 1
+
+    def test_async_describe_respects_cap(self, addon_config):
+        names = [f"coll_{i}" for i in range(8)]
+        tracker = {"active": 0, "peak": 0}
+        mock_connection = MagicMock()
+        mock_db = MagicMock()
+        mock_collection = MagicMock()
+        mock_connection.__getitem__.return_value = mock_db
+        mock_db.__getitem__.return_value = mock_collection
+        mock_db.list_collection_names = AsyncMock(return_value=names)
+
+        async def aggregate(pipeline, **kwargs):
+            cursor = MagicMock()
+            if "$sample" in pipeline[0]:
+                tracker["active"] += 1
+                tracker["peak"] = max(tracker["peak"], tracker["active"])
+                await asyncio.sleep(0.01)
+                tracker["active"] -= 1
+                cursor.to_list = AsyncMock(return_value=[])
+            else:
+                cursor.to_list = AsyncMock(return_value=batch_result(pipeline))
+            return cursor
+
+        mock_collection.aggregate = aggregate
+
+        response = asyncio.run(describe_collection_async(addon_config(), mock_connection, names, max_concurrency=3))
+
+        assert response.code == 200
+        assert [c.stats.count for c in response.output.collections] == list(range(8))
+        assert tracker["peak"] == 3
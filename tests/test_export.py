@@ -0,0 +1,178 @@
+import gzip
+import os
+
+import bson
+import pytest
+from bson import ObjectId, json_util
+from bson.raw_bson import RawBSONDocument
+
+from mongodb_rooms_pkg.actions.export_collection import ActionInput as ExportInput
+from mongodb_rooms_pkg.actions.export_collection import export_collection
+from mongodb_rooms_pkg.storage import DocumentExporter, MissingDependencyError, ParquetSchemaError
+from mongodb_rooms_pkg.storage.writers import check_dependencies, to_arrow_value
+
+
+@pytest.fixture
+def get_connection(mock_connection, fake_cursor):
+    """(connection, collection, cursor) with find() returning a cursor over documents, raw codec or not."""
+    def make(documents):
+        connection, _, collection = mock_connection
+        cursor = fake_cursor(documents)
+        collection.find.return_value = cursor
+        collection.with_options.return_value.find.return_value = cursor
+        return connection, collection, cursor
+    return make
+
+
+DOCUMENTS = [{"_id": ObjectId(), "n": i, "name": f"user-{i}"} for i in range(5)]
+
+
+class TestDocumentExporter:
+    def test_rotates_by_document_count(self, tmp_path):
+        exporter = DocumentExporter(str(tmp_path), "users", max_documents_per_file=2).write_all(DOCUMENTS)
+
+        assert exporter.dropped_fields == []
+
+        assert [file["documents"] for file in exporter.files] == [2, 2, 1]
+        assert [os.path.basename(file["path"]) for file in exporter.files] == [
+            "users-00000.ndjson", "users-00001.ndjson", "users-00002.ndjson"]
+        lines = [json_util.loads(line) for file in exporter.files for line in open(file["path"])]
+        assert lines == DOCUMENTS
+        assert not [name for name in os.listdir(tmp_path) if name.endswith(".part")]
+
+    def test_rotates_by_bytes(self, tmp_path):
+        size = len(bson.encode(DOCUMENTS[0]))
+        exporter = DocumentExporter(str(tmp_path), "users", format="bson", max_bytes_per_file=size * 2).write_all(DOCUMENTS)
+        assert [file["documents"] for file in exporter.files] == [2, 2, 1]
+
+    def test_gzip_bson_round_trip(self, tmp_path):
+        exporter = DocumentExporter(str(tmp_path), "users", format="bson", compression="gzip").write_all(DOCUMENTS)
+
+        [file] = exporter.files
+        assert file["path"].endswith("users-00000.bson.gz")
+        with gzip.open(file["path"], "rb") as f:
+            assert bson.decode_all(f.read()) == DOCUMENTS
+
+    def test_empty_export_writes_one_file(self, tmp_path):
+        exporter = DocumentExporter(str(tmp_path), "users").write_all([])
+        assert [file["documents"] for file in exporter.files] == [0]
+
+    def test_failure_discards_partial_file(self, tmp_path):
+        def documents():
+            yield from DOCUMENTS[:3]
+            raise RuntimeError("cursor died")
+
+        exporter = DocumentExporter(str(tmp_path), "users", max_documents_per_file=2)
+        with pytest.raises(RuntimeError):
+            exporter.write_all(documents())
+
+        assert [file["documents"] for file in exporter.files] == [2]
+        assert sorted(os.listdir(tmp_path)) == ["users-00000.ndjson"]
+
+    @pytest.mark.parametrize("kwargs", [
+        {"format": "csv"},
+        {"format": "ndjson", "compression": "snappy"},
+        {"json_mode": "shell"},
+    ])
+    def test_invalid_options(self, tmp_path, kwargs):
+        with pytest.raises(ValueError):
+            DocumentExporter(str(tmp_path), "users", **kwargs)
+
+    def test_arrow_values(self):
+        oid = ObjectId()
+        assert to_arrow_value({"_id": oid, "tags": [oid], "n": 1}) == {"_id": str(oid), "tags": [str(oid)], "n": 1}
+
+
+class TestExportCollectionAction:
+    def test_ndjson_export_with_server_side_projection(self, tmp_path, addon_config, get_connection):
+        connection, collection, cursor = get_connection(DOCUMENTS)
+        action_input = ExportInput(collection="users", directory=str(tmp_path), projection={"name": 1},
+                                   sort={"n": 1}, compression="gzip")
+
+        response = export_collection(addon_config(), connection, action_input)
+
+        assert response.code == 200
+        assert response.output.document_count == 5
+        assert response.output.files[0].path.endswith("users-00000.ndjson.gz")
+        assert collection.find.call_args.kwargs["projection"] == {"name": 1}
+        assert cursor.closed
+
+    def test_bson_export_reads_raw_documents(self, tmp_path, addon_config, get_connection):
+        raw = [RawBSONDocument(bson.encode(document)) for document in DOCUMENTS]
+        connection, collection, _ = get_connection(raw)
+
+        response = export_collection(addon_config(), connection, ExportInput(collection="users", directory=str(tmp_path), format="bson"))
+
+        assert response.code == 200
+        codec_options = collection.with_options.call_args.kwargs["codec_options"]
+        assert codec_options.document_class is RawBSONDocument
+        with open(response.output.files[0].path, "rb") as f:
+            assert bson.decode_all(f.read()) == DOCUMENTS
+
+    def test_missing_optional_dependency(self, tmp_path, monkeypatch, addon_config, get_connection):
+        import builtins
+        real_import = builtins.__import__
+
+        def fake_import(name, *args, **kwargs):
+            if name in ("pyarrow", "zstandard"):
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+        connection, collection, _ = get_connection(DOCUMENTS)
+
+        response = export_collection(addon_config(), connection, ExportInput(collection="users", directory=str(tmp_path), format="parquet"))
+
+        assert response.code == 400
+        assert "pyarrow" in response.message
+        collection.find.assert_not_called()
+        with pytest.raises(MissingDependencyError):
+            check_dependencies("ndjson", "zstd")
+
+    def test_no_connection(self, tmp_path, addon_config):
+        response = export_collection(addon_config(), None, ExportInput(collection="users", directory=str(tmp_path)))
+        assert response.code == 500
+
+
+class TestParquet:
+    def test_parquet_row_groups(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        exporter = DocumentExporter(str(tmp_path), "users", format="parquet", row_group_size=2).write_all(DOCUMENTS)
+
+        parquet_file = pq.ParquetFile(exporter.files[0]["path"])
+        assert parquet_file.metadata.num_row_groups == 3
+        assert parquet_file.read().column("n").to_pylist() == [0, 1, 2, 3, 4]
+
+    def test_parquet_late_and_mixed_fields(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        documents = [
+            {"_id": 1, "n": 1, "note": None, "mixed": 1, "address": {"city": "Paris"}},
+            {"_id": 2, "n": 2, "note": None, "mixed": "two", "address": {"city": "Lyon"}},
+            {"_id": 3, "n": 3, "note": "late", "mixed": 3.5, "address": {"city": "Nice", "zip": "06000"}, "extra": True},
+        ]
+        exporter = DocumentExporter(str(tmp_path), "users", format="parquet", row_group_size=2).write_all(documents)
+
+        table = pq.read_table(exporter.files[0]["path"])
+        assert table.column("note").to_pylist() == [None, None, "late"]
+        assert table.column("mixed").to_pylist() == ["1", "two", "3.5"]
+        assert exporter.files[0]["dropped_fields"] == ["address.zip", "extra"]
+        assert exporter.dropped_fields == ["address.zip", "extra"]
+
+    def test_parquet_lossy_value_fails_clearly(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        documents = [{"_id": 1, "price": 1}, {"_id": 2, "price": 1.5}]
+
+        with pytest.raises(ParquetSchemaError, match="price"):
+            DocumentExporter(str(tmp_path), "users", format="parquet", row_group_size=1).write_all(documents)
+        assert os.listdir(tmp_path) == []
+
+    def test_action_reports_dropped_field_count(self, tmp_path, addon_config, get_connection):
+        pytest.importorskip("pyarrow")
+        connection, _, _ = get_connection([{"_id": 1}, {"_id": 2, "late": 1}])
+
+        response = export_collection(addon_config(), connection, ExportInput(
+            collection="users", directory=str(tmp_path), format="parquet", row_group_size=1))
+
+        assert response.code == 200
+        assert response.output.dropped_field_count == 1
+        assert response.output.files[0].dropped_fields == ["late"]
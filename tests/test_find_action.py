@@ -0,0 +1,96 @@
+
+import pytest
+from pydantic import ValidationError
+
+from mongodb_rooms_pkg.actions.find import ActionInput as FindInput
+from mongodb_rooms_pkg.actions.find import find
+from mongodb_rooms_pkg.utils.batching import iter_batches
+
+
+class TestIterBatches:
+    def test_splits_into_fixed_size_batches(self):
+        assert list(iter_batches(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_empty_iterable(self):
+        assert list(iter_batches([], 3)) == []
+
+    def test_is_lazy(self):
+        consumed = []
+
+        def source():
+            for i in range(10):
+                consumed.append(i)
+                yield i
+
+        batches = iter_batches(source(), 2)
+        assert next(batches) == [0, 1]
+        assert consumed == [0, 1]
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError):
+            list(iter_batches([1], 0))
+
+
+class TestFindAction:
+    def test_find_input_defaults(self):
+        input_data = FindInput(collection="users")
+        assert input_data.filter is None
+        assert input_data.batch_size == 100
+        assert input_data.limit is None
+
+    def test_find_input_invalid_batch_size(self):
+        with pytest.raises(ValidationError):
+            FindInput(collection="users", batch_size=0)
+
+    def test_find_no_connection(self, addon_config):
+        response = find(addon_config(), None, FindInput(collection="users"))
+
+        assert response.code == 500
+        assert response.message == "No database connection provided"
+        assert list(response.output.pages) == []
+
+    def test_find_streams_pages(self, addon_config, mock_connection, fake_cursor):
+        cursor = fake_cursor([{"_id": i} for i in range(5)])
+        connection, _, mock_collection = mock_connection
+        mock_collection.find.return_value = cursor
+        input_data = FindInput(
+            collection="users",
+            filter={"active": True},
+            projection={"_id": 1},
+            sort={"created_at": -1},
+            limit=5,
+            batch_size=2
+        )
+
+        response = find(addon_config(), connection, input_data)
+
+        assert response.code == 200
+        mock_collection.find.assert_called_once_with({"active": True}, projection={"_id": 1}, batch_size=2)
+        assert cursor.sort_spec == [("created_at", -1)]
+        assert cursor.limit_value == 5
+        assert cursor.closed is False
+
+        pages = list(response.output.pages)
+        assert pages == [[{"_id": 0}, {"_id": 1}], [{"_id": 2}, {"_id": 3}], [{"_id": 4}]]
+        assert cursor.closed is True
+
+    def test_closing_output_pages_closes_cursor(self, addon_config, mock_connection, fake_cursor):
+        cursor = fake_cursor([{"_id": i} for i in range(5)])
+        connection, _, mock_collection = mock_connection
+        mock_collection.find.return_value = cursor
+
+        response = find(addon_config(), connection, FindInput(collection="users", batch_size=2))
+        assert next(response.output.pages) == [{"_id": 0}, {"_id": 1}]
+        response.output.pages.close()
+
+        assert cursor.closed is True
+
+    def test_find_error(self, addon_config, mock_connection):
+        connection, _, mock_collection = mock_connection
+        mock_collection.find.return_value = None
+        mock_collection.find.side_effect = Exception("boom")
+
+        response = find(addon_config(), connection, FindInput(collection="users"))
+
+        assert response.code == 500
+        assert "Error finding documents: boom" in response.message
@@ -0,0 +1,266 @@
+import gzip
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import bson
+import pytest
+from bson import ObjectId, json_util
+from bson.raw_bson import RawBSONDocument
+from pymongo.errors import BulkWriteError
+from pymongo.results import InsertManyResult
+
+from mongodb_rooms_pkg.actions.import_file import ActionInput as ImportInput
+from mongodb_rooms_pkg.actions.import_file import import_file
+from mongodb_rooms_pkg.storage import FileImporter, MissingDependencyError
+from mongodb_rooms_pkg.storage.importer import RecordReader, detect_format
+
+
+class RecordingCollection:
+    """Collects what insert_many / bulk_write receive, from several writer threads."""
+
+    def __init__(self):
+        self.inserted = []
+        self.operations = []
+        self.lock = threading.Lock()
+
+    def insert_many(self, documents, ordered=True):
+        with self.lock:
+            self.inserted.extend(documents)
+        # Like pymongo, which leaves RawBSONDocuments out of inserted_ids.
+        return InsertManyResult([document.get("_id") for document in documents if not isinstance(document, RawBSONDocument)], True)
+
+    def bulk_write(self, operations, ordered=True):
+        with self.lock:
+            self.operations.extend(operations)
+        return MagicMock(matched_count=0, upserted_count=len(operations))
+
+
+DOCUMENTS = [{"_id": ObjectId(), "n": i, "tags": ["a"]} for i in range(25)]
+
+
+def write_ndjson(path, lines):
+    path.write_text("".join(line + "\n" for line in lines))
+    return str(path)
+
+
+class TestReading:
+    @pytest.mark.parametrize("name, expected", [
+        ("users.ndjson", ("ndjson", None)),
+        ("users.jsonl.gz", ("ndjson", "gzip")),
+        ("dump/users.bson", ("bson", None)),
+        ("users.csv.zst", ("csv", "zstd")),
+    ])
+    def test_detect_format(self, name, expected):
+        assert detect_format(name) == expected
+
+    def test_unknown_extension(self):
+        with pytest.raises(ValueError):
+            detect_format("users.xml")
+
+    def test_mapped_and_streamed_bson_agree(self, tmp_path):
+        data = b"".join(bson.encode(document) for document in DOCUMENTS)
+        (tmp_path / "users.bson").write_bytes(data)
+        with gzip.open(tmp_path / "users.bson.gz", "wb") as f:
+            f.write(data)
+
+        mapped = list(RecordReader(str(tmp_path / "users.bson"), "bson"))
+        streamed = list(RecordReader(str(tmp_path / "users.bson.gz"), "bson", "gzip"))
+
+        assert [bytes(raw) for _, raw in mapped] == [bytes(raw) for _, raw in streamed]
+        assert bson.decode(mapped[-1][1]) == DOCUMENTS[-1]
+
+    def test_truncated_bson_is_reported(self, tmp_path):
+        data = bson.encode(DOCUMENTS[0])
+        (tmp_path / "users.bson").write_bytes(data + data[:10])
+        records = list(RecordReader(str(tmp_path / "users.bson"), "bson"))
+        assert len(records) == 2
+        assert isinstance(records[1][1], ValueError)
+
+
+class TestFileImporter:
+    def test_ndjson_import_with_rejects(self, tmp_path):
+        lines = [json_util.dumps(document) for document in DOCUMENTS]
+        lines.insert(3, "{not json")
+        lines.insert(7, "[1, 2]")
+        lines.insert(9, "")
+        path = write_ndjson(tmp_path / "users.ndjson", lines)
+        collection = RecordingCollection()
+
+        report = FileImporter(collection, path, chunk_size=4, write_workers=3).run()
+
+        assert sorted(collection.inserted, key=lambda d: d["n"]) == DOCUMENTS
+        assert report["written_count"] == 25
+        assert report["rejected_count"] == 2
+        assert [rejected["record"] for rejected in report["rejected"]] == [4, 8]
+        assert report["records_read"] == 27
+        assert report["bytes_read"] == (tmp_path / "users.ndjson").stat().st_size
+
+    def test_bson_is_inserted_raw(self, tmp_path):
+        (tmp_path / "users.bson").write_bytes(b"".join(bson.encode(document) for document in DOCUMENTS))
+        collection = RecordingCollection()
+
+        report = FileImporter(collection, str(tmp_path / "users.bson"), chunk_size=10).run()
+
+        assert report["written_count"] == 25
+        assert report["documents_per_second"] > 0
+        assert all(isinstance(document, RawBSONDocument) for document in collection.inserted)
+        assert sorted(bson.decode(document.raw)["n"] for document in collection.inserted) == list(range(25))
+
+    def test_csv_types_nesting_and_blanks(self, tmp_path):
+        path = tmp_path / "people.csv.gz"
+        with gzip.open(path, "wt", newline="") as f:
+            f.write('name,age,active,address.city,joined\n')
+            f.write('Ada,36,true,"London, UK",2024-01-02T03:04:05Z\n')
+            f.write('Bob,,false,Paris,2024-02-03\n')
+            f.write('Eve,old,true,Rome,2024-03-04\n')
+        collection = RecordingCollection()
+
+        report = FileImporter(collection, str(path), csv_types={"age": "int", "active": "bool", "joined": "date"},
+                              ignore_blanks=True).run()
+
+        ada, bob = sorted(collection.inserted, key=lambda d: d["name"])
+        assert ada["age"] == 36 and ada["active"] is True and ada["address"] == {"city": "London, UK"}
+        assert ada["joined"].year == 2024
+        assert "age" not in bob
+        assert report["rejected"] == [{"record": 3, "error": "invalid literal for int() with base 10: 'old'"}]
+
+    def test_csv_with_explicit_fields_has_no_header(self, tmp_path):
+        (tmp_path / "rows.csv").write_text("1;a\n2;b\n")
+        collection = RecordingCollection()
+        FileImporter(collection, str(tmp_path / "rows.csv"), csv_fields=["n", "s"], csv_types={"n": "int"},
+                     csv_delimiter=";").run()
+        assert sorted(collection.inserted, key=lambda d: d["n"]) == [{"n": 1, "s": "a"}, {"n": 2, "s": "b"}]
+
+    def test_upsert_by_key(self, tmp_path):
+        path = write_ndjson(tmp_path / "users.ndjson", ['{"email": "a@x", "n": 1}', '{"n": 2}', '{"email": "b@x", "n": 3}'])
+        collection = RecordingCollection()
+
+        report = FileImporter(collection, path, upsert_keys=["email"]).run()
+
+        assert [op._filter for op in collection.operations] == [{"email": "a@x"}, {"email": "b@x"}]
+        assert all(op._upsert for op in collection.operations)
+        assert report["written_count"] == 2
+        assert report["rejected"][0]["record"] == 2
+
+    def test_server_rejections_are_reported(self, tmp_path):
+        path = write_ndjson(tmp_path / "users.ndjson", [json_util.dumps(document) for document in DOCUMENTS[:4]])
+        collection = MagicMock()
+        collection.insert_many.side_effect = BulkWriteError({
+            "nInserted": 3, "writeErrors": [{"index": 1, "code": 11000, "errmsg": "E11000 duplicate key"}]
+        })
+
+        report = FileImporter(collection, path, chunk_size=10).run()
+
+        assert report["written_count"] == 3
+        assert report["failed_count"] == 1
+        assert report["failed_chunks"][0].errors == ["E11000 duplicate key"]
+
+    def test_unreadable_file_keeps_counts_of_earlier_chunks(self, tmp_path):
+        path = tmp_path / "users.csv"
+        path.write_bytes(b"n\n" + b"".join(b"%d\n" % i for i in range(1000)) + b"\xff\xfe\n")
+        collection = RecordingCollection()
+
+        report = FileImporter(collection, str(path), chunk_size=10, write_workers=2).run()
+
+        assert report["error"].startswith("Reading documents failed:")
+        assert 0 < report["written_count"] == len(collection.inserted) < 1000
+        assert report["failed_chunks"][-1].source_error is True
+
+    def test_back_pressure_bounds_read_ahead(self, tmp_path):
+        path = write_ndjson(tmp_path / "users.ndjson", [f'{{"n": {i}}}' for i in range(10000)])
+        read_at_first_write = []
+
+        class SlowCollection(RecordingCollection):
+            def insert_many(self, documents, ordered=True):
+                if not read_at_first_write:
+                    read_at_first_write.append(importer.records_read)
+                time.sleep(0.005)
+                return super().insert_many(documents, ordered)
+
+        importer = FileImporter(SlowCollection(), path, chunk_size=100, write_workers=2)
+        report = importer.run()
+
+        assert report["written_count"] == 10000
+        # Chunks held by writers plus the one being read, far below the 10000 records of the file.
+        assert read_at_first_write[0] <= 100 * (2 * 2 + 1)
+
+
+class TestImportFileAction:
+    def test_bson_import_is_fully_successful(self, tmp_path, addon_config):
+        (tmp_path / "users.bson").write_bytes(b"".join(bson.encode(document) for document in DOCUMENTS))
+        connection = MagicMock()
+        connection.__getitem__.return_value.__getitem__.return_value = RecordingCollection()
+
+        response = import_file(addon_config(), connection, ImportInput(collection="users", path=str(tmp_path / "users.bson")))
+
+        assert response.code == 200
+        assert response.output.written_count == 25
+
+    def test_import(self, tmp_path, addon_config):
+        path = write_ndjson(tmp_path / "users.ndjson", [json_util.dumps(document) for document in DOCUMENTS])
+        connection = MagicMock()
+        collection = RecordingCollection()
+        connection.__getitem__.return_value.__getitem__.return_value = collection
+
+        response = import_file(addon_config(), connection, ImportInput(collection="users", path=path))
+
+        assert response.code == 200
+        assert response.output.written_count == 25
+        assert response.output.documents_per_second > 0
+
+    def test_partial_import(self, tmp_path, addon_config):
+        path = write_ndjson(tmp_path / "users.ndjson", ['{"n": 1}', "oops"])
+        connection = MagicMock()
+        connection.__getitem__.return_value.__getitem__.return_value = RecordingCollection()
+
+        response = import_file(addon_config(), connection, ImportInput(collection="users", path=path))
+
+        assert response.code == 207
+        assert response.output.rejected[0].record == 2
+
+    def test_mid_file_error_reports_written_documents(self, tmp_path, addon_config):
+        path = tmp_path / "users.csv"
+        path.write_bytes(b"n\n" + b"".join(b"%d\n" % i for i in range(1000)) + b"\xff\xfe\n")
+        connection = MagicMock()
+        connection.__getitem__.return_value.__getitem__.return_value = RecordingCollection()
+
+        response = import_file(addon_config(), connection, ImportInput(collection="users", path=str(path), chunk_size=10))
+
+        assert response.code == 207
+        assert response.output.written_count > 0
+        assert "stopped after writing" in response.message
+        assert "codec can't decode" in response.message
+
+    def test_error_before_any_write_is_bad_input(self, tmp_path, addon_config):
+        path = tmp_path / "users.csv"
+        path.write_bytes(b"n\n\xff\xfe\n")
+        connection = MagicMock()
+        collection = RecordingCollection()
+        connection.__getitem__.return_value.__getitem__.return_value = collection
+
+        response = import_file(addon_config(), connection, ImportInput(collection="users", path=str(path)))
+
+        assert response.code == 400
+        assert "failed before any document was written" in response.message
+        assert collection.inserted == []
+
+    def test_missing_zstandard_is_reported_up_front(self, tmp_path, addon_config):
+        path = tmp_path / "users.ndjson.zst"
+        path.write_bytes(b"not read")
+        with patch("mongodb_rooms_pkg.storage.writers.require_optional", side_effect=MissingDependencyError("zstd")):
+            response = import_file(addon_config(), MagicMock(), ImportInput(collection="users", path=str(path)))
+
+        assert response.code == 400
+        assert response.message == "zstd"
+
+    @pytest.mark.parametrize("name, content", [("missing.ndjson", None), ("users.xml", "<a/>"), ("empty.ndjson", "")])
+    def test_bad_input(self, tmp_path, name, content, addon_config):
+        if content is not None:
+            (tmp_path / name).write_text(content)
+        response = import_file(addon_config(), MagicMock(), ImportInput(collection="users", path=str(tmp_path / name)))
+        assert response.code == 400
+
+    def test_no_connection(self, tmp_path, addon_config):
+        response = import_file(addon_config(), None, ImportInput(collection="users", path=str(tmp_path / "a.ndjson")))
+        assert response.code == 500
@@ -0,0 +1,178 @@
+from unittest.mock import patch
+
+import pytest
+from bson import SON
+from pydantic import ValidationError
+from pymongo.errors import OperationFailure
+
+from mongodb_rooms_pkg.actions.base import ActionResponse, TokensSchema
+from mongodb_rooms_pkg.actions.create_collection import ActionInput as CreateCollectionInput
+from mongodb_rooms_pkg.actions.create_collection import create_collection
+from mongodb_rooms_pkg.actions.create_indexes import ActionInput as CreateIndexesInput
+from mongodb_rooms_pkg.actions.create_indexes import create_indexes
+from mongodb_rooms_pkg.actions.drop_index import ActionInput as DropIndexInput
+from mongodb_rooms_pkg.actions.drop_index import drop_index
+from mongodb_rooms_pkg.actions.list_indexes import ActionInput as ListIndexesInput
+from mongodb_rooms_pkg.actions.list_indexes import ActionOutput as ListIndexesOutput
+from mongodb_rooms_pkg.actions.list_indexes import list_indexes
+from mongodb_rooms_pkg.addon import MongoDBRoomsAddon
+from mongodb_rooms_pkg.services.index_advisor import IndexAdvisor, filter_shape, prefix_coverage
+from mongodb_rooms_pkg.services.indexes import IndexSpec
+
+ID_INDEX = {"v": 2, "key": {"_id": 1}, "name": "_id_"}
+
+
+class TestIndexSpec:
+    def test_compound_partial_index_document(self):
+        spec = IndexSpec(keys={"tenant": 1, "created_at": -1}, name="tenant_recent",
+                         partial_filter_expression={"status": "active"})
+        assert spec.to_index_model().document == {
+            "key": SON([("tenant", 1), ("created_at", -1)]),
+            "name": "tenant_recent",
+            "partialFilterExpression": {"status": "active"},
+        }
+
+    def test_ttl_hidden_and_wildcard(self):
+        assert IndexSpec(keys={"expires_at": 1}, expire_after_seconds=0).to_index_model().document["expireAfterSeconds"] == 0
+        assert IndexSpec(keys={"a": 1}, hidden=True).to_index_model().document["hidden"] is True
+        wildcard = IndexSpec(keys={"$**": 1}, wildcard_projection={"attributes": 1})
+        assert wildcard.to_index_model().document["wildcardProjection"] == {"attributes": 1}
+
+    @pytest.mark.parametrize("kwargs", [
+        {"keys": {}},
+        {"keys": {"a": 2}},
+        {"keys": {"a": 1, "b": 1}, "expire_after_seconds": 60},
+        {"keys": {"_id": 1}, "expire_after_seconds": 60},
+        {"keys": {"a.$**": 1}, "unique": True},
+        {"keys": {"a.$**": 1}, "wildcard_projection": {"b": 1}},
+        {"keys": {"_id": 1}, "hidden": True},
+    ])
+    def test_invalid_specs(self, kwargs):
+        with pytest.raises(ValidationError):
+            IndexSpec(**kwargs)
+
+
+class TestIndexActions:
+    def test_create_indexes(self, addon_config, mock_connection):
+        connection, db, collection = mock_connection
+        collection.create_indexes.return_value = ["a_1", "ttl"]
+        action_input = CreateIndexesInput(collection="events", indexes=[
+            {"keys": {"a": 1}},
+            {"keys": {"expires_at": 1}, "name": "ttl", "expire_after_seconds": 3600},
+        ], commit_quorum="majority")
+
+        result = create_indexes(addon_config(), connection, action_input)
+
+        assert result.code == 201
+        assert result.output.index_names == ["a_1", "ttl"]
+        models, = collection.create_indexes.call_args.args
+        assert [model.document["name"] for model in models] == ["a_1", "ttl"]
+        assert collection.create_indexes.call_args.kwargs == {"commitQuorum": "majority"}
+
+    def test_create_indexes_requires_indexes(self, addon_config, mock_connection):
+        connection, _, _ = mock_connection
+        result = create_indexes(addon_config(), connection, CreateIndexesInput(collection="events", indexes=[]))
+        assert result.code == 400
+
+    def test_drop_index_by_keys(self, addon_config, mock_connection):
+        connection, _, collection = mock_connection
+        result = drop_index(addon_config(), connection, DropIndexInput(collection="events", keys={"a": 1, "b": -1}))
+        assert result.code == 200
+        assert result.output.index == "a_1_b_-1"
+        collection.drop_index.assert_called_once_with([("a", 1), ("b", -1)])
+
+    def test_drop_index_not_found(self, addon_config, mock_connection):
+        connection, _, collection = mock_connection
+        collection.drop_index.side_effect = OperationFailure("index not found", code=27)
+        result = drop_index(addon_config(), connection, DropIndexInput(collection="events", name="missing"))
+        assert result.code == 404
+        assert result.output.dropped is False
+
+    @pytest.mark.parametrize("kwargs", [{}, {"name": "a_1", "keys": {"a": 1}}, {"name": "_id_"}])
+    def test_drop_index_validation(self, kwargs, addon_config, mock_connection):
+        connection, _, collection = mock_connection
+        result = drop_index(addon_config(), connection, DropIndexInput(collection="events", **kwargs))
+        assert result.code == 400
+        collection.drop_index.assert_not_called()
+
+    def test_list_indexes(self, addon_config, mock_connection):
+        connection, _, collection = mock_connection
+        collection.list_indexes.return_value = [SON(ID_INDEX), SON({"v": 2, "key": SON([("a", 1)]), "name": "a_1", "hidden": True})]
+        result = list_indexes(addon_config(), connection, ListIndexesInput(collection="events"))
+        assert result.code == 200
+        assert result.output.indexes[1] == {"v": 2, "key": {"a": 1}, "name": "a_1", "hidden": True}
+        assert type(result.output.indexes[1]["key"]) is dict
+
+    def test_create_collection_with_indexes(self, addon_config, mock_connection):
+        connection, db, _ = mock_connection
+        db.list_collection_names.return_value = []
+        db.create_collection.return_value.create_indexes.return_value = ["a_1"]
+        action_input = CreateCollectionInput(collection_name="events", indexes=[{"keys": {"a": 1}}])
+
+        result = create_collection(addon_config(), connection, action_input)
+
+        assert result.code == 201
+        assert result.output.index_names == ["a_1"]
+
+    def test_create_collection_index_failure_is_partial(self, addon_config, mock_connection):
+        connection, db, _ = mock_connection
+        db.list_collection_names.return_value = []
+        db.create_collection.return_value.create_indexes.side_effect = OperationFailure("bad index")
+        action_input = CreateCollectionInput(collection_name="events", indexes=[{"keys": {"a": 1}}])
+
+        result = create_collection(addon_config(), connection, action_input)
+
+        assert result.code == 207
+        assert result.output.created is True
+
+
+class TestIndexAdvisor:
+    def test_filter_shape(self):
+        assert filter_shape({"tenant": "t1", "age": {"$gte": 18}, "$or": [{"x": 1}]}) == (("tenant",), ("age",))
+        assert filter_shape({"$and": [{"a": 1}, {"b": {"$in": [1, 2]}}], "c": {"nested": 1}}) == (("a", "b", "c"), ())
+
+    def test_prefix_coverage(self):
+        assert prefix_coverage(["b", "a", "c"], ("a", "b"), ("c",)) == 3
+        assert prefix_coverage(["a", "x", "b"], ("a", "b"), ()) == 1
+        assert prefix_coverage(["c", "a"], ("a",), ("c",)) == 0
+
+    def test_suggests_missing_and_partial_indexes(self):
+        advisor = IndexAdvisor()
+        for _ in range(3):
+            advisor.observe("update", "orders", {"tenant": "t1", "status": "open", "total": {"$gt": 10}})
+        advisor.observe("delete", "orders", {"customer": "c1"})
+        advisor.observe("delete", "orders", {"_id": 1})
+
+        suggestions = advisor.suggest("orders", [ID_INDEX, {"key": {"tenant": 1}, "name": "tenant_1"}])
+
+        assert [s["keys"] for s in suggestions] == [{"status": 1, "tenant": 1, "total": 1}, {"customer": 1}]
+        assert suggestions[0]["occurrences"] == 3
+        assert suggestions[0]["best_existing_index"] == "tenant_1"
+        assert suggestions[1]["reason"] == "no usable index"
+
+    def test_hidden_indexes_do_not_count(self):
+        advisor = IndexAdvisor()
+        advisor.observe("delete", "orders", {"customer": "c1"})
+        assert advisor.suggest("orders", [{"key": {"customer": 1}, "name": "customer_1", "hidden": True}])
+        assert not advisor.suggest("orders", [{"key": {"customer": 1}, "name": "customer_1"}])
+
+    def test_shape_limit(self):
+        advisor = IndexAdvisor(max_shapes=1)
+        advisor.observe("delete", "a", {"x": 1})
+        advisor.observe("delete", "b", {"y": 1})
+        assert advisor.collections() == ["a"]
+
+    @patch("mongodb_rooms_pkg.addon.list_indexes")
+    @patch("mongodb_rooms_pkg.addon.delete")
+    def test_addon_suggestions(self, mock_delete, mock_list_indexes, addon_config):
+        mock_list_indexes.return_value = ActionResponse(
+            output=ListIndexesOutput(collection_name="orders", indexes=[ID_INDEX]),
+            tokens=TokensSchema(stepAmount=1000, totalCurrentAmount=17236), code=200
+        )
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config()
+        addon.delete("orders", {"customer": "c1"})
+
+        [suggestion] = addon.index_suggestions()
+        assert suggestion["keys"] == {"customer": 1}
+        assert suggestion["actions"] == {"delete": 1}
@@ -0,0 +1,157 @@
+import threading
+from unittest.mock import MagicMock
+
+from pymongo.errors import BulkWriteError
+
+from mongodb_rooms_pkg.actions.insert_chunked import ActionInput as InsertChunkedInput
+from mongodb_rooms_pkg.actions.insert_chunked import insert_chunked, insert_in_chunks
+
+
+class FakeCollection:
+    def __init__(self, fail_on=None, acknowledged=True):
+        self.fail_on = fail_on or set()
+        self.acknowledged = acknowledged
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def insert_many(self, documents, ordered=True):
+        with self.lock:
+            self.calls.append((list(documents), ordered))
+        if any(doc["_id"] in self.fail_on for doc in documents):
+            raise BulkWriteError({
+                "nInserted": len(documents) - 1,
+                "writeErrors": [{"index": 0, "code": 11000, "errmsg": "duplicate key"}],
+            })
+        result = MagicMock()
+        result.inserted_ids = [doc["_id"] for doc in documents]
+        result.acknowledged = self.acknowledged
+        return result
+
+
+class TestInsertInChunks:
+    def test_consumes_generator_in_unordered_chunks(self):
+        collection = FakeCollection()
+        documents = ({"_id": i} for i in range(25))
+
+        inserted, chunks, failures, acknowledged = insert_in_chunks(collection, documents, chunk_size=10, max_workers=3)
+
+        assert inserted == 25
+        assert chunks == 3
+        assert failures == []
+        assert acknowledged is True
+        assert sorted(len(call[0]) for call in collection.calls) == [5, 10, 10]
+        assert all(ordered is False for _, ordered in collection.calls)
+
+    def test_reports_failed_chunks(self):
+        collection = FakeCollection(fail_on={12})
+
+        inserted, chunks, failures, _ = insert_in_chunks(collection, [{"_id": i} for i in range(20)], chunk_size=5, max_workers=2)
+
+        assert chunks == 4
+        assert inserted == 19
+        assert len(failures) == 1
+        assert failures[0].chunk_index == 2
+        assert failures[0].document_count == 5
+        assert failures[0].inserted_count == 4
+        assert failures[0].errors == ["duplicate key"]
+
+    def test_source_error_keeps_written_chunks(self):
+        collection = FakeCollection()
+
+        def documents():
+            yield from ({"_id": i} for i in range(12))
+            raise ValueError("bad record")
+
+        inserted, chunks, failures, acknowledged = insert_in_chunks(collection, documents(), chunk_size=5, max_workers=2)
+
+        assert (inserted, chunks, acknowledged) == (10, 2, True)
+        [failure] = failures
+        assert failure.source_error is True
+        assert failure.chunk_index == 2
+        assert failure.errors == ["Reading documents failed: bad record"]
+
+    def test_unacknowledged_writes(self):
+        collection = FakeCollection(acknowledged=False)
+
+        inserted, chunks, failures, acknowledged = insert_in_chunks(collection, [{"_id": i} for i in range(4)], chunk_size=2, max_workers=2)
+
+        assert (inserted, chunks, failures, acknowledged) == (4, 2, [], False)
+
+
+class TestInsertChunkedAction:
+    def test_insert_chunked_no_connection(self, addon_config):
+        input_data = InsertChunkedInput(collection="events", documents=[{"_id": 1}])
+
+        response = insert_chunked(addon_config(), None, input_data)
+
+        assert response.code == 500
+        assert response.message == "No database connection provided"
+
+    def test_insert_chunked_no_documents(self, addon_config, mock_connection):
+        connection, db, _ = mock_connection
+        db.__getitem__.return_value = FakeCollection()
+        input_data = InsertChunkedInput(collection="events", documents=iter([]))
+
+        response = insert_chunked(addon_config(), connection, input_data)
+
+        assert response.code == 400
+
+    def test_insert_chunked_success(self, addon_config, mock_connection):
+        connection, db, _ = mock_connection
+        db.__getitem__.return_value = FakeCollection()
+        input_data = InsertChunkedInput(
+            collection="events",
+            documents=({"_id": i} for i in range(7)),
+            chunk_size=3,
+            max_workers=2
+        )
+
+        response = insert_chunked(addon_config(), connection, input_data)
+
+        assert response.code == 200
+        assert response.output.inserted_count == 7
+        assert response.output.chunk_count == 3
+        assert response.output.failed_chunks == []
+
+    def test_insert_chunked_partial_failure(self, addon_config, mock_connection):
+        connection, db, _ = mock_connection
+        db.__getitem__.return_value = FakeCollection(fail_on={0})
+        input_data = InsertChunkedInput(collection="events", documents=[{"_id": i} for i in range(4)], chunk_size=2)
+
+        response = insert_chunked(addon_config(), connection, input_data)
+
+        assert response.code == 207
+        assert response.output.inserted_count == 3
+        assert len(response.output.failed_chunks) == 1
+
+    def test_insert_chunked_source_error_reports_partial_counts(self, addon_config, mock_connection):
+        connection, db, _ = mock_connection
+        db.__getitem__.return_value = FakeCollection()
+
+        def documents():
+            yield from ({"_id": i} for i in range(5))
+            raise OSError("connection reset")
+
+        input_data = InsertChunkedInput(collection="events", documents=documents(), chunk_size=2)
+
+        response = insert_chunked(addon_config(), connection, input_data)
+
+        assert response.code == 207
+        assert response.output.inserted_count == 4
+        assert response.output.acknowledged is True
+        assert response.output.failed_chunks[-1].source_error is True
+        assert "connection reset" in response.message
+
+    def test_insert_chunked_source_error_before_any_chunk(self, addon_config, mock_connection):
+        connection, db, _ = mock_connection
+        db.__getitem__.return_value = FakeCollection()
+
+        def documents():
+            raise OSError("connection reset")
+            yield
+
+        response = insert_chunked(addon_config(), connection, InsertChunkedInput(collection="events", documents=documents()))
+
+        assert response.code == 500
+        assert response.output.inserted_count == 0
+        assert response.output.acknowledged is False
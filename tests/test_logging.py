@@ -0,0 +1,102 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+import bson
+import pytest
+from bson.raw_bson import RawBSONDocument
+from loguru import logger
+
+from mongodb_rooms_pkg.actions.insert import ActionInput as InsertInput
+from mongodb_rooms_pkg.actions.insert import insert
+from mongodb_rooms_pkg.addon import MongoDBRoomsAddon
+from mongodb_rooms_pkg.async_addon import AsyncMongoDBRoomsAddon
+from mongodb_rooms_pkg.utils.summary import summarize
+
+
+@pytest.fixture
+def captured_logs():
+    """Replace loguru sinks with one in-memory sink at INFO level."""
+    records = []
+    logger.remove()
+    logger.add(lambda message: records.append(message.record), level="INFO")
+    yield records
+    logger.remove()
+    logger.add(sys.stderr)
+
+
+class TestSummarize:
+    def test_large_list_is_bounded(self):
+        text = summarize(list(range(100000)))
+
+        assert text == "[0, 1, 2, 3, 4, ...] (len=100000)"
+
+    def test_model_summarized_without_dump(self):
+        input_data = InsertInput(collection="events", documents=[{"i": i} for i in range(1000)])
+
+        with patch.object(InsertInput, "model_dump", side_effect=AssertionError("dumped")):
+            text = summarize(input_data)
+
+        assert text.startswith("ActionInput(collection='events', document=None, documents=[{'i': 0}")
+        assert "(len=1000)" in text
+
+    def test_bytes_and_raw_documents(self):
+        raw = RawBSONDocument(bson.encode({"a": "x" * 100}))
+
+        assert summarize(b"\x00" * 4096) == "<4096 bytes>"
+        assert summarize(raw) == f"RawBSONDocument(<{len(raw.raw)} bytes>)"
+
+    def test_truncates_to_max_length(self):
+        text = summarize({f"key{i}": "v" * 70 for i in range(5)}, max_length=100)
+
+        assert len(text) == 100
+        assert text.endswith("...")
+
+
+class TestLazyActionLogging:
+    def test_payload_not_summarized_when_debug_disabled(self, captured_logs):
+        mock_connection = MagicMock()
+        collection = mock_connection.__getitem__.return_value.__getitem__.return_value
+        collection.insert_many.return_value = MagicMock(inserted_ids=list(range(3)), acknowledged=True)
+        config = MagicMock(database="testdb")
+
+        with patch("mongodb_rooms_pkg.actions.insert.summarize") as mock_summarize:
+            insert(config, mock_connection, InsertInput(collection="events", documents=[{"a": 1}] * 3))
+
+        mock_summarize.assert_not_called()
+
+    def test_payload_summarized_when_debug_enabled(self, captured_logs):
+        logger.remove()
+        logger.add(lambda message: captured_logs.append(message.record), level="DEBUG")
+        mock_connection = MagicMock()
+        collection = mock_connection.__getitem__.return_value.__getitem__.return_value
+        collection.insert_many.return_value = MagicMock(inserted_ids=list(range(10000)), acknowledged=True)
+
+        insert(MagicMock(database="testdb"), mock_connection, InsertInput(collection="events", documents=[{"a": 1}] * 10000))
+
+        input_message = next(record["message"] for record in captured_logs if record["message"].startswith("Input:"))
+        assert "(len=10000)" in input_message
+        assert len(input_message) < 600
+
+
+class TestPrefixedLogger:
+    def test_logger_is_cached(self):
+        addon = MongoDBRoomsAddon()
+
+        assert addon.logger is addon.logger
+        assert addon.logger is MongoDBRoomsAddon().logger
+        assert AsyncMongoDBRoomsAddon().logger is addon.logger
+
+    def test_prefix_and_lazy_arguments(self, captured_logs):
+        addon = MongoDBRoomsAddon()
+        expensive = MagicMock(return_value="payload")
+
+        addon.logger.debug("Skipped: {}", expensive, lazy=True)
+        addon.logger.info("Loaded {} with {'literal': 'braces'} kept")
+        addon.logger.warning("Value: {}", 3)
+
+        expensive.assert_not_called()
+        assert [record["message"] for record in captured_logs] == [
+            "[TYPE: STORAGE] Loaded {} with {'literal': 'braces'} kept",
+            "[TYPE: STORAGE] Value: 3",
+        ]
+        assert captured_logs[0]["function"] == "test_prefix_and_lazy_arguments"
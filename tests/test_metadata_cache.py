@@ -0,0 +1,139 @@
+from unittest.mock import MagicMock, patch
+
+from mongodb_rooms_pkg.actions.create_collection import ActionOutput as CreateOutput
+from mongodb_rooms_pkg.actions.describe_collection import describe_collection
+from mongodb_rooms_pkg.addon import MongoDBRoomsAddon
+from mongodb_rooms_pkg.services.metadata_cache import MetadataCache, cached
+
+
+class TestMetadataCache:
+    def test_get_or_load_caches_value(self):
+        cache = MetadataCache(ttl_seconds=60)
+        loader = MagicMock(return_value=["users"])
+
+        assert cache.get_or_load(("db", None, "collection_names"), loader) == ["users"]
+        assert cache.get_or_load(("db", None, "collection_names"), loader) == ["users"]
+
+        loader.assert_called_once()
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_entries_expire(self):
+        cache = MetadataCache(ttl_seconds=5)
+        loader = MagicMock(side_effect=[1, 2])
+
+        with patch('mongodb_rooms_pkg.services.metadata_cache.time.monotonic', return_value=100.0):
+            assert cache.get_or_load("key", loader) == 1
+        with patch('mongodb_rooms_pkg.services.metadata_cache.time.monotonic', return_value=104.0):
+            assert cache.get_or_load("key", loader) == 1
+        with patch('mongodb_rooms_pkg.services.metadata_cache.time.monotonic', return_value=106.0):
+            assert cache.get_or_load("key", loader) == 2
+
+    def test_lru_eviction(self):
+        cache = MetadataCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == (True, 1)
+        assert cache.get("b") == (False, None)
+        assert len(cache) == 2
+
+    def test_invalidate_collection(self):
+        cache = MetadataCache(ttl_seconds=60)
+        cache.set(("db", None, "collection_names"), ["users", "orders"])
+        cache.set(("db", "users", "stats"), {})
+        cache.set(("db", "orders", "stats"), {})
+        cache.set(("other", None, "collection_names"), [])
+
+        cache.invalidate("db", "users")
+
+        assert cache.get(("db", "users", "stats"))[0] is False
+        assert cache.get(("db", None, "collection_names"))[0] is False
+        assert cache.get(("db", "orders", "stats"))[0] is True
+        assert cache.get(("other", None, "collection_names"))[0] is True
+
+    def test_invalidate_database(self):
+        cache = MetadataCache(ttl_seconds=60)
+        cache.set(("db", "users", "stats"), {})
+        cache.set(("db", None, "collection_names"), [])
+
+        cache.invalidate("db")
+
+        assert len(cache) == 0
+
+    def test_cached_without_cache_calls_loader(self):
+        loader = MagicMock(return_value=3)
+
+        assert cached(None, "key", loader, "arg") == 3
+        assert cached(None, "key", loader, "arg") == 3
+        assert loader.call_count == 2
+        loader.assert_called_with("arg")
+
+
+class TestDescribeCollectionCache:
+    def test_repeated_describe_uses_cache(self, addon_config):
+        mock_connection = MagicMock()
+        mock_db = MagicMock()
+        mock_connection.__getitem__.return_value = mock_db
+        mock_db.list_collection_names.return_value = ["users"]
+        batch = [
+            {"_collection": "users", "_kind": "stats", "storageStats": {"count": 1, "size": 10, "storageSize": 20, "nindexes": 1, "totalIndexSize": 5}},
+            {"_collection": "users", "_kind": "index", "name": "_id_", "key": {"_id": 1}},
+        ]
+        mock_db.__getitem__.return_value.aggregate.side_effect = lambda pipeline, **kwargs: [] if "$sample" in pipeline[0] else batch
+        cache = MetadataCache(ttl_seconds=60)
+
+        for _ in range(3):
+            response = describe_collection(addon_config(), mock_connection, ["users"], cache=cache)
+            assert response.output.collections[0].stats.count == 1
+            assert response.output.collections[0].indexes == [{"name": "_id_", "key": {"_id": 1}}]
+
+        pipelines = [call.args[0] for call in mock_db.__getitem__.return_value.aggregate.call_args_list]
+        mock_db.list_collection_names.assert_called_once()
+        assert sum("$collStats" in pipeline[0] for pipeline in pipelines) == 1
+        assert sum("$sample" in pipeline[0] for pipeline in pipelines) == 3
+        mock_db.command.assert_not_called()
+
+
+class TestAddonMetadataCache:
+    def test_cache_created_on_connection(self, addon_config):
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config(metadataCacheTTLSeconds=30, metadataCacheMaxEntries=10)
+
+        with patch('mongodb_rooms_pkg.addon.create_connection', return_value=MagicMock()):
+            addon.initConnection()
+
+        assert addon.metadata_cache.ttl_seconds == 30
+        assert addon.metadata_cache.max_entries == 10
+
+    def test_cache_off_by_default(self, addon_config):
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config()
+
+        with patch('mongodb_rooms_pkg.addon.create_connection', return_value=MagicMock()):
+            addon.initConnection()
+
+        assert addon.metadata_cache is None
+
+    def test_cache_disabled(self, addon_config):
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config(metadataCacheTTLSeconds=0)
+
+        with patch('mongodb_rooms_pkg.addon.create_connection', return_value=MagicMock()):
+            addon.initConnection()
+
+        assert addon.metadata_cache is None
+
+    def test_create_collection_invalidates_cache(self, addon_config):
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config()
+        addon.metadata_cache = MetadataCache(ttl_seconds=60)
+        addon.metadata_cache.set(("testdb", None, "collection_names"), [])
+        response = MagicMock(output=CreateOutput(collection_name="users", created=True, schema_applied=False, message="ok"))
+
+        with patch('mongodb_rooms_pkg.addon.create_collection', return_value=response):
+            addon.create_collection("users")
+
+        assert len(addon.metadata_cache) == 0
@@ -0,0 +1,259 @@
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import bson
+import pytest
+
+from mongodb_rooms_pkg.actions.aggregate import ActionInput as AggregateInput
+from mongodb_rooms_pkg.actions.aggregate import aggregate
+from mongodb_rooms_pkg.actions.base import ActionResponse, OutputBase, TokensSchema
+from mongodb_rooms_pkg.actions.find import ActionInput as FindInput
+from mongodb_rooms_pkg.actions.find import find
+from mongodb_rooms_pkg.addon import MongoDBRoomsAddon
+from mongodb_rooms_pkg.services.connection import create_connection
+from mongodb_rooms_pkg.services.metrics import (
+    CommandMetricsListener,
+    LatencyHistogram,
+    MetricsCollector,
+    documents_processed,
+    to_prometheus,
+)
+
+TOKENS = TokensSchema(stepAmount=1, totalCurrentAmount=1)
+
+
+class PagesOutput(OutputBase):
+    pages: object
+
+
+class CountOutput(OutputBase):
+    inserted_count: int
+
+
+@pytest.fixture
+def command_listener():
+    listener = CommandMetricsListener()
+    listener.reset()
+    yield listener
+    listener.reset()
+
+
+class TestLatencyHistogram:
+    def test_empty_percentiles(self):
+        assert LatencyHistogram().percentile(0.5) is None
+
+    def test_percentiles_are_ordered_and_bounded(self):
+        histogram = LatencyHistogram()
+        for i in range(100):
+            histogram.observe(0.001 * (i + 1))
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 100
+        assert 0.025 <= snapshot["p50_seconds"] <= 0.1
+        assert snapshot["p50_seconds"] <= snapshot["p95_seconds"] <= snapshot["p99_seconds"] <= 0.1
+        assert snapshot["max_seconds"] == pytest.approx(0.1)
+
+    def test_values_above_last_bucket(self):
+        histogram = LatencyHistogram()
+        histogram.observe(30.0)
+        assert histogram.counts[-1] == 1
+        assert 10.0 < histogram.percentile(0.99) <= 30.0
+
+
+class TestMetricsCollector:
+    def test_timed_counts_calls_errors_and_documents(self):
+        collector = MetricsCollector()
+        ok = ActionResponse(output=CountOutput(data=None, inserted_count=3), tokens=TOKENS, code=200)
+        failed = ActionResponse(output=CountOutput(data=None, inserted_count=0), tokens=TOKENS, code=500)
+        collector.timed("insert", "users", lambda: ok)
+        collector.timed("insert", "users", lambda: failed)
+
+        [entry] = collector.snapshot()
+        assert (entry["action"], entry["collection"]) == ("insert", "users")
+        assert entry["calls"] == 2
+        assert entry["errors"] == 1
+        assert entry["documents"] == 3
+        assert entry["latency"]["count"] == 2
+
+    def test_timed_records_exceptions(self):
+        collector = MetricsCollector()
+
+        def boom():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            collector.timed("find", "users", boom)
+        assert collector.snapshot()[0]["errors"] == 1
+
+    def test_lazy_pages_are_counted_when_consumed(self):
+        collector = MetricsCollector()
+        response = ActionResponse(output=PagesOutput(data=None, pages=iter([[1, 2], [3]])), tokens=TOKENS, code=200)
+        result = collector.timed("find", "users", lambda: response)
+        assert collector.snapshot()[0]["documents"] == 0
+        assert list(result.output.pages) == [[1, 2], [3]]
+        assert collector.snapshot()[0]["documents"] == 3
+
+    def test_lazy_pages_latency_covers_consumption(self):
+        collector = MetricsCollector()
+
+        def slow_pages():
+            yield [1]
+            time.sleep(0.05)
+            yield [2]
+
+        response = ActionResponse(output=PagesOutput(data=None, pages=slow_pages()), tokens=TOKENS, code=200)
+        result = collector.timed("find", "users", lambda: response)
+        assert collector.snapshot()[0]["calls"] == 1
+        assert collector.snapshot()[0]["latency"]["count"] == 0
+
+        list(result.output.pages)
+
+        [entry] = collector.snapshot()
+        assert entry["latency"]["count"] == 1
+        assert entry["latency"]["max_seconds"] >= 0.05
+        assert entry["errors"] == 0
+
+    def test_failing_pages_count_as_error(self):
+        collector = MetricsCollector()
+
+        def failing_pages():
+            yield [1]
+            raise RuntimeError("cursor killed")
+
+        response = ActionResponse(output=PagesOutput(data=None, pages=failing_pages()), tokens=TOKENS, code=200)
+        result = collector.timed("find", "users", lambda: response)
+        with pytest.raises(RuntimeError):
+            list(result.output.pages)
+
+        [entry] = collector.snapshot()
+        assert (entry["calls"], entry["errors"], entry["documents"]) == (1, 1, 1)
+        assert entry["latency"]["count"] == 1
+
+    def test_closing_pages_closes_the_source(self):
+        collector = MetricsCollector()
+        closed = []
+
+        def pages():
+            try:
+                yield [1]
+                yield [2]
+            finally:
+                closed.append(True)
+
+        response = ActionResponse(output=PagesOutput(data=None, pages=pages()), tokens=TOKENS, code=200)
+        result = collector.timed("parallel_scan", "users", lambda: response)
+        next(result.output.pages)
+        result.output.pages.close()
+
+        assert closed == [True]
+        assert collector.snapshot()[0]["latency"]["count"] == 1
+
+    @pytest.mark.parametrize("action, func, action_input", [
+        ("find", find, FindInput(collection="users", batch_size=2)),
+        ("aggregate", aggregate, AggregateInput(collection="users", pipeline=[], batch_size=2)),
+    ])
+    def test_closing_action_pages_closes_the_cursor(self, action, func, action_input, addon_config, mock_connection,
+                                                    fake_cursor):
+        connection, _, collection = mock_connection
+        cursor = fake_cursor([{"_id": i} for i in range(5)])
+        collection.find.return_value = cursor
+        collection.aggregate.return_value = cursor
+        collector = MetricsCollector()
+
+        result = collector.timed(action, "users", func, addon_config(), connection, action_input)
+        assert next(result.output.pages) == [{"_id": 0}, {"_id": 1}]
+        result.output.pages.close()
+
+        assert cursor.closed is True
+        [entry] = collector.snapshot()
+        assert (entry["calls"], entry["documents"], entry["latency"]["count"]) == (1, 2, 1)
+
+    def test_documents_processed_ignores_non_int_fields(self):
+        assert documents_processed(MagicMock()) == 0
+        assert documents_processed(SimpleNamespace(output=SimpleNamespace(modified_count=2, upserted_count=1))) == 3
+
+
+class TestCommandMetricsListener:
+    def test_bytes_by_collection(self, command_listener):
+        command = {"insert": "users", "documents": [{"a": 1}]}
+        reply = {"n": 1, "ok": 1}
+        command_listener.started(SimpleNamespace(command=command, command_name="insert", database_name="testdb",
+                                                 connection_id=("h", 1), request_id=7))
+        command_listener.succeeded(SimpleNamespace(reply=reply, connection_id=("h", 1), request_id=7))
+
+        [entry] = command_listener.snapshot("testdb")
+        assert entry["collection"] == "users"
+        assert entry["bytes_sent"] == len(bson.encode(command))
+        assert entry["bytes_received"] == len(bson.encode(reply))
+        assert command_listener.snapshot("other") == []
+
+    def test_get_more_counted_under_its_collection(self, command_listener):
+        command = {"getMore": bson.Int64(123456789), "collection": "users", "batchSize": 100}
+        command_listener.started(SimpleNamespace(command=command, command_name="getMore", database_name="testdb",
+                                                 connection_id=("h", 1), request_id=8))
+        command_listener.succeeded(SimpleNamespace(reply={"cursor": {"id": 0, "nextBatch": []}, "ok": 1},
+                                                   connection_id=("h", 1), request_id=8))
+
+        [entry] = command_listener.snapshot("testdb")
+        assert (entry["collection"], entry["command"]) == ("users", "getMore")
+
+    def test_failure_counted(self, command_listener):
+        command_listener.started(SimpleNamespace(command={"ping": 1}, command_name="ping", database_name="admin",
+                                                 connection_id=("h", 1), request_id=1))
+        command_listener.failed(SimpleNamespace(connection_id=("h", 1), request_id=1))
+        assert command_listener.snapshot()[0]["failures"] == 1
+        assert command_listener.snapshot()[0]["collection"] == ""
+
+    def test_attached_to_the_client(self):
+        client = create_connection("mongodb://localhost:1/?serverSelectionTimeoutMS=10", lazy=True,
+                                   command_listener=CommandMetricsListener())
+        try:
+            assert CommandMetricsListener() in client.options.event_listeners
+        finally:
+            client.close()
+
+
+class TestPrometheusExport:
+    def test_text_format(self):
+        collector = MetricsCollector()
+        collector.record("insert", 'we"ird', 0.002, documents=4)
+        text = to_prometheus(collector, [{"database": "testdb", "collection": "users", "command": "insert",
+                                          "calls": 1, "failures": 0, "bytes_sent": 10, "bytes_received": 5}])
+        assert '# TYPE mongodb_rooms_action_calls_total counter' in text
+        assert 'mongodb_rooms_action_documents_total{action="insert",collection="we\\"ird"} 4' in text
+        assert 'mongodb_rooms_action_duration_seconds_bucket{action="insert",collection="we\\"ird",le="+Inf"} 1' in text
+        assert 'mongodb_rooms_command_sent_bytes_total{database="testdb",collection="users",command="insert"} 10' in text
+
+
+class TestAddonMetrics:
+    @patch("mongodb_rooms_pkg.addon.insert")
+    def test_addon_actions_are_recorded(self, mock_insert, addon_config):
+        mock_insert.return_value = ActionResponse(output=CountOutput(data=None, inserted_count=2), tokens=TOKENS, code=200)
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config()
+        addon.insert("users", documents=[{"a": 1}, {"a": 2}])
+
+        metrics = addon.metrics()
+        assert metrics["commands"] == []
+        assert metrics["actions"][0]["documents"] == 2
+        assert "mongodb_rooms_action_calls_total" in addon.prometheus_metrics()
+
+    @patch("mongodb_rooms_pkg.addon.ClientRegistry")
+    def test_command_metrics_uses_its_own_client_variant(self, mock_registry, addon_config):
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config(commandMetrics=True)
+
+        assert addon.initConnection()
+        uri, factory, variant = mock_registry.return_value.acquire.call_args.args
+        assert variant == "commands"
+        assert factory.keywords["command_listener"] is CommandMetricsListener()
+
+    @patch("mongodb_rooms_pkg.addon.ClientRegistry")
+    def test_no_command_listener_by_default(self, mock_registry, addon_config):
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config()
+
+        assert addon.initConnection()
+        uri, factory, variant = mock_registry.return_value.acquire.call_args.args
+        assert variant == ""
+        assert "command_listener" not in getattr(factory, "keywords", {})
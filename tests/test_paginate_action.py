@@ -0,0 +1,192 @@
+
+import bson
+import pytest
+from bson.raw_bson import RawBSONDocument
+from pydantic import ValidationError
+
+from mongodb_rooms_pkg.actions.paginate import SORT_BRACKETS, keyset_filter, keyset_projection, paginate
+from mongodb_rooms_pkg.actions.paginate import ActionInput as PaginateInput
+from mongodb_rooms_pkg.services.slow_op_profiler import explain_command
+
+_MISSING = object()
+
+
+def bracket(value):
+    """Sort-order type bracket: null (or missing), numbers, then strings."""
+    if value is None:
+        return 0
+    return 1 if isinstance(value, (int, float)) else 2
+
+
+def sort_value(document, key):
+    value = document.get(key)
+    return bracket(value), value if value is not None else 0
+
+
+TYPE_ALIASES = {"number": 1, "string": 2}
+
+
+def matches(document, query):
+    """Evaluate the subset of query operators keyset pagination emits, with MongoDB's type bracketing."""
+    for key, condition in query.items():
+        if key == "$and":
+            if not all(matches(document, q) for q in condition):
+                return False
+        elif key == "$or":
+            if not any(matches(document, q) for q in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = document.get(key)
+            for op, operand in condition.items():
+                if op in ("$gt", "$lt"):
+                    if value is None or bracket(value) != bracket(operand):
+                        return False
+                    if op == "$gt" and not value > operand or op == "$lt" and not value < operand:
+                        return False
+                elif op == "$ne" and value == operand:
+                    return False
+                elif op == "$type" and bracket(value) not in {TYPE_ALIASES.get(alias) for alias in operand}:
+                    return False
+        elif document.get(key) != condition:
+            return False
+    return True
+
+
+class FakeCollection:
+    def __init__(self, documents):
+        self.documents = documents
+        self.queries = []
+
+    def find(self, query, projection=None, sort=None, limit=0):
+        self.queries.append(query)
+        found = [dict(d) for d in self.documents if matches(d, query)]
+        for key, direction in reversed(sort):
+            found.sort(key=lambda d: sort_value(d, key), reverse=direction == -1)
+        return iter(found[:limit])
+
+
+@pytest.fixture
+def get_connection(mock_connection):
+    """(connection, collection) serving documents from a FakeCollection."""
+    def make(documents):
+        connection, db, _ = mock_connection
+        collection = db.__getitem__.return_value = FakeCollection(documents)
+        return connection, collection
+    return make
+
+
+def read_all(config, connection, **kwargs):
+    pages, token = [], None
+    while True:
+        response = paginate(config, connection, PaginateInput(collection="orders", continuation_token=token, **kwargs))
+        assert response.code == 200
+        pages.append(response.output.documents)
+        token = response.output.next_token
+        if not response.output.has_more:
+            assert token is None
+            return pages
+
+
+class TestPaginate:
+    def test_pages_by_id(self, addon_config, get_connection):
+        connection, collection = get_connection([{"_id": i} for i in range(7)])
+
+        pages = read_all(addon_config(), connection, page_size=3)
+
+        assert [[d["_id"] for d in page] for page in pages] == [[0, 1, 2], [3, 4, 5], [6]]
+        assert collection.queries[1] == {"_id": {"$gt": 2}}
+
+    def test_sort_key_with_ties_descending(self, addon_config, get_connection):
+        documents = [{"_id": i, "score": score} for i, score in enumerate([5, 3, 5, 1, 3, 5])]
+        connection, _ = get_connection(documents)
+
+        pages = read_all(addon_config(), connection, sort_key="score", direction=-1, page_size=2, filter={"score": {"$gt": 0}})
+
+        assert [(d["score"], d["_id"]) for page in pages for d in page] == [(5, 5), (5, 2), (5, 0), (3, 4), (3, 1), (1, 3)]
+
+    @pytest.mark.parametrize("direction", [1, -1])
+    def test_missing_null_and_mixed_type_sort_values(self, direction, addon_config, get_connection):
+        scores = [3, None, "b", _MISSING, 1, "a", None, 2.5, _MISSING, 3]
+        documents = [{"_id": i} if score is _MISSING else {"_id": i, "score": score} for i, score in enumerate(scores)]
+        connection, _ = get_connection(documents)
+
+        pages = read_all(addon_config(), connection, sort_key="score", direction=direction, page_size=2)
+
+        returned = [d["_id"] for page in pages for d in page]
+        expected = [d["_id"] for d in sorted(documents, key=lambda d: (sort_value(d, "score"), d["_id"]),
+                                             reverse=direction == -1)]
+        assert returned == expected
+        assert len(returned) == len(documents)
+
+    def test_exact_multiple_has_no_empty_page(self, addon_config, get_connection):
+        connection, _ = get_connection([{"_id": i} for i in range(4)])
+        assert [len(page) for page in read_all(addon_config(), connection, page_size=2)] == [2, 2]
+
+    def test_projection_keeps_token_fields_but_returns_requested_ones(self, addon_config, get_connection):
+        connection, _ = get_connection([{"_id": i, "score": i, "name": str(i)} for i in range(3)])
+
+        response = paginate(addon_config(), connection, PaginateInput(
+            collection="orders", sort_key="score", page_size=2, projection={"name": 1, "_id": 0}))
+
+        assert response.output.documents == [{"name": "0"}, {"name": "1"}]
+        assert response.output.has_more is True
+
+    def test_projection_strips_token_fields_from_raw_documents(self, addon_config, get_connection):
+        connection, collection = get_connection([{"_id": i, "score": i, "name": str(i)} for i in range(3)])
+        find = collection.find
+        collection.find = lambda *args, **kwargs: (RawBSONDocument(bson.encode(d)) for d in find(*args, **kwargs))
+
+        response = paginate(addon_config(), connection, PaginateInput(
+            collection="orders", sort_key="score", page_size=2, projection={"name": 1, "_id": 0}))
+
+        documents = response.output.documents
+        assert all(isinstance(d, RawBSONDocument) for d in documents)
+        assert [dict(d.items()) for d in documents] == [{"name": "0"}, {"name": "1"}]
+        assert response.output.next_token is not None
+
+    def test_keyset_projection(self):
+        assert keyset_projection({"name": 1}, "score") == ({"name": 1, "score": 1}, ["score"])
+        assert keyset_projection({"score": 0}, "score") == ({}, ["score"])
+        assert keyset_projection({"name": 1, "score": 1}, "score") == ({"name": 1, "score": 1}, [])
+        assert keyset_projection(None, "score") == (None, [])
+
+    def test_token_bound_to_query(self, addon_config, get_connection):
+        connection, _ = get_connection([{"_id": i} for i in range(3)])
+        first = paginate(addon_config(), connection, PaginateInput(collection="orders", page_size=1))
+
+        reused = paginate(addon_config(), connection, PaginateInput(
+            collection="orders", page_size=1, filter={"a": 1}, continuation_token=first.output.next_token))
+        garbage = paginate(addon_config(), connection, PaginateInput(collection="orders", continuation_token="not-a-token"))
+
+        assert reused.code == 400
+        assert garbage.code == 400
+
+    def test_no_connection(self, addon_config):
+        response = paginate(addon_config(), None, PaginateInput(collection="orders"))
+        assert response.code == 500
+
+    def test_page_size_validation(self):
+        with pytest.raises(ValidationError):
+            PaginateInput(collection="orders", page_size=0)
+
+    def test_explain_command(self, addon_config, get_connection):
+        connection, _ = get_connection([{"_id": i, "score": i} for i in range(3)])
+        first = paginate(addon_config(), connection, PaginateInput(collection="orders", sort_key="score", page_size=1))
+        action_input = PaginateInput(collection="orders", sort_key="score", page_size=1, continuation_token=first.output.next_token)
+
+        command = explain_command("paginate", "orders", action_input)
+
+        assert command["sort"] == {"score": 1, "_id": 1}
+        assert command["limit"] == 2
+        assert command["filter"] == {"$or": [
+            {"score": {"$gt": 0}},
+            {"score": 0, "_id": {"$gt": 0}},
+            {"score": {"$type": list(SORT_BRACKETS[1:])}},
+        ]}
+
+    def test_keyset_filter_after_null(self):
+        ascending = keyset_filter(PaginateInput(collection="orders", sort_key="score"), None, 4)
+        descending = keyset_filter(PaginateInput(collection="orders", sort_key="score", direction=-1), None, 4)
+
+        assert ascending == {"$or": [{"score": None, "_id": {"$gt": 4}}, {"score": {"$ne": None}}]}
+        assert descending == {"score": None, "_id": {"$lt": 4}}
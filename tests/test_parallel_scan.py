@@ -0,0 +1,164 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+
+from mongodb_rooms_pkg.actions.parallel_scan import ActionInput as ParallelScanInput
+from mongodb_rooms_pkg.actions.parallel_scan import parallel_scan
+from mongodb_rooms_pkg.services.partitioned_scan import (
+    PartitionScanError,
+    partition_filters,
+    scan_partitions,
+    split_points,
+)
+
+
+def in_range(value, condition):
+    if "$not" in condition:
+        return not isinstance(value, int)
+    if not isinstance(value, int):
+        return False
+    return ("$gte" not in condition or value >= condition["$gte"]) and ("$lt" not in condition or value < condition["$lt"])
+
+
+class FakeCollection:
+    """Integer-_id collection understanding the range and $and filters of a partitioned scan."""
+
+    def __init__(self, ids, buckets=None, cursor=None):
+        self.cursor = cursor
+        self.documents = [{"_id": i, "even": isinstance(i, int) and i % 2 == 0} for i in ids]
+        self.buckets = buckets or []
+        self.cursors = []
+        self.lock = threading.Lock()
+
+    def aggregate(self, pipeline):
+        self.pipeline = pipeline
+        return iter(self.buckets)
+
+    def find(self, query, projection=None, batch_size=None):
+        parts = query.get("$and", [query])
+        found = [d for d in self.documents
+                 if all(in_range(d["_id"], p["_id"]) if "_id" in p else all(d.get(k) == v for k, v in p.items()) for p in parts)]
+        cursor = self.cursor(found)
+        with self.lock:
+            self.cursors.append(cursor)
+        return cursor
+
+
+@pytest.fixture
+def fake_collection(fake_cursor):
+    return lambda ids, buckets=None: FakeCollection(ids, buckets, fake_cursor)
+
+
+def buckets(*bounds):
+    return [{"_id": {"min": lower, "max": upper}, "count": 1} for lower, upper in zip(bounds, bounds[1:])]
+
+
+class TestPartitioning:
+    def test_split_points_from_bucket_auto(self, fake_collection):
+        collection = fake_collection([], buckets(0, 25, 50, 75, 99))
+        assert split_points(collection, 4, sample_size=400) == [25, 50, 75]
+        assert collection.pipeline[0] == {"$sample": {"size": 400}}
+        assert collection.pipeline[-1] == {"$bucketAuto": {"groupBy": "$_id", "buckets": 4}}
+
+    def test_mixed_id_types_fall_back_to_one_partition(self, fake_collection):
+        collection = fake_collection([], buckets(0, 50, "a"))
+        assert split_points(collection, 2) == []
+        assert partition_filters([]) == [{}]
+
+    def test_filters_cover_all_ids(self):
+        oid = ObjectId()
+        assert partition_filters([oid]) == [
+            {"_id": {"$lt": oid}},
+            {"_id": {"$gte": oid}},
+            {"_id": {"$not": {"$type": "objectId"}}},
+        ]
+
+
+class TestScan:
+    def test_reads_every_document_once(self, fake_collection):
+        ids = list(range(100)) + ["odd-type"]
+        collection = fake_collection(ids)
+        partitions = partition_filters([25, 50, 75])
+        events = []
+
+        pages = list(scan_partitions(collection, partitions, batch_size=10, max_workers=3, progress=events.append))
+
+        assert sorted(map(str, (d["_id"] for page in pages for d in page))) == sorted(map(str, ids))
+        assert all(len(page) <= 10 for page in pages)
+        assert events[-1]["completed"] == events[-1]["total"] == 5
+        assert events[-1]["documents"] == 101
+        assert all(cursor.closed for cursor in collection.cursors)
+
+    def test_filter_applies_within_partitions(self, fake_collection):
+        collection = fake_collection(range(20))
+        pages = scan_partitions(collection, partition_filters([10]), filter={"even": True}, batch_size=4)
+        assert sorted(d["_id"] for page in pages for d in page) == list(range(0, 20, 2))
+
+    def test_closing_early_stops_workers(self, fake_collection):
+        collection = fake_collection(range(1000))
+        pages = scan_partitions(collection, partition_filters([250, 500, 750]), batch_size=1, max_workers=2, queue_size=1)
+
+        next(pages)
+        pages.close()
+
+        assert not any(t.name.startswith("mongodb-scan") for t in threading.enumerate())
+
+    def test_dropping_the_iterator_stops_workers(self, fake_collection):
+        collection = fake_collection(range(1000))
+        pages = scan_partitions(collection, partition_filters([250, 500, 750]), batch_size=1, max_workers=2, queue_size=1)
+
+        next(pages)
+        del pages
+
+        assert not any(t.name.startswith("mongodb-scan") for t in threading.enumerate())
+        assert all(cursor.closed for cursor in collection.cursors)
+
+    def test_workers_are_daemon_threads(self, fake_collection):
+        collection = fake_collection(range(1000))
+        pages = scan_partitions(collection, partition_filters([500]), batch_size=1, max_workers=2, queue_size=1)
+
+        next(pages)
+        workers = [t for t in threading.enumerate() if t.name.startswith("mongodb-scan")]
+        pages.close()
+
+        assert workers and all(worker.daemon for worker in workers)
+
+    def test_failed_partition_raises(self):
+        collection = MagicMock()
+        collection.find.side_effect = RuntimeError("cursor killed")
+        with pytest.raises(PartitionScanError) as excinfo:
+            list(scan_partitions(collection, [{}]))
+        assert excinfo.value.partition == 0
+
+
+class TestParallelScanAction:
+    def test_action(self, addon_config, fake_collection):
+        collection = fake_collection(range(30), buckets(0, 10, 20, 29))
+        connection = MagicMock()
+        connection.__getitem__.return_value.__getitem__.return_value = collection
+
+        response = parallel_scan(addon_config(), connection, ParallelScanInput(collection="events", partitions=3, batch_size=7))
+
+        assert response.code == 200
+        assert len(response.output.partitions) == 4
+        assert sorted(d["_id"] for page in response.output.pages for d in page) == list(range(30))
+
+    def test_closing_output_pages_stops_the_scan(self, addon_config, fake_collection):
+        collection = fake_collection(range(1000), buckets(0, 250, 500, 750, 999))
+        connection = MagicMock()
+        connection.__getitem__.return_value.__getitem__.return_value = collection
+        action_input = ParallelScanInput(collection="events", partitions=4, batch_size=1, max_workers=2, queue_size=1)
+
+        response = parallel_scan(addon_config(), connection, action_input)
+        next(response.output.pages)
+        response.output.pages.close()
+
+        assert not any(t.name.startswith("mongodb-scan") for t in threading.enumerate())
+        assert all(cursor.closed for cursor in collection.cursors)
+
+    def test_no_connection(self, addon_config):
+        response = parallel_scan(addon_config(), None, ParallelScanInput(collection="events"))
+        assert response.code == 500
+        assert list(response.output.pages) == []
@@ -0,0 +1,136 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from loguru import logger
+
+from mongodb_rooms_pkg.addon import MongoDBRoomsAddon
+from mongodb_rooms_pkg.services.connection import create_connection
+from mongodb_rooms_pkg.services.pool_telemetry import PoolTelemetry, find_pool_telemetry, pool_telemetry_from_config
+
+ADDRESS = ("db.example", 27017)
+
+
+@pytest.fixture
+def events():
+    records = []
+    sink = logger.add(lambda message: records.append(message.record), level="DEBUG")
+    yield records
+    logger.remove(sink)
+
+
+def check_out(telemetry, duration=0.001):
+    telemetry.connection_check_out_started(SimpleNamespace(address=ADDRESS))
+    telemetry.connection_checked_out(SimpleNamespace(address=ADDRESS, connection_id=1, duration=duration))
+
+
+class TestPoolTelemetry:
+    def test_checked_out_and_wait_time(self):
+        telemetry = PoolTelemetry()
+        telemetry.pool_created(SimpleNamespace(address=ADDRESS, options={"maxPoolSize": 10}))
+        check_out(telemetry)
+        check_out(telemetry, 0.004)
+        telemetry.connection_checked_in(SimpleNamespace(address=ADDRESS, connection_id=1))
+
+        pool = telemetry.snapshot()["pools"]["db.example:27017"]
+        assert pool["max_pool_size"] == 10
+        assert pool["checked_out"] == 1
+        assert pool["peak_checked_out"] == 2
+        assert pool["waiting"] == 0
+        assert pool["check_outs"] == 2
+        assert pool["wait_time"]["count"] == 2
+        assert pool["utilization"] == 0.1
+
+    def test_connection_churn(self):
+        telemetry = PoolTelemetry()
+        for connection_id in range(3):
+            telemetry.connection_created(SimpleNamespace(address=ADDRESS, connection_id=connection_id))
+        telemetry.connection_closed(SimpleNamespace(address=ADDRESS, connection_id=0, reason="idle"))
+
+        pool = telemetry.snapshot()["pools"]["db.example:27017"]
+        assert pool["connections_open"] == 2
+        assert pool["connections_closed"] == 1
+        assert pool["closed_by_reason"] == {"idle": 1}
+
+    def test_saturation_alert_is_rate_limited(self, events):
+        telemetry = PoolTelemetry(saturation_ratio=0.5)
+        telemetry.pool_created(SimpleNamespace(address=ADDRESS, options={"maxPoolSize": 2}))
+        for _ in range(3):
+            check_out(telemetry)
+
+        alerts = [record for record in events if record["extra"].get("event") == "pool_saturated"]
+        assert len(alerts) == 1
+        assert alerts[0]["level"].name == "WARNING"
+        assert alerts[0]["extra"]["max_pool_size"] == 2
+
+    def test_slow_wait_alerts(self, events):
+        telemetry = PoolTelemetry(wait_alert_seconds=0.5)
+        check_out(telemetry, duration=2.0)
+        assert any(record["extra"].get("event") == "pool_saturated" for record in events)
+
+    def test_check_out_failure_logged(self, events):
+        telemetry = PoolTelemetry()
+        telemetry.connection_check_out_started(SimpleNamespace(address=ADDRESS))
+        telemetry.connection_check_out_failed(SimpleNamespace(address=ADDRESS, reason="timeout", duration=5.0))
+
+        pool = telemetry.snapshot()["pools"]["db.example:27017"]
+        assert pool["check_out_failures"] == {"timeout": 1}
+        assert pool["waiting"] == 0
+        assert [r["extra"]["reason"] for r in events if r["extra"].get("event") == "connection_check_out_failed"] == ["timeout"]
+
+    def test_heartbeats(self, events):
+        telemetry = PoolTelemetry()
+        telemetry.succeeded(SimpleNamespace(connection_id=ADDRESS, duration=0.002, reply=None, awaited=False))
+        telemetry.failed(SimpleNamespace(connection_id=ADDRESS, duration=1.0, reply=Exception("refused"), awaited=False))
+
+        server = telemetry.snapshot()["servers"]["db.example:27017"]
+        assert server["heartbeats"] == 2
+        assert server["heartbeat_failures"] == 1
+        assert server["last_rtt_seconds"] == 0.002
+        assert any(record["extra"].get("event") == "heartbeat_failed" for record in events)
+
+    def test_server_type_change(self, events):
+        telemetry = PoolTelemetry()
+        telemetry.description_changed(SimpleNamespace(
+            server_address=ADDRESS,
+            previous_description=SimpleNamespace(server_type_name="Unknown"),
+            new_description=SimpleNamespace(server_type_name="RSPrimary"),
+        ))
+        assert telemetry.snapshot()["servers"]["db.example:27017"]["server_type"] == "RSPrimary"
+        assert any(record["extra"].get("event") == "server_type_changed" for record in events)
+
+
+class TestClientIntegration:
+    def test_create_connection_registers_listener(self):
+        telemetry = PoolTelemetry()
+        client = create_connection("mongodb://localhost:1/?serverSelectionTimeoutMS=10", lazy=True, telemetry=telemetry)
+        try:
+            assert find_pool_telemetry(client) is telemetry
+        finally:
+            client.close()
+
+    def test_find_without_telemetry(self):
+        assert find_pool_telemetry(MagicMock(options=SimpleNamespace(event_listeners=[]))) is None
+
+    def test_config_disabled_by_default(self, addon_config):
+        assert pool_telemetry_from_config(addon_config()) is None
+        telemetry = pool_telemetry_from_config(addon_config(poolTelemetry=True, poolWaitAlertMS=250))
+        assert telemetry.wait_alert_seconds == 0.25
+
+    @patch("mongodb_rooms_pkg.addon.ClientRegistry")
+    def test_addon_uses_telemetry_variant(self, mock_registry, addon_config):
+        telemetry = PoolTelemetry()
+        client = MagicMock(options=SimpleNamespace(event_listeners=[telemetry]))
+        mock_registry.return_value.acquire.return_value = client
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config(poolTelemetry=True)
+
+        assert addon.initConnection()
+        uri, factory, variant = mock_registry.return_value.acquire.call_args.args
+        assert variant == "telemetry"
+        assert isinstance(factory.keywords["telemetry"], PoolTelemetry)
+        assert addon.telemetry is telemetry
+        assert addon.pool_telemetry() == {"pools": {}, "servers": {}}
+
+    def test_addon_without_telemetry(self):
+        assert MongoDBRoomsAddon().pool_telemetry() == {"pools": {}, "servers": {}}
@@ -0,0 +1,126 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import bson
+from bson.raw_bson import RawBSONDocument
+from pymongo import MongoClient
+from pymongo.results import InsertManyResult
+
+from mongodb_rooms_pkg.actions.aio.insert import ActionInput as AsyncInsertInput
+from mongodb_rooms_pkg.actions.aio.insert import insert as async_insert
+from mongodb_rooms_pkg.actions.find import ActionInput as FindInput
+from mongodb_rooms_pkg.actions.find import find
+from mongodb_rooms_pkg.actions.insert import ActionInput as InsertInput
+from mongodb_rooms_pkg.actions.insert import insert
+from mongodb_rooms_pkg.addon import MongoDBRoomsAddon
+from mongodb_rooms_pkg.services.connection import ClientRegistry, create_connection
+from mongodb_rooms_pkg.services.schema_inference import SchemaProfile
+
+
+class TestRawClient:
+    @patch('mongodb_rooms_pkg.services.connection.MongoClient')
+    def test_raw_client_uses_raw_document_class(self, mock_client_class):
+        create_connection("mongodb://localhost:27017", lazy=True, raw_bson=True)
+
+        mock_client_class.assert_called_once_with(
+            "mongodb://localhost:27017", serverSelectionTimeoutMS=5000, document_class=RawBSONDocument
+        )
+
+    def test_registry_separates_raw_variant(self):
+        factory = MagicMock(side_effect=lambda uri: MagicMock())
+        registry = ClientRegistry()
+
+        decoded = registry.acquire("mongodb://h:1/db", factory)
+        raw = registry.acquire("mongodb://h:1/db", factory, "raw")
+
+        assert decoded is not raw
+        assert registry.refcount("mongodb://h:1/db") == 1
+        assert registry.refcount("mongodb://h:1/db", "raw") == 1
+
+    def test_addon_acquires_raw_client(self, addon_config):
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config(rawBson=True)
+        client = MagicMock()
+
+        with patch('mongodb_rooms_pkg.addon.create_connection', return_value=client) as mock_create:
+            assert addon.initConnection() is True
+
+        assert mock_create.call_args.kwargs == {"lazy": False, "raw_bson": True}
+        assert ClientRegistry().refcount(addon.connection_uri, "raw") == 1
+
+        addon.closeConnection()
+
+        client.close.assert_called_once()
+
+
+class TestRawInsert:
+    def test_insert_raw_documents_passes_bytes_through(self, addon_config, mock_connection):
+        connection, _, collection = mock_connection
+        collection.insert_many.return_value = InsertManyResult([], True)
+        payloads = [bson.encode({"_id": 1, "a": "x"}), bson.encode({"_id": 2, "a": "y"})]
+
+        response = insert(addon_config(), connection, InsertInput(collection="events", raw_documents=payloads))
+
+        assert response.code == 200
+        assert response.output.inserted_count == 2
+        sent = collection.insert_many.call_args.args[0]
+        assert all(isinstance(doc, RawBSONDocument) for doc in sent)
+        assert [doc.raw for doc in sent] == payloads
+
+    def test_raw_insert_count_with_real_driver(self, addon_config):
+        # The real insert_many leaves RawBSONDocuments out of inserted_ids; only the wire call is stubbed.
+        client = MongoClient("mongodb://localhost:27017", connect=False)
+        try:
+            with patch("pymongo.synchronous.collection._Bulk.execute"):
+                payloads = [bson.encode({"_id": 1, "a": "x"}), bson.encode({"a": "y"})]
+                response = insert(addon_config(), client, InsertInput(collection="events", raw_documents=payloads))
+        finally:
+            client.close()
+
+        assert response.code == 200
+        assert response.output.inserted_count == 2
+        assert response.output.inserted_ids == [1]
+        assert "inserted 2 document(s)" in response.message
+
+    def test_async_raw_insert_counts_sent_documents(self, addon_config, mock_connection):
+        connection, _, collection = mock_connection
+        collection.insert_many = AsyncMock(return_value=InsertManyResult([], True))
+        payloads = [bson.encode({"_id": 1}), bson.encode({"_id": 2})]
+
+        response = asyncio.run(async_insert(addon_config(), connection, AsyncInsertInput(collection="events", raw_documents=payloads)))
+
+        assert response.output.inserted_count == 2
+        assert response.output.inserted_ids == [1, 2]
+
+    def test_raw_documents_cannot_be_combined(self, addon_config, mock_connection):
+        connection, _, _ = mock_connection
+        input_data = InsertInput(collection="events", document={"a": 1}, raw_documents=[bson.encode({"a": 1})])
+
+        response = insert(addon_config(), connection, input_data)
+
+        assert response.code == 400
+        assert "raw_documents" in response.message
+
+
+class TestRawReads:
+    def test_find_returns_raw_documents_untouched(self, addon_config, mock_connection):
+        connection, _, collection = mock_connection
+        docs = [RawBSONDocument(bson.encode({"_id": i})) for i in range(3)]
+        cursor = MagicMock()
+        cursor.__iter__.return_value = iter(docs)
+        collection.find.return_value = cursor
+
+        response = find(addon_config(), connection, FindInput(collection="events", batch_size=2))
+        pages = list(response.output.pages)
+
+        assert [doc for page in pages for doc in page] == docs
+        assert all(a is b for a, b in zip([doc for page in pages for doc in page], docs))
+
+    def test_schema_profile_accepts_raw_documents(self):
+        raw = RawBSONDocument(bson.encode({"_id": 1, "address": {"city": "Paris"}, "items": [{"sku": "a"}]}))
+
+        fields = {field["field_name"]: field for field in SchemaProfile().observe_many([raw]).fields()}
+
+        assert fields["address"]["data_types"] == ["object"]
+        assert fields["address.city"]["data_types"] == ["string"]
+        assert fields["items.sku"]["sample_values"] == ["a"]
@@ -0,0 +1,141 @@
+import datetime
+from unittest.mock import MagicMock
+
+from bson import Int64, ObjectId
+from pymongo.errors import OperationFailure
+
+from mongodb_rooms_pkg.actions.describe_collection import analyze_schema
+from mongodb_rooms_pkg.services.schema_inference import (
+    KMVSketch,
+    SchemaProfile,
+    bson_type_name,
+    build_schema_pipeline,
+    fields_from_histogram,
+    infer_schema,
+)
+
+
+def by_path(fields):
+    return {field["field_name"]: field for field in fields}
+
+
+class TestBsonTypeName:
+    def test_type_names(self):
+        assert bson_type_name(None) == "null"
+        assert bson_type_name(True) == "bool"
+        assert bson_type_name(1) == "int"
+        assert bson_type_name(2 ** 40) == "long"
+        assert bson_type_name(Int64(1)) == "long"
+        assert bson_type_name(1.5) == "double"
+        assert bson_type_name("a") == "string"
+        assert bson_type_name({}) == "object"
+        assert bson_type_name([]) == "array"
+        assert bson_type_name(ObjectId()) == "objectId"
+        assert bson_type_name(datetime.datetime.now()) == "date"
+
+
+class TestKMVSketch:
+    def test_exact_below_k(self):
+        sketch = KMVSketch(k=64)
+        for value in [1, 2, 2, 3, "3"]:
+            sketch.add(value)
+
+        assert sketch.estimate() == 4
+
+    def test_estimate_large_stream(self):
+        sketch = KMVSketch(k=256)
+        for value in range(20000):
+            sketch.add(value % 10000)
+
+        assert 8500 < sketch.estimate() < 11500
+        assert len(sketch.hashes()) == 256
+
+
+class TestSchemaProfile:
+    def test_nested_documents_and_arrays(self):
+        profile = SchemaProfile(max_depth=3).observe_many([
+            {"_id": 1, "name": "a", "address": {"city": "Paris", "geo": {"lat": 1.0}}, "items": [{"sku": "x"}, {"sku": "y"}]},
+            {"_id": 2, "name": None, "address": {"city": "Lyon"}, "items": []},
+            {"_id": 3, "name": 7, "items": [{"sku": 1}]},
+            {"_id": 4},
+        ])
+        fields = by_path(profile.fields())
+
+        assert fields["name"]["count"] == 3
+        assert fields["name"]["presence_ratio"] == 0.75
+        assert fields["name"]["null_count"] == 1
+        assert sorted(fields["name"]["data_types"]) == ["int", "string"]
+        assert fields["address.city"]["cardinality_estimate"] == 2
+        assert fields["address.geo.lat"]["data_types"] == ["double"]
+        assert fields["items.sku"]["count"] == 2
+        assert fields["items.sku"]["type_distribution"] == {"string": 0.5, "int": 0.5}
+        assert fields["items.sku"]["sample_values"] == ["x", "y", 1]
+        assert fields["items"]["cardinality_estimate"] is None
+
+    def test_max_depth_limits_descent(self):
+        fields = by_path(SchemaProfile(max_depth=0).observe_many([{"a": {"b": 1}}]).fields())
+
+        assert list(fields) == ["a"]
+
+    def test_round_trip(self):
+        profile = SchemaProfile().observe_many([{"_id": i, "v": i % 3} for i in range(10)])
+
+        restored = SchemaProfile.from_dict(profile.to_dict())
+        restored.observe({"_id": 10, "v": 5})
+
+        fields = by_path(restored.fields())
+        assert restored.document_count == 11
+        assert fields["v"]["cardinality_estimate"] == 4
+
+    def test_analyze_schema_builds_field_infos(self):
+        fields = analyze_schema([{"name": "a"}, {"name": None}])
+
+        assert fields[0].field_name == "name"
+        assert fields[0].data_types == ["string"]
+        assert fields[0].null_count == 1
+        assert fields[0].presence_ratio == 1.0
+
+
+class TestServerPipeline:
+    def test_pipeline_shape(self):
+        pipeline = build_schema_pipeline(sample_size=500, max_depth=2)
+
+        assert pipeline[0] == {"$sample": {"size": 500}}
+        assert sum("$set" in stage for stage in pipeline) == 2
+        assert [next(iter(stage)) for stage in pipeline[-6:]] == ["$unwind", "$group", "$group", "$project", "$project", "$sort"]
+
+    def test_fields_from_histogram(self):
+        fields = by_path(fields_from_histogram([
+            {"path": "_id", "type": "objectId", "count": 4, "distinct": 4, "samples": ["a", "b", "c"]},
+            {"path": "age", "type": "int", "count": 2, "distinct": 2, "samples": [30, 40]},
+            {"path": "age", "type": "null", "count": 1, "distinct": 0, "samples": []},
+            {"path": "tags", "type": "array", "count": 4, "distinct": 0, "samples": []},
+        ]))
+
+        assert fields["age"]["count"] == 3
+        assert fields["age"]["presence_ratio"] == 0.75
+        assert fields["age"]["null_count"] == 1
+        assert fields["age"]["data_types"] == ["int"]
+        assert fields["age"]["cardinality_estimate"] == 2
+        assert fields["tags"]["cardinality_estimate"] is None
+
+    def test_infer_schema_uses_server_histogram(self):
+        collection = MagicMock()
+        collection.aggregate.return_value = [{"path": "_id", "type": "int", "count": 1, "distinct": 1, "samples": [1]}]
+
+        fields = infer_schema(collection, sample_size=50)
+
+        assert fields[0]["field_name"] == "_id"
+        assert collection.aggregate.call_args.kwargs == {"allowDiskUse": True}
+
+    def test_infer_schema_streams_on_failure(self):
+        collection = MagicMock()
+        cursor = MagicMock()
+        cursor.__iter__.return_value = iter([{"_id": 1, "a": 1}, {"_id": 2}])
+        collection.aggregate.side_effect = [OperationFailure("unsupported"), cursor]
+
+        fields = by_path(infer_schema(collection, sample_size=50))
+
+        assert fields["a"]["presence_ratio"] == 0.5
+        assert collection.aggregate.call_args.args[0] == [{"$sample": {"size": 50}}]
+        cursor.close.assert_called_once()
@@ -0,0 +1,420 @@
+import datetime
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import OperationFailure
+
+from mongodb_rooms_pkg.actions.describe_collection import describe_collection
+from mongodb_rooms_pkg.addon import MongoDBRoomsAddon
+from mongodb_rooms_pkg.services.schema_inference import SchemaProfile
+from mongodb_rooms_pkg.services.schema_store import WATCH_PIPELINE, SchemaProfileStore, SchemaProfileWatcher
+
+
+def by_path(fields):
+    return {field["field_name"]: field for field in fields}
+
+
+class FakeChangeStream:
+    """Stand-in for pymongo's ChangeStream: try_next() yields queued events, then None."""
+
+    def __init__(self, events, keep_alive=False):
+        self.events = list(events)
+        self.keep_alive = keep_alive
+        self.resume_token = None
+
+    @property
+    def alive(self):
+        return bool(self.events) or self.keep_alive
+
+    def try_next(self):
+        if not self.events:
+            return None
+        event = self.events.pop(0)
+        self.resume_token = event.get("_id")
+        return event
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.keep_alive = False
+
+
+def insert_event(token, document):
+    return {"_id": {"_data": token}, "operationType": "insert", "fullDocument": document}
+
+
+class TestSchemaProfileStore:
+    def test_persists_profiles_and_tokens(self, tmp_path):
+        path = str(tmp_path / "profiles.json")
+        store = SchemaProfileStore(path)
+        profile = SchemaProfile().observe_many([{"_id": ObjectId(), "created": datetime.datetime(2024, 1, 1)}])
+        store.put("testdb", "users", profile, resume_token={"_data": "abc"})
+        store.save()
+
+        reloaded = SchemaProfileStore(path)
+
+        assert reloaded.has("testdb", "users")
+        assert reloaded.resume_token("testdb", "users") == {"_data": "abc"}
+        created = by_path(reloaded.fields("testdb", "users"))["created"]
+        assert created["data_types"] == ["date"]
+        assert isinstance(created["sample_values"][0], datetime.datetime)
+
+    def test_missing_profile(self, tmp_path):
+        store = SchemaProfileStore(str(tmp_path / "profiles.json"))
+
+        assert store.fields("testdb", "users") is None
+        assert store.has("testdb", "users") is False
+
+    def test_observe_uses_store_max_depth(self, tmp_path):
+        store = SchemaProfileStore(str(tmp_path / "profiles.json"), max_depth=1)
+
+        store.observe("testdb", "users", {"a": {"b": {"c": 1}}})
+
+        assert set(by_path(store.fields("testdb", "users"))) == {"a", "a.b"}
+
+    def test_concurrent_saves(self, tmp_path):
+        path = tmp_path / "profiles.json"
+        store = SchemaProfileStore(str(path))
+        errors = []
+
+        def work(name):
+            try:
+                for i in range(20):
+                    store.observe("testdb", name, {"_id": i})
+                    store.save()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(f"c{n}",)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert [p.name for p in tmp_path.iterdir()] == ["profiles.json"]
+        reloaded = SchemaProfileStore(str(path))
+        assert [reloaded.document_count("testdb", f"c{n}") for n in range(4)] == [20] * 4
+
+    def test_save_serializes_only_changed_profiles(self, tmp_path):
+        path = tmp_path / "profiles.json"
+        store = SchemaProfileStore(str(path))
+        store.observe("testdb", "users", {"_id": 1})
+        store.observe("testdb", "orders", {"_id": 1})
+        store.save()
+
+        store.observe("testdb", "users", {"_id": 2})
+        with patch.object(SchemaProfile, "to_dict", autospec=True, side_effect=SchemaProfile.to_dict) as to_dict:
+            store.save()
+
+        assert to_dict.call_count == 1
+        reloaded = SchemaProfileStore(str(path))
+        assert reloaded.document_count("testdb", "users") == 2
+        assert reloaded.document_count("testdb", "orders") == 1
+
+    def test_dropped_profile_is_removed_on_save(self, tmp_path):
+        path = tmp_path / "profiles.json"
+        store = SchemaProfileStore(str(path))
+        store.observe("testdb", "users", {"_id": 1})
+        store.save()
+
+        store.drop("testdb", "users")
+        store.save()
+
+        assert SchemaProfileStore(str(path)).has("testdb", "users") is False
+
+    def test_file_is_written_outside_the_data_lock(self, tmp_path):
+        store = SchemaProfileStore(str(tmp_path / "profiles.json"))
+        store.observe("testdb", "users", {"_id": 1})
+        acquired = []
+
+        def try_lock():
+            if store._lock.acquire(timeout=1):
+                store._lock.release()
+                acquired.append(True)
+
+        def write(path, data):
+            thread = threading.Thread(target=try_lock)
+            thread.start()
+            thread.join()
+
+        with patch("mongodb_rooms_pkg.services.schema_store.atomic_write", side_effect=write):
+            store.save()
+
+        assert acquired == [True]
+
+    def test_failed_save_is_retried(self, tmp_path):
+        path = tmp_path / "profiles.json"
+        store = SchemaProfileStore(str(path))
+        store.observe("testdb", "users", {"_id": 1})
+
+        with patch("mongodb_rooms_pkg.services.schema_store.atomic_write", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                store.save()
+        store.save()
+
+        assert SchemaProfileStore(str(path)).document_count("testdb", "users") == 1
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "profiles.json"
+        path.write_text("{not json")
+
+        assert SchemaProfileStore(str(path)).has("testdb", "users") is False
+
+
+class TestSchemaProfileWatcher:
+    def test_consume_updates_profile_and_token(self, tmp_path):
+        path = str(tmp_path / "profiles.json")
+        store = SchemaProfileStore(path)
+        store.put("testdb", "users", SchemaProfile().observe_many([{"_id": 1, "name": "a"}]))
+        collection = MagicMock()
+        collection.name = "users"
+        watcher = SchemaProfileWatcher(store, collection, "testdb", flush_every=2)
+        stream = FakeChangeStream([
+            insert_event("t1", {"_id": 2, "name": "b", "age": 30}),
+            {"_id": {"_data": "t2"}, "operationType": "update", "fullDocument": {"_id": 1, "name": "a", "age": 31}},
+            insert_event("t3", {"_id": 3, "name": None}),
+        ])
+
+        assert watcher.consume(stream) == 3
+
+        fields = by_path(store.fields("testdb", "users"))
+        assert store.document_count("testdb", "users") == 3
+        assert fields["age"]["count"] == 1
+        assert fields["name"]["null_count"] == 1
+        reloaded = SchemaProfileStore(path)
+        assert reloaded.resume_token("testdb", "users") == {"_data": "t3"}
+        assert reloaded.document_count("testdb", "users") == 3
+
+    def test_updates_do_not_count_as_documents(self, tmp_path):
+        store = SchemaProfileStore(str(tmp_path / "profiles.json"))
+        store.put("testdb", "users", SchemaProfile().observe_many([{"_id": 1, "name": "a"}]))
+        collection = MagicMock()
+        collection.name = "users"
+        stream = FakeChangeStream([
+            {"_id": {"_data": f"t{i}"}, "operationType": "update", "fullDocument": {"_id": 1, "name": f"a{i}"}}
+            for i in range(5)
+        ] + [{"_id": {"_data": "t9"}, "operationType": "replace", "fullDocument": {"_id": 1, "name": "z", "tags": ["x"]}}])
+
+        SchemaProfileWatcher(store, collection, "testdb").consume(stream)
+
+        fields = by_path(store.fields("testdb", "users"))
+        assert store.document_count("testdb", "users") == 1
+        assert fields["name"]["presence_ratio"] == 1.0
+        assert fields["tags"]["data_types"] == ["array"]
+        assert fields["tags"]["presence_ratio"] == 1.0
+
+    def test_unexpected_error_is_logged(self, tmp_path):
+        store = SchemaProfileStore(str(tmp_path / "profiles.json"))
+        collection = MagicMock()
+        collection.name = "users"
+        collection.watch.return_value = FakeChangeStream([insert_event("t1", {"_id": 1})])
+        watcher = SchemaProfileWatcher(store, collection, "testdb")
+
+        with patch.object(store, "observe", side_effect=TypeError("boom")), \
+                patch("mongodb_rooms_pkg.services.schema_store.logger") as mock_logger:
+            watcher.start().join(2)
+
+        assert watcher.running is False
+        assert "boom" in mock_logger.exception.call_args.args[0]
+
+    def test_resumes_from_persisted_token(self, tmp_path):
+        store = SchemaProfileStore(str(tmp_path / "profiles.json"))
+        store.put("testdb", "users", SchemaProfile(), resume_token={"_data": "t9"})
+        collection = MagicMock()
+        collection.name = "users"
+
+        SchemaProfileWatcher(store, collection, "testdb").open_stream()
+
+        assert collection.watch.call_args.kwargs["resume_after"] == {"_data": "t9"}
+        assert collection.watch.call_args.kwargs["full_document"] == "updateLookup"
+
+    def test_drop_event_discards_profile(self, tmp_path):
+        store = SchemaProfileStore(str(tmp_path / "profiles.json"))
+        store.put("testdb", "users", SchemaProfile())
+        collection = MagicMock()
+        collection.name = "users"
+        stream = FakeChangeStream([{"_id": {"_data": "t1"}, "operationType": "drop"}, insert_event("t2", {"_id": 1})])
+
+        SchemaProfileWatcher(store, collection, "testdb").consume(stream)
+
+        assert store.has("testdb", "users") is False
+
+    def test_pipeline_matches_end_of_stream_and_delete_events(self):
+        operation_types = WATCH_PIPELINE[0]["$match"]["operationType"]["$in"]
+
+        assert {"delete", "drop", "dropDatabase", "rename"} <= set(operation_types)
+
+    def test_rename_event_discards_profile(self, tmp_path):
+        store = SchemaProfileStore(str(tmp_path / "profiles.json"))
+        store.put("testdb", "users", SchemaProfile())
+        collection = MagicMock()
+        collection.name = "users"
+
+        SchemaProfileWatcher(store, collection, "testdb").consume(
+            FakeChangeStream([{"_id": {"_data": "t1"}, "operationType": "rename"}]))
+
+        assert store.has("testdb", "users") is False
+
+    def test_deletes_trigger_resample(self, tmp_path):
+        store = SchemaProfileStore(str(tmp_path / "profiles.json"))
+        store.put("testdb", "users", SchemaProfile().observe_many([{"_id": i, "name": "a"} for i in range(10)]))
+        collection = MagicMock()
+        collection.name = "users"
+        sample = MagicMock(return_value=SchemaProfile().observe_many([{"_id": i} for i in range(8)]))
+        watcher = SchemaProfileWatcher(store, collection, "testdb", sample=sample, resample_ratio=0.2)
+        stream = FakeChangeStream([{"_id": {"_data": f"t{i}"}, "operationType": "delete", "documentKey": {"_id": i}}
+                                   for i in range(3)])
+
+        assert watcher.consume(stream) == 3
+
+        sample.assert_called_once_with()
+        assert store.document_count("testdb", "users") == 8
+        assert "name" not in by_path(store.fields("testdb", "users"))
+        assert SchemaProfileStore(store.path).resume_token("testdb", "users") == {"_data": "t2"}
+
+    def test_deletes_without_sample_are_ignored(self, tmp_path):
+        store = SchemaProfileStore(str(tmp_path / "profiles.json"))
+        store.put("testdb", "users", SchemaProfile().observe_many([{"_id": 1}]))
+        collection = MagicMock()
+        collection.name = "users"
+        stream = FakeChangeStream([{"_id": {"_data": "t1"}, "operationType": "delete", "documentKey": {"_id": 1}}])
+
+        assert SchemaProfileWatcher(store, collection, "testdb").consume(stream) == 1
+
+        assert store.document_count("testdb", "users") == 1
+        assert store.resume_token("testdb", "users") == {"_data": "t1"}
+
+    def test_bootstrap_opens_stream_before_sampling(self, tmp_path):
+        store = SchemaProfileStore(str(tmp_path / "profiles.json"))
+        collection = MagicMock()
+        collection.name = "users"
+        stream = FakeChangeStream([insert_event("t1", {"_id": 2, "age": 3})])
+        stream.resume_token = {"_data": "t0"}
+        collection.watch.return_value = stream
+
+        def sample():
+            assert collection.watch.called
+            return SchemaProfile().observe_many([{"_id": 1}])
+
+        watcher = SchemaProfileWatcher(store, collection, "testdb", sample=sample)
+
+        assert watcher.bootstrap() is stream
+        assert store.resume_token("testdb", "users") == {"_data": "t0"}
+        assert SchemaProfileStore(store.path).has("testdb", "users")
+
+        watcher.consume(stream)
+
+        assert store.document_count("testdb", "users") == 2
+        assert "age" in by_path(store.fields("testdb", "users"))
+
+    def test_bootstrap_keeps_existing_profile(self, tmp_path):
+        store = SchemaProfileStore(str(tmp_path / "profiles.json"))
+        store.put("testdb", "users", SchemaProfile(), resume_token={"_data": "t9"})
+        collection = MagicMock()
+        collection.name = "users"
+        sample = MagicMock()
+
+        SchemaProfileWatcher(store, collection, "testdb", sample=sample).bootstrap()
+
+        sample.assert_not_called()
+        assert collection.watch.call_args.kwargs["resume_after"] == {"_data": "t9"}
+
+    def test_bootstrap_closes_stream_when_sampling_fails(self, tmp_path):
+        store = SchemaProfileStore(str(tmp_path / "profiles.json"))
+        collection = MagicMock()
+        collection.name = "users"
+        stream = collection.watch.return_value = FakeChangeStream([], keep_alive=True)
+        watcher = SchemaProfileWatcher(store, collection, "testdb", sample=MagicMock(side_effect=OSError("boom")))
+
+        with pytest.raises(OSError):
+            watcher.bootstrap()
+
+        assert stream.alive is False
+        assert store.has("testdb", "users") is False
+
+    def test_background_thread_stops(self, tmp_path):
+        store = SchemaProfileStore(str(tmp_path / "profiles.json"))
+        collection = MagicMock()
+        collection.name = "users"
+        stream = FakeChangeStream([insert_event("t1", {"_id": 1})], keep_alive=True)
+        collection.watch.return_value = stream
+        watcher = SchemaProfileWatcher(store, collection, "testdb")
+
+        watcher.start()
+        for _ in range(100):
+            if store.resume_token("testdb", "users"):
+                break
+            threading.Event().wait(0.01)
+        watcher.stop(timeout=2)
+
+        assert watcher.running is False
+        assert store.document_count("testdb", "users") == 1
+
+
+class TestDescribeWithProfileStore:
+    def test_profile_built_once_then_served_from_store(self, tmp_path, addon_config):
+        store = SchemaProfileStore(str(tmp_path / "profiles.json"))
+        mock_connection = MagicMock()
+        mock_db = MagicMock()
+        mock_connection.__getitem__.return_value = mock_db
+        mock_db.list_collection_names.return_value = ["users"]
+        collection = mock_db.__getitem__.return_value
+
+        def aggregate(pipeline, **kwargs):
+            if pipeline == [{"$sample": {"size": 1000}}]:
+                return MagicMock(__iter__=lambda self: iter([{"_id": 1, "name": "a"}]))
+            return []
+
+        collection.aggregate.side_effect = aggregate
+
+        for _ in range(2):
+            response = describe_collection(addon_config(), mock_connection, ["users"], profile_store=store)
+            assert [field.field_name for field in response.output.collections[0].schema_sample] == ["_id", "name"]
+
+        sample_calls = [c for c in collection.aggregate.call_args_list if c.args[0] == [{"$sample": {"size": 1000}}]]
+        assert len(sample_calls) == 1
+
+
+class TestAddonSchemaWatch:
+    def test_watch_requires_store(self):
+        addon = MongoDBRoomsAddon()
+
+        assert addon.watch_schema(["users"]) == {"users": False}
+
+    def test_watch_schema_starts_and_stops_watchers(self, tmp_path, addon_config):
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config(schemaProfilePath=str(tmp_path / "profiles.json"))
+
+        with patch('mongodb_rooms_pkg.addon.create_connection', return_value=MagicMock()):
+            addon.initConnection()
+        collection = addon.connection.__getitem__.return_value.__getitem__.return_value
+        collection.name = "users"
+        collection.aggregate.return_value = MagicMock(__iter__=lambda self: iter([{"_id": 1}]))
+        collection.watch.return_value = FakeChangeStream([], keep_alive=True)
+
+        assert addon.watch_schema(["users"]) == {"users": True}
+        assert addon.schema_store.has("testdb", "users")
+
+        addon.closeConnection()
+
+        assert addon.schema_watchers == {}
+        assert (tmp_path / "profiles.json").exists()
+
+    def test_watch_reports_stream_errors(self, tmp_path, addon_config):
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config(schemaProfilePath=str(tmp_path / "profiles.json"))
+
+        with patch('mongodb_rooms_pkg.addon.create_connection', return_value=MagicMock()):
+            addon.initConnection()
+        collection = addon.connection.__getitem__.return_value.__getitem__.return_value
+        collection.watch.side_effect = OperationFailure("The $changeStream stage is only supported on replica sets")
+
+        assert addon.watch_schema(["users"]) == {"users": False}
+        assert addon.schema_watchers == {}
@@ -0,0 +1,174 @@
+import time
+from unittest.mock import MagicMock, patch
+
+from bson import json_util
+from pymongo.errors import OperationFailure
+
+from mongodb_rooms_pkg.actions.base import ActionResponse, TokensSchema
+from mongodb_rooms_pkg.actions.delete import ActionInput as DeleteInput
+from mongodb_rooms_pkg.actions.find import ActionInput as FindInput
+from mongodb_rooms_pkg.actions.find import ActionOutput as FindOutput
+from mongodb_rooms_pkg.actions.insert import ActionInput as InsertInput
+from mongodb_rooms_pkg.actions.update import ActionInput as UpdateInput
+from mongodb_rooms_pkg.addon import MongoDBRoomsAddon
+from mongodb_rooms_pkg.services.slow_op_profiler import (
+    SlowOpProfiler,
+    explain_command,
+    slow_op_profiler_from_config,
+    summarize_explain,
+)
+
+COLLSCAN_EXPLAIN = {
+    "queryPlanner": {"winningPlan": {"stage": "UPDATE", "inputStage": {"stage": "COLLSCAN", "filter": {"a": 1}}}},
+    "executionStats": {"nReturned": 2, "totalDocsExamined": 1000, "totalKeysExamined": 0, "executionTimeMillis": 12},
+    "ok": 1,
+}
+
+IXSCAN_AGGREGATE_EXPLAIN = {
+    "stages": [
+        {"$cursor": {
+            "queryPlanner": {"winningPlan": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN", "indexName": "a_1"}}},
+            "executionStats": {"nReturned": 5, "totalDocsExamined": 5, "totalKeysExamined": 5, "executionTimeMillis": 1},
+        }},
+        {"$group": {"_id": "$a"}},
+    ],
+    "ok": 1,
+}
+
+
+class TestExplainCommand:
+    def test_update(self):
+        action_input = UpdateInput(collection="users", filter={"a": 1}, update={"$set": {"b": 2}}, update_many=True)
+        assert explain_command("update", "users", action_input) == {
+            "update": "users", "updates": [{"q": {"a": 1}, "u": {"$set": {"b": 2}}, "multi": True, "upsert": False}]
+        }
+
+    def test_upsert_always_upserts(self):
+        action_input = UpdateInput(collection="users", filter={"a": 1}, update={"$set": {"b": 2}})
+        assert explain_command("upsert", "users", action_input)["updates"][0]["upsert"] is True
+
+    def test_delete_one(self):
+        command = explain_command("delete", "users", DeleteInput(collection="users", filter={"a": 1}))
+        assert command == {"delete": "users", "deletes": [{"q": {"a": 1}, "limit": 1}]}
+
+    def test_find(self):
+        action_input = FindInput(collection="users", filter={"a": 1}, sort={"b": -1}, limit=5)
+        assert explain_command("find", "users", action_input) == {"find": "users", "filter": {"a": 1}, "sort": {"b": -1}, "limit": 5}
+
+    def test_unsupported(self):
+        assert explain_command("insert", "users", InsertInput(collection="users", document={"a": 1})) is None
+
+
+class TestSummarizeExplain:
+    def test_collscan(self):
+        summary = summarize_explain(COLLSCAN_EXPLAIN)
+        assert summary["collscan"] is True
+        assert summary["stages"] == ["UPDATE", "COLLSCAN"]
+        assert summary["docs_examined"] == 1000
+        assert summary["n_returned"] == 2
+        assert summary["examined_per_returned"] == 500
+
+    def test_aggregate_cursor_stage(self):
+        summary = summarize_explain(IXSCAN_AGGREGATE_EXPLAIN)
+        assert summary["collscan"] is False
+        assert summary["stages"] == ["FETCH", "IXSCAN"]
+        assert summary["examined_per_returned"] == 1
+
+
+class TestSlowOpProfiler:
+    def update_input(self):
+        return UpdateInput(collection="users", filter={"a": 1}, update={"$set": {"b": 2}})
+
+    def test_fast_operations_ignored(self):
+        profiler = SlowOpProfiler(MagicMock(), threshold_seconds=0.1)
+        assert profiler.observe("update", "users", self.update_input(), 0.01) is None
+        assert profiler.records() == []
+
+    def test_slow_operation_is_explained_out_of_band(self):
+        db = MagicMock()
+        db.command.return_value = COLLSCAN_EXPLAIN
+        profiler = SlowOpProfiler(db, threshold_seconds=0.1)
+
+        record = profiler.observe("update", "users", self.update_input(), 0.5)
+        assert record["duration_ms"] == 500
+        profiler.stop(timeout=5)
+
+        [stored] = profiler.records()
+        assert stored["explain_status"] == "done"
+        assert stored["explain"]["collscan"] is True
+        db.command.assert_called_once_with("explain", record["command"], verbosity="executionStats")
+
+    def test_explains_are_rate_limited(self):
+        db = MagicMock()
+        db.command.return_value = COLLSCAN_EXPLAIN
+        profiler = SlowOpProfiler(db, threshold_seconds=0.1, explain_interval_seconds=60)
+        with patch.object(profiler, "_ensure_worker"):
+            first = profiler.observe("update", "users", self.update_input(), 0.5)
+            second = profiler.observe("update", "users", self.update_input(), 0.5)
+        assert first["explain_status"] == "pending"
+        assert second["explain_status"] == "rate_limited"
+
+    def test_explain_failure_recorded(self):
+        db = MagicMock()
+        db.command.side_effect = OperationFailure("not authorized")
+        profiler = SlowOpProfiler(db, threshold_seconds=0)
+        with patch.object(profiler, "_ensure_worker"):
+            record = profiler.observe("update", "users", self.update_input(), 0.5)
+        profiler.explain(record)
+        assert profiler.records()[0]["explain_status"].startswith("failed")
+
+    def test_ring_buffer_is_bounded(self):
+        profiler = SlowOpProfiler(MagicMock(), threshold_seconds=0, capacity=3)
+        for i in range(5):
+            profiler.observe("insert", f"c{i}", None, 1.0)
+        assert [record["collection"] for record in profiler.records()] == ["c2", "c3", "c4"]
+        assert profiler.records()[0]["explain_status"] == "unsupported"
+
+    def test_export(self, tmp_path):
+        profiler = SlowOpProfiler(MagicMock(), threshold_seconds=0)
+        profiler.observe("insert", "users", None, 1.0)
+        path = tmp_path / "slow.ndjson"
+        assert profiler.export(str(path)) == 1
+        [line] = path.read_text().splitlines()
+        assert json_util.loads(line)["collection"] == "users"
+
+
+class TestAddonProfiler:
+    def test_disabled_by_default(self, addon_config):
+        assert slow_op_profiler_from_config(addon_config(), MagicMock()) is None
+        assert MongoDBRoomsAddon().slow_operations() == []
+
+    @patch("mongodb_rooms_pkg.addon.delete")
+    def test_addon_records_slow_actions(self, mock_delete, addon_config):
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config(slowOpThresholdMS=0, slowOpBufferSize=10)
+        addon.profiler = slow_op_profiler_from_config(addon.config, MagicMock())
+        with patch.object(addon.profiler, "_ensure_worker"):
+            addon.delete("users", {"a": 1})
+
+        [record] = addon.slow_operations()
+        assert record["action"] == "delete"
+        assert record["command"] == {"delete": "users", "deletes": [{"q": {"a": 1}, "limit": 1}]}
+
+    @patch("mongodb_rooms_pkg.addon.find")
+    def test_addon_times_find_until_pages_are_exhausted(self, mock_find, addon_config):
+        def slow_pages():
+            yield [{"_id": 1}]
+            time.sleep(0.05)
+            yield [{"_id": 2}]
+
+        mock_find.return_value = ActionResponse(
+            output=FindOutput(collection_name="users", batch_size=1, pages=slow_pages()),
+            tokens=TokensSchema(stepAmount=800, totalCurrentAmount=17036), code=200
+        )
+        addon = MongoDBRoomsAddon()
+        addon.config = addon_config(slowOpThresholdMS=40, slowOpBufferSize=10)
+        addon.profiler = slow_op_profiler_from_config(addon.config, MagicMock())
+        with patch.object(addon.profiler, "_ensure_worker"):
+            response = addon.find("users", {"a": 1})
+            assert addon.slow_operations() == []
+            list(response.output.pages)
+
+        [record] = addon.slow_operations()
+        assert record["action"] == "find"
+        assert record["duration_ms"] >= 50